@@ -0,0 +1,21 @@
+# benchmarks - Performance benchmarks for the simulation (headless, no window)
+"""
+Run from the repository root:
+
+    python -m benchmarks.micro                 # Query primitives at several scales
+    python -m benchmarks.micro --quick         # Smaller grid, for a fast check
+    python -m benchmarks.micro --save          # Also write the baseline file
+    python -m benchmarks.micro --compare       # Compare against the saved baseline
+    python -m benchmarks.scenarios             # Scripted situations, p50/p99 per tick phase
+
+Modules:
+- world.py: builds synthetic GameStates (generated maps at the scenario_world
+  presets, random populations) without touching the scenario files
+- baseline.py: saving, loading and comparing timing baselines
+- micro.py: per-call cost and scaling of GameState / GameLogic queries
+- scenarios.py: farming day / brawl / famine / archery runs timed per
+  process_tick phase through the profiler
+
+Baselines are machine-specific; compare against one recorded on the same
+machine.
+"""
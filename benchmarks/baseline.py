@@ -0,0 +1,70 @@
+# baseline.py - Save, load and compare benchmark baselines
+"""
+A baseline is a JSON file of {key: seconds} plus a little metadata about
+where it was recorded. compare() flags every key that got slower than the
+baseline by more than a ratio threshold.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+
+
+DEFAULT_THRESHOLD = 1.25  # Slower than baseline by more than this ratio = regression
+
+
+def save_baseline(path, results):
+    """Write {key: seconds} to `path` with machine/version metadata."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        'meta': {
+            'recorded': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    return path
+
+
+def load_baseline(path):
+    """{key: seconds} from a baseline file, or None if it doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare results against a baseline.
+
+    Returns:
+        (rows, regressions): rows are (key, baseline, current, ratio) for every
+        key in both; regressions are the rows whose ratio exceeds threshold.
+    """
+    rows = []
+    for key in sorted(results):
+        if key not in baseline or not baseline[key]:
+            continue
+        ratio = results[key] / baseline[key]
+        rows.append((key, baseline[key], results[key], ratio))
+    regressions = [row for row in rows if row[3] > threshold]
+    return rows, regressions
+
+
+def print_comparison(rows, regressions, threshold=DEFAULT_THRESHOLD, unit=1e6, unit_name='us'):
+    """Print a comparison table and a one-line verdict."""
+    for key, old, new, ratio in rows:
+        flag = "  << REGRESSION" if ratio > threshold else ""
+        print(f"  {key:<48} {old * unit:10.2f}{unit_name} -> {new * unit:10.2f}{unit_name}  x{ratio:5.2f}{flag}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond x{threshold:.2f}")
+    else:
+        print(f"No regressions beyond x{threshold:.2f} ({len(rows)} compared)")
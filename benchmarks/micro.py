@@ -0,0 +1,205 @@
+# micro.py - Per-call cost of GameState / GameLogic query primitives
+"""
+Times the queries the simulation leans on every tick, at every combination
+of map size (the scenario_world presets) and population, and reports:
+- per-call cost (best of several repeats, so noise only ever adds time)
+- a scaling exponent per primitive and map: the slope of log(cost) against
+  log(population) - ~0 constant, ~1 linear, ~2 quadratic
+
+Each primitive gets a fixed, seeded list of arguments so runs are
+comparable. Usage: see benchmarks/__init__.py.
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+
+from constants import VISION_RANGE
+from benchmarks.baseline import (
+    DEFAULT_THRESHOLD, save_baseline, load_baseline, compare, print_comparison,
+)
+from benchmarks.world import benchmark_state, scaling_exponent
+
+
+MAP_SIZES = (30, 60, 350)
+POPULATIONS = (10, 100, 500, 2000)
+QUICK_MAP_SIZES = (30, 60)
+QUICK_POPULATIONS = (10, 100, 500)
+
+DEFAULT_BASELINE = "benchmarks/baselines/micro.json"
+
+MEASURE_TIME = 0.05  # Target seconds per repeat (calls are batched up to this)
+REPEATS = 3
+ARGUMENT_SETS = 256  # Distinct argument tuples cycled through per primitive
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+# Each entry builds (callable, [args, ...]) for a populated state
+
+def _random_point(rng, size):
+    return rng.uniform(0, size), rng.uniform(0, size)
+
+
+def _bench_is_position_blocked(state, logic, rng):
+    size = state.chunks.bounds[2]
+    args = []
+    for _ in range(ARGUMENT_SETS):
+        char = rng.choice(state.characters)
+        x, y = _random_point(rng, size)
+        args.append((x, y, char))
+    return state.is_position_blocked, args
+
+
+def _bench_can_perceive_character(state, logic, rng):
+    args = [(rng.choice(state.characters), rng.choice(state.characters))
+            for _ in range(ARGUMENT_SETS)]
+    return logic.can_perceive_character, args
+
+
+def _bench_check_line_of_sight(state, logic, rng):
+    size = state.chunks.bounds[2]
+    args = []
+    for _ in range(ARGUMENT_SETS):
+        x, y = _random_point(rng, size)
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(1, VISION_RANGE)
+        args.append((x, y, x + distance * math.cos(angle), y + distance * math.sin(angle), None))
+    return logic._check_line_of_sight, args
+
+
+def _bench_get_memories(state, logic, rng):
+    calls = []
+    for _ in range(ARGUMENT_SETS):
+        char = rng.choice(state.characters)
+        subject = rng.choice(state.characters)
+        calls.append((char.get_memories, subject))
+    return (lambda get_memories, subject: get_memories(memory_type='crime', subject=subject)), calls
+
+
+def _bench_find_nearby_defender(state, logic, rng):
+    args = [(rng.choice(state.characters), VISION_RANGE, rng.choice(state.characters))
+            for _ in range(ARGUMENT_SETS)]
+    return logic.find_nearby_defender, args
+
+
+def _bench_nearest_in_area(state, logic, rng):
+    areas = [area['name'] for area in state.chunks.static.areas] or [None]
+    args = [(rng.choice(state.characters), rng.choice(areas)) for _ in range(ARGUMENT_SETS)]
+    return logic._nearest_in_area, args
+
+
+PRIMITIVES = {
+    'is_position_blocked': _bench_is_position_blocked,
+    'can_perceive_character': _bench_can_perceive_character,
+    '_check_line_of_sight': _bench_check_line_of_sight,
+    'get_memories': _bench_get_memories,
+    'find_nearby_defender': _bench_find_nearby_defender,
+    '_nearest_in_area': _bench_nearest_in_area,
+}
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+def time_per_call(func, args, measure_time=MEASURE_TIME, repeats=REPEATS):
+    """Best-of-`repeats` mean seconds per call, cycling through `args`."""
+    # Calibrate: how many calls fit in measure_time
+    start = time.perf_counter()
+    func(*args[0])
+    single = time.perf_counter() - start
+    calls = max(1, min(len(args) * 64, int(measure_time / max(single, 1e-7))))
+
+    best = float('inf')
+    count = len(args)
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for i in range(calls):
+            func(*args[i % count])
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def run(map_sizes, populations, primitives=None, seed=0):
+    """Time every primitive on every (map, population). Returns {key: seconds}."""
+    names = primitives or list(PRIMITIVES)
+    results = {}
+    for size in map_sizes:
+        for population in populations:
+            with benchmark_state(size, population, seed=seed) as (state, logic):
+                for name in names:
+                    rng = random.Random(f"{seed}:{name}")
+                    func, args = PRIMITIVES[name](state, logic, rng)
+                    seconds = time_per_call(func, args)
+                    key = f"{name}|map{size}|pop{population}"
+                    results[key] = seconds
+                    print(f"  {key:<48} {seconds * 1e6:12.2f}us/call", flush=True)
+    return results
+
+
+def report_scaling(results, map_sizes, populations, primitives=None):
+    """Print scaling exponents vs population (per map) and vs map size (per population)."""
+    names = primitives or list(PRIMITIVES)
+    print("\nScaling exponent vs population (per map size):")
+    header = "  " + f"{'primitive':<26}" + "".join(f"{f'map {s}':>10}" for s in map_sizes)
+    print(header)
+    for name in names:
+        row = f"  {name:<26}"
+        for size in map_sizes:
+            points = [(p, results.get(f"{name}|map{size}|pop{p}", 0)) for p in populations]
+            exponent = scaling_exponent(points)
+            row += f"{exponent:10.2f}" if exponent is not None else f"{'-':>10}"
+        print(row)
+
+    print("\nScaling exponent vs map size (per population):")
+    print("  " + f"{'primitive':<26}" + "".join(f"{f'pop {p}':>10}" for p in populations))
+    for name in names:
+        row = f"  {name:<26}"
+        for population in populations:
+            points = [(s, results.get(f"{name}|map{s}|pop{population}", 0)) for s in map_sizes]
+            exponent = scaling_exponent(points)
+            row += f"{exponent:10.2f}" if exponent is not None else f"{'-':>10}"
+        print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for GameState/GameLogic queries")
+    parser.add_argument('--quick', action='store_true', help="smaller maps and populations")
+    parser.add_argument('--maps', type=int, nargs='+', help=f"map sizes (default {MAP_SIZES})")
+    parser.add_argument('--populations', type=int, nargs='+', help=f"populations (default {POPULATIONS})")
+    parser.add_argument('--only', nargs='+', choices=list(PRIMITIVES), help="primitives to run")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline file")
+    parser.add_argument('--save', action='store_true', help="write results as the new baseline")
+    parser.add_argument('--compare', action='store_true', help="compare against the baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    map_sizes = args.maps or (QUICK_MAP_SIZES if args.quick else MAP_SIZES)
+    populations = args.populations or (QUICK_POPULATIONS if args.quick else POPULATIONS)
+
+    print(f"Micro-benchmarks: maps {tuple(map_sizes)}, populations {tuple(populations)}")
+    results = run(map_sizes, populations, args.only)
+    report_scaling(results, map_sizes, populations, args.only)
+
+    status = 0
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            print(f"\nNo baseline at {args.baseline} (run with --save first)")
+        else:
+            print(f"\nAgainst {args.baseline}:")
+            rows, regressions = compare(results, baseline, args.threshold)
+            print_comparison(rows, regressions, args.threshold)
+            status = 1 if regressions else 0
+    if args.save:
+        print(f"\nBaseline written to {save_baseline(args.baseline, results)}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# scenarios.py - End-to-end scenario benchmarks with per-phase tick timing
+"""
+Scripts production-like situations on a headless GameState, runs a fixed
+number of ticks (each followed by the same movement substeps the
+SimulationRunner does), and reports p50/p99 per phase from the profiler's
+scopes (tick.* inside process_tick, plus sim.tick / sim.move / move.*, and
+sim.publish for the render snapshot, taken once per step - here once per tick).
+
+Scenarios:
+- farming_day: a working village going about its day
+- brawl:       everyone gathered in the market while a quarter of them start
+               fights (resolve_melee_attack -> witness_crime / broadcast_violence)
+- famine:      no food anywhere and hunger at the edge (_process_starvation,
+               farm theft, deaths)
+- archery:     half the village shooting at the other half every second
+               (update_arrows)
+
+Usage:
+    python -m benchmarks.scenarios [--ticks N] [--only brawl famine]
+                                   [--save] [--compare] [--threshold 1.25]
+"""
+
+import argparse
+import math
+import random
+import sys
+
+from constants import UPDATE_INTERVAL, MOVEMENT_SUBSTEP, TICK_MULTIPLIER
+import game_logic
+import game_state
+from profiler import get_profiler
+from render_snapshot import take_snapshot
+from benchmarks.baseline import (
+    DEFAULT_THRESHOLD, save_baseline, load_baseline, compare, print_comparison,
+)
+from benchmarks.world import make_world_data, synthetic_world, village_templates
+
+
+MAP_SIZE = 60
+POPULATION = 60
+DEFAULT_TICKS = 1000
+DEFAULT_BASELINE = "benchmarks/baselines/scenarios.json"
+
+# Phases faster than this (p50, seconds) are too noisy to flag as regressions
+MIN_COMPARED_SECONDS = 20e-6
+
+
+# =============================================================================
+# SCENARIO SCRIPTS
+# =============================================================================
+# setup(state, logic, rng) runs once and returns a context for
+# step(state, logic, rng, context), which runs before every tick
+
+def _exterior(state):
+    return [c for c in state.characters if c.zone is None]
+
+
+def _setup_farming_day(state, logic, rng):
+    pass
+
+
+def _setup_brawl(state, logic, rng):
+    # Everyone outdoors gathers in the market so the fights have witnesses
+    market = state.get_area_by_role('market')
+    cells = state.get_area_cells(market) if market else []
+    fighters = _exterior(state)
+    for char in fighters:
+        if cells:
+            x, y = rng.choice(cells)
+            char.prevailing_x = x + 0.5
+            char.prevailing_y = y + 0.5
+
+    rng.shuffle(fighters)
+    attackers = fighters[:len(fighters) // 4]
+    for attacker in attackers:
+        targets = [c for c in fighters if c is not attacker]
+        if not targets:
+            continue
+        target = min(targets, key=lambda c: (c.x - attacker.x) ** 2 + (c.y - attacker.y) ** 2)
+        attacker['morality'] = 1
+        attacker.set_intent('attack', target, reason='murder_intent', started_tick=state.ticks)
+
+
+def _setup_famine(state, logic, rng):
+    for char in state.characters:
+        char['hunger'] = 1
+        char['morality'] = rng.randint(1, 6)
+        for i, slot in enumerate(char.inventory):
+            if slot is not None and slot['type'] in ('wheat', 'bread'):
+                char.inventory[i] = None
+    for barrel in state.interactables.barrels.values():
+        for i, slot in enumerate(barrel.inventory):
+            if slot is not None and slot['type'] in ('wheat', 'bread'):
+                barrel.inventory[i] = None
+
+
+def _setup_archery(state, logic, rng):
+    outside = _exterior(state)
+    rng.shuffle(outside)
+    archers = outside[:len(outside) // 2]
+    for archer in archers:
+        archer.inventory[1] = {'type': 'bow', 'amount': 1}
+    return archers
+
+
+def _step_archery(state, logic, rng, archers):
+    # Each archer looses one arrow per second of game time at someone in range
+    if state.ticks % TICK_MULTIPLIER:
+        return
+    alive = state.characters
+    for archer in archers:
+        if not state.has_character(archer):
+            continue
+        target = rng.choice(alive)
+        if target is archer or target.zone != archer.zone:
+            continue
+        angle = math.atan2(target.y - archer.y, target.x - archer.x)
+        logic.shoot_arrow(archer, angle, rng.uniform(0.5, 1.0))
+
+
+SCENARIOS = {
+    'farming_day': (_setup_farming_day, None),
+    'brawl': (_setup_brawl, None),
+    'famine': (_setup_famine, None),
+    'archery': (_setup_archery, _step_archery),
+}
+
+
+# =============================================================================
+# HARNESS
+# =============================================================================
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(name, ticks=DEFAULT_TICKS, seed=0, population=POPULATION, map_size=MAP_SIZE):
+    """Run one scenario headless.
+
+    Returns:
+        ({phase: (calls, p50, p99, max)} in seconds, characters alive at the end)
+    """
+    setup, step = SCENARIOS[name]
+    rng = random.Random(f"{seed}:{name}")
+    random.seed(seed)  # The game rolls on the global generator
+
+    profiler = get_profiler()
+    was_enabled = profiler.enabled
+    profile = profiler.scope
+    tick_duration = UPDATE_INTERVAL / 1000.0
+
+    world_data = make_world_data(map_size)
+    with synthetic_world(world_data, village_templates(world_data, population, rng)):
+        state = game_state.GameState()
+        logic = game_logic.GameLogic(state)
+        context = setup(state, logic, rng)
+
+        snapshot = take_snapshot(state, logic, None)
+        profiler.enabled = True
+        since = profiler.now()
+        try:
+            for _ in range(ticks):
+                if step:
+                    step(state, logic, rng, context)
+                with profile('sim.tick'):
+                    logic.process_tick()
+                with profile('sim.move'):
+                    remaining = tick_duration
+                    while remaining > 0:
+                        substep = min(remaining, MOVEMENT_SUBSTEP)
+                        with profile('move.npcs'):
+                            logic.update_npc_positions(substep)
+                        with profile('move.arrows'):
+                            logic.update_arrows(substep)
+                        remaining -= substep
+                with profile('sim.publish'):
+                    snapshot = take_snapshot(state, logic, None, snapshot)
+        finally:
+            profiler.enabled = was_enabled
+        durations = profiler.durations(since)
+        survivors = len(state.characters)
+
+    stats = {}
+    for phase, values in durations.items():
+        values.sort()
+        stats[phase] = (len(values), percentile(values, 0.50), percentile(values, 0.99), values[-1])
+    return stats, survivors
+
+
+def print_stats(name, stats, survivors, population):
+    print(f"\n[{name}] {survivors}/{population} alive at the end")
+    print(f"  {'phase':<24}{'calls':>8}{'p50':>12}{'p99':>12}{'max':>12}")
+    for phase in sorted(stats, key=lambda p: (p.split('.')[0] != 'sim', -stats[p][2])):
+        calls, p50, p99, longest = stats[phase]
+        print(f"  {phase:<24}{calls:>8}{p50 * 1e6:10.1f}us{p99 * 1e6:10.1f}us{longest * 1e6:10.1f}us")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scenario benchmarks with per-phase tick timing")
+    parser.add_argument('--ticks', type=int, default=DEFAULT_TICKS, help="ticks per scenario")
+    parser.add_argument('--population', type=int, default=POPULATION, help="characters per scenario")
+    parser.add_argument('--only', nargs='+', choices=list(SCENARIOS), help="scenarios to run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline file")
+    parser.add_argument('--save', action='store_true', help="write results as the new baseline")
+    parser.add_argument('--compare', action='store_true', help="compare against the baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="p50/p99 slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name in args.only or SCENARIOS:
+        stats, survivors = run_scenario(name, args.ticks, args.seed, args.population)
+        print_stats(name, stats, survivors, args.population)
+        for phase, (_, p50, p99, _) in stats.items():
+            results[f"{name}|{phase}|p50"] = p50
+            results[f"{name}|{phase}|p99"] = p99
+
+    status = 0
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            print(f"\nNo baseline at {args.baseline} (run with --save first)")
+        else:
+            # Skip phases too quick to time reliably
+            compared = {key: value for key, value in results.items()
+                        if baseline.get(key.rsplit('|', 1)[0] + '|p50', 0) >= MIN_COMPARED_SECONDS}
+            print(f"\nAgainst {args.baseline}:")
+            rows, regressions = compare(compared, baseline, args.threshold)
+            print_comparison(rows, regressions, args.threshold)
+            status = 1 if regressions else 0
+    if args.save:
+        print(f"\nBaseline written to {save_baseline(args.baseline, results)}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
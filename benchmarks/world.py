@@ -0,0 +1,190 @@
+# world.py - Synthetic worlds and populations for benchmarks
+"""
+GameState reads its map from scenario_world's module-level data (and
+game_logic keeps its own SIZE), both at construction and in later queries,
+so a benchmark at another map size swaps those module globals for the
+duration of a `with synthetic_world(...)` block and restores them after.
+States built inside the block must only be used inside it.
+CHARACTER_TEMPLATES is shared by reference and is swapped in place.
+
+Map presets mirror the commented WORLD_DATA lines in scenario_world.py.
+"""
+
+import math
+import random
+from contextlib import contextmanager
+
+import game_logic
+import game_state
+import scenario.scenario_world as scenario_world
+from character import Character
+from scenario.scenario_characters import CHARACTER_TEMPLATES
+from scenario.town_gen import generate_areas
+
+
+# size -> generate_areas(size, houses, farms, seed, name, trees) arguments
+MAP_PRESETS = {
+    30: dict(houses=0, farms=2, trees=0.01),
+    60: dict(houses=10, farms=2, trees=0.05),
+    350: dict(houses=20, farms=4, trees=0.08),
+}
+
+# Module-level names GameState / GameLogic read the map from
+_WORLD_NAMES = ('VILLAGE_NAME', 'SIZE', 'AREAS', 'ROADS', 'TREES',
+                'HOUSES', 'BARRELS', 'BEDS', 'STOVES', 'WORLD_PLAN')
+
+
+def make_world_data(size, seed=4, name="Dunmere"):
+    """Generate WORLD_DATA for one of the MAP_PRESETS sizes."""
+    preset = MAP_PRESETS[size]
+    return generate_areas(size, preset['houses'], preset['farms'], seed=seed,
+                          name=name, trees=preset['trees'])
+
+
+@contextmanager
+def synthetic_world(world_data, templates=None):
+    """Make GameState() build `world_data` (and `templates`, if given) inside the block."""
+    saved_world = {name: getattr(scenario_world, name) for name in _WORLD_NAMES + ('WORLD_DATA',)}
+    saved_state = {name: getattr(game_state, name) for name in _WORLD_NAMES}
+    saved_logic_size = game_logic.SIZE
+    saved_templates = dict(CHARACTER_TEMPLATES)
+
+    try:
+        scenario_world.WORLD_DATA = world_data
+        scenario_world.VILLAGE_NAME = world_data["name"]
+        scenario_world.SIZE = world_data["size"]
+        scenario_world.AREAS = world_data["areas"]
+        scenario_world.ROADS = world_data.get("roads", [])
+        scenario_world.TREES = world_data.get("trees", [])
+        scenario_world.WORLD_PLAN = None
+        scenario_world.HOUSES = scenario_world._generate_houses()
+        (scenario_world.BARRELS, scenario_world.BEDS,
+         scenario_world.STOVES) = scenario_world._generate_objects()
+        for name in _WORLD_NAMES:
+            setattr(game_state, name, getattr(scenario_world, name))
+        game_logic.SIZE = world_data["size"]
+
+        if templates is not None:
+            CHARACTER_TEMPLATES.clear()
+            CHARACTER_TEMPLATES.update(templates)
+        yield
+    finally:
+        for name, value in saved_world.items():
+            setattr(scenario_world, name, value)
+        for name, value in saved_state.items():
+            setattr(game_state, name, value)
+        game_logic.SIZE = saved_logic_size
+        CHARACTER_TEMPLATES.clear()
+        CHARACTER_TEMPLATES.update(saved_templates)
+
+
+def random_template(rng, job=None, allegiance=None, home=None):
+    """A plausible NPC template with random traits and skills."""
+    return {
+        "attractiveness": rng.randint(1, 10),
+        "confidence": rng.randint(1, 10),
+        "cunning": rng.randint(1, 10),
+        "morality": rng.randint(1, 10),
+        "starting_allegiance": allegiance,
+        "starting_job": job,
+        "starting_home": home,
+        "starting_inventory": [{"type": "gold", "amount": rng.randint(0, 100)}],
+        "starting_age": rng.randint(16, 60),
+        "starting_skills": {"strength": rng.randint(0, 80), "swords": rng.randint(0, 80)},
+        "is_player": False,
+    }
+
+
+def village_templates(world_data, count, rng):
+    """Templates for a working village on `world_data`: GameState spawns these.
+
+    A farmer per farmhouse, a steward and soldiers in the military housing,
+    villagers living in the houses, and the rest homeless - all with food
+    and money, like the hand-written scenario characters.
+    """
+    village = world_data["name"]
+    areas = world_data["areas"]
+    farmhouses = [a["name"] for a in areas if a.get("role") == "farmhouse"]
+    barracks = [a["name"] for a in areas if a.get("role") in ("military_housing", "barracks")]
+    houses = [a["name"] for a in areas if a.get("role") == "house"]
+
+    roles = [("Farmer", village, home) for home in farmhouses]
+    for home in barracks:
+        roles.append(("Steward", village, home))
+        roles.extend(("Soldier", village, home) for _ in range(2))
+    roles.extend((None, village, home) for home in houses)
+
+    templates = {}
+    for i in range(count):
+        job, allegiance, home = roles[i] if i < len(roles) else (None, None, None)
+        template = random_template(rng, job=job, allegiance=allegiance, home=home)
+        template["starting_inventory"] = [
+            {"type": "gold", "amount": rng.randint(10, 200)},
+            {"type": "wheat", "amount": rng.randint(5, 15)},
+        ]
+        templates[f"Villager {i}"] = template
+    return templates
+
+
+def populate(state, count, rng, memories_per_character=20):
+    """Scatter `count` NPCs over free exterior cells, with memories of each other.
+
+    About one in ten is a soldier of the village, so defender searches have
+    something to find. Characters go through state.add_character; this is a
+    benchmark fixture, not the game's spawn logic.
+    """
+    size = state.chunks.bounds[2]
+    village = scenario_world.VILLAGE_NAME
+    characters = []
+    for i in range(count):
+        soldier = i % 10 == 0
+        template = random_template(rng, job="Soldier" if soldier else None,
+                                   allegiance=village if soldier else None)
+        name = f"Bench {i}"
+        CHARACTER_TEMPLATES[name] = template
+        for _ in range(100):
+            x, y = rng.randrange(size), rng.randrange(size)
+            if not state.is_obstacle_at(x, y):
+                break
+        char = Character(name, template, x, y)
+        characters.append(char)
+        state.add_character(char)
+
+    memory_types = ('crime', 'attacked_by', 'sighting', 'helped_by')
+    for char in characters:
+        for _ in range(memories_per_character):
+            subject = rng.choice(characters)
+            memory_type = rng.choice(memory_types)
+            char.add_memory(memory_type, subject, rng.randrange(1000),
+                            intensity=rng.randint(1, 20), crime_type='theft')
+    return characters
+
+
+@contextmanager
+def benchmark_state(size, population, seed=0, memories_per_character=20):
+    """Yield (state, logic) on a generated map of `size` with `population` NPCs."""
+    rng = random.Random(seed)
+    world_data = make_world_data(size)
+    with synthetic_world(world_data, templates={}):
+        state = game_state.GameState()
+        logic = game_logic.GameLogic(state)
+        populate(state, population, rng, memories_per_character)
+        yield state, logic
+
+
+def scaling_exponent(points):
+    """Least-squares slope of log(cost) against log(n) for [(n, cost), ...].
+
+    ~0 means constant per call, ~1 linear in n, ~2 quadratic.
+    """
+    points = [(n, cost) for n, cost in points if n > 0 and cost > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(cost) for _, cost in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if var == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var
@@ -25,23 +25,63 @@ Memory Types:
 
 import time  # Used for attack animation timing (visual only, doesn't scale with game speed)
 import math
+import weakref
 from constants import (
     MAX_HUNGER, MAX_FATIGUE, MAX_STAMINA, INVENTORY_SLOTS, ITEMS, SKILLS,
     CHARACTER_WIDTH, CHARACTER_HEIGHT,
     BREAD_PER_BITE, STARVATION_THRESHOLD,
     ATTACK_ANIMATION_DURATION, ATTACK_DAMAGE_TICKS_BEFORE_END,
     UPDATE_INTERVAL,
-    STAMINA_DRAIN_PER_TICK, STAMINA_REGEN_PER_TICK, STAMINA_REGEN_DELAY_TICKS, STAMINA_SPRINT_THRESHOLD,
+    STAMINA_SPRINT_THRESHOLD,
     DEBUG_TRIPLE_PLAYER_HEALTH,
     HEAVY_ATTACK_THRESHOLD_TICKS, HEAVY_ATTACK_CHARGE_TICKS,
     HEAVY_ATTACK_MIN_MULTIPLIER, HEAVY_ATTACK_MAX_MULTIPLIER,
 )
 from scenario.scenario_characters import CHARACTER_TEMPLATES
+from vitals import VitalField
 
 # Get bow stats from ITEMS
 _BOW = ITEMS["bow"]
 
 
+# =========================================================================
+# CHARACTER REFERENCES
+# =========================================================================
+# Attributes that point at another character. Held as weak references, and
+# registered in the target's _referrers so GameState.remove_character only
+# has to visit the characters that actually referenced the deceased.
+CHARACTER_REF_SLOTS = ('face_target', 'combat_track_target', 'tax_collection_target')
+
+
+class CharacterRef:
+    """Descriptor for an attribute holding another character (or None)."""
+    
+    def __set_name__(self, owner, name):
+        self.slot = name
+        self.attr = '_ref_' + name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        ref = obj.__dict__.get(self.attr)
+        return ref() if ref is not None else None
+    
+    def __set__(self, obj, value):
+        old = self.__get__(obj)
+        if old is value:
+            return
+        if isinstance(old, Character):
+            obj._untrack(self.slot, old)
+        if value is None:
+            obj.__dict__[self.attr] = None
+        elif isinstance(value, Character):
+            obj.__dict__[self.attr] = weakref.ref(value)
+            obj._track(self.slot, value)
+        else:
+            # Not a character (e.g. a position) - nothing to track
+            obj.__dict__[self.attr] = lambda value=value: value
+
+
 class Character:
     """
     Represents a character in the game world.
@@ -51,6 +91,25 @@ class Character:
     compatibility with code that treats characters as dicts.
     """
     
+    face_target = CharacterRef()            # Character to keep facing
+    combat_track_target = CharacterRef()    # Character being tracked in combat
+    tax_collection_target = CharacterRef()  # Steward: who they're collecting from
+    
+    # Vital stats - rows of GameState.vitals once added to a GameState
+    # (see vitals.py), plain per-instance values before that / after removal
+    health = VitalField()
+    hunger = VitalField()
+    stamina = VitalField()
+    is_sprinting = VitalField()
+    _last_sprint_tick = VitalField()
+    _stamina_depleted = VitalField()
+    is_starving = VitalField()
+    is_frozen = VitalField()
+    starvation_health_lost = VitalField()
+    ticks_starving = VitalField()
+    _vitals = None       # VitalsTable holding this character's row
+    _vitals_row = None
+    
     def __init__(self, name, template, x, y, home_area=None):
         """
         Create a character from a template.
@@ -64,7 +123,13 @@ class Character:
         """
         # Identity
         self.name = name
+        self.char_id = None  # Assigned by GameState.add_character
         self._is_player = template.get('is_player', False)
+        
+        # Reference tracking, both directions: {Character: {slot, ...}}
+        # Slots are CHARACTER_REF_SLOTS names, 'intent' or 'memory'
+        self._referrers = {}   # Characters holding a reference to this one
+        self._references = {}  # Characters this one holds a reference to
 
         # Position (float-based for smooth movement)
         # _prevailing_x/_prevailing_y store actual position (interior coords when inside, world coords when outside)
@@ -84,6 +149,12 @@ class Character:
         # Zone system for interiors
         # None = exterior world, "house_name" = inside that building's interior
         self.zone = None
+        # Called as zone_listener(char, old_zone, new_zone) whenever zone changes
+        # (GameState uses it to keep its per-zone character sets current)
+        self.zone_listener = None
+        # Called as role_listener(char) whenever job or allegiance changes
+        # (GameState uses it to keep stewards indexed by allegiance)
+        self.role_listener = None
         
         # Interior projection parameters (set when entering interior)
         # These allow computing world coordinates without needing InteriorManager reference
@@ -91,9 +162,6 @@ class Character:
         self._interior_proj_y = 0      # exterior_y of building
         self._interior_scale_x = 1.0   # exterior_width / interior_width
         self._interior_scale_y = 1.0   # exterior_height / interior_height
-        # Animation tracking
-        self._last_anim_x = self._prevailing_x
-        self._last_anim_y = self._prevailing_y
         # Attack animation state
         self.attack_animation_start = None
         self.attack_direction = None
@@ -165,8 +233,9 @@ class Character:
         
         # Current state
         self._job_name = template.get('starting_job')  # String name, not Job object
-        self.allegiance = template.get('starting_allegiance')
+        self._allegiance = template.get('starting_allegiance')
         self.home = home_area
+        self.tax_due_tick = None  # Farmers: tick their tax is due (see GameState.schedule_tax_deadline)
         
         # =====================================================================
         # MEMORY SYSTEM
@@ -177,7 +246,7 @@ class Character:
         # Current intent - what this character has decided to do THIS tick
         # Structure: {'action': str, 'target': Any, 'reason': memory or str, 'started_tick': int}
         # Actions: 'attack', 'flee', 'follow', 'goto', 'stay_near', None
-        self.intent = None
+        self._intent = None
 
         # Movement goal - where this character is trying to go
         # Set by job.decide(), used by movement system
@@ -196,9 +265,9 @@ class Character:
         self.idle_wait_ticks = 0
         self.idle_is_idle = False
 
-        # Squeeze/pathfinding state
-        self.blocked_ticks = 0
-        self.squeeze_direction = 0
+        # Local avoidance: velocity actually moved at last substep (vx/vy is the preferred one)
+        self.avoid_vx = 0.0
+        self.avoid_vy = 0.0
 
         
         # Patrol state (soldiers)
@@ -236,6 +305,20 @@ class Character:
     def job(self, value):
         """Set job name (string or None)."""
         self._job_name = value
+        if self.role_listener is not None:
+            self.role_listener(self)
+    
+    @property
+    def allegiance(self):
+        """Get allegiance (village/kingdom name or None)."""
+        return self._allegiance
+    
+    @allegiance.setter
+    def allegiance(self, value):
+        """Set allegiance."""
+        self._allegiance = value
+        if self.role_listener is not None:
+            self.role_listener(self)
     
     @property
     def confidence(self):
@@ -416,7 +499,10 @@ class Character:
         Args:
             interior: Interior object to enter
         """
+        old_zone = self.zone
         self.zone = interior.name
+        if self.zone_listener is not None:
+            self.zone_listener(self, old_zone, self.zone)
         
         # Store projection parameters for on-demand world coordinate calculation
         self._interior_proj_x = interior.exterior_x
@@ -440,11 +526,14 @@ class Character:
         exit_x, exit_y = interior.get_exit_position()
         
         # Clear zone and projection params FIRST
+        old_zone = self.zone
         self.zone = None
         self._interior_proj_x = 0
         self._interior_proj_y = 0
         self._interior_scale_x = 1.0
         self._interior_scale_y = 1.0
+        if self.zone_listener is not None:
+            self.zone_listener(self, old_zone, None)
         
         # Move to exit position (now zone is None, so this sets world position directly)
         self._prevailing_x = exit_x
@@ -909,6 +998,11 @@ class Character:
             'details': details
         }
         self.memories.append(memory)
+        if isinstance(subject, Character):
+            self._track('memory', subject)
+        victim = details.get('victim')
+        if isinstance(victim, Character):
+            self._track('memory', victim)
         return memory
     
     def get_memories(self, memory_type=None, subject=None, source=None, 
@@ -959,6 +1053,75 @@ class Character:
         # Clear intent if it was about this subject
         if self.intent and self.intent.get('target') is subject:
             self.intent = None
+        
+        if isinstance(subject, Character) and not any(
+                m['details'].get('victim') is subject for m in self.memories):
+            self._untrack('memory', subject)
+    
+    # =========================================================================
+    # REFERENCE TRACKING
+    # =========================================================================
+    
+    @property
+    def intent(self):
+        """Current intent dict (see set_intent), or None."""
+        return self._intent
+    
+    @intent.setter
+    def intent(self, value):
+        old = self._intent.get('target') if self._intent else None
+        new = value.get('target') if value else None
+        if old is not new:
+            if isinstance(old, Character):
+                self._untrack('intent', old)
+            if isinstance(new, Character):
+                self._track('intent', new)
+        self._intent = value
+    
+    def _track(self, slot, target):
+        """Record that this character refers to `target` through `slot`."""
+        target._referrers.setdefault(self, set()).add(slot)
+        self._references.setdefault(target, set()).add(slot)
+    
+    def _untrack(self, slot, target):
+        for table, key in ((target._referrers, self), (self._references, target)):
+            slots = table.get(key)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del table[key]
+    
+    def get_referrers(self):
+        """Characters currently holding a reference to this one."""
+        return list(self._referrers)
+    
+    def release_references_to(self, other):
+        """Drop every reference this character holds to `other` (who is gone).
+        
+        Clears ref slots and an intent aimed at them, forgets memories about
+        them, and keeps only the name of a victim in crime memories.
+        """
+        slots = other._referrers.pop(self, set())
+        self._references.pop(other, None)
+        for slot in CHARACTER_REF_SLOTS:
+            if slot in slots:
+                self.__dict__['_ref_' + slot] = None
+        if 'intent' in slots:
+            self._intent = None
+        if 'memory' in slots:
+            self.memories = [m for m in self.memories if m['subject'] is not other]
+            for m in self.memories:
+                if m['details'].get('victim') is other:
+                    m['details']['victim'] = other.name
+    
+    def release_all_references(self):
+        """Unregister everything this character points at (called once it's removed)."""
+        for target in self._references:
+            target._referrers.pop(self, None)
+        self._references = {}
+        for slot in CHARACTER_REF_SLOTS:
+            self.__dict__['_ref_' + slot] = None
+        self._intent = None
     
     def clear_intent(self):
         """Clear current intent."""
@@ -1489,7 +1652,7 @@ class Character:
         """Check if character can START sprinting.
         
         Requires stamina above threshold. Once sprinting, can continue
-        until stamina hits 0 (handled by drain_stamina_sprint).
+        until stamina hits 0 (drain and regen are GameLogic._process_stamina).
         
         Returns:
             True if can start sprinting
@@ -1519,51 +1682,6 @@ class Character:
             return False
         return self.stamina > 0
     
-    def drain_stamina_sprint(self, current_tick):
-        """Drain stamina while sprinting. Called once per tick.
-        
-        Args:
-            current_tick: Current game tick
-            
-        Returns:
-            True if still have stamina, False if depleted
-        """
-        self.stamina = max(0, self.stamina - STAMINA_DRAIN_PER_TICK)
-        
-        # Track when we last sprinted (for regen delay)
-        self._last_sprint_tick = current_tick
-        
-        if self.stamina <= 0:
-            self._stamina_depleted = True
-            return False
-        return True
-    
-    def regenerate_stamina(self, current_tick):
-        """Regenerate stamina when not sprinting. Called once per tick.
-        
-        Only regenerates if enough ticks have passed since last sprint
-        (simulates Skyrim's brief pause before regen kicks in).
-        
-        Args:
-            current_tick: Current game tick
-            
-        Returns:
-            Amount regenerated
-        """
-        # Check if we've waited long enough since sprinting
-        ticks_since_sprint = current_tick - self._last_sprint_tick
-        if ticks_since_sprint < STAMINA_REGEN_DELAY_TICKS:
-            return 0
-        
-        # Already full
-        if self.stamina >= MAX_STAMINA:
-            return 0
-        
-        old_stamina = self.stamina
-        self.stamina = min(MAX_STAMINA, self.stamina + STAMINA_REGEN_PER_TICK)
-        
-        return self.stamina - old_stamina
-    
     def get_stamina_fraction(self):
         """Get stamina as a fraction (0-1) for UI display."""
         return self.stamina / MAX_STAMINA
@@ -1587,7 +1705,7 @@ class Character:
     def __setitem__(self, key, value):
         """Allow dict-like write access: char['x'] = 5 -> char.x = 5"""
         if key == 'job':
-            self._job_name = value
+            self.job = value
         elif hasattr(self, key):
             setattr(self, key, value)
         else:
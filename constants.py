@@ -10,6 +10,8 @@ MIN_ZOOM = 0.5             # Minimum zoom (zoomed out)
 MAX_ZOOM = 4.0             # Maximum zoom (zoomed in)
 SPEED_OPTIONS = [1, 2, 10, 20, 100]
 START_MUTED = True         # Start with music muted (toggle with M key)
+GROUND_TILE_CELLS = 16     # Ground is baked into render textures of this many cells per side
+GROUND_TILE_CACHE_SIZE = 96  # Baked ground tiles kept in VRAM (least recently drawn unloaded first)
 
 # =============================================================================
 # BOARD SETTINGS
@@ -19,6 +21,16 @@ BG_COLOR = "#000000" # UI Background Color
 GRID_COLOR = "#cccccc" # UI Grid Color
 ROAD_COLOR = "#A89880" # Road cell color
 
+# =============================================================================
+# WORLD STREAMING SETTINGS
+# =============================================================================
+# The world plan (exported from the world map generator) is split into square
+# chunks of SIZE cells, one per biome-grid cell. Only chunks near the player
+# are kept in memory; the rest are generated on demand or read back from disk.
+CHUNK_LOAD_RADIUS = 1      # Chunks around the player's chunk to keep loaded (1 = 3x3)
+CHUNK_MAX_RESIDENT = 25    # Hard cap on loaded chunks (least recently used evicted first)
+SPATIAL_BUCKET_SIZE = 16   # Cells per side of a spatial index bucket (world objects, ground items, corpses)
+
 # =============================================================================
 # TIMING SETTINGS
 # =============================================================================
@@ -31,6 +43,15 @@ BASE_TICKS_PER_DAY = 1500  # Base values (in "seconds" of game time): 25 minutes
 BASE_TICKS_PER_YEAR = BASE_TICKS_PER_DAY * 3  # 4500 base ticks = 75 minutes = 3 days
 TICKS_PER_DAY = BASE_TICKS_PER_DAY * TICK_MULTIPLIER  # Actual tick values (multiplied for smooth movement): 15000 ticks
 TICKS_PER_YEAR = BASE_TICKS_PER_YEAR * TICK_MULTIPLIER  # 45000 ticks
+SIMULATION_THREADED = True  # Run the simulation on a worker thread; the renderer interpolates between ticks
+SIMULATION_STEP_INTERVAL = 1 / 60  # Seconds between simulation steps on the worker thread
+SIMULATION_STEP_BUDGET = 0.012  # Wall-clock seconds of ticks per step/frame; the rest is carried as debt
+SIMULATION_MAX_DEBT_TICKS = 200  # Owed ticks beyond this are dropped (the game runs slower instead)
+MOVEMENT_SUBSTEP = 0.05  # Seconds per movement update within a tick
+SIMULATION_PRESSURE_TICKS = 5  # Owed ticks after a step that count as "under pressure"
+COARSE_SUBSTEPS_UNDER_PRESSURE = True  # Under pressure, move once per tick instead of per substep
+TURBO_RENDER_FPS = 5  # Frame rate while in turbo mode (the simulation gets the rest of the CPU)
+TURBO_STEP_BUDGET = 0.05  # Wall-clock seconds of ticks per step in turbo mode
 
 # =============================================================================
 # CHARACTER SETTINGS
@@ -92,8 +113,16 @@ SPRINT_SPEED = 1.2      # Sprint (cells/second)
 # Set VERY small to allow characters to squeeze past each other like in ALTTP
 # Characters can overlap significantly - this just prevents standing on exact same spot
 CHARACTER_COLLISION_RADIUS = 0.15  # Tiny - only blocks when nearly on top of each other
-SQUEEZE_THRESHOLD_TICKS = 3  # Ticks blocked before starting to squeeze
-SQUEEZE_SLIDE_SPEED = 0.8  # How fast to slide perpendicular (relative to movement speed)
+
+# Local avoidance (ORCA) - NPCs steer around each other instead of bumping
+# See local_avoidance.py
+AVOIDANCE_RADIUS = 0.2  # Personal space per character (> collision radius, so they steer before they bump)
+AVOIDANCE_NEIGHBOR_DIST = 1.5  # Cells - only characters this close are considered
+AVOIDANCE_MAX_NEIGHBORS = 8  # Nearest neighbours considered per character (caps per-NPC cost in crowds)
+AVOIDANCE_TIME_HORIZON = 1.0  # Seconds ahead to guarantee no collision with other characters
+AVOIDANCE_OBSTACLE_TIME_HORIZON = 0.5  # Seconds ahead for static obstacles (react later, hug them closer)
+AVOIDANCE_OBSTACLE_RADIUS = 0.45  # Trees/barrels/beds/stoves treated as circles this big
+AVOIDANCE_OBSTACLE_KINDS = ('tree', 'barrel', 'bed', 'stove')  # Spatial index kinds steered around
 
 # Adjacency threshold - how close characters need to be for object interactions
 ADJACENCY_DISTANCE = 0.8  # Within 0.8 cells for barrels, beds, stoves, dialogue, etc.
@@ -248,6 +277,22 @@ FLEE_DISTANCE_DIVISOR = 2  # Flee distance = crime intensity / this value
 INVENTORY_SLOTS = 5
 BARREL_SLOTS = 30
 
+# =============================================================================
+# CORPSE SETTINGS
+# =============================================================================
+# Corpses collapse into a marker (bones) once looted bare; unlooted ones rot
+# after CORPSE_DECAY_TICKS and drop what they carried on the ground.
+# See world_objects/corpses.py
+CORPSE_EMPTY_TICKS = 60 * TICK_MULTIPLIER  # How often a corpse is checked for being looted bare (1 minute)
+CORPSE_DECAY_TICKS = TICKS_PER_DAY  # Unlooted corpses rot after 1 day
+CORPSE_MARKER_TICKS = TICKS_PER_DAY * 3  # Markers fade after 3 days
+
+# =============================================================================
+# GROUND ITEM SETTINGS
+# =============================================================================
+GROUND_ITEM_MERGE_RADIUS = 1.0  # Drops this close to a same-type stack top it up (cells)
+GROUND_ITEM_DESPAWN_TICKS = TICKS_PER_DAY * 2  # Lifetime of items spilled by rotting corpses
+
 # =============================================================================
 # ITEM DEFINITIONS
 # =============================================================================
@@ -625,6 +670,21 @@ DEBUG_COLOR_POSITION = (255, 255, 255, 255)     # White - center position dot
 # =============================================================================
 DEBUG_TRIPLE_PLAYER_HEALTH = False    # Player starts with 300 HP instead of 100
 
+# =============================================================================
+# PROFILING SETTINGS
+# =============================================================================
+# Scoped timers around tick phases and render passes (see profiler.py)
+PROFILER_ENABLED = False              # Record timings (near-zero cost when off)
+PROFILER_RING_SIZE = 200000           # Most recent scopes/counter samples kept
+PROFILER_REPORT_INTERVAL = 2.0        # Seconds between console reports (0 = no reports)
+PROFILER_TRACE_PATH = "profile_trace.json"  # Chrome trace written on exit (None = don't write)
+
+# On-demand stack sampling ("Capture Profile" in the debug window)
+PROFILE_CAPTURE_LENGTH = 300          # Ticks (and frames) to record per capture
+PROFILE_CAPTURE_TIMEOUT = 30.0        # Seconds before a capture stops anyway (e.g. while paused)
+PROFILE_SAMPLE_INTERVAL = 0.001       # Seconds between stack samples
+PROFILE_CAPTURE_DIR = "profiles"      # Where .pstats / .folded files are written
+
 # =============================================================================
 # DESIGN NOTES AND FUTURE PLANS
 # =============================================================================
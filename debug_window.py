@@ -1,9 +1,15 @@
 # debug_window.py - Tkinter-based debug window running in separate process
 # This solves the pygame/tkinter macOS conflict by complete process isolation
+import os
+import time
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import multiprocessing
-from constants import TICKS_PER_YEAR, TICKS_PER_DAY, SKILLS, SPEED_OPTIONS, UPDATE_INTERVAL
+from constants import (
+    TICKS_PER_YEAR, TICKS_PER_DAY, SKILLS, SPEED_OPTIONS, UPDATE_INTERVAL,
+    PROFILE_CAPTURE_LENGTH, PROFILE_CAPTURE_TIMEOUT, PROFILE_CAPTURE_DIR,
+)
+from profiler import SamplingCapture
 from scenario.scenario_characters import CHARACTER_TEMPLATES
 
 
@@ -31,6 +37,9 @@ class DebugWindowProcess:
         
         # Track speed index locally
         self.speed_index = 0
+        
+        # Profile capture in progress (see _start_profile_capture)
+        self._capture = None
     
     def set_status(self, status_text):
         """Send status update to debug window"""
@@ -50,6 +59,9 @@ class DebugWindowProcess:
         
         # Process commands from debug window
         self._process_commands()
+        
+        if self._capture:
+            self._update_profile_capture()
     
     def _build_snapshot(self):
         """Build a serializable snapshot of game state for the debug window"""
@@ -168,6 +180,8 @@ class DebugWindowProcess:
         return {
             'ticks': self.state.ticks,
             'game_speed': self.state.game_speed,
+            'effective_speed': self.state.effective_speed,
+            'turbo': self.state.turbo,
             'paused': self.state.paused,
             'characters': characters,
             'barrels': barrels,
@@ -175,6 +189,7 @@ class DebugWindowProcess:
             'action_log': list(self.state.action_log),
             'log_total_count': self.state.log_total_count,
             'player_status': player_status,
+            'capturing_profile': self._capture is not None,
         }
     
     def _process_commands(self):
@@ -186,8 +201,13 @@ class DebugWindowProcess:
                 break
             
             if cmd['type'] == 'toggle_speed':
-                self.speed_index = (self.speed_index + 1) % len(SPEED_OPTIONS)
-                self.state.game_speed = SPEED_OPTIONS[self.speed_index]
+                # Cycles through SPEED_OPTIONS, then turbo, then back to the first speed
+                self.speed_index = (self.speed_index + 1) % (len(SPEED_OPTIONS) + 1)
+                if self.speed_index == len(SPEED_OPTIONS):
+                    self.state.turbo = True
+                else:
+                    self.state.turbo = False
+                    self.state.game_speed = SPEED_OPTIONS[self.speed_index]
             
             elif cmd['type'] == 'toggle_pause':
                 self.state.paused = not self.state.paused
@@ -195,6 +215,50 @@ class DebugWindowProcess:
             elif cmd['type'] == 'skip_year':
                 if self.logic:
                     self._skip_one_year()
+            
+            elif cmd['type'] == 'capture_profile':
+                self._start_profile_capture(cmd.get('length', PROFILE_CAPTURE_LENGTH))
+    
+    def _start_profile_capture(self, length):
+        """Start sampling all threads until `length` ticks and frames have run"""
+        if self._capture:
+            return
+        sampler = SamplingCapture()
+        sampler.start()
+        self._capture = {
+            'sampler': sampler,
+            'length': length,
+            'start_tick': self.state.ticks,
+            'population': len(self.state.characters),
+            'frames': 0,
+            'started': time.time(),
+        }
+        self.state.log_action(f"=== CAPTURING PROFILE ({length} ticks) ===")
+    
+    def _update_profile_capture(self):
+        """Count a frame; once enough ticks and frames have run, write the capture"""
+        capture = self._capture
+        capture['frames'] += 1
+        ticks = self.state.ticks - capture['start_tick']
+        timed_out = time.time() - capture['started'] > PROFILE_CAPTURE_TIMEOUT
+        if not timed_out and (ticks < capture['length'] or capture['frames'] < capture['length']):
+            return
+        
+        sampler = capture['sampler']
+        sampler.stop()
+        self._capture = None
+        
+        os.makedirs(PROFILE_CAPTURE_DIR, exist_ok=True)
+        base = os.path.join(
+            PROFILE_CAPTURE_DIR,
+            f"profile_tick{capture['start_tick']}_pop{capture['population']}"
+        )
+        sampler.write_pstats(base + ".pstats")
+        sampler.write_folded(base + ".folded")
+        self.state.log_action(
+            f"=== PROFILE WRITTEN: {base}.pstats/.folded "
+            f"({ticks} ticks, {capture['frames']} frames, {sampler.samples} samples) ==="
+        )
     
     def _skip_one_year(self):
         """Skip forward one year"""
@@ -318,7 +382,7 @@ class _DebugWindowInternal:
         self.is_mac = is_mac
         
         # Speed button
-        self.speed_btn = create_button(control_frame, "Speed: 1x", self._toggle_speed, width=12)
+        self.speed_btn = create_button(control_frame, "Speed: 1x", self._toggle_speed, width=18)
         self.speed_btn.pack(side=tk.LEFT, padx=2)
         
         # Pause button
@@ -329,6 +393,10 @@ class _DebugWindowInternal:
         self.skip_btn = create_button(control_frame, "Skip 1 Year", self._skip_one_year, width=12)
         self.skip_btn.pack(side=tk.LEFT, padx=2)
         
+        # Capture profile button
+        self.profile_btn = create_button(control_frame, "Capture Profile", self._capture_profile, width=14)
+        self.profile_btn.pack(side=tk.LEFT, padx=2)
+        
         # Copy All button
         self.copy_all_btn = create_button(control_frame, "📋 Copy All", self._copy_all, width=12)
         self.copy_all_btn.pack(side=tk.LEFT, padx=2)
@@ -440,6 +508,13 @@ class _DebugWindowInternal:
         except:
             pass
     
+    def _capture_profile(self):
+        """Send profile capture command to main process"""
+        try:
+            self.command_queue.put_nowait({'type': 'capture_profile'})
+        except:
+            pass
+    
     def _readonly_handler(self, event):
         """Allow copy but prevent editing"""
         if event.state & 0x4:  # Ctrl held
@@ -526,8 +601,17 @@ class _DebugWindowInternal:
     
     def _update_button_states(self):
         """Update button text to reflect current state"""
-        self.speed_btn.configure(text=f"Speed: {self.snapshot['game_speed']}x")
+        requested = self.snapshot['game_speed']
+        effective = self.snapshot.get('effective_speed', requested)
+        if self.snapshot.get('turbo'):
+            speed_text = f"TURBO ({effective:.0f}x)"
+        else:
+            speed_text = f"Speed: {requested}x"
+            if not self.snapshot['paused'] and effective < requested * 0.95:
+                speed_text += f" ({effective:.1f}x)"  # What the simulation actually achieves
+        self.speed_btn.configure(text=speed_text)
         self.pause_btn.configure(text="Resume" if self.snapshot['paused'] else "Pause")
+        self.profile_btn.configure(text="Capturing..." if self.snapshot.get('capturing_profile') else "Capture Profile")
     
     def _update_tick_info(self):
         """Update the tick/time display"""
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 """
 World Map Generator - Everything is cells
-Controls: Mouse wheel to zoom, click+drag to pan
+Controls: Mouse wheel to zoom, click+drag to pan, E to export the world plan (world_plan.json)
 """
 
 import pygame
+import numpy as np
 import random
 import math
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict
 from enum import Enum
 import hashlib
+import json
 
 def deterministic_hash(s: str) -> int:
     return int(hashlib.md5(s.encode()).hexdigest(), 16) & 0x7FFFFFFF
@@ -22,6 +24,8 @@ CELL_SIZE = 2  # pixels per cell
 CELLS_X = MAP_WIDTH // CELL_SIZE  # 700
 CELLS_Y = MAP_HEIGHT // CELL_SIZE  # 450
 BIOME_GRID = 20  # original biome grid size
+GRID_X = MAP_WIDTH // BIOME_GRID  # 84
+GRID_Y = MAP_HEIGHT // BIOME_GRID  # 54
 UI_HEIGHT = 40
 
 class Biome(Enum):
@@ -29,6 +33,11 @@ class Biome(Enum):
     PLAINS = "plains"
     SWAMP = "swamp"
 
+# Raster codes for the biome grid (index into this list)
+BIOME_ORDER = [Biome.FOREST, Biome.PLAINS, Biome.SWAMP]
+FOREST_CODE = BIOME_ORDER.index(Biome.FOREST)
+SWAMP_CODE = BIOME_ORDER.index(Biome.SWAMP)
+
 class LocationType(Enum):
     KINGDOM = "kingdom"
     VILLAGE = "village"
@@ -71,6 +80,25 @@ class Bridge:
     length: int
     is_stone: bool = True  # Stone for main roads, wood for paths
 
+def segment_distance(px, py, x1, y1, x2, y2):
+    """Distance from point(s) to a line segment; px/py may be NumPy arrays"""
+    dx, dy = x2 - x1, y2 - y1
+    if dx == 0 and dy == 0:
+        return np.sqrt((px - x1) ** 2 + (py - y1) ** 2)
+    t = np.clip(((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy), 0, 1)
+    return np.sqrt((px - (x1 + t * dx)) ** 2 + (py - (y1 + t * dy)) ** 2)
+
+def polygon_contains(px, py, poly):
+    """Even-odd point-in-polygon test broadcast over arrays of points"""
+    inside = np.zeros(np.broadcast(px, py).shape, dtype=bool)
+    j = len(poly) - 1
+    for i in range(len(poly)):
+        (xi, yi), (xj, yj) = poly[i], poly[j]
+        if yi != yj:
+            inside ^= ((yi > py) != (yj > py)) & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+        j = i
+    return inside
+
 # Color palette
 C = {
     'road': (139, 115, 85),
@@ -153,14 +181,19 @@ class WorldMapGenerator:
         self.roads: List[Road] = []
         self.water_bodies: List[WaterBody] = []
         self.bridges: List[Bridge] = []
-        self.biome_map: Dict[Tuple[int,int], Biome] = {}
-        self.elevation_map: Dict[Tuple[int,int], float] = {}  # 0.0 = low, 1.0 = mountain peak
-        self.rocky_map: Dict[Tuple[int,int], float] = {}  # 0.0 = not rocky, 1.0 = very rocky
+        # Biome-grid rasters, indexed [gx, gy]
+        self.biome_map = np.zeros((GRID_X, GRID_Y), dtype=np.int8)  # index into BIOME_ORDER
+        self.elevation_map = np.zeros((GRID_X, GRID_Y))  # 0.0 = low, 1.0 = mountain peak
+        self.rocky_map = np.zeros((GRID_X, GRID_Y))  # 0.0 = not rocky, 1.0 = very rocky
+        self.territory_map = np.full((GRID_X, GRID_Y), -1, dtype=np.int8)  # kingdom id or -1
         self.trees: List[Tuple[int, int, int]] = []  # (x, y, size) in world coords
         self.kingdom_territories: Dict[int, set] = {}
         
-        # The cell grid - stores RGB or None (use biome)
-        self.cells = [[None for _ in range(CELLS_Y)] for _ in range(CELLS_X)]
+        # Water coverage per world pixel, indexed [x, y]; rasterized once after generate_water
+        self.water_mask = np.zeros((MAP_WIDTH, MAP_HEIGHT), dtype=bool)
+        
+        # The cell grid - RGB per cell, indexed [cx, cy] (same layout as pygame.surfarray)
+        self.cells = np.zeros((CELLS_X, CELLS_Y, 3), dtype=np.uint8)
         
         # View transformation
         self.view_x = 0
@@ -226,7 +259,7 @@ class WorldMapGenerator:
 
     def set_cell(self, cx, cy, color):
         if 0 <= cx < CELLS_X and 0 <= cy < CELLS_Y:
-            self.cells[cx][cy] = color
+            self.cells[cx, cy] = color
 
     def paint_rect(self, cx, cy, width, height, color):
         for dx in range(width):
@@ -489,23 +522,31 @@ class WorldMapGenerator:
         
         # Check if pond center is in swamp
         center_x, center_y = (min_x + max_x) // 2, (min_y + max_y) // 2
-        biome = self.biome_map.get((center_x // BIOME_GRID, center_y // BIOME_GRID), Biome.PLAINS)
+        biome = self.get_biome(center_x, center_y)
         is_swamp = biome == Biome.SWAMP
         
-        for wy in range(int(min_y), int(max_y) + 1):
-            for wx in range(int(min_x), int(max_x) + 1):
-                if self.point_in_polygon(wx, wy, wb.points):
-                    cx, cy = self.world_to_cell(wx, wy)
-                    edge = any(not self.point_in_polygon(wx + dwx, wy + dwy, wb.points) for dwx, dwy in [(-3,0),(3,0),(0,-3),(0,3)])
-                    if is_swamp:
-                        self.set_cell(cx, cy, C['swamp_shallow'] if edge else C['swamp_water'])
-                    else:
-                        self.set_cell(cx, cy, C['water_shallow'] if edge else C['water'])
+        # Test the bounding box (plus the 3px edge probe) in one pass
+        x0, y0 = int(min_x) - 3, int(min_y) - 3
+        px = np.arange(x0, int(max_x) + 4)[:, None]
+        py = np.arange(y0, int(max_y) + 4)[None, :]
+        inside = polygon_contains(px, py, wb.points)
+        core = inside[3:-3, 3:-3]
+        edge = core & ~(inside[:-6, 3:-3] & inside[6:, 3:-3] & inside[3:-3, :-6] & inside[3:-3, 6:])
+        
+        wx, wy = np.nonzero(core)
+        cx = (wx + x0 + 3) // CELL_SIZE
+        cy = (wy + y0 + 3) // CELL_SIZE
+        valid = (cx >= 0) & (cx < CELLS_X) & (cy >= 0) & (cy < CELLS_Y)
+        if is_swamp:
+            colors = np.where(edge[wx, wy][:, None], C['swamp_shallow'], C['swamp_water'])
+        else:
+            colors = np.where(edge[wx, wy][:, None], C['water_shallow'], C['water'])
+        self.cells[cx[valid], cy[valid]] = colors[valid]
 
     def paint_tree(self, tx, ty, size):
         cx, cy = self.world_to_cell(tx, ty)
-        biome = self.biome_map.get((tx // BIOME_GRID, ty // BIOME_GRID), Biome.PLAINS)
-        elevation = self.elevation_map.get((tx // BIOME_GRID, ty // BIOME_GRID), 0.0)
+        biome = self.get_biome(tx, ty)
+        elevation = self.get_elevation(tx, ty)
         
         if biome == Biome.SWAMP:
             colors = [C['tree_swamp'], (40, 65, 40), (45, 70, 45)]
@@ -730,21 +771,21 @@ class WorldMapGenerator:
 
     def paint_territory_tint(self):
         """Create a separate territory overlay surface for toggling"""
-        self.territory_surface = pygame.Surface((MAP_WIDTH, MAP_HEIGHT), pygame.SRCALPHA)
         territory_colors = {
             0: (160, 60, 60, 80),    # Red with alpha
             1: (60, 60, 160, 80),    # Blue with alpha
             2: (60, 130, 60, 80)     # Green with alpha
         }
-        cells_per = BIOME_GRID // CELL_SIZE
-        for kid, territory in self.kingdom_territories.items():
-            tint = territory_colors.get(kid, (160, 60, 60, 80))
-            for gx, gy in territory:
-                # Draw a rectangle for each territory cell
-                rect_x = gx * BIOME_GRID
-                rect_y = gy * BIOME_GRID
-                pygame.draw.rect(self.territory_surface, tint, 
-                               (rect_x, rect_y, BIOME_GRID, BIOME_GRID))
+        # Build the overlay at biome-grid resolution, then scale up once
+        rgba = np.zeros((GRID_X, GRID_Y, 4), dtype=np.uint8)
+        for kid in self.kingdom_territories:
+            rgba[self.territory_map == kid] = territory_colors.get(kid, (160, 60, 60, 80))
+        
+        grid_surface = pygame.Surface((GRID_X, GRID_Y), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(grid_surface)[:] = rgba[:, :, :3]
+        pygame.surfarray.pixels_alpha(grid_surface)[:] = rgba[:, :, 3]
+        self.territory_surface = pygame.Surface((MAP_WIDTH, MAP_HEIGHT), pygame.SRCALPHA)
+        self.territory_surface.blit(pygame.transform.scale(grid_surface, (GRID_X * BIOME_GRID, GRID_Y * BIOME_GRID)), (0, 0))
 
     # ─── GENERATION ───────────────────────────────────────────────────────────
 
@@ -773,15 +814,18 @@ class WorldMapGenerator:
         self.water_bodies.clear()
         self.bridges.clear()
         self.trees.clear()
-        self.biome_map.clear()
-        self.elevation_map.clear()
-        self.rocky_map.clear()
+        self.biome_map.fill(0)
+        self.elevation_map.fill(0.0)
+        self.rocky_map.fill(0.0)
+        self.territory_map.fill(-1)
+        self.water_mask.fill(False)
         self.kingdom_territories.clear()
-        self.cells = [[None for _ in range(CELLS_Y)] for _ in range(CELLS_X)]
+        self.cells.fill(0)
         self.map_surface = None
         self.territory_surface = None
         self.view_x, self.view_y, self.view_scale = 0, 0, 1.0
         random.seed(self.current_seed)
+        np.random.seed(self.current_seed & 0xFFFFFFFF)
         
         self.generate_biomes()
         self.generate_elevation()
@@ -837,56 +881,59 @@ class WorldMapGenerator:
 
     def paint_biomes(self):
         cells_per = BIOME_GRID // CELL_SIZE
-        
-        for (gx, gy), biome in self.biome_map.items():
-            base = self.biome_colors[biome]
-            elevation = self.elevation_map.get((gx, gy), 0.0)
-            rockiness = self.rocky_map.get((gx, gy), 0.0)
-            
-            # Use distinct rocky floor for high rockiness
-            if rockiness > 0.35:
-                # Rocky terrain - use rocky colors
-                rocky_strength = min(1.0, (rockiness - 0.35) * 2)
-                rocky_base = C['rocky']
-                base = (
-                    int(base[0] * (1 - rocky_strength) + rocky_base[0] * rocky_strength),
-                    int(base[1] * (1 - rocky_strength) + rocky_base[1] * rocky_strength),
-                    int(base[2] * (1 - rocky_strength) + rocky_base[2] * rocky_strength),
-                )
-            
-            # Apply mountain tint on top for high elevation
-            if elevation > 0.3:
-                tint_strength = min(0.6, (elevation - 0.3) * 1.0)
-                mt = self.mountain_tint
-                base = (
-                    int(base[0] * (1 - tint_strength) + mt[0] * tint_strength),
-                    int(base[1] * (1 - tint_strength) + mt[1] * tint_strength),
-                    int(base[2] * (1 - tint_strength) + mt[2] * tint_strength),
-                )
-            
-            neighbors = {(dx, dy): self.biome_colors[self.biome_map[(gx+dx, gy+dy)]]
-                        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)] if (gx+dx, gy+dy) in self.biome_map and self.biome_map[(gx+dx, gy+dy)] != biome}
-            for sub_x in range(cells_per):
-                for sub_y in range(cells_per):
-                    r, g, b = base
-                    for (dx, dy), nc in neighbors.items():
-                        blend = 3
-                        if (dx == -1 and sub_x < blend) or (dx == 1 and sub_x >= cells_per - blend) or \
-                           (dy == -1 and sub_y < blend) or (dy == 1 and sub_y >= cells_per - blend):
-                            t = 0.5 * ((blend - sub_x if dx == -1 else sub_x - cells_per + blend + 1 if dx == 1 else blend - sub_y if dy == -1 else sub_y - cells_per + blend + 1) / blend)
-                            r, g, b = int(r*(1-t)+nc[0]*t), int(g*(1-t)+nc[1]*t), int(b*(1-t)+nc[2]*t)
-                    noise = random.randint(-12, 12)
-                    # Add extra noise variation for mountainous or rocky areas
-                    if elevation > 0.3 or rockiness > 0.35:
-                        noise += random.randint(-12, 12)
-                        # Add rocky texture with light/dark variation
-                        if random.random() < 0.15:
-                            rocky_var = random.choice([C['rocky_dark'], C['rocky_light']])
-                            r = int(r * 0.7 + rocky_var[0] * 0.3)
-                            g = int(g * 0.7 + rocky_var[1] * 0.3)
-                            b = int(b * 0.7 + rocky_var[2] * 0.3)
-                    self.set_cell(gx * cells_per + sub_x, gy * cells_per + sub_y,
-                        (max(0,min(255,r+noise)), max(0,min(255,g+noise+random.randint(-4,4))), max(0,min(255,b+noise+random.randint(-4,4)))))
+        blend = 3
+        palette = np.array([self.biome_colors[b] for b in BIOME_ORDER], dtype=float)
+        elevation, rockiness = self.elevation_map, self.rocky_map
+        
+        base = palette[self.biome_map]
+        
+        # Use distinct rocky floor for high rockiness
+        rocky_strength = np.where(rockiness > 0.35, np.minimum(1.0, (rockiness - 0.35) * 2), 0.0)[..., None]
+        base = np.floor(base * (1 - rocky_strength) + np.array(C['rocky']) * rocky_strength)
+        
+        # Apply mountain tint on top for high elevation
+        tint_strength = np.where(elevation > 0.3, np.minimum(0.6, elevation - 0.3), 0.0)[..., None]
+        base = np.floor(base * (1 - tint_strength) + np.array(self.mountain_tint) * tint_strength)
+        
+        # Expand to cell resolution
+        def expand(a):
+            return np.repeat(np.repeat(a, cells_per, axis=0), cells_per, axis=1)
+        rgb = expand(base)
+        
+        # Blend toward differing neighbour biomes along the shared edge
+        sub = np.arange(cells_per)
+        ramps = {
+            -1: np.where(sub < blend, 0.5 * (blend - sub) / blend, 0.0),
+            1: np.where(sub >= cells_per - blend, 0.5 * (sub - cells_per + blend + 1) / blend, 0.0),
+        }
+        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
+            neighbour = np.full_like(self.biome_map, -1)
+            src_x = slice(max(0, dx), GRID_X + min(0, dx))
+            src_y = slice(max(0, dy), GRID_Y + min(0, dy))
+            dst_x = slice(max(0, -dx), GRID_X + min(0, -dx))
+            dst_y = slice(max(0, -dy), GRID_Y + min(0, -dy))
+            neighbour[dst_x, dst_y] = self.biome_map[src_x, src_y]
+            differs = (neighbour >= 0) & (neighbour != self.biome_map)
+            ramp = ramps[dx or dy]
+            ramp = np.tile(ramp, GRID_X)[:, None] if dx else np.tile(ramp, GRID_Y)[None, :]
+            t = (expand(differs.astype(float)) * ramp)[..., None]
+            nc = expand(palette[np.maximum(neighbour, 0)])
+            rgb = np.where(t > 0, np.floor(rgb * (1 - t) + nc * t), rgb)
+        
+        shape = rgb.shape[:2]
+        noise = np.random.randint(-12, 13, shape)
+        # Add extra noise variation and rocky texture for mountainous or rocky areas
+        rough = expand((elevation > 0.3) | (rockiness > 0.35))
+        noise += np.where(rough, np.random.randint(-12, 13, shape), 0)
+        speckle = rough & (np.random.random(shape) < 0.15)
+        rocky_var = np.where((np.random.random(shape) < 0.5)[..., None], C['rocky_dark'], C['rocky_light'])
+        rgb = np.where(speckle[..., None], np.floor(rgb * 0.7 + rocky_var * 0.3), rgb)
+        
+        rgb[..., 0] += noise
+        rgb[..., 1] += noise + np.random.randint(-4, 5, shape)
+        rgb[..., 2] += noise + np.random.randint(-4, 5, shape)
+        w, h = min(CELLS_X, shape[0]), min(CELLS_Y, shape[1])
+        self.cells[:w, :h] = np.clip(rgb[:w, :h], 0, 255).astype(np.uint8)
 
     def generate_biomes(self):
         # =========================================================================
@@ -907,14 +954,18 @@ class WorldMapGenerator:
                 biome = Biome.SWAMP
             seeds.append((x, y, biome))
         
-        # Assign biomes based on nearest seed
-        for gx in range(0, MAP_WIDTH, BIOME_GRID):
-            for gy in range(0, MAP_HEIGHT, BIOME_GRID):
-                self.biome_map[(gx // BIOME_GRID, gy // BIOME_GRID)] = min(seeds, key=lambda s: math.sqrt((gx-s[0])**2+(gy-s[1])**2)+random.uniform(-30,30))[2]
+        # Assign biomes based on nearest seed (with jitter), all grid cells at once
+        gx = (np.arange(GRID_X) * BIOME_GRID)[:, None, None]
+        gy = (np.arange(GRID_Y) * BIOME_GRID)[None, :, None]
+        sx = np.array([s[0] for s in seeds])
+        sy = np.array([s[1] for s in seeds])
+        score = np.sqrt((gx - sx) ** 2 + (gy - sy) ** 2) + np.random.uniform(-30, 30, (GRID_X, GRID_Y, len(seeds)))
+        codes = np.array([BIOME_ORDER.index(s[2]) for s in seeds], dtype=np.int8)
+        self.biome_map[:] = codes[np.argmin(score, axis=2)]
         
         # Count forest coverage
-        total_cells = len(self.biome_map)
-        forest_cells = sum(1 for b in self.biome_map.values() if b == Biome.FOREST)
+        total_cells = self.biome_map.size
+        forest_cells = int(np.sum(self.biome_map == FOREST_CODE))
         forest_percent = forest_cells / total_cells if total_cells > 0 else 0
         
         # If forest is below 40%, convert some plains/swamp to forest
@@ -923,20 +974,20 @@ class WorldMapGenerator:
             cells_to_convert = target_forest - forest_cells
             
             # Find non-forest cells adjacent to forest (natural expansion)
-            non_forest = [(k, v) for k, v in self.biome_map.items() if v != Biome.FOREST]
+            non_forest = [(int(gx), int(gy)) for gx, gy in np.argwhere(self.biome_map != FOREST_CODE)]
             random.shuffle(non_forest)
             
             converted = 0
-            for (gx, gy), biome in non_forest:
+            for gx, gy in non_forest:
                 if converted >= cells_to_convert:
                     break
                 # Check if adjacent to forest
                 adjacent_forest = any(
-                    self.biome_map.get((gx + dx, gy + dy)) == Biome.FOREST
+                    0 <= gx + dx < GRID_X and 0 <= gy + dy < GRID_Y and self.biome_map[gx + dx, gy + dy] == FOREST_CODE
                     for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]
                 )
                 if adjacent_forest or random.random() < 0.3:  # Convert adjacent or 30% random
-                    self.biome_map[(gx, gy)] = Biome.FOREST
+                    self.biome_map[gx, gy] = FOREST_CODE
                     converted += 1
     
     def generate_elevation(self):
@@ -965,63 +1016,57 @@ class WorldMapGenerator:
             width = random.uniform(40, 90)
             rocky_streaks.append((x1, y1, x2, y2, width))
         
-        def dist_to_line(px, py, x1, y1, x2, y2):
-            """Distance from point to line segment"""
-            dx, dy = x2 - x1, y2 - y1
-            if dx == 0 and dy == 0:
-                return math.sqrt((px - x1)**2 + (py - y1)**2)
-            t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-            proj_x = x1 + t * dx
-            proj_y = y1 + t * dy
-            return math.sqrt((px - proj_x)**2 + (py - proj_y)**2)
-        
-        # Generate elevation and rockiness for each grid cell
-        for gx in range(MAP_WIDTH // BIOME_GRID):
-            for gy in range(MAP_HEIGHT // BIOME_GRID):
-                wx, wy = gx * BIOME_GRID + BIOME_GRID // 2, gy * BIOME_GRID + BIOME_GRID // 2
-                
-                # Swamps are always low elevation, not rocky
-                biome = self.biome_map.get((gx, gy), Biome.PLAINS)
-                if biome == Biome.SWAMP:
-                    self.elevation_map[(gx, gy)] = 0.0
-                    self.rocky_map[(gx, gy)] = 0.0
-                    continue
-                
-                # Calculate elevation based on distance to mountain ranges
-                max_elevation = 0.0
-                for x1, y1, x2, y2, width in mountain_ranges:
-                    dist = dist_to_line(wx, wy, x1, y1, x2, y2)
-                    if dist < width:
-                        elevation = 1.0 - (dist / width)
-                        elevation = elevation ** 0.6  # Make ridges sharper
-                        max_elevation = max(max_elevation, elevation)
-                
-                self.elevation_map[(gx, gy)] = max_elevation
-                
-                # Calculate rockiness - from rocky streaks AND from mountains
-                max_rocky = 0.0
-                # Mountains are also rocky
-                if max_elevation > 0.25:
-                    max_rocky = max_elevation * 0.9
-                
-                # Rocky streaks
-                for x1, y1, x2, y2, width in rocky_streaks:
-                    dist = dist_to_line(wx, wy, x1, y1, x2, y2)
-                    if dist < width:
-                        rocky = (1.0 - (dist / width)) * 0.7
-                        max_rocky = max(max_rocky, rocky)
-                
-                self.rocky_map[(gx, gy)] = max_rocky
+        # Evaluate every grid cell center at once
+        wx = (np.arange(GRID_X) * BIOME_GRID + BIOME_GRID // 2)[:, None]
+        wy = (np.arange(GRID_Y) * BIOME_GRID + BIOME_GRID // 2)[None, :]
+        
+        # Calculate elevation based on distance to mountain ranges
+        elevation = np.zeros((GRID_X, GRID_Y))
+        for x1, y1, x2, y2, width in mountain_ranges:
+            dist = segment_distance(wx, wy, x1, y1, x2, y2)
+            ridge = np.clip(1.0 - dist / width, 0.0, None) ** 0.6  # Make ridges sharper
+            elevation = np.maximum(elevation, np.where(dist < width, ridge, 0.0))
+        
+        # Calculate rockiness - mountains are also rocky, plus rocky streaks
+        rocky = np.where(elevation > 0.25, elevation * 0.9, 0.0)
+        for x1, y1, x2, y2, width in rocky_streaks:
+            dist = segment_distance(wx, wy, x1, y1, x2, y2)
+            rocky = np.maximum(rocky, np.where(dist < width, (1.0 - dist / width) * 0.7, 0.0))
+        
+        # Swamps are always low elevation, not rocky
+        swamp = self.biome_map == SWAMP_CODE
+        elevation[swamp] = 0.0
+        rocky[swamp] = 0.0
+        
+        self.elevation_map[:] = elevation
+        self.rocky_map[:] = rocky
     
+    def _grid_index(self, x, y):
+        """Biome-grid index for a world position, or None when off the map"""
+        gx, gy = int(x // BIOME_GRID), int(y // BIOME_GRID)
+        if 0 <= gx < GRID_X and 0 <= gy < GRID_Y:
+            return gx, gy
+        return None
+
+    def get_biome(self, x, y, default=Biome.PLAINS):
+        idx = self._grid_index(x, y)
+        return BIOME_ORDER[self.biome_map[idx]] if idx else default
+
+    def get_elevation(self, x, y):
+        idx = self._grid_index(x, y)
+        return float(self.elevation_map[idx]) if idx else 0.0
+
+    def get_rockiness(self, x, y):
+        idx = self._grid_index(x, y)
+        return float(self.rocky_map[idx]) if idx else 0.0
+
     def is_mountainous(self, x, y, threshold=0.4):
         """Check if a position is mountainous (high elevation)"""
-        gx, gy = x // BIOME_GRID, y // BIOME_GRID
-        return self.elevation_map.get((gx, gy), 0.0) >= threshold
+        return self.get_elevation(x, y) >= threshold
     
     def is_rocky(self, x, y, threshold=0.3):
         """Check if a position is rocky"""
-        gx, gy = x // BIOME_GRID, y // BIOME_GRID
-        return self.rocky_map.get((gx, gy), 0.0) >= threshold
+        return self.get_rockiness(x, y) >= threshold
 
     def generate_water(self):
         # Main rivers
@@ -1060,7 +1105,7 @@ class WorldMapGenerator:
             self.water_bodies.append(WaterBody(pts + [pts[0]], False, 0))
         
         # Swamp pools - find swamp areas and add small pools
-        swamp_cells = [(gx, gy) for (gx, gy), biome in self.biome_map.items() if biome == Biome.SWAMP]
+        swamp_cells = [(int(gx), int(gy)) for gx, gy in np.argwhere(self.biome_map == SWAMP_CODE)]
         num_swamp_pools = min(len(swamp_cells) // 3, random.randint(5, 12))
         for _ in range(num_swamp_pools):
             if not swamp_cells:
@@ -1072,6 +1117,46 @@ class WorldMapGenerator:
             n = random.randint(6, 10)
             pts = [(cx+int(math.cos(2*math.pi*i/n)*(r+random.randint(-8,8))), cy+int(math.sin(2*math.pi*i/n)*(r+random.randint(-8,8)))) for i in range(n)]
             self.water_bodies.append(WaterBody(pts + [pts[0]], False, 0))
+        
+        self.rasterize_water()
+
+    def rasterize_water(self):
+        """Rasterize all water bodies into water_mask once, so is_in_water is a lookup.
+        
+        Uses the same tests as the analytic check: rivers cover points closer
+        than width + 5 to any segment, ponds use the even-odd polygon rule.
+        Only each segment's / polygon's bounding box is evaluated.
+        """
+        self.water_mask.fill(False)
+        
+        def window(xs, ys, reach):
+            x0 = max(0, int(math.floor(min(xs) - reach)))
+            x1 = min(MAP_WIDTH, int(math.ceil(max(xs) + reach)) + 1)
+            y0 = max(0, int(math.floor(min(ys) - reach)))
+            y1 = min(MAP_HEIGHT, int(math.ceil(max(ys) + reach)) + 1)
+            if x0 >= x1 or y0 >= y1:
+                return None
+            return x0, x1, y0, y1
+        
+        for wb in self.water_bodies:
+            if wb.is_river:
+                reach = wb.width + 5
+                for (x1, y1), (x2, y2) in zip(wb.points, wb.points[1:]):
+                    box = window((x1, x2), (y1, y2), reach)
+                    if box is None:
+                        continue
+                    bx0, bx1, by0, by1 = box
+                    px = np.arange(bx0, bx1)[:, None]
+                    py = np.arange(by0, by1)[None, :]
+                    self.water_mask[bx0:bx1, by0:by1] |= segment_distance(px, py, x1, y1, x2, y2) < reach
+            else:
+                box = window([p[0] for p in wb.points], [p[1] for p in wb.points], 0)
+                if box is None:
+                    continue
+                bx0, bx1, by0, by1 = box
+                px = np.arange(bx0, bx1)[:, None]
+                py = np.arange(by0, by1)[None, :]
+                self.water_mask[bx0:bx1, by0:by1] |= polygon_contains(px, py, wb.points)
 
     def generate_kingdoms(self):
         # =========================================================================
@@ -1102,7 +1187,7 @@ class WorldMapGenerator:
             # Find valid position not in water, mountains, or swamp
             x, y = int(rx + random.randint(-80, 80)), int(ry + random.randint(-80, 80))
             for _ in range(50):
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if not self.is_in_water(x, y) and biome != Biome.SWAMP and not self.is_mountainous(x, y):
                     break
                 x, y = int(rx + random.randint(-150, 150)), int(ry + random.randint(-120, 120))
@@ -1138,7 +1223,7 @@ class WorldMapGenerator:
                     
                     if self.is_in_water(hx, hy):
                         continue
-                    biome = self.biome_map.get((hx // BIOME_GRID, hy // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(hx, hy)
                     if biome == Biome.SWAMP:
                         continue
                     if not all(math.sqrt((hx-l.x)**2+(hy-l.y)**2) >= 16 for l in self.locations):
@@ -1172,7 +1257,7 @@ class WorldMapGenerator:
                     
                     if self.is_in_water(hx, hy):
                         continue
-                    biome = self.biome_map.get((hx // BIOME_GRID, hy // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(hx, hy)
                     if biome == Biome.SWAMP:
                         continue
                     if not all(math.sqrt((hx-l.x)**2+(hy-l.y)**2) >= 16 for l in self.locations):
@@ -1203,7 +1288,7 @@ class WorldMapGenerator:
                     
                     if self.is_in_water(hx, hy):
                         continue
-                    biome = self.biome_map.get((hx // BIOME_GRID, hy // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(hx, hy)
                     if biome == Biome.SWAMP:
                         continue
                     if not all(math.sqrt((hx-l.x)**2+(hy-l.y)**2) >= 16 for l in self.locations):
@@ -1247,7 +1332,7 @@ class WorldMapGenerator:
                     if self.is_in_water(fx, fy):
                         continue
                     
-                    biome = self.biome_map.get((fx // BIOME_GRID, fy // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(fx, fy)
                     if biome == Biome.SWAMP:
                         continue
                     
@@ -1291,16 +1376,18 @@ class WorldMapGenerator:
                     continue
                 if nx < 0 or nx >= MAP_WIDTH//BIOME_GRID or ny < 0 or ny >= MAP_HEIGHT//BIOME_GRID:
                     continue
-                if any((nx,ny) in t for t in self.kingdom_territories.values()):
+                if self.territory_map[nx, ny] >= 0:
                     continue
                 # Don't expand into mountainous areas
-                elevation = self.elevation_map.get((nx, ny), 0.0)
+                elevation = self.elevation_map[nx, ny]
                 if elevation > 0.5:
                     continue
                 if random.random() < max(0.1, 1 - math.sqrt((nx-kingdom.x//BIOME_GRID)**2+(ny-kingdom.y//BIOME_GRID)**2)/40):
                     territory.add((nx, ny))
                     frontier.append((nx, ny))
         self.kingdom_territories[kid] = territory
+        gxs, gys = zip(*territory)
+        self.territory_map[list(gxs), list(gys)] = kid
 
     def generate_villages(self):
         # =========================================================================
@@ -1349,7 +1436,7 @@ class WorldMapGenerator:
                     x = max(150, min(MAP_WIDTH - 150, x))
                     y = max(150, min(MAP_HEIGHT - 150, y))
                     
-                    biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(x, y)
                     if biome == Biome.SWAMP:
                         continue
                     if self.is_in_water(x, y):
@@ -1402,7 +1489,7 @@ class WorldMapGenerator:
             
             for attempt in range(350):
                 x, y = random.randint(150, MAP_WIDTH-150), random.randint(150, MAP_HEIGHT-150)
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if biome == Biome.SWAMP:
                     continue
                 if self.is_in_water(x, y):
@@ -1496,7 +1583,7 @@ class WorldMapGenerator:
                 # Validate position
                 if self.is_in_water(hx, hy):
                     continue
-                biome = self.biome_map.get((hx // BIOME_GRID, hy // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(hx, hy)
                 if biome == Biome.SWAMP:
                     continue
                 # Check no overlap with existing locations
@@ -1528,7 +1615,7 @@ class WorldMapGenerator:
                     if self.is_in_water(fx, fy):
                         continue
                     
-                    biome = self.biome_map.get((fx // BIOME_GRID, fy // BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(fx, fy)
                     if biome == Biome.SWAMP:
                         continue
                     
@@ -1576,7 +1663,7 @@ class WorldMapGenerator:
                 # Must not be in water or swamp
                 if self.is_in_water(x, y):
                     continue
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if biome == Biome.SWAMP:
                     continue
                 # Encampments should NOT be on roads - they're hidden camps
@@ -1601,7 +1688,7 @@ class WorldMapGenerator:
             if random.random() < 0.25:
                 a, d = random.uniform(0, 2*math.pi), random.randint(50, 80)
                 fx, fy = x + int(math.cos(a)*d), y + int(math.sin(a)*d)
-                biome = self.biome_map.get((fx // BIOME_GRID, fy // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(fx, fy)
                 if not self.is_in_water(fx, fy) and biome != Biome.SWAMP and not self.is_mountainous(fx, fy):
                     f = Location(fx, fy, LocationType.FARM, f"{e.name} Farm", e.kingdom_id, size=15)
                     e.farms.append(f)
@@ -1638,7 +1725,7 @@ class WorldMapGenerator:
                     elif is_rocky_area:
                         terrain_bonus = 1.5
                     
-                    biome = self.biome_map.get((x//BIOME_GRID, y//BIOME_GRID), Biome.PLAINS)
+                    biome = self.get_biome(x, y)
                     if lt == LocationType.CAVE and biome == Biome.FOREST:
                         terrain_bonus = max(terrain_bonus, 1.3)
                     
@@ -1935,7 +2022,7 @@ class WorldMapGenerator:
             if not self.is_valid_position(x, y, 100):  # More spread out
                 continue
             
-            biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+            biome = self.get_biome(x, y)
             if biome == Biome.SWAMP:
                 continue
                 
@@ -1961,7 +2048,7 @@ class WorldMapGenerator:
                 if self.is_in_water(x, y):
                     continue
                     
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if biome == Biome.SWAMP:
                     continue
                     
@@ -1972,7 +2059,7 @@ class WorldMapGenerator:
                     if random.random() < 0.3:
                         a, d = random.uniform(0, 2 * math.pi), random.randint(35, 55)
                         fx, fy = x + int(math.cos(a) * d), y + int(math.sin(a) * d)
-                        farm_biome = self.biome_map.get((fx // BIOME_GRID, fy // BIOME_GRID), Biome.PLAINS)
+                        farm_biome = self.get_biome(fx, fy)
                         if not self.is_in_water(fx, fy) and farm_biome != Biome.SWAMP and not self.is_mountainous(fx, fy) and not self.is_rocky(fx, fy):
                             f = Location(fx, fy, LocationType.FARM, "Homestead Farm", size=15)
                             h.farms.append(f)
@@ -1995,7 +2082,7 @@ class WorldMapGenerator:
                 if self.is_in_water(x, y):
                     continue
                 
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if biome == Biome.SWAMP:
                     continue
                 
@@ -2020,7 +2107,7 @@ class WorldMapGenerator:
                 if self.is_in_water(x, y):
                     continue
                 
-                biome = self.biome_map.get((x // BIOME_GRID, y // BIOME_GRID), Biome.PLAINS)
+                biome = self.get_biome(x, y)
                 if biome == Biome.SWAMP:
                     continue
                 if self.is_mountainous(x, y) or self.is_rocky(x, y):
@@ -2042,9 +2129,9 @@ class WorldMapGenerator:
         
         for gx in range(0, MAP_WIDTH, BIOME_GRID):
             for gy in range(0, MAP_HEIGHT, BIOME_GRID):
-                biome = self.biome_map.get((gx // BIOME_GRID, gy // BIOME_GRID), Biome.PLAINS)
-                elevation = self.elevation_map.get((gx // BIOME_GRID, gy // BIOME_GRID), 0.0)
-                rockiness = self.rocky_map.get((gx // BIOME_GRID, gy // BIOME_GRID), 0.0)
+                biome = self.get_biome(gx, gy)
+                elevation = self.get_elevation(gx, gy)
+                rockiness = self.get_rockiness(gx, gy)
                 
                 if self.is_in_water(gx + BIOME_GRID//2, gy + BIOME_GRID//2): continue
                 
@@ -2093,6 +2180,9 @@ class WorldMapGenerator:
     # ─── HELPERS ──────────────────────────────────────────────────────────────
 
     def is_in_water(self, x, y):
+        # Integer positions on the map come straight from the water raster
+        if x == int(x) and y == int(y) and 0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT:
+            return bool(self.water_mask[int(x), int(y)])
         for wb in self.water_bodies:
             if wb.is_river:
                 for i in range(len(wb.points) - 1):
@@ -2119,10 +2209,10 @@ class WorldMapGenerator:
         return True
 
     def get_kingdom_at(self, x, y):
-        gx, gy = x // BIOME_GRID, y // BIOME_GRID
-        for kid, t in self.kingdom_territories.items():
-            if (gx, gy) in t: return kid
-        return None
+        idx = self._grid_index(x, y)
+        if idx is None or self.territory_map[idx] < 0:
+            return None
+        return int(self.territory_map[idx])
 
     def point_to_segment_dist(self, px, py, x1, y1, x2, y2):
         dx, dy = x2 - x1, y2 - y1
@@ -2138,14 +2228,60 @@ class WorldMapGenerator:
             j = i
         return inside
 
+    # ─── EXPORT ───────────────────────────────────────────────────────────────
+
+    def to_plan(self):
+        """World plan for the game's chunk streamer (scenario/world_chunks.py).
+        
+        One biome-grid cell becomes one game chunk. Grids are row-major [gy][gx].
+        """
+        water = self.water_mask.reshape(GRID_X, BIOME_GRID, GRID_Y, BIOME_GRID).mean(axis=(1, 3))
+        
+        settlements = []
+        for loc in self.locations:
+            if loc.loc_type == LocationType.KINGDOM:
+                houses = sum(1 for l in self.locations
+                             if l.loc_type == LocationType.KINGDOM_HOUSE and l.kingdom_id == loc.kingdom_id)
+            elif loc.loc_type == LocationType.VILLAGE:
+                houses = sum(1 for l in self.locations
+                             if l.loc_type == LocationType.VILLAGE_HOUSE and l.name == f"{loc.name} House")
+            elif loc.loc_type == LocationType.ENCAMPMENT:
+                houses = 0
+            else:
+                continue
+            gx, gy = self._grid_index(loc.x, loc.y) or (0, 0)
+            settlements.append({
+                "name": loc.name,
+                "type": loc.loc_type.value,
+                "cell": [gx, gy],
+                "kingdom": self.kingdom_names[loc.kingdom_id] if loc.kingdom_id is not None else None,
+                "houses": houses,
+                "farms": len(loc.farms),
+            })
+        
+        return {
+            "seed": self.current_seed,
+            "chunks_x": GRID_X,
+            "chunks_y": GRID_Y,
+            "cell_pixels": BIOME_GRID,
+            "biomes": [[BIOME_ORDER[self.biome_map[gx, gy]].value for gx in range(GRID_X)] for gy in range(GRID_Y)],
+            "water": [[round(float(water[gx, gy]), 3) for gx in range(GRID_X)] for gy in range(GRID_Y)],
+            "settlements": settlements,
+            "roads": [[[int(x), int(y)] for x, y in r.points] for r in self.roads],
+        }
+
+    def export_plan(self, path="world_plan.json"):
+        with open(path, 'w') as f:
+            json.dump(self.to_plan(), f)
+        print(f"World plan saved to: {path}")
+
     # ─── RENDERING ────────────────────────────────────────────────────────────
 
     def render_map_surface(self):
-        self.map_surface = pygame.Surface((MAP_WIDTH, MAP_HEIGHT))
-        for cx in range(CELLS_X):
-            for cy in range(CELLS_Y):
-                if self.cells[cx][cy]:
-                    pygame.draw.rect(self.map_surface, self.cells[cx][cy], (cx * CELL_SIZE, cy * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        # One blit of the whole cell array, then a nearest-neighbour upscale
+        cell_surface = pygame.Surface((CELLS_X, CELLS_Y))
+        pygame.surfarray.blit_array(cell_surface, self.cells)
+        self.map_surface = pygame.transform.scale(cell_surface, (CELLS_X * CELL_SIZE, CELLS_Y * CELL_SIZE))
 
     def draw(self):
         self.screen.fill((26, 26, 46))
@@ -2227,6 +2363,8 @@ class WorldMapGenerator:
                 if event.key == pygame.K_RETURN: self.generate_with_seed(); self.seed_input_active = False
                 elif event.key == pygame.K_BACKSPACE: self.seed_text = self.seed_text[:-1]
                 elif event.unicode.isprintable(): self.seed_text += event.unicode
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_e:
+                self.export_plan()
         return True
 
     def zoom_at(self, pos, factor):
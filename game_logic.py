@@ -9,16 +9,18 @@ import random
 import math
 import time
 from collections import deque
+import numpy as np
 from constants import (
     DIRECTIONS, ITEMS, FISTS,
     MAX_HUNGER, HUNGER_DECAY, HUNGER_CRITICAL, HUNGER_CHANCE_THRESHOLD,
     STARVATION_THRESHOLD, STARVATION_DAMAGE, STARVATION_MORALITY_INTERVAL,
     STARVATION_MORALITY_CHANCE, STARVATION_FREEZE_HEALTH,
+    MAX_STAMINA, STAMINA_DRAIN_PER_TICK, STAMINA_REGEN_PER_TICK, STAMINA_REGEN_DELAY_TICKS,
     INVENTORY_SLOTS,
     FARM_CELL_YIELD,
     FARM_CELL_HARVEST_INTERVAL, FARM_HARVEST_TIME, FARM_REPLANT_TIME,
     TRADE_COOLDOWN,
-    STEWARD_TAX_INTERVAL, STEWARD_TAX_AMOUNT, SOLDIER_WHEAT_PAYMENT, TAX_GRACE_PERIOD,
+    STEWARD_TAX_INTERVAL, STEWARD_TAX_AMOUNT, SOLDIER_WHEAT_PAYMENT,
     ALLEGIANCE_WHEAT_TIMEOUT, TICKS_PER_DAY, TICKS_PER_YEAR,
     CRIME_INTENSITY_MURDER, CRIME_INTENSITY_ASSAULT, CRIME_INTENSITY_THEFT,
     THEFT_PATIENCE_TICKS, THEFT_COOLDOWN_TICKS,
@@ -31,7 +33,6 @@ from constants import (
     DIRECTION_TO_FACINGS, OPPOSITE_DIRECTIONS,
     IDLE_SPEED_MULTIPLIER, IDLE_MIN_WAIT_TICKS, IDLE_MAX_WAIT_TICKS,
     IDLE_PAUSE_CHANCE, IDLE_PAUSE_MIN_TICKS, IDLE_PAUSE_MAX_TICKS,
-    SQUEEZE_THRESHOLD_TICKS, SQUEEZE_SLIDE_SPEED,
     ATTACK_ANIMATION_DURATION, ATTACK_CONE_ANGLE, ATTACK_CONE_BASE_ANGLE,
     WHEAT_TO_BREAD_RATIO,
     BREAD_PER_BITE, BREAD_BUFFER_TARGET,
@@ -44,6 +45,8 @@ from scenario.scenario_world import SIZE
 from scenario.scenario_characters import CHARACTER_TEMPLATES
 from jobs import get_job
 from world_objects import find_valid_drop_position
+from profiler import get_profiler
+from local_avoidance import Agent, build_grid, compute_velocities, bumps_neighbour
 
 
 class GameLogic:
@@ -76,30 +79,48 @@ class GameLogic:
 
     def process_tick(self):
         """Process one game tick - updates all game state"""
+        profile = get_profiler().scope
         self.state.ticks += 1
         
+        # Stream world chunks around the player (no-op without a world plan)
+        if self.state.player:
+            with profile('tick.chunks'):
+                self.state.chunks.update_focus(self.state.player.x, self.state.player.y)
+        
         # Update hunger for all characters
-        for char in self.state.characters:
-            char['hunger'] = max(0, char['hunger'] - HUNGER_DECAY)
+        with profile('tick.hunger'):
+            hunger = self.state.vitals.view('hunger')
+            np.maximum(hunger - HUNGER_DECAY, 0, out=hunger)
         
         # Update stamina for all characters (Skyrim-style)
-        self._process_stamina()
+        with profile('tick.stamina'):
+            self._process_stamina()
         
         # Process starvation
-        self._process_starvation()
+        with profile('tick.starvation'):
+            self._process_starvation()
         
         # Update NPC combat mode based on intent
-        self._process_npc_combat_mode()
+        with profile('tick.combat_mode'):
+            self._process_npc_combat_mode()
         
         # Process pending attacks (resolve damage when animation completes)
-        self._process_pending_attacks()
+        with profile('tick.combat_attacks'):
+            self._process_pending_attacks()
         
         # Handle deaths IMMEDIATELY - remove from game logic, store visual info separately
         # This must happen right after starvation before any other processing
-        self._process_deaths()
+        with profile('tick.deaths'):
+            self._process_deaths()
         
         # Update farm cells
-        self._update_farm_cells()
+        with profile('tick.farms'):
+            self._update_farm_cells()
+        
+        # Rot old corpses and fade their markers, then despawn expired ground items
+        with profile('tick.corpses'):
+            self.state.corpses.update(self.state.ticks)
+            self.state.ground_items.update(self.state.ticks)
         
         # Age increment
         if self.state.ticks > 0 and self.state.ticks % TICKS_PER_YEAR == 0:
@@ -108,30 +129,48 @@ class GameLogic:
             self.state.log_action(f"A new year begins! Everyone is one year older.")
         
         # Tax grace period check - steward goes to collect if farmer is late
-        steward = self.state.get_steward()
-        if steward:
-            steward_allegiance = steward.get('allegiance')
-            for char in self.state.characters:
-                if char.get('job') == 'Farmer' and char.get('allegiance') == steward_allegiance:
-                    tax_due_tick = char.get('tax_due_tick')
-                    if tax_due_tick is not None and self.state.ticks >= tax_due_tick + TAX_GRACE_PERIOD:
-                        if steward.get('tax_collection_target') != char:
-                            steward_name = steward.get_display_name()
-                            char_name = char.get_display_name()
-                            self.state.log_action(f"Steward {steward_name} going to collect tax from {char_name}!")
-                            steward['tax_collection_target'] = char
+        # Deadlines sit in per-steward queues, so this is a peek per allegiance
+        # until one actually passes
+        with profile('tick.taxes'):
+            self._process_tax_deadlines()
         
         # Move NPCs with swap detection to prevent oscillation
         self._process_npc_movement()
         
         # Process deaths again to catch combat kills
-        self._process_deaths()
+        with profile('tick.deaths'):
+            self._process_deaths()
+    
+    def _process_tax_deadlines(self):
+        """Send each steward after the longest-overdue farmer once they're free.
+        
+        A steward already collecting from a live farmer keeps going. The
+        farmer being collected from stays at the front of the queue until they
+        pay, so if the steward dies or is replaced first, the next steward is
+        sent after them again.
+        """
+        ticks = self.state.ticks
+        for allegiance in self.state.get_overdue_allegiances(ticks):
+            steward = self.state.get_steward_for_allegiance(allegiance)
+            if steward is None:
+                continue
+            current = steward.tax_collection_target
+            if current is not None and self.state.has_character(current) and current.tax_due_tick is not None:
+                continue
+            char = self.state.peek_overdue_taxpayer(allegiance, ticks)
+            if char is None:
+                continue
+            steward_name = steward.get_display_name()
+            char_name = char.get_display_name()
+            self.state.log_action(f"Steward {steward_name} going to collect tax from {char_name}!")
+            steward['tax_collection_target'] = char
     
     def _process_deaths(self):
         """Remove dead characters from game and create corpse interactables"""
         from world_objects import Corpse
 
-        dead_chars = [char for char in self.state.characters if char['health'] <= 0]
+        vitals = self.state.vitals
+        dead_chars = [vitals.chars[row] for row in np.flatnonzero(vitals.view('health') <= 0)]
         for char in dead_chars:
             # Log death message
             dead_name = char.get_display_name()
@@ -179,94 +218,124 @@ class GameLogic:
                     corpse.set_interior_projection(interior)
 
             # Add corpse to game state
-            self.state.corpses.append(corpse)
+            self.state.add_corpse(corpse)
 
             # Immediately remove character from game - no more processing
             self.state.remove_character(char)
     
     def _process_stamina(self):
-        """Process stamina drain/regeneration for all characters (Skyrim-style)."""
-        current_tick = self.state.ticks
+        """Process stamina drain/regeneration for all characters (Skyrim-style).
         
-        for char in self.state.characters:
-            # Skip dying characters
-            if char.get('health', 100) <= 0:
-                continue
-            
-            if char.is_sprinting:
-                # Drain stamina while sprinting
-                if not char.drain_stamina_sprint(current_tick):
-                    # Stamina depleted - force stop sprinting
-                    char.is_sprinting = False
-                    # Reduce velocity to walking speed
-                    if char.vx != 0 or char.vy != 0:
-                        speed_ratio = MOVEMENT_SPEED / SPRINT_SPEED
-                        char.vx *= speed_ratio
-                        char.vy *= speed_ratio
-            else:
-                # Regenerate stamina when not sprinting
-                char.regenerate_stamina(current_tick)
+        Whole-population array update on state.vitals; only characters that
+        run dry this tick are touched individually (sprint stops, velocity
+        drops to walking speed).
+        """
+        vitals = self.state.vitals
+        current_tick = self.state.ticks
+        stamina = vitals.view('stamina')
+        sprinting = vitals.view('is_sprinting')
+        last_sprint_tick = vitals.view('_last_sprint_tick')
+        
+        # Skip dying characters
+        alive = vitals.view('health') > 0
+        
+        # Drain stamina while sprinting (and remember when, for the regen delay)
+        draining = alive & sprinting
+        stamina[draining] = np.maximum(stamina[draining] - STAMINA_DRAIN_PER_TICK, 0)
+        last_sprint_tick[draining] = current_tick
+        
+        # Stamina depleted - force stop sprinting
+        exhausted = draining & (stamina <= 0)
+        if exhausted.any():
+            vitals.view('_stamina_depleted')[exhausted] = True
+            sprinting[exhausted] = False
+            # Reduce velocity to walking speed
+            speed_ratio = MOVEMENT_SPEED / SPRINT_SPEED
+            for row in np.flatnonzero(exhausted):
+                char = vitals.chars[row]
+                char.vx *= speed_ratio
+                char.vy *= speed_ratio
+        
+        # Regenerate once enough ticks have passed since the last sprint
+        resting = alive & ~draining & (current_tick - last_sprint_tick >= STAMINA_REGEN_DELAY_TICKS)
+        stamina[resting] = np.minimum(stamina[resting] + STAMINA_REGEN_PER_TICK, MAX_STAMINA)
     
     def _process_starvation(self):
-        """Process starvation for all characters"""
-        for char in self.state.characters:
-            # Skip dying characters
-            if char.get('health', 100) <= 0:
-                continue
-            
+        """Process starvation for all characters.
+        
+        Damage, counters and flags are array updates on state.vitals. Per
+        character work is only for threshold crossings: entering starvation
+        (log, soldiers quit), freezing (drop intent) and morality loss rolls.
+        """
+        vitals = self.state.vitals
+        health = vitals.view('health')
+        health_lost = vitals.view('starvation_health_lost')
+        ticks_starving = vitals.view('ticks_starving')
+        is_starving = vitals.view('is_starving')
+        is_frozen = vitals.view('is_frozen')
+        
+        # Skip dying characters
+        alive = health > 0
+        starving = alive & (vitals.view('hunger') <= STARVATION_THRESHOLD)
+        
+        # Not starving anymore
+        recovered = alive & ~starving & is_starving
+        is_starving[recovered] = False
+        is_frozen[recovered] = False
+        health_lost[recovered] = 0
+        ticks_starving[recovered] = 0
+        
+        if not starving.any():
+            return
+        
+        # Just entered starvation
+        entered = starving & ~is_starving
+        is_starving[entered] = True
+        health_lost[entered] = 0
+        ticks_starving[entered] = 0
+        
+        # Apply starvation damage
+        ticks_starving[starving] += 1
+        health[starving] -= STARVATION_DAMAGE
+        health_lost[starving] += STARVATION_DAMAGE
+        
+        # Too weak to move (health <= STARVATION_FREEZE_HEALTH)
+        froze = starving & ~is_frozen & (health <= STARVATION_FREEZE_HEALTH)
+        is_frozen[froze] = True
+        
+        # Morality check every STARVATION_MORALITY_INTERVAL health lost
+        demoralized = starving & (health_lost >= STARVATION_MORALITY_INTERVAL)
+        health_lost[demoralized] -= STARVATION_MORALITY_INTERVAL
+        
+        chars = vitals.chars
+        for row in np.flatnonzero(entered):
+            char = chars[row]
             name = char.get_display_name()
-            
-            # Check if character should enter starvation (hunger = 0)
-            if char['hunger'] <= STARVATION_THRESHOLD:
-                was_starving = char.get('is_starving', False)
-                
-                if not was_starving:
-                    # Just entered starvation
-                    char['is_starving'] = True
-                    char['starvation_health_lost'] = 0
-                    char['ticks_starving'] = 0
-                    self.state.log_action(f"{name} is STARVING! Losing health...")
-                    
-                    # Soldiers quit when they start starving - lose job and home, but keep allegiance
-                    # This gives them a chance to buy wheat from a farmer and rejoin
-                    # If no farmer will sell to them, wheat timeout will naturally remove allegiance
-                    if char.get('job') == 'Soldier':
-                        char['job'] = None
-                        char['home'] = None
-                        # Remove bed ownership
-                        self.state.interactables.unassign_bed_owner(char['name'])
-                        self.state.log_action(f"{name} QUIT being a Soldier due to starvation!")
-                
-                # Increment ticks starving
-                char['ticks_starving'] = char.get('ticks_starving', 0) + 1
-                
-                # Apply starvation damage
-                char['health'] -= STARVATION_DAMAGE
-                char['starvation_health_lost'] += STARVATION_DAMAGE
-                
-                # Check if should freeze (health <= 20)
-                if char['health'] <= STARVATION_FREEZE_HEALTH:
-                    if not char.get('is_frozen', False):
-                        char['is_frozen'] = True
-                        # Clear any intent when freezing
-                        char.clear_intent()
-                        self.state.log_action(f"{name} is too weak to move! (health: {char['health']})")
-                
-                # Check for morality loss every STARVATION_MORALITY_INTERVAL health lost
-                if char['starvation_health_lost'] >= STARVATION_MORALITY_INTERVAL:
-                    char['starvation_health_lost'] -= STARVATION_MORALITY_INTERVAL
-                    if random.random() < STARVATION_MORALITY_CHANCE:
-                        old_morality = char.get('morality', 5)
-                        if old_morality > 1:
-                            char['morality'] = old_morality - 1
-                            self.state.log_action(f"{name}'s morality dropped from {old_morality} to {char['morality']} due to starvation!")
-            else:
-                # Not starving anymore
-                if char.get('is_starving', False):
-                    char['is_starving'] = False
-                    char['is_frozen'] = False
-                    char['starvation_health_lost'] = 0
-                    char['ticks_starving'] = 0
+            self.state.log_action(f"{name} is STARVING! Losing health...")
+            
+            # Soldiers quit when they start starving - lose job and home, but keep allegiance
+            # This gives them a chance to buy wheat from a farmer and rejoin
+            # If no farmer will sell to them, wheat timeout will naturally remove allegiance
+            if char.get('job') == 'Soldier':
+                char['job'] = None
+                char['home'] = None
+                # Remove bed ownership
+                self.state.interactables.unassign_bed_owner(char['name'])
+                self.state.log_action(f"{name} QUIT being a Soldier due to starvation!")
+        
+        for row in np.flatnonzero(froze):
+            char = chars[row]
+            # Clear any intent when freezing
+            char.clear_intent()
+            self.state.log_action(f"{char.get_display_name()} is too weak to move! (health: {char['health']})")
+        
+        for row in np.flatnonzero(demoralized):
+            if random.random() < STARVATION_MORALITY_CHANCE:
+                char = chars[row]
+                old_morality = char.get('morality', 5)
+                if old_morality > 1:
+                    char['morality'] = old_morality - 1
+                    self.state.log_action(f"{char.get_display_name()}'s morality dropped from {old_morality} to {char['morality']} due to starvation!")
     
     # =============================================================================
     # GOAL MANAGEMENT - Setting and clearing character movement goals
@@ -721,7 +790,8 @@ class GameLogic:
 
         # Find targets in attack arc
         targets_hit = []
-        for char in self.state.characters:
+        # Can only attack characters in the same zone (both exterior or same interior)
+        for char in self.state.characters_in_zone(attacker.zone):
             if char is attacker:
                 continue
 
@@ -729,10 +799,6 @@ class GameLogic:
             if char.get('health', 100) <= 0:
                 continue
 
-            # Can only attack characters in the same zone (both exterior or same interior)
-            if char.zone != attacker.zone:
-                continue
-
             # Calculate relative position using prevailing coords (local when in interior)
             # This gives correct distance in interior space
             rel_x = char.prevailing_x - attacker.prevailing_x
@@ -899,7 +965,7 @@ class GameLogic:
         """
         result = {'hit': False, 'damage': 0, 'killed': False}
 
-        if target is None or target not in self.state.characters:
+        if target is None or not self.state.has_character(target):
             return result
 
         if target.get('health', 100) <= 0:
@@ -2894,14 +2960,11 @@ class GameLogic:
         nearest_npc = None
         nearest_dist = float('inf')
 
-        for char in self.state.characters:
+        # Must be in same zone
+        for char in self.state.characters_in_zone(player.zone):
             if char.is_player:
                 continue
 
-            # Must be in same zone
-            if char.zone != player.zone:
-                continue
-
             # Calculate distance using prevailing coords
             dx = char.prevailing_x - player.prevailing_x
             dy = char.prevailing_y - player.prevailing_y
@@ -2928,29 +2991,14 @@ class GameLogic:
         if not character:
             return None
 
-        import math
-        char_zone = character.zone
-
-        for corpse in self.state.corpses:
-            # Must be in same zone
-            if corpse.zone != char_zone:
-                continue
-
-            # Calculate distance using appropriate coordinates
-            if char_zone is not None:
-                # Interior - use prevailing (local) coords
-                dx = character.prevailing_x - (corpse.x + 0.5)
-                dy = character.prevailing_y - (corpse.y + 0.5)
-            else:
-                # Exterior - use world coords
-                dx = character.x - (corpse.x + 0.5)
-                dy = character.y - (corpse.y + 0.5)
-
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist <= max_distance:
-                return corpse
+        # Interior - use prevailing (local) coords, exterior - world coords
+        if character.zone is not None:
+            x, y = character.prevailing_x, character.prevailing_y
+        else:
+            x, y = character.x, character.y
 
-        return None
+        nearby = self.state.corpses.get_corpses_near(x, y, max_distance, character.zone)
+        return nearby[0] if nearby else None
 
     def get_nearby_tree(self, character, max_distance=1.5):
         """
@@ -3535,7 +3583,7 @@ class GameLogic:
         """
         # Check for face_target override first
         face_target = char.get('face_target')
-        if face_target and face_target in self.state.characters:
+        if face_target and self.state.has_character(face_target):
             self._face_toward_character(char, face_target)
             return
         
@@ -3726,7 +3774,7 @@ class GameLogic:
             criminal = m['subject']
             
             # Skip if criminal is dead/gone
-            if criminal not in self.state.characters:
+            if not self.state.has_character(criminal):
                 continue
             if criminal.get('health', 100) <= 0:
                 continue
@@ -4043,10 +4091,10 @@ class GameLogic:
         
         target = attacker.intent.get('target')
         
-        if attacker not in self.state.characters:
+        if not self.state.has_character(attacker):
             return False
         
-        if target is None or target not in self.state.characters:
+        if target is None or not self.state.has_character(target):
             attacker.clear_intent()
             return False
         
@@ -4230,14 +4278,12 @@ class GameLogic:
         
         char_name = char.get_display_name()
         
-        for other in self.state.characters:
+        # Must be in same zone to report
+        for other in self.state.characters_in_zone(char.zone):
             if other == char:
                 continue
             if other.get('job') != 'Soldier':
                 continue
-            # Must be in same zone to report
-            if other.zone != char.zone:
-                continue
             
             # Use prevailing coords if same zone (correct for interiors)
             if char.zone is not None:
@@ -4259,7 +4305,7 @@ class GameLogic:
                 # Only report to soldiers of same allegiance
                 if crime_allegiance == soldier_allegiance:
                     criminal = crime_memory['subject']
-                    if criminal in self.state.characters:
+                    if self.state.has_character(criminal):
                         self.report_crime_to(char, other, crime_memory)
 
     # =============================================================================
@@ -4436,8 +4482,12 @@ class GameLogic:
     def update_npc_positions(self, dt):
         """Update NPC positions based on velocity. Called every frame for smooth movement.
         
-        Implements squeeze behavior: when blocked for more than SQUEEZE_THRESHOLD_TICKS,
-        characters will slide perpendicular to their movement direction to squeeze past obstacles.
+        An NPC's vx/vy is its preferred velocity (set each tick from its goal).
+        One local avoidance pass (local_avoidance.py) turns those into
+        collision-free velocities for the whole crowd, so characters steer
+        around each other instead of bumping and retrying. If a step still runs
+        into a wall, house or another character, the NPC slides along it on
+        one axis, or waits this substep out.
         
         Uses prevailing coords (local when in interior, world when in exterior) since
         velocity is calculated in that coordinate space.
@@ -4445,22 +4495,33 @@ class GameLogic:
         Note: Stamina drain/regen is handled separately in gui._game_loop using real-time
         to ensure consistent feel regardless of game speed.
         """
-        npcs = [c for c in self.state.characters if not c.is_player]
+        agents = []
+        for char in self.state.characters:
+            pref_x = char.get('vx', 0.0)
+            pref_y = char.get('vy', 0.0)
+            if char.is_player:
+                # Player steers themselves - others avoid them
+                agents.append(Agent(char, char.zone, char.prevailing_x, char.prevailing_y,
+                                    pref_x, pref_y, 0.0, 0.0, False))
+            elif pref_x == 0.0 and pref_y == 0.0:
+                # Not moving - an obstacle for everyone else
+                char['avoid_vx'] = 0.0
+                char['avoid_vy'] = 0.0
+                agents.append(Agent(char, char.zone, char.prevailing_x, char.prevailing_y,
+                                    0.0, 0.0, 0.0, 0.0, False))
+            else:
+                agents.append(Agent(char, char.zone, char.prevailing_x, char.prevailing_y,
+                                    char.get('avoid_vx', 0.0), char.get('avoid_vy', 0.0),
+                                    pref_x, pref_y, True))
         
-        for char in npcs:
-            vx = char.get('vx', 0.0)
-            vy = char.get('vy', 0.0)
-            
-            if vx == 0.0 and vy == 0.0:
-                # Not moving - reset squeeze state
-                char['blocked_ticks'] = 0
-                char['squeeze_direction'] = 0
-                continue
-            
-            # Use prevailing coords (local when in interior, world when exterior)
-            # Velocity is calculated in this space, so movement must be too
-            curr_x = char.prevailing_x
-            curr_y = char.prevailing_y
+        grid = build_grid(agents)
+        velocities = compute_velocities(agents, dt, self.state.interactables.spatial, grid)
+        collision_dist = CHARACTER_COLLISION_RADIUS * 2
+        
+        for agent, (vx, vy) in velocities.items():
+            char = agent.char
+            curr_x = agent.x
+            curr_y = agent.y
             
             # Calculate base new position
             new_x = curr_x + vx * dt
@@ -4468,9 +4529,10 @@ class GameLogic:
             
             # Keep within bounds - different for interior vs exterior
             if char.zone is None:
-                # Exterior - use world SIZE
-                new_x = max(0, min(SIZE, new_x))
-                new_y = max(0, min(SIZE, new_y))
+                # Exterior - use world bounds
+                _, _, max_x, max_y = self.state.chunks.bounds
+                new_x = max(0, min(max_x, new_x))
+                new_y = max(0, min(max_y, new_y))
             else:
                 # Interior - use interior dimensions
                 interior = self.state.interiors.get_interior(char.zone)
@@ -4478,17 +4540,33 @@ class GameLogic:
                     new_x = max(0.3, min(interior.width - 0.3, new_x))
                     new_y = max(0.3, min(interior.height - 0.3, new_y))
             
-            # Check for collision with other characters
-            # is_position_blocked handles zone-aware collision checking
-            if not self.state.is_position_blocked(new_x, new_y, exclude_char=char):
-                # Clear path - move normally
-                char.prevailing_x = new_x
-                char.prevailing_y = new_y
-                char['blocked_ticks'] = 0
-                char['squeeze_direction'] = 0
+            # Full step first, then slide along whichever axis carries more of it
+            if abs(vx) >= abs(vy):
+                candidates = ((new_x, new_y), (new_x, curr_y), (curr_x, new_y))
             else:
-                # Blocked - try to find a way through
-                moved = self._try_squeeze_movement(char, vx, vy, new_x, new_y, dt)
+                candidates = ((new_x, new_y), (curr_x, new_y), (new_x, curr_y))
+            
+            moved_x, moved_y = curr_x, curr_y
+            for test_x, test_y in candidates:
+                if test_x == curr_x and test_y == curr_y:
+                    continue
+                # Other characters are checked against the neighbour grid, so
+                # the world check only needs static obstacles
+                if self.state.is_position_blocked(test_x, test_y, exclude_char=char,
+                                                  check_characters=False):
+                    continue
+                if bumps_neighbour(agent, test_x, test_y, grid, collision_dist):
+                    continue
+                moved_x, moved_y = test_x, test_y
+                break
+            
+            char.prevailing_x = moved_x
+            char.prevailing_y = moved_y
+            char['avoid_vx'] = (moved_x - curr_x) / dt
+            char['avoid_vy'] = (moved_y - curr_y) / dt
+            # Later movers in this pass see where this one ended up
+            agent.x = moved_x
+            agent.y = moved_y
     
 
     def update_arrows(self, dt):
@@ -4554,15 +4632,12 @@ class GameLogic:
         Returns:
             Character that was hit, or None
         """
-        for char in self.state.characters:
+        # Must be in same zone
+        for char in self.state.characters_in_zone(arrow['zone']):
             # Don't hit the owner
             if char is arrow['owner']:
                 continue
             
-            # Must be in same zone
-            if char.zone != arrow['zone']:
-                continue
-            
             # Skip dead characters
             if char.get('health', 100) <= 0:
                 continue
@@ -4652,146 +4727,6 @@ class GameLogic:
                 self.state.log_action(f"{target_name} was killed by an arrow!")
     
 
-    def _try_squeeze_movement(self, char, vx, vy, new_x, new_y, dt):
-        """Try to squeeze past an obstacle when blocked.
-        
-        Strategy:
-        1. First, try simple axis-aligned sliding (might work for glancing collisions)
-        2. If blocked for 3+ ticks, pick a perpendicular direction and slide that way
-        3. Keep sliding in that direction until we make forward progress or get unstuck
-        
-        Uses prevailing coords (local when in interior, world when in exterior).
-        
-        Returns True if character moved, False if completely stuck.
-        """
-        moved = False
-        made_forward_progress = False
-        
-        # Use prevailing coords - match coordinate space of new_x/new_y
-        curr_x = char.prevailing_x
-        curr_y = char.prevailing_y
-        
-        # Try simple axis-aligned sliding first (handles glancing collisions)
-        # Only try if we're actually moving in that direction
-        if abs(vx) >= abs(vy):
-            # Moving mostly horizontal - try X only first
-            if abs(vx) > 0.01 and not self.state.is_position_blocked(new_x, curr_y, exclude_char=char):
-                char.prevailing_x = new_x
-                moved = True
-                made_forward_progress = True
-            # Then try Y if we have Y velocity
-            elif abs(vy) > 0.01 and not self.state.is_position_blocked(curr_x, new_y, exclude_char=char):
-                char.prevailing_y = new_y
-                moved = True
-        else:
-            # Moving mostly vertical - try Y only first
-            if abs(vy) > 0.01 and not self.state.is_position_blocked(curr_x, new_y, exclude_char=char):
-                char.prevailing_y = new_y
-                moved = True
-                made_forward_progress = True
-            # Then try X if we have X velocity
-            elif abs(vx) > 0.01 and not self.state.is_position_blocked(new_x, curr_y, exclude_char=char):
-                char.prevailing_x = new_x
-                moved = True
-        
-        if made_forward_progress:
-            # Made actual forward progress - reset squeeze state
-            char['blocked_ticks'] = 0
-            char['squeeze_direction'] = 0
-            return True
-        
-        # Still blocked on primary axis - increment counter
-        char['blocked_ticks'] = char.get('blocked_ticks', 0) + 1
-        
-        # After threshold OR if already squeezing, continue squeeze behavior
-        if char['blocked_ticks'] >= SQUEEZE_THRESHOLD_TICKS or char.get('squeeze_direction', 0) != 0:
-            # Pick a squeeze direction if we don't have one
-            if char.get('squeeze_direction', 0) == 0:
-                # Choose direction based on which way has more space
-                # or randomly if equal
-                char['squeeze_direction'] = self._choose_squeeze_direction(char, vx, vy)
-            
-            squeeze_dir = char['squeeze_direction']
-            slide_speed = MOVEMENT_SPEED * SQUEEZE_SLIDE_SPEED * dt
-            
-            # Calculate slide movement perpendicular to travel direction
-            if abs(vx) > abs(vy):
-                # Moving horizontal, slide vertical
-                slide_y = curr_y + squeeze_dir * slide_speed
-                # Try to move: slide perpendicular + forward progress
-                if not self.state.is_position_blocked(new_x, slide_y, exclude_char=char):
-                    char.prevailing_x = new_x
-                    char.prevailing_y = slide_y
-                    char['blocked_ticks'] = 0
-                    char['squeeze_direction'] = 0
-                    return True
-                # Try just sliding perpendicular
-                elif not self.state.is_position_blocked(curr_x, slide_y, exclude_char=char):
-                    char.prevailing_y = slide_y
-                    return True
-                else:
-                    # This direction is blocked, try the other way
-                    char['squeeze_direction'] = -squeeze_dir
-            else:
-                # Moving vertical, slide horizontal
-                slide_x = curr_x + squeeze_dir * slide_speed
-                # Try to move: slide perpendicular + forward progress
-                if not self.state.is_position_blocked(slide_x, new_y, exclude_char=char):
-                    char.prevailing_x = slide_x
-                    char.prevailing_y = new_y
-                    char['blocked_ticks'] = 0
-                    char['squeeze_direction'] = 0
-                    return True
-                # Try just sliding perpendicular
-                elif not self.state.is_position_blocked(slide_x, curr_y, exclude_char=char):
-                    char.prevailing_x = slide_x
-                    return True
-                else:
-                    # This direction is blocked, try the other way
-                    char['squeeze_direction'] = -squeeze_dir
-        
-        return False
-    
-
-    def _choose_squeeze_direction(self, char, vx, vy):
-        """Choose which direction to squeeze (perpendicular to movement).
-        Picks the direction with more open space, or random if equal.
-        Returns -1 or 1.
-        """
-        # Use prevailing coords for interior/exterior compatibility
-        curr_x = char.prevailing_x
-        curr_y = char.prevailing_y
-        
-        # Check space in both perpendicular directions
-        check_dist = 1.0  # How far to look
-        
-        if abs(vx) > abs(vy):
-            # Moving horizontal, check vertical space
-            space_pos = 0
-            space_neg = 0
-            for d in [0.3, 0.6, 1.0]:
-                if not self.state.is_position_blocked(curr_x, curr_y + d, exclude_char=char):
-                    space_pos += 1
-                if not self.state.is_position_blocked(curr_x, curr_y - d, exclude_char=char):
-                    space_neg += 1
-        else:
-            # Moving vertical, check horizontal space
-            space_pos = 0
-            space_neg = 0
-            for d in [0.3, 0.6, 1.0]:
-                if not self.state.is_position_blocked(curr_x + d, curr_y, exclude_char=char):
-                    space_pos += 1
-                if not self.state.is_position_blocked(curr_x - d, curr_y, exclude_char=char):
-                    space_neg += 1
-        
-        if space_pos > space_neg:
-            return 1
-        elif space_neg > space_pos:
-            return -1
-        else:
-            # Equal space - pick randomly
-            return random.choice([-1, 1])
-
     # =============================================================================
     # PATHFINDING - Goal selection, navigation, and movement AI
     # =============================================================================
@@ -4806,144 +4741,148 @@ class GameLogic:
         
         Position updates happen every frame via update_npc_positions().
         """
+        profile = get_profiler().scope
         npcs = [c for c in self.state.characters if not c.is_player]
         
         # Each NPC decides what to do (sets goal and/or takes action)
-        for char in npcs:
-            if char not in self.state.characters:
-                continue  # May have been killed
-            
-            if char.get('is_frozen'):
-                char.vx = 0.0
-                char.vy = 0.0
-                continue
-            
-            # Skip dying characters
-            if char.get('health', 100) <= 0:
-                char.vx = 0.0
-                char.vy = 0.0
-                continue
-            
-            # Reset idle flag before deciding
-            char.idle_is_idle = False
-            
-            # Get the job and let it decide what to do
-            job = get_job(char.get('job'))
-            job.decide(char, self.state, self)
-            
-            # Wake up if not sleep time
-            if not self.state.is_sleep_time() and char.get('is_sleeping'):
-                char.is_sleeping = False
-                name = char.get_display_name()
-                self.state.log_action(f"{name} woke up")
-        
-        # Update velocities based on goals (with zone transition handling)
-        for char in npcs:
-            if char not in self.state.characters:
-                continue
-            
-            if char.get('is_frozen') or char.get('health', 100) <= 0:
-                continue
-            
-            # Check for combat tracking (bypasses goal system for smooth pursuit)
-            combat_target = char.get('combat_track_target')
-            if combat_target and combat_target in self.state.characters:
-                self._update_combat_tracking_velocity(char, combat_target)
-                continue
-            
-            goal = char.goal
-            goal_zone = getattr(char, 'goal_zone', None)
-            
-            if goal:
-                # Get effective local goal and check for zone transitions
-                effective_goal, transition = self._get_effective_goal_and_transition(
-                    char, goal, goal_zone
-                )
+        with profile('tick.npc_decisions'):
+            for char in npcs:
+                if not self.state.has_character(char):
+                    continue  # May have been killed
                 
-                # Handle zone transitions at door thresholds
-                if transition == 'need_to_exit':
-                    interior = self.state.interiors.get_interior(char.zone)
-                    if interior and interior.is_at_door(char.prevailing_x, char.prevailing_y):
-                        self._do_exit_interior(char, interior)
-                        continue  # Re-evaluate next tick
+                if char.get('is_frozen'):
+                    char.vx = 0.0
+                    char.vy = 0.0
+                    continue
                 
-                elif transition == 'need_to_enter':
-                    interior = self.state.interiors.get_interior(goal_zone)
-                    if interior:
-                        door_x, door_y = interior.get_exit_position()
-                        dist_to_door = math.sqrt((char.x - door_x)**2 + (char.y - door_y)**2)
-                        if dist_to_door < DOOR_THRESHOLD:
-                            self._do_enter_interior(char, interior)
-                            continue  # Re-evaluate next tick
+                # Skip dying characters
+                if char.get('health', 100) <= 0:
+                    char.vx = 0.0
+                    char.vy = 0.0
+                    continue
                 
-                # Calculate velocity toward effective_goal (in local coords)
-                dx = effective_goal[0] - char.prevailing_x
-                dy = effective_goal[1] - char.prevailing_y
-                dist = math.sqrt(dx * dx + dy * dy)
+                # Reset idle flag before deciding
+                char.idle_is_idle = False
                 
-                # Check if in combat (tracking a moving target)
-                is_combat_tracking = (char.intent and char.intent.get('action') == 'attack')
+                # Get the job and let it decide what to do
+                job = get_job(char.get('job'))
+                job.decide(char, self.state, self)
                 
-                # For combat tracking, use tighter threshold to stay responsive
-                # For normal movement, use 0.35 to prevent overshoot jitter
-                stop_threshold = 0.1 if is_combat_tracking else 0.35
+                # Wake up if not sleep time
+                if not self.state.is_sleep_time() and char.get('is_sleeping'):
+                    char.is_sleeping = False
+                    name = char.get_display_name()
+                    self.state.log_action(f"{name} woke up")
+            
+        # Update velocities based on goals (with zone transition handling)
+        with profile('tick.npc_velocity'):
+            for char in npcs:
+                if not self.state.has_character(char):
+                    continue
                 
-                if dist < stop_threshold:
-                    char.vx = 0.0
-                    char.vy = 0.0
-                    char.is_sprinting = False
-                    # Even when stopped, face the target if backpedaling
-                    face_target = char.get('face_target')
-                    if face_target and face_target in self.state.characters:
-                        self._face_toward_character(char, face_target)
-                else:
-                    # Determine if NPC should sprint
-                    should_sprint = self._should_npc_sprint(char)
+                if char.get('is_frozen') or char.get('health', 100) <= 0:
+                    continue
+                
+                # Check for combat tracking (bypasses goal system for smooth pursuit)
+                combat_target = char.get('combat_track_target')
+                if combat_target and self.state.has_character(combat_target):
+                    self._update_combat_tracking_velocity(char, combat_target)
+                    continue
+                
+                goal = char.goal
+                goal_zone = getattr(char, 'goal_zone', None)
+                
+                if goal:
+                    # Get effective local goal and check for zone transitions
+                    effective_goal, transition = self._get_effective_goal_and_transition(
+                        char, goal, goal_zone
+                    )
                     
-                    # Check stamina before allowing sprint
-                    if should_sprint:
-                        if char.is_sprinting:
-                            if not char.can_continue_sprint():
-                                should_sprint = False
-                        else:
-                            if not char.can_start_sprint():
-                                should_sprint = False
+                    # Handle zone transitions at door thresholds
+                    if transition == 'need_to_exit':
+                        interior = self.state.interiors.get_interior(char.zone)
+                        if interior and interior.is_at_door(char.prevailing_x, char.prevailing_y):
+                            self._do_exit_interior(char, interior)
+                            continue  # Re-evaluate next tick
                     
-                    char.is_sprinting = should_sprint
+                    elif transition == 'need_to_enter':
+                        interior = self.state.interiors.get_interior(goal_zone)
+                        if interior:
+                            door_x, door_y = interior.get_exit_position()
+                            dist_to_door = math.sqrt((char.x - door_x)**2 + (char.y - door_y)**2)
+                            if dist_to_door < DOOR_THRESHOLD:
+                                self._do_enter_interior(char, interior)
+                                continue  # Re-evaluate next tick
                     
-                    # Use slower speed if idling or patrolling, sprint speed if sprinting
-                    if should_sprint:
-                        speed = SPRINT_SPEED
-                    elif char.get('idle_is_idle', False):
-                        speed = MOVEMENT_SPEED * IDLE_SPEED_MULTIPLIER
-                    elif char.get('is_patrolling', False):
-                        speed = MOVEMENT_SPEED * PATROL_SPEED_MULTIPLIER
-                    else:
-                        speed = MOVEMENT_SPEED
+                    # Calculate velocity toward effective_goal (in local coords)
+                    dx = effective_goal[0] - char.prevailing_x
+                    dy = effective_goal[1] - char.prevailing_y
+                    dist = math.sqrt(dx * dx + dy * dy)
                     
-                    # Normalize and apply speed
-                    char.vx = (dx / dist) * speed
-                    char.vy = (dy / dist) * speed
+                    # Check if in combat (tracking a moving target)
+                    is_combat_tracking = (char.intent and char.intent.get('action') == 'attack')
                     
-                    # Update facing - check face_target first (for backpedaling)
-                    face_target = char.get('face_target')
-                    if face_target and face_target in self.state.characters:
-                        self._face_toward_character(char, face_target)
+                    # For combat tracking, use tighter threshold to stay responsive
+                    # For normal movement, use 0.35 to prevent overshoot jitter
+                    stop_threshold = 0.1 if is_combat_tracking else 0.35
+                    
+                    if dist < stop_threshold:
+                        char.vx = 0.0
+                        char.vy = 0.0
+                        char.is_sprinting = False
+                        # Even when stopped, face the target if backpedaling
+                        face_target = char.get('face_target')
+                        if face_target and self.state.has_character(face_target):
+                            self._face_toward_character(char, face_target)
                     else:
-                        self._update_facing_from_velocity(char)
-            else:
-                char.vx = 0.0
-                char.vy = 0.0
-                char.is_sprinting = False
+                        # Determine if NPC should sprint
+                        should_sprint = self._should_npc_sprint(char)
+                        
+                        # Check stamina before allowing sprint
+                        if should_sprint:
+                            if char.is_sprinting:
+                                if not char.can_continue_sprint():
+                                    should_sprint = False
+                            else:
+                                if not char.can_start_sprint():
+                                    should_sprint = False
+                        
+                        char.is_sprinting = should_sprint
+                        
+                        # Use slower speed if idling or patrolling, sprint speed if sprinting
+                        if should_sprint:
+                            speed = SPRINT_SPEED
+                        elif char.get('idle_is_idle', False):
+                            speed = MOVEMENT_SPEED * IDLE_SPEED_MULTIPLIER
+                        elif char.get('is_patrolling', False):
+                            speed = MOVEMENT_SPEED * PATROL_SPEED_MULTIPLIER
+                        else:
+                            speed = MOVEMENT_SPEED
+                        
+                        # Normalize and apply speed
+                        char.vx = (dx / dist) * speed
+                        char.vy = (dy / dist) * speed
+                        
+                        # Update facing - check face_target first (for backpedaling)
+                        face_target = char.get('face_target')
+                        if face_target and self.state.has_character(face_target):
+                            self._face_toward_character(char, face_target)
+                        else:
+                            self._update_facing_from_velocity(char)
+                else:
+                    char.vx = 0.0
+                    char.vy = 0.0
+                    char.is_sprinting = False
+                
+                # If not idling, reset idle state for next time
+                if not char.get('idle_is_idle', False):
+                    self._reset_idle_state(char)
             
-            # If not idling, reset idle state for next time
-            if not char.get('idle_is_idle', False):
-                self._reset_idle_state(char)
-        
         # Report crimes to nearby soldiers
-        for char in self.state.characters:
-            self.try_report_crimes_to_soldier(char)
-    
+        with profile('tick.crime_reports'):
+            for char in self.state.characters:
+                self.try_report_crimes_to_soldier(char)
+        
 
     def _get_desired_step(self, char):
         """Calculate the position this NPC wants to move toward.
@@ -5560,7 +5499,7 @@ class GameLogic:
 
     def move_toward_character(self, char, target):
         """Move character one step toward another character."""
-        if target is None or target not in self.state.characters:
+        if target is None or not self.state.has_character(target):
             return
         self._move_toward_point(char, (target['x'], target['y']))
     
@@ -5617,7 +5556,7 @@ class GameLogic:
         if char.intent and char.intent.get('action') == 'flee':
             reason = char.intent.get('reason')
             target = char.intent.get('target')
-            if target and target in self.state.characters and target.health > 0:
+            if target and self.state.has_character(target) and target.health > 0:
                 # Bystanders stop caring once out of perception
                 if reason == 'bystander':
                     can_perceive, _ = self.can_perceive_character(char, target)
@@ -5641,7 +5580,7 @@ class GameLogic:
         if char.get_trait('confidence') < 7:
             for memory in char.get_memories(memory_type='attacked_by'):
                 attacker = memory.get('subject')
-                if attacker and attacker in self.state.characters and attacker.health > 0:
+                if attacker and self.state.has_character(attacker) and attacker.health > 0:
                     # Is this attacker nearby (within perception)?
                     can_perceive, _ = self.can_perceive_character(char, attacker)
                     if can_perceive:
@@ -5659,7 +5598,7 @@ class GameLogic:
             if reason not in ('monitoring_threat', 'bystander'):
                 return False
             target = char.intent.get('target')
-            if target and target in self.state.characters and target.health > 0:
+            if target and self.state.has_character(target) and target.health > 0:
                 # Stop watching if we can't perceive them anymore
                 # For victims: _check_flee will resume via memory if attacker returns
                 # For bystanders: they just forget
@@ -5682,7 +5621,7 @@ class GameLogic:
         # Also check: do we have attacked_by memory of someone nearby?
         for memory in char.get_memories(memory_type='attacked_by'):
             attacker = memory.get('subject')
-            if attacker and attacker in self.state.characters and attacker.health > 0:
+            if attacker and self.state.has_character(attacker) and attacker.health > 0:
                 # Is this attacker nearby (within perception)?
                 can_perceive, _ = self.can_perceive_character(char, attacker)
                 if can_perceive:
@@ -5697,7 +5636,7 @@ class GameLogic:
         if char.intent.get('action') != 'attack':
             return False
         target = char.intent.get('target')
-        return target and target in self.state.characters and target.health > 0
+        return target and self.state.has_character(target) and target.health > 0
     
     def check_flee_criminal(self, char):
         """Should flee from a known criminal (witnessed crime)?"""
@@ -5706,7 +5645,7 @@ class GameLogic:
             reason = char.intent.get('reason')
             if reason in ('witnessed_crime', 'known_criminal'):
                 target = char.intent.get('target')
-                if target and target in self.state.characters and target.health > 0:
+                if target and self.state.has_character(target) and target.health > 0:
                     return True
         
         # New criminal nearby?
@@ -5735,7 +5674,7 @@ class GameLogic:
         if char.intent and char.intent.get('action') == 'watch':
             if char.intent.get('reason') == 'monitoring_distress':
                 target = char.intent.get('target')
-                if target and target in self.state.characters:
+                if target and self.state.has_character(target):
                     # Still fleeing and we can perceive them?
                     if target.intent and target.intent.get('action') == 'flee':
                         can_perceive, _ = self.can_perceive_character(char, target)
@@ -5818,7 +5757,7 @@ class GameLogic:
         attacker = None
         if char.intent and char.intent.get('action') in ('flee', 'watch'):
             attacker = char.intent.get('target')
-            if attacker and (attacker not in self.state.characters or attacker.health <= 0):
+            if attacker and (not self.state.has_character(attacker) or attacker.health <= 0):
                 attacker = None
         
         if not attacker:
@@ -5984,7 +5923,7 @@ class GameLogic:
         - Bystanders: just watch, perception check done in _check_watch_threat
         """
         threat = char.intent.get('target') if char.intent else None
-        if not threat or threat not in self.state.characters or threat.health <= 0:
+        if not threat or not self.state.has_character(threat) or threat.health <= 0:
             char.clear_intent()
             return False
         
@@ -6118,7 +6057,7 @@ class GameLogic:
         if not attacker:
             for memory in char.get_memories(memory_type='attacked_by'):
                 potential = memory.get('subject')
-                if potential and potential in self.state.characters and potential.health > 0:
+                if potential and self.state.has_character(potential) and potential.health > 0:
                     can_perceive, _ = self.can_perceive_character(char, potential)
                     if can_perceive:
                         attacker = potential
@@ -6145,7 +6084,7 @@ class GameLogic:
             return False
 
         target = char.intent.get('target')
-        if not target or target not in self.state.characters or target.health <= 0:
+        if not target or not self.state.has_character(target) or target.health <= 0:
             char.clear_intent()
             char['combat_track_target'] = None
             char.cancel_bow_draw()
@@ -6282,7 +6221,7 @@ class GameLogic:
             flee_target = char.intent.get('target')
         
         # Find new criminal if needed
-        if not flee_target or flee_target not in self.state.characters or flee_target.health <= 0:
+        if not flee_target or not self.state.has_character(flee_target) or flee_target.health <= 0:
             criminal, intensity = self.find_known_criminal_nearby(char)
             if criminal:
                 self.state.log_action(f"{char.get_display_name()} fleeing from {criminal.get_display_name()}!")
@@ -6479,7 +6418,7 @@ class GameLogic:
             if char.intent.get('reason') == 'monitoring_distress':
                 fleeing_person = char.intent.get('target')
         
-        if not fleeing_person or fleeing_person not in self.state.characters:
+        if not fleeing_person or not self.state.has_character(fleeing_person):
             fleeing_person = self.find_fleeing_person_nearby(char)
         
         if not fleeing_person:
@@ -6772,18 +6711,10 @@ class GameLogic:
         else:
             px, py = player.x, player.y
         
-        for corpse in self.state.corpses:
-            if corpse.zone != player.zone:
-                continue
-            
+        for corpse in self.state.corpses.get_corpses_near(px, py, INTERACT_DISTANCE, player.zone):
             cx, cy = corpse.center
-            dx = px - cx
-            dy = py - cy
-            dist = (dx * dx + dy * dy) ** 0.5
-            
-            if dist <= INTERACT_DISTANCE:
-                if player.is_facing_position(cx, cy):
-                    return corpse
+            if player.is_facing_position(cx, cy):
+                return corpse
         
         return None
     
@@ -6953,7 +6884,7 @@ class GameLogic:
             attacker = m['subject']
 
             # Still alive?
-            if attacker not in self.state.characters or attacker.health <= 0:
+            if not self.state.has_character(attacker) or attacker.health <= 0:
                 continue
 
             # Still nearby?
@@ -7,18 +7,28 @@ Query methods here are pure lookups (get_character, get_area_at, is_sleep_time).
 Game rules and behavior logic live in game_logic.py.
 """
 
+import heapq
 import random
 import math
 from constants import (
+    TAX_GRACE_PERIOD,
     MAX_HUNGER, FARM_CELL_HARVEST_INTERVAL, ITEMS,
     INVENTORY_SLOTS, BARREL_SLOTS,
     SKILLS, CELL_SIZE,
-    CHARACTER_WIDTH, CHARACTER_HEIGHT, ADJACENCY_DISTANCE, CHARACTER_COLLISION_RADIUS
+    CHARACTER_WIDTH, CHARACTER_HEIGHT, ADJACENCY_DISTANCE, CHARACTER_COLLISION_RADIUS,
+    CHUNK_LOAD_RADIUS, CHUNK_MAX_RESIDENT
 )
-from scenario.scenario_world import AREAS, BARRELS, BEDS, STOVES, SIZE, TREES, HOUSES
+from scenario.scenario_world import (
+    AREAS, BARRELS, BEDS, STOVES, SIZE, TREES, HOUSES, ROADS, VILLAGE_NAME, WORLD_PLAN
+)
+from scenario.world_chunks import ChunkDirectory
 from scenario.scenario_characters import CHARACTER_TEMPLATES
 from character import Character, create_character
-from world_objects import InteractableManager, InteriorManager, GroundItemManager
+from vitals import VitalsTable
+from world_objects import InteractableManager, InteriorManager, GroundItemManager, CorpseManager
+
+# Spatial index kinds that block movement (see is_position_blocked)
+BLOCKING_KINDS = ('house', 'barrel', 'bed', 'stove')
 
 
 class GameState:
@@ -41,11 +51,14 @@ class GameState:
         # Time tracking
         self.ticks = 0
         self.game_speed = 1
+        self.effective_speed = 1.0  # Speed actually achieved (lower than game_speed when the CPU can't keep up)
+        self.turbo = False  # Run ticks flat out (ignores game_speed) and render at a low rate
         self.paused = False
         
         # World data
-        self.area_map = [[None for _ in range(SIZE)] for _ in range(SIZE)]
+        self.chunks = None  # ChunkDirectory - area lookups and streamed world chunks
         self.farm_cells = {}  # (x, y) -> {'state': str, 'timer': int}
+        self.roads = set()  # (x, y) road cells in loaded chunks
         
         # Interactable objects (barrels, beds, stoves, campfires, trees, houses)
         self.interactables = InteractableManager()
@@ -53,15 +66,26 @@ class GameState:
         # Interior spaces for buildings
         self.interiors = InteriorManager()
         
-        # Ground items (dropped items in the world)
-        self.ground_items = GroundItemManager()
+        # Ground items (dropped items in the world), indexed alongside interactables
+        self.ground_items = GroundItemManager(self.interactables.spatial)
         
         # Character data
         self.characters = []  # List of Character instances
         self.player = None    # Reference to player Character
+        self._characters_by_zone = {}  # zone -> {Character: None} (insertion-ordered set)
+        self._characters_by_id = {}    # char_id -> Character
+        self._characters_by_name = {}  # name -> Character
+        self._next_character_id = 1
+        self._stewards_by_allegiance = {}  # allegiance -> steward Character
+        self.vitals = VitalsTable()  # Health/hunger/stamina arrays, one row per character
+        
+        # Tax deadlines, one queue per steward (keyed by the allegiance it collects for):
+        # heap of (overdue_tick, seq, char_id, due_tick) - see schedule_tax_deadline
+        self._tax_deadlines = {}
+        self._tax_seq = 0
 
-        # Corpses (dead characters with lootable inventory)
-        self.corpses = []  # List of Corpse instances
+        # Corpses (dead characters with lootable inventory) and the markers they decay into
+        self.corpses = CorpseManager(self.interactables.spatial, self.ground_items)
 
         # Projectiles (arrows)
         self.arrows = []  # List of {'x': float, 'y': float, 'dx': float, 'dy': float, 'distance': float, 'owner': Character, 'zone': str}
@@ -78,14 +102,32 @@ class GameState:
         self._init_characters()
     
     def _init_areas(self):
-        """Initialize the area map from AREAS configuration"""
-        for area in AREAS:
-            name = area["name"]
-            start_y, start_x, end_y, end_x = area["bounds"]
-            for y in range(start_y, end_y):
-                for x in range(start_x, end_x):
-                    if 0 <= y < SIZE and 0 <= x < SIZE:
-                        self.area_map[y][x] = name
+        """Initialize the chunk directory with the scenario town as its home chunk"""
+        if self.chunks is not None:
+            self.chunks.clear_cache()
+        home = {"name": VILLAGE_NAME, "areas": AREAS, "roads": ROADS, "trees": TREES}
+        self.chunks = ChunkDirectory(home, SIZE, plan=WORLD_PLAN,
+                                     load_radius=CHUNK_LOAD_RADIUS,
+                                     max_resident=CHUNK_MAX_RESIDENT)
+        self.chunks.on_load = self._on_chunk_loaded
+        self.chunks.on_evict = self._on_chunk_evicted
+        self.roads = set(self.chunks.static.roads)
+    
+    def _on_chunk_loaded(self, chunk):
+        """Merge a streamed chunk's trees, roads and farm cells into live state."""
+        for x, y in chunk.trees:
+            self.interactables.add_tree(x, y)
+        self.roads.update(chunk.roads)
+        self.farm_cells.update(chunk.farm_cells)
+    
+    def _on_chunk_evicted(self, chunk):
+        """Write back what survived in a chunk (felled trees, crop timers) and drop it."""
+        chunk.trees = [pos for pos in chunk.trees if self.interactables.has_tree_at(*pos)]
+        for x, y in chunk.trees:
+            self.interactables.remove_tree(x, y)
+        self.roads.difference_update(chunk.roads)
+        chunk.farm_cells = {pos: self.farm_cells.pop(pos) for pos in chunk.farm_cells
+                            if pos in self.farm_cells}
     
     def _init_farm_cells(self):
         """Initialize harvestable farm cells.
@@ -151,6 +193,7 @@ class GameState:
         Characters spawn inside their home if it's an interior.
         """
         occupied = set()
+        spawn_pools = {}  # zone/area -> free cells still to hand out, shared across characters
         
         for name, template in CHARACTER_TEMPLATES.items():
             # Determine home area based on job
@@ -165,7 +208,7 @@ class GameState:
             if home_interior:
                 # Spawn inside the interior
                 # Find a valid position inside the interior (center area, not on furniture)
-                spawn_x, spawn_y = self._find_interior_spawn(home_interior, occupied)
+                spawn_x, spawn_y = self._find_interior_spawn(home_interior, occupied, spawn_pools)
                 
                 # Create Character object
                 char = create_character(name, 0, 0, home_area)  # Temp coords
@@ -179,13 +222,13 @@ class GameState:
                 occupied.add((home_area, int(spawn_x), int(spawn_y)))
             else:
                 # Spawn in exterior
-                x, y = self._find_spawn_location(home_area, occupied)
+                x, y = self._find_spawn_location(home_area, occupied, spawn_pools)
                 occupied.add((None, x, y))
                 
                 # Create Character object (not dict)
                 char = create_character(name, x, y, home_area)
             
-            self.characters.append(char)
+            self.add_character(char)
 
             # Assign bed and barrel based on job or home
             if starting_job:
@@ -199,34 +242,39 @@ class GameState:
             if char.is_player:
                 self.player = char
     
-    def _find_interior_spawn(self, interior, occupied):
+    def _find_interior_spawn(self, interior, occupied, pools=None):
         """Find a valid spawn location inside an interior.
         
         Args:
             interior: Interior object to spawn in
             occupied: Set of (zone, x, y) tuples that are already taken
+            pools: Optional dict of per-zone free-cell lists, built on first use
+                and consumed across calls so each spawn is O(1) instead of a
+                scan over the whole interior
             
         Returns:
             (x, y) in interior coordinates
         """
-        # Try center first
         center_x = interior.width / 2
         center_y = interior.height / 2
         
-        # Check if center is valid and unoccupied
-        if not interior.is_position_blocked(int(center_x), int(center_y)):
-            key = (interior.name, int(center_x), int(center_y))
-            if key not in occupied:
-                return (center_x, center_y)
+        if pools is None:
+            pools = {}
+        pool = pools.get(interior.name)
+        if pool is None:
+            # Free cells in scan order, center first; popped from the end
+            pool = [(local_x + 0.5, local_y + 0.5)
+                    for local_y in range(interior.height - 1, -1, -1)
+                    for local_x in range(interior.width - 1, -1, -1)
+                    if not interior.is_position_blocked(local_x, local_y)]
+            if not interior.is_position_blocked(int(center_x), int(center_y)):
+                pool.append((center_x, center_y))
+            pools[interior.name] = pool
         
-        # Try other positions
-        for local_y in range(interior.height):
-            for local_x in range(interior.width):
-                if interior.is_position_blocked(local_x, local_y):
-                    continue
-                key = (interior.name, local_x, local_y)
-                if key not in occupied:
-                    return (local_x + 0.5, local_y + 0.5)
+        while pool:
+            x, y = pool.pop()
+            if (interior.name, int(x), int(y)) not in occupied:
+                return (x, y)
         
         # Fallback to center
         return (center_x, center_y)
@@ -251,41 +299,108 @@ class GameState:
             if barrel:
                 barrel.owner = char_name
     
-    def _find_spawn_location(self, area_name, occupied):
-        """Find a valid spawn location in the given area"""
-        cells = []
-        for y in range(SIZE):
-            for x in range(SIZE):
-                if self.area_map[y][x] == area_name:
-                    cells.append((x, y))
+    def _find_spawn_location(self, area_name, occupied, pools=None):
+        """Find a valid spawn location in the given area.
         
-        # Try to find unoccupied cell in area
-        if cells:
+        Args:
+            area_name: Area to spawn in (None = anywhere)
+            occupied: Set of (zone, x, y) tuples that are already taken
+            pools: Optional dict of per-area shuffled cell lists, consumed across
+                calls so a crowded area isn't reshuffled and rescanned per spawn
+        """
+        if pools is None:
+            pools = {}
+        key = ('area', area_name)
+        cells = pools.get(key)
+        if cells is None:
+            cells = self.get_area_cells(area_name) if area_name else []
             random.shuffle(cells)
-            for x, y in cells:
-                if (x, y) not in occupied:
-                    return x, y
+            pools[key] = cells
+        
+        # Try to find unoccupied cell in area
+        while cells:
+            x, y = cells.pop()
+            if (None, x, y) not in occupied:
+                return x, y
         
         # Fallback: find any unoccupied cell
         for _ in range(1000):
             x = random.randint(0, SIZE - 1)
             y = random.randint(0, SIZE - 1)
-            if (x, y) not in occupied:
+            if (None, x, y) not in occupied:
                 return x, y
         
         # Last resort: just return something
         return random.randint(0, SIZE - 1), random.randint(0, SIZE - 1)
 
+    # =============================================================================
+    # CHARACTER REGISTRY - Adding characters and tracking which zone they're in
+    # =============================================================================
+
+    def add_character(self, char):
+        """Add a character to the game, give it an id, and register it by id, name and zone"""
+        char.char_id = self._next_character_id
+        self._next_character_id += 1
+        self.characters.append(char)
+        self._characters_by_id[char.char_id] = char
+        self._characters_by_name[char.name] = char
+        self._characters_by_zone.setdefault(char.zone, {})[char] = None
+        self.vitals.attach(char)
+        char.zone_listener = self._on_character_zone_change
+        char.role_listener = self._on_character_role_change
+        self._on_character_role_change(char)
+
+    def _on_character_zone_change(self, char, old_zone, new_zone):
+        """Move a character between zone sets (Character.enter/exit_interior)"""
+        members = self._characters_by_zone.get(old_zone)
+        if members is not None:
+            members.pop(char, None)
+        self._characters_by_zone.setdefault(new_zone, {})[char] = None
+
+    def _on_character_role_change(self, char):
+        """Re-index stewards and move tax deadlines after a job or allegiance change"""
+        for allegiance, steward in list(self._stewards_by_allegiance.items()):
+            if steward is char and (char.job != 'Steward' or char.allegiance != allegiance):
+                self._replace_steward(allegiance)
+        if char.job == 'Steward' and char.allegiance not in self._stewards_by_allegiance:
+            self._stewards_by_allegiance[char.allegiance] = char
+        if char.tax_due_tick is not None:
+            # Re-queue under the (possibly new) allegiance; the old entry goes stale
+            self.schedule_tax_deadline(char, char.tax_due_tick)
+
+    def _replace_steward(self, allegiance):
+        """The steward for an allegiance left - index the next one, if any (rare, so a scan)"""
+        self._stewards_by_allegiance.pop(allegiance, None)
+        for char in self.characters:
+            if char.job == 'Steward' and char.allegiance == allegiance:
+                self._stewards_by_allegiance[allegiance] = char
+                return
+
+    def characters_in_zone(self, zone):
+        """Characters in one zone (None = exterior, interior name = inside).
+        
+        Returns a live view, not a copy - collision probes call this several
+        times per character per substep. Wrap it in tuple() before moving
+        characters between zones or removing them while iterating.
+        """
+        members = self._characters_by_zone.get(zone)
+        return members.keys() if members is not None else ()
+
     # =============================================================================
     # CHARACTER QUERIES - Finding and retrieving character objects
     # =============================================================================
 
     def get_character(self, name):
         """Get a character by name"""
-        for char in self.characters:
-            if char['name'] == name:
-                return char
-        return None
+        return self._characters_by_name.get(name)
+    
+    def get_character_by_id(self, char_id):
+        """Get a character by char_id (None once they've been removed)"""
+        return self._characters_by_id.get(char_id)
+    
+    def has_character(self, char):
+        """Is this character still in the game (alive and not removed)?"""
+        return char is not None and self._characters_by_id.get(getattr(char, 'char_id', None)) is char
     
     def get_characters_by_job(self, job):
         """Get all characters with a specific job"""
@@ -297,11 +412,7 @@ class GameState:
 
     def get_area_at(self, x, y):
         """Get the area name at a position. Works with float positions."""
-        cell_x = int(x)
-        cell_y = int(y)
-        if 0 <= cell_x < SIZE and 0 <= cell_y < SIZE:
-            return self.area_map[cell_y][cell_x]
-        return None
+        return self.chunks.get_area_at(x, y)
     
     def get_area_by_role(self, role):
         """Get the first area with the specified role. Returns area name or None."""
@@ -316,9 +427,9 @@ class GameState:
     
     def get_area_role(self, area_name):
         """Get the role of an area by its name. Returns role or None."""
-        for area_def in AREAS:
-            if area_def["name"] == area_name:
-                return area_def.get("role")
+        area_def = self.chunks.get_area_def(area_name)
+        if area_def:
+            return area_def.get("role")
         return None
     
     def get_villages(self):
@@ -337,11 +448,11 @@ class GameState:
         - If area has an 'allegiance' field, return that
         - Otherwise return None
         """
-        for area_def in AREAS:
-            if area_def["name"] == area_name:
-                if area_def.get("role") == "village":
-                    return area_name  # Village's allegiance is itself
-                return area_def.get("allegiance")
+        area_def = self.chunks.get_area_def(area_name)
+        if area_def:
+            if area_def.get("role") == "village":
+                return area_name  # Village's allegiance is itself
+            return area_def.get("allegiance")
         return None
     
     def get_areas_for_allegiance(self, allegiance):
@@ -359,18 +470,15 @@ class GameState:
     
     def get_steward_for_allegiance(self, allegiance):
         """Find the steward character for a given allegiance."""
-        for char in self.characters:
-            if char.get('job') == 'Steward' and char.get('allegiance') == allegiance:
-                return char
-        return None
+        return self._stewards_by_allegiance.get(allegiance)
 
     # =============================================================================
     # COLLISION & POSITION VALIDATION - Obstacle and character collision checks
     # =============================================================================
 
     def is_position_valid(self, x, y):
-        """Check if position is within bounds (works with float positions)"""
-        return 0 <= x < SIZE and 0 <= y < SIZE
+        """Check if position is within world bounds (works with float positions)"""
+        return self.chunks.contains(x, y)
     
     def is_obstacle_at(self, x, y):
         """Check if there's an obstacle (tree, rock, etc.) at this cell position."""
@@ -409,73 +517,42 @@ class GameState:
         
         # Trees only exist in exterior (zone=None)
         if zone is None:
-            tree_collision_radius = 0.4  # Trees block most of their cell
-            for tree_pos in self.interactables.trees.keys():
-                tree_x, tree_y = tree_pos
-                tree_center_x = tree_x + 0.5
-                tree_center_y = tree_y + 0.5
-                dx = abs(x - tree_center_x)
-                dy = abs(y - tree_center_y)
-                if dx < tree_collision_radius and dy < tree_collision_radius:
+            # Trees block most of their cell (radius 0.4 < 0.5), so only the tree
+            # in the cell containing (x, y) can collide
+            tree_collision_radius = 0.4
+            tree_x, tree_y = math.floor(x), math.floor(y)
+            if self.interactables.has_tree_at(tree_x, tree_y):
+                if (abs(x - (tree_x + 0.5)) < tree_collision_radius and
+                        abs(y - (tree_y + 0.5)) < tree_collision_radius):
                     return True
         
-        # Houses only exist in exterior (zone=None)
-        if zone is None:
-            house_collision_buffer = 0.35  # Buffer around house edges
-            for house in self.interactables.houses.values():
-                y_start, x_start, y_end, x_end = house.bounds
+        # Houses, barrels, beds and stoves near (x, y) in this zone - every
+        # collision box below reaches less than a cell past its object.
+        # Houses only exist in exterior (zone=None), so interiors never get one.
+        house_collision_buffer = 0.35  # Buffer around house edges
+        furniture_collision_radius = 0.35  # Barrels, beds, stoves
+        nearby = self.interactables.spatial.query_rect(zone, x - 1, y - 1, x + 1, y + 1, BLOCKING_KINDS)
+        for kind, obj in nearby:
+            if kind == 'house':
+                y_start, x_start, y_end, x_end = obj.bounds
                 # Use y_start + 1 to make houses 1 cell shorter from top (allows walking behind)
                 effective_y_start = y_start + 1
                 # Expand bounds by buffer for collision
                 if (x_start - house_collision_buffer <= x < x_end + house_collision_buffer and
                     effective_y_start - house_collision_buffer <= y < y_end + house_collision_buffer):
                     return True
-        
-        # Check barrel collisions - only in same zone
-        barrel_collision_radius = 0.35
-        for barrel in self.interactables.barrels.values():
-            if barrel.zone != zone:
-                continue
-            barrel_center_x = barrel.x + 0.5
-            barrel_center_y = barrel.y + 0.5
-            dx = abs(x - barrel_center_x)
-            dy = abs(y - barrel_center_y)
-            if dx < barrel_collision_radius and dy < barrel_collision_radius:
-                return True
-        
-        # Check bed collisions - only in same zone
-        bed_collision_radius = 0.35
-        for bed in self.interactables.beds.values():
-            if bed.zone != zone:
-                continue
-            bed_center_x = bed.x + 0.5
-            bed_center_y = bed.y + 0.5
-            dx = abs(x - bed_center_x)
-            dy = abs(y - bed_center_y)
-            if dx < bed_collision_radius and dy < bed_collision_radius:
-                return True
-        
-        # Check stove collisions - only in same zone
-        stove_collision_radius = 0.35
-        for stove in self.interactables.stoves.values():
-            if stove.zone != zone:
-                continue
-            stove_center_x = stove.x + 0.5
-            stove_center_y = stove.y + 0.5
-            dx = abs(x - stove_center_x)
-            dy = abs(y - stove_center_y)
-            if dx < stove_collision_radius and dy < stove_collision_radius:
-                return True
+            else:
+                dx = abs(x - (obj.x + 0.5))
+                dy = abs(y - (obj.y + 0.5))
+                if dx < furniture_collision_radius and dy < furniture_collision_radius:
+                    return True
         
         # Check character collisions - only in same zone
         if check_characters:
-            for char in self.characters:
+            # Only collide with characters in the same zone
+            for char in self.characters_in_zone(zone):
                 if char is exclude_char:
                     continue
-                # Only collide with characters in the same zone
-                char_zone = char.zone if hasattr(char, 'zone') else None
-                if char_zone != zone:
-                    continue
                 # Use interior coords when in interior, world coords otherwise
                 if zone is not None:
                     char_x = char.prevailing_x
@@ -554,11 +631,7 @@ class GameState:
         Returns True if the area has an allegiance (is part of a settlement).
         Works with float positions - uses the cell containing the point.
         """
-        cell_x = int(x)
-        cell_y = int(y)
-        if not (0 <= cell_x < SIZE and 0 <= cell_y < SIZE):
-            return False
-        area = self.area_map[cell_y][cell_x]
+        area = self.chunks.get_area_at(x, y)
         if not area:
             return False
         # Check if this area has an allegiance (is part of a settlement)
@@ -569,11 +642,7 @@ class GameState:
         """Check if position is in an area belonging to a specific allegiance.
         Works with float positions.
         """
-        cell_x = int(x)
-        cell_y = int(y)
-        if not (0 <= cell_x < SIZE and 0 <= cell_y < SIZE):
-            return False
-        area = self.area_map[cell_y][cell_x]
+        area = self.chunks.get_area_at(x, y)
         if not area:
             return False
         area_allegiance = self.get_allegiance_of_area(area)
@@ -593,13 +662,8 @@ class GameState:
     # =============================================================================
 
     def get_area_cells(self, area_name):
-        """Get all cells belonging to an area"""
-        cells = []
-        for y in range(SIZE):
-            for x in range(SIZE):
-                if self.area_map[y][x] == area_name:
-                    cells.append((x, y))
-        return cells
+        """Get all cells belonging to an area (in loaded chunks)"""
+        return self.chunks.get_area_cells(area_name)
     
     def get_area_bounds(self, area_name):
         """Get the bounding box of an area as (min_x, min_y, max_x, max_y).
@@ -749,18 +813,19 @@ class GameState:
         
         # Exterior area logic - return cell centers (world coords)
         valid_positions = []
+        if not is_village:
+            for x, y in self.get_area_cells(area_name):
+                if (x, y) not in self.farm_cells:
+                    valid_positions.append((x + 0.5, y + 0.5))
+            return valid_positions
+        
         for y in range(SIZE):
             for x in range(SIZE):
                 # Skip farm cells
                 if (x, y) in self.farm_cells:
                     continue
-                
-                if is_village:
-                    if self.is_in_village(x, y):
-                        valid_positions.append((x + 0.5, y + 0.5))
-                else:
-                    if self.get_area_at(x, y) == area_name:
-                        valid_positions.append((x + 0.5, y + 0.5))
+                if self.is_in_village(x, y):
+                    valid_positions.append((x + 0.5, y + 0.5))
         return valid_positions
 
     # =============================================================================
@@ -925,9 +990,48 @@ class GameState:
 
     def get_steward(self):
         """Get the steward character, or None if no steward exists."""
-        for char in self.characters:
-            if char.get('job') == 'Steward':
+        return next(iter(self._stewards_by_allegiance.values()), None)
+    
+    # =============================================================================
+    # TAX DEADLINES - Per-steward queues of when farmers become overdue
+    # =============================================================================
+    
+    def schedule_tax_deadline(self, char, due_tick):
+        """Set when a farmer's tax is due and queue it for their allegiance's steward.
+        
+        The steward hears about it TAX_GRACE_PERIOD ticks after due_tick (see
+        peek_overdue_taxpayer). The entry stays queued while the steward
+        collects; rescheduling or clear_tax_deadline leaves it stale, and it's
+        dropped when it reaches the front.
+        """
+        char.tax_due_tick = due_tick
+        self._tax_seq += 1
+        queue = self._tax_deadlines.setdefault(char.allegiance, [])
+        heapq.heappush(queue, (due_tick + TAX_GRACE_PERIOD, self._tax_seq, char.char_id, due_tick))
+    
+    def clear_tax_deadline(self, char):
+        """The farmer paid - nothing is due any more"""
+        char.tax_due_tick = None
+    
+    def get_overdue_allegiances(self, tick):
+        """Allegiances whose earliest tax deadline has passed (cheap when none have)"""
+        return [allegiance for allegiance, queue in self._tax_deadlines.items()
+                if queue and queue[0][0] <= tick]
+    
+    def peek_overdue_taxpayer(self, allegiance, tick):
+        """The farmer at the front of an allegiance's queue if they're overdue, else None.
+        
+        Entries that no longer apply (farmer gone, no longer a farmer of this
+        allegiance, paid, or rescheduled) are discarded on the way.
+        """
+        queue = self._tax_deadlines.get(allegiance)
+        while queue and queue[0][0] <= tick:
+            _, _, char_id, due_tick = queue[0]
+            char = self._characters_by_id.get(char_id)
+            if (char is not None and char.job == 'Farmer' and char.allegiance == allegiance
+                    and char.tax_due_tick == due_tick):
                 return char
+            heapq.heappop(queue)
         return None
     
     def get_allegiance_count(self, allegiance):
@@ -1031,31 +1135,40 @@ class GameState:
         return None
 
     # =============================================================================
-    # STATE MODIFICATION - Character removal and action logging
+    # STATE MODIFICATION - Character removal, corpses and action logging
     # =============================================================================
 
     def remove_character(self, char):
         """Remove a character from the game and clear all references to them"""
-        if char in self.characters:
-            self.characters.remove(char)
+        if not self.has_character(char):
+            return
+        self.characters.remove(char)
+        del self._characters_by_id[char.char_id]
+        if self._characters_by_name.get(char.name) is char:
+            del self._characters_by_name[char.name]
+        members = self._characters_by_zone.get(char.zone)
+        if members is not None:
+            members.pop(char, None)
+        self.vitals.detach(char)
+        char.zone_listener = None
+        char.role_listener = None
+        if self._stewards_by_allegiance.get(char.allegiance) is char:
+            self._replace_steward(char.allegiance)
         if char == self.player:
             self.player = None
         
-        # Get the id before clearing references (needed for known_crimes lookup)
-        char_id = id(char)
-        
-        # Clear all references to this character from other characters
-        for other in self.characters:
-            if other.get('robbery_target') == char:
-                other['robbery_target'] = None
-                other['is_aggressor'] = False
-            if other.get('flee_from') == char:
-                other['flee_from'] = None
-            if other.get('tax_collection_target') == char:
-                other['tax_collection_target'] = None
-            # Clear from known_crimes memory (uses id() as key)
-            if 'known_crimes' in other and char_id in other['known_crimes']:
-                del other['known_crimes'][char_id]
+        # Only characters that referenced the deceased need touching
+        for other in char.get_referrers():
+            other.release_references_to(char)
+        char.release_all_references()
+    
+    def add_corpse(self, corpse):
+        """Add a corpse to the world (starts decaying from the current tick)"""
+        self.corpses.add(corpse, self.ticks)
+    
+    def remove_corpse(self, corpse):
+        """Remove a corpse from the world without leaving a marker"""
+        self.corpses.remove(corpse)
     
     def log_action(self, message):
         """Add a message to the action log"""
@@ -1081,14 +1194,21 @@ class GameState:
         """Reset game to initial state"""
         self.ticks = 0
         self.game_speed = 1
+        self.effective_speed = 1.0
+        self.turbo = False
         self.paused = False
         self.characters = []
+        self._characters_by_zone = {}
+        self._characters_by_id = {}
+        self._characters_by_name = {}
+        self._stewards_by_allegiance = {}
+        self._tax_deadlines = {}
+        self.vitals = VitalsTable()
         self.player = None
         self.farm_cells = {}
-        self.corpses = []
+        self.corpses.clear()
         self.action_log = []
         self.log_total_count = 0
-        self.area_map = [[None for _ in range(SIZE)] for _ in range(SIZE)]
         
         self._init_areas()
         self._init_farm_cells()
@@ -0,0 +1,122 @@
+# interaction_resolver.py - Ranked E-key interaction candidates around the player
+"""
+InteractionResolver finds what the player could interact with next, for both
+the HUD hint (every frame) and the E key (PlayerController.handle_interact).
+
+The world objects in reach (doors, windows, stoves, corpses, barrels, beds,
+trees) come from ONE radius query against the interactables' spatial index.
+Each candidate is checked once (distance + facing) and the survivors are
+ranked by priority, then distance. That ranked list is cached until the
+player moves, turns, changes zone, or the index changes (spatial.version),
+so a player standing still costs a dict lookup per frame.
+
+Characters and camps are not in the index and can move without the player
+moving, so get_available_interaction still checks those live, at their
+place in the priority order (see PRIORITY_NPC / PRIORITY_COOKING).
+"""
+
+from constants import ADJACENCY_DISTANCE, INTERACT_DISTANCE
+
+
+# Interaction priorities, lowest first (the order of the original E-key chain)
+PRIORITY_DOOR = 0     # Allows escaping combat
+PRIORITY_NPC = 1      # Checked live
+PRIORITY_WINDOW = 2
+PRIORITY_COOKING = 3  # Stoves from the index; camps checked live
+PRIORITY_CORPSE = 4
+PRIORITY_BARREL = 5
+PRIORITY_BED = 6
+PRIORITY_TREE = 7
+
+# Reach of the candidate query. Objects are indexed at their cell corner (or
+# house bounds) while checks use centers up to a cell away, hence the margin.
+QUERY_RADIUS = max(ADJACENCY_DISTANCE, INTERACT_DISTANCE) + 1.5
+
+_OBJECT_KINDS = ('house', 'stove', 'corpse', 'barrel', 'bed', 'tree')
+
+
+class InteractionResolver:
+    """Caches the ranked (priority, kind, target) candidates around the player."""
+
+    def __init__(self, controller):
+        """
+        Args:
+            controller: PlayerController (for state and window facing rules)
+        """
+        self.controller = controller
+        self.state = controller.state
+        self._cache_key = None
+        self._candidates = []
+
+    def invalidate(self):
+        """Force the next candidates() call to re-query."""
+        self._cache_key = None
+
+    def candidates(self, player):
+        """Ranked [(priority, kind, target), ...] the player can currently use."""
+        if player.zone is not None:
+            px, py = player.prevailing_x, player.prevailing_y
+        else:
+            px, py = player.x, player.y
+        key = (player.zone, px, py, player.facing, self.state.interactables.spatial.version)
+        if key != self._cache_key:
+            self._candidates = self._collect(player, px, py)
+            self._cache_key = key
+        return self._candidates
+
+    def _collect(self, player, px, py):
+        zone = player.zone
+        found = []  # (priority, distance_sq, kind, target)
+
+        def add(priority, kind, target, tx, ty):
+            found.append((priority, (tx - px) ** 2 + (ty - py) ** 2, kind, target))
+
+        # Interior doors and windows belong to the interior, not the index
+        if zone is not None:
+            interior = self.state.interiors.get_interior(zone)
+            if interior:
+                if interior.is_at_door(px, py, threshold=0.5):
+                    add(PRIORITY_DOOR, 'door', interior.house, px, py)
+                for window in interior.windows:
+                    if window.is_character_near(px, py, threshold=1.0):
+                        add(PRIORITY_WINDOW, 'window', window, window.interior_x + 0.5, window.interior_y + 0.5)
+
+        for kind, obj in self.state.interactables.get_objects_near(zone, px, py, QUERY_RADIUS, _OBJECT_KINDS):
+            if kind == 'house':
+                interior = obj.interior
+                if not interior:
+                    continue
+                door_x, door_y = interior.exterior_door_x, interior.exterior_door_y
+                if abs(px - door_x) < 1.0 and abs(py - door_y) < 1.0:
+                    add(PRIORITY_DOOR, 'door', obj, door_x, door_y)
+                # Outside: must be near a window AND facing into it
+                for window in interior.windows:
+                    if (window.is_character_near_exterior(px, py, threshold=1.0)
+                            and self.controller._is_facing_toward_window(player, window)):
+                        add(PRIORITY_WINDOW, 'window', window, px, py)
+
+            elif kind == 'corpse':
+                cx, cy = obj.center
+                if (cx - px) ** 2 + (cy - py) ** 2 <= INTERACT_DISTANCE ** 2 and player.is_facing_position(cx, cy):
+                    add(PRIORITY_CORPSE, 'corpse', obj, cx, cy)
+
+            elif obj.is_adjacent(player):
+                # Stoves, barrels, beds and trees: adjacent and facing the object
+                if kind == 'barrel' and obj.zone is None:
+                    tx, ty = obj.world_x, obj.world_y
+                else:
+                    tx, ty = obj.x + 0.5, obj.y + 0.5
+                if not player.is_facing_position(tx, ty):
+                    continue
+                if kind == 'stove':
+                    spot = {'type': 'stove', 'name': obj.name, 'source': obj}
+                    add(PRIORITY_COOKING, 'cooking', spot, tx, ty)
+                elif kind == 'barrel':
+                    add(PRIORITY_BARREL, 'barrel', obj, tx, ty)
+                elif kind == 'bed':
+                    add(PRIORITY_BED, 'bed', obj, tx, ty)
+                elif kind == 'tree':
+                    add(PRIORITY_TREE, 'tree', obj, tx, ty)
+
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [(priority, kind, target) for priority, _, kind, target in found]
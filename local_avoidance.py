@@ -0,0 +1,322 @@
+# local_avoidance.py - Reciprocal velocity-obstacle (ORCA) crowd steering
+"""
+Turns every moving NPC's preferred velocity (vx/vy, set each tick from its
+goal) into a collision-free velocity, for the whole crowd in one pass.
+
+Per substep:
+1. Every character in a zone goes into a uniform neighbour grid (cell size =
+   AVOIDANCE_NEIGHBOR_DIST), so finding the agents worth avoiding is a 3x3
+   cell lookup instead of a scan over everyone.
+2. Each moving NPC builds one ORCA half-plane per neighbour (at most
+   AVOIDANCE_MAX_NEIGHBORS, nearest first) and per small static obstacle
+   (trees, barrels, beds, stoves from the world spatial index, as circles),
+   then solves the 2D linear program for the velocity closest to its
+   preferred one inside all of them.
+
+Moving NPCs share the avoidance effort with each other (each takes half);
+idle characters and the player are treated as immovable, so the mover
+takes all of it. Cost per agent is bounded by the neighbour cap, so dense
+crowds flow at a fixed cost instead of repeatedly probing collisions.
+
+The solver follows the RVO2 library (van den Berg et al., "Reciprocal
+n-Body Collision Avoidance"), restricted to agent-agent lines: obstacles
+are approximated as static round agents, and walls/houses are still
+handled by the caller's blocked-position check.
+"""
+
+import math
+
+from constants import (
+    AVOIDANCE_RADIUS, AVOIDANCE_NEIGHBOR_DIST, AVOIDANCE_MAX_NEIGHBORS,
+    AVOIDANCE_TIME_HORIZON, AVOIDANCE_OBSTACLE_TIME_HORIZON,
+    AVOIDANCE_OBSTACLE_RADIUS, AVOIDANCE_OBSTACLE_KINDS,
+)
+
+EPSILON = 1e-5
+
+
+# =============================================================================
+# LINEAR PROGRAM (RVO2 linearProgram1/2/3)
+# =============================================================================
+# A line is (point_x, point_y, dir_x, dir_y); the permitted half-plane is to
+# the left of the direction.
+
+def _program1(lines, line_no, radius, opt_x, opt_y, direction_opt):
+    """Optimize along one line, subject to the lines before it and the speed disc."""
+    px, py, dx, dy = lines[line_no]
+    dot = px * dx + py * dy
+    discriminant = dot * dot + radius * radius - (px * px + py * py)
+    if discriminant < 0.0:
+        return None  # Max speed circle fully invalidates this line
+    sqrt_disc = math.sqrt(discriminant)
+    t_left = -dot - sqrt_disc
+    t_right = -dot + sqrt_disc
+
+    for i in range(line_no):
+        qx, qy, ex, ey = lines[i]
+        denominator = dx * ey - dy * ex
+        numerator = ex * (py - qy) - ey * (px - qx)
+        if abs(denominator) <= EPSILON:
+            # Lines are (nearly) parallel
+            if numerator < 0.0:
+                return None
+            continue
+        t = numerator / denominator
+        if denominator >= 0.0:
+            t_right = min(t_right, t)
+        else:
+            t_left = max(t_left, t)
+        if t_left > t_right:
+            return None
+
+    if direction_opt:
+        t = t_right if opt_x * dx + opt_y * dy > 0.0 else t_left
+    else:
+        t = dx * (opt_x - px) + dy * (opt_y - py)
+        t = min(max(t, t_left), t_right)
+    return px + t * dx, py + t * dy
+
+
+def _program2(lines, radius, opt_x, opt_y, direction_opt):
+    """Velocity closest to opt inside all lines. Returns (fail_index, vx, vy)."""
+    if direction_opt:
+        rx, ry = opt_x * radius, opt_y * radius
+    else:
+        speed_sq = opt_x * opt_x + opt_y * opt_y
+        if speed_sq > radius * radius:
+            scale = radius / math.sqrt(speed_sq)
+            rx, ry = opt_x * scale, opt_y * scale
+        else:
+            rx, ry = opt_x, opt_y
+
+    for i, (px, py, dx, dy) in enumerate(lines):
+        if dx * (py - ry) - dy * (px - rx) > 0.0:
+            # Current result violates line i
+            solved = _program1(lines, i, radius, opt_x, opt_y, direction_opt)
+            if solved is None:
+                return i, rx, ry
+            rx, ry = solved
+    return len(lines), rx, ry
+
+
+def _program3(lines, begin, radius, rx, ry):
+    """Infeasible case: minimize the largest penetration into the failing lines."""
+    distance = 0.0
+    for i in range(begin, len(lines)):
+        px, py, dx, dy = lines[i]
+        if dx * (py - ry) - dy * (px - rx) <= distance:
+            continue
+        projected = []
+        for j in range(i):
+            qx, qy, ex, ey = lines[j]
+            determinant = dx * ey - dy * ex
+            if abs(determinant) <= EPSILON:
+                if dx * ex + dy * ey > 0.0:
+                    continue  # Same direction
+                point_x, point_y = 0.5 * (px + qx), 0.5 * (py + qy)
+            else:
+                t = (ex * (py - qy) - ey * (px - qx)) / determinant
+                point_x, point_y = px + t * dx, py + t * dy
+            nx, ny = ex - dx, ey - dy
+            length = math.hypot(nx, ny)
+            if length <= EPSILON:
+                continue
+            projected.append((point_x, point_y, nx / length, ny / length))
+        fail, new_x, new_y = _program2(projected, radius, -dy, dx, True)
+        if fail >= len(projected):
+            rx, ry = new_x, new_y
+        distance = dx * (py - ry) - dy * (px - rx)
+    return rx, ry
+
+
+# =============================================================================
+# ORCA
+# =============================================================================
+
+def _orca_line(rel_x, rel_y, rel_vx, rel_vy, vx, vy, combined_radius,
+               time_horizon, dt, responsibility):
+    """Half-plane of velocities that avoid one neighbour for time_horizon seconds.
+
+    rel = neighbour position - own position, rel_v = own velocity - neighbour's.
+    """
+    dist_sq = rel_x * rel_x + rel_y * rel_y
+    radius_sq = combined_radius * combined_radius
+
+    if dist_sq > radius_sq:
+        # No collision yet
+        inv_horizon = 1.0 / time_horizon
+        wx = rel_vx - inv_horizon * rel_x
+        wy = rel_vy - inv_horizon * rel_y
+        w_len_sq = wx * wx + wy * wy
+        dot1 = wx * rel_x + wy * rel_y
+        if dot1 < 0.0 and dot1 * dot1 > radius_sq * w_len_sq:
+            # Project on cut-off circle
+            w_len = math.sqrt(w_len_sq)
+            ux, uy = wx / w_len, wy / w_len
+            dir_x, dir_y = uy, -ux
+            scale = combined_radius * inv_horizon - w_len
+            u_x, u_y = scale * ux, scale * uy
+        else:
+            # Project on the nearer leg of the cone
+            leg = math.sqrt(dist_sq - radius_sq)
+            if rel_x * wy - rel_y * wx > 0.0:
+                dir_x = (rel_x * leg - rel_y * combined_radius) / dist_sq
+                dir_y = (rel_x * combined_radius + rel_y * leg) / dist_sq
+            else:
+                dir_x = -(rel_x * leg + rel_y * combined_radius) / dist_sq
+                dir_y = -(-rel_x * combined_radius + rel_y * leg) / dist_sq
+            dot2 = rel_vx * dir_x + rel_vy * dir_y
+            u_x = dot2 * dir_x - rel_vx
+            u_y = dot2 * dir_y - rel_vy
+    else:
+        # Already overlapping: get apart within this step
+        inv_step = 1.0 / dt
+        wx = rel_vx - inv_step * rel_x
+        wy = rel_vy - inv_step * rel_y
+        w_len = math.hypot(wx, wy)
+        if w_len <= EPSILON:
+            return None
+        ux, uy = wx / w_len, wy / w_len
+        dir_x, dir_y = uy, -ux
+        scale = combined_radius * inv_step - w_len
+        u_x, u_y = scale * ux, scale * uy
+
+    return (vx + responsibility * u_x, vy + responsibility * u_y, dir_x, dir_y)
+
+
+def solve_velocity(lines, pref_x, pref_y, max_speed):
+    """Velocity closest to the preferred one that satisfies every ORCA line."""
+    fail, vx, vy = _program2(lines, max_speed, pref_x, pref_y, False)
+    if fail < len(lines):
+        vx, vy = _program3(lines, fail, max_speed, vx, vy)
+    return vx, vy
+
+
+# =============================================================================
+# CROWD PASS
+# =============================================================================
+
+class Agent:
+    """One character's snapshot for an avoidance pass."""
+    __slots__ = ('char', 'zone', 'x', 'y', 'vx', 'vy', 'pref_x', 'pref_y', 'movable')
+
+    def __init__(self, char, zone, x, y, vx, vy, pref_x, pref_y, movable):
+        self.char = char
+        self.zone = zone
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.pref_x = pref_x
+        self.pref_y = pref_y
+        self.movable = movable
+
+
+def build_grid(agents, cell_size=AVOIDANCE_NEIGHBOR_DIST):
+    """Bucket agents by (zone, cell_x, cell_y)."""
+    grid = {}
+    for agent in agents:
+        key = (agent.zone, int(agent.x // cell_size), int(agent.y // cell_size))
+        grid.setdefault(key, []).append(agent)
+    return grid
+
+
+def neighbours(agent, grid, cell_size=AVOIDANCE_NEIGHBOR_DIST,
+               max_neighbours=AVOIDANCE_MAX_NEIGHBORS):
+    """Nearest agents within cell_size of agent, as (dist_sq, other), closest first."""
+    cx = int(agent.x // cell_size)
+    cy = int(agent.y // cell_size)
+    range_sq = cell_size * cell_size
+    found = []
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            for other in grid.get((agent.zone, gx, gy), ()):
+                if other is agent:
+                    continue
+                dx = other.x - agent.x
+                dy = other.y - agent.y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < range_sq:
+                    found.append((dist_sq, other))
+    if len(found) > max_neighbours:
+        found.sort(key=lambda pair: pair[0])
+        del found[max_neighbours:]
+    return found
+
+
+def compute_velocities(agents, dt, spatial=None, grid=None):
+    """Collision-free velocities for every movable agent with a preferred velocity.
+
+    Args:
+        agents: Agent snapshots for everyone that can be bumped into
+        dt: Length of the coming movement step (seconds)
+        spatial: Optional world SpatialIndex for small static obstacles
+        grid: build_grid(agents), if the caller already has it
+
+    Returns:
+        {agent: (vx, vy)} for the movable agents
+    """
+    if grid is None:
+        grid = build_grid(agents)
+    combined = AVOIDANCE_RADIUS * 2
+    obstacle_combined = AVOIDANCE_RADIUS + AVOIDANCE_OBSTACLE_RADIUS
+    results = {}
+
+    for agent in agents:
+        if not agent.movable:
+            continue
+        pref_x, pref_y = agent.pref_x, agent.pref_y
+        max_speed = math.hypot(pref_x, pref_y)
+        if max_speed <= EPSILON:
+            continue
+        vx, vy = agent.vx, agent.vy
+        lines = []
+
+        for _, other in neighbours(agent, grid):
+            responsibility = 0.5 if other.movable and (other.pref_x or other.pref_y) else 1.0
+            line = _orca_line(other.x - agent.x, other.y - agent.y,
+                              vx - other.vx, vy - other.vy, vx, vy,
+                              combined, AVOIDANCE_TIME_HORIZON, dt, responsibility)
+            if line is not None:
+                lines.append(line)
+
+        if spatial is not None:
+            for _, obj in spatial.query_radius(agent.zone, agent.x - 0.5, agent.y - 0.5,
+                                               AVOIDANCE_NEIGHBOR_DIST, AVOIDANCE_OBSTACLE_KINDS):
+                line = _orca_line(obj.x + 0.5 - agent.x, obj.y + 0.5 - agent.y,
+                                  vx, vy, vx, vy, obstacle_combined,
+                                  AVOIDANCE_OBSTACLE_TIME_HORIZON, dt, 1.0)
+                if line is not None:
+                    lines.append(line)
+
+        if lines:
+            results[agent] = solve_velocity(lines, pref_x, pref_y, max_speed)
+        else:
+            results[agent] = (pref_x, pref_y)
+    return results
+
+
+def bumps_neighbour(agent, x, y, grid, collision_dist, cell_size=AVOIDANCE_NEIGHBOR_DIST):
+    """Would moving agent to (x, y) push it into another character?
+
+    Only counts neighbours it would end up within collision_dist of *and*
+    closer to than before, so characters that already overlap can separate.
+    """
+    cx = int(agent.x // cell_size)
+    cy = int(agent.y // cell_size)
+    limit_sq = collision_dist * collision_dist
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            for other in grid.get((agent.zone, gx, gy), ()):
+                if other is agent:
+                    continue
+                dx = other.x - x
+                dy = other.y - y
+                new_sq = dx * dx + dy * dy
+                if new_sq >= limit_sq:
+                    continue
+                old_dx = other.x - agent.x
+                old_dy = other.y - agent.y
+                if new_sq < old_dx * old_dx + old_dy * old_dy:
+                    return True
+    return False
@@ -22,7 +22,7 @@ from constants import (
     DIRECTION_TO_FACINGS, OPPOSITE_DIRECTIONS,
     INTERACT_DISTANCE, FISTS,
 )
-from scenario.scenario_world import SIZE
+from interaction_resolver import InteractionResolver, PRIORITY_NPC, PRIORITY_COOKING
 
 # Get bow stats from ITEMS
 _BOW = ITEMS["bow"]
@@ -52,6 +52,9 @@ class PlayerController:
         
         # Movement state
         self.moving = False
+        
+        # Ranked interaction candidates, cached until the player moves or turns
+        self.interactions = InteractionResolver(self)
     
     @property
     def player(self):
@@ -141,8 +144,9 @@ class PlayerController:
         new_y = player.y + vy * dt
         
         # Keep within bounds (allow touching edges)
-        new_x = max(0, min(SIZE, new_x))
-        new_y = max(0, min(SIZE, new_y))
+        _, _, max_x, max_y = self.state.chunks.bounds
+        new_x = max(0, min(max_x, new_x))
+        new_y = max(0, min(max_y, new_y))
         
         # Try to move, handling collisions
         self._apply_movement_with_collision(player, new_x, new_y, vx, vy, dt)
@@ -516,13 +520,11 @@ class PlayerController:
         nearest_npc = None
         nearest_dist = float('inf')
 
-        for char in self.state.characters:
+        for char in self.state.characters_in_zone(player.zone):
             if char == player:
                 continue
             if char.get('health', 100) <= 0:
                 continue
-            if char.zone != player.zone:
-                continue
 
             # Get positions in local coords (prevailing when interior, x/y when exterior)
             if player.zone:
@@ -546,6 +548,9 @@ class PlayerController:
         """Get what interaction is currently available (for hints and execution).
 
         This is the SINGLE SOURCE OF TRUTH for all E key interactions.
+        World objects come from InteractionResolver (one spatial query, cached
+        while the player stands still facing the same way), so calling this
+        every frame for the hint and again on the key press is cheap.
 
         Returns dict with interaction info, or None if nothing available:
         {
@@ -571,119 +576,134 @@ class PlayerController:
                 'can_interact': True
             }
 
-        # Priority 2: Door (allows escaping combat)
-        house = self.state.get_adjacent_door(player)
-        if house:
+        # Objects come ranked from the resolver's cache; NPCs and camps can
+        # move on their own, so they're checked live at their priority
+        live_checks = [
+            (PRIORITY_NPC, lambda: self._npc_interaction(player, gui_callbacks)),
+            (PRIORITY_COOKING, lambda: self._camp_interaction(player)),
+        ]
+        for priority, kind, target in self.interactions.candidates(player):
+            while live_checks and live_checks[0][0] < priority:
+                interaction = live_checks.pop(0)[1]()
+                if interaction:
+                    return interaction
+            return self._describe_interaction(player, kind, target)
+
+        for _, check in live_checks:
+            interaction = check()
+            if interaction:
+                return interaction
+        return None
+
+    def _npc_interaction(self, player, gui_callbacks):
+        """NPC the player is facing (must be facing them), as an interaction dict."""
+        npc = gui_callbacks['get_facing_npc'](player)
+        if not npc:
+            return None
+        can_talk = gui_callbacks['can_start_dialogue'](npc)
+        return {
+            'type': 'npc',
+            'name': npc.get_display_name(),
+            'label': 'Talk',
+            'target': npc,
+            'can_interact': can_talk,
+            'blocked_reason': f"{npc.get_display_name()} is busy!" if not can_talk else None
+        }
+
+    def _camp_interaction(self, player):
+        """Adjacent campfire the player is facing (camps live on characters, not the index)."""
+        if player.zone is not None:
+            return None
+        camp_pos, camp_owner = self.logic.get_adjacent_camp(player)
+        if not camp_pos or not player.is_facing_position(camp_pos[0] + 0.5, camp_pos[1] + 0.5):
+            return None
+        owner_name = camp_owner.get_display_name() if camp_owner else 'unknown'
+        spot = {'type': 'camp', 'name': f"{owner_name}'s campfire", 'source': camp_pos}
+        return self._describe_interaction(player, 'cooking', spot)
+
+    def _describe_interaction(self, player, kind, target):
+        """Interaction dict for a candidate from InteractionResolver."""
+        if kind == 'door':
             if player.zone is None:
                 return {
                     'type': 'door',
-                    'name': house.name,
+                    'name': target.name,
                     'label': 'Enter',
-                    'target': house,
+                    'target': target,
                     'can_interact': True
                 }
-            else:
-                return {
-                    'type': 'door',
-                    'name': 'Exit',
-                    'label': 'Exit Building',
-                    'target': house,
-                    'can_interact': True
-                }
-
-        # Priority 3: NPC (must be facing them)
-        npc = gui_callbacks['get_facing_npc'](player)
-        if npc:
-            can_talk = gui_callbacks['can_start_dialogue'](npc)
             return {
-                'type': 'npc',
-                'name': npc.get_display_name(),
-                'label': 'Talk',
-                'target': npc,
-                'can_interact': can_talk,
-                'blocked_reason': f"{npc.get_display_name()} is busy!" if not can_talk else None
+                'type': 'door',
+                'name': 'Exit',
+                'label': 'Exit Building',
+                'target': target,
+                'can_interact': True
             }
 
-        # Priority 4: Window
-        window = self.handle_window_input()
-        if window:
+        if kind == 'window':
             return {
                 'type': 'window',
                 'name': 'Window',
                 'label': 'Look Through',
-                'target': window,
+                'target': target,
                 'can_interact': True
             }
 
-        # Priority 5: Cooking spot (stove/campfire - must be facing)
-        cooking_spot = self.logic.get_adjacent_cooking_spot(player)
-        if cooking_spot:
-            source = cooking_spot.get('source')
-            if cooking_spot['type'] == 'stove':
-                target_x, target_y = source.x + 0.5, source.y + 0.5
+        if kind == 'cooking':
+            source = target.get('source')
+            if target['type'] == 'stove':
                 spot_name = source.name
                 can_use = source.can_use(player)
             else:  # campfire
-                target_x, target_y = source[0] + 0.5, source[1] + 0.5
                 spot_name = 'Campfire'
                 can_use = True
+            return {
+                'type': 'cooking',
+                'name': spot_name,
+                'label': 'Bake Bread',
+                'target': target,
+                'can_interact': can_use,
+                'blocked_reason': 'Not your stove' if not can_use else None
+            }
 
-            if player.is_facing_position(target_x, target_y):
-                return {
-                    'type': 'cooking',
-                    'name': spot_name,
-                    'label': 'Bake Bread',
-                    'target': cooking_spot,
-                    'can_interact': can_use,
-                    'blocked_reason': 'Not your stove' if not can_use else None
-                }
-
-        # Priority 6: Corpse (must be facing)
-        corpse = self.logic.get_player_nearby_corpse(player)
-        if corpse:
+        if kind == 'corpse':
             return {
                 'type': 'corpse',
-                'name': f"{corpse.character_name}'s Corpse",
+                'name': f"{target.character_name}'s Corpse",
                 'label': 'Loot',
-                'target': corpse,
+                'target': target,
                 'can_interact': True
             }
 
-        # Priority 7: Barrel (must be facing)
-        barrel = self.logic.get_player_nearby_barrel(player)
-        if barrel:
-            can_use = barrel.can_use(player)
+        if kind == 'barrel':
+            can_use = target.can_use(player)
             return {
                 'type': 'barrel',
-                'name': barrel.name,
+                'name': target.name,
                 'label': 'Open',
-                'target': barrel,
+                'target': target,
                 'can_interact': can_use,
                 'blocked_reason': 'Not your barrel' if not can_use else None
             }
 
-        # Priority 8: Bed (must be facing)
-        bed = self.logic.get_player_nearby_bed(player)
-        if bed:
-            is_owned = bed.is_owned_by(player.name)
-            can_use = is_owned or not bed.is_owned()
+        if kind == 'bed':
+            is_owned = target.is_owned_by(player.name)
+            can_use = is_owned or not target.is_owned()
             return {
                 'type': 'bed',
-                'name': bed.name,
+                'name': target.name,
                 'label': 'Sleep',
-                'target': bed,
+                'target': target,
                 'can_interact': False,  # Not implemented
                 'blocked_reason': 'Sleep not implemented yet' if can_use else 'Not your bed'
             }
 
-        # Priority 9: Tree (must be facing)
-        tree = self.logic.get_player_nearby_tree(player)
-        if tree:
+        if kind == 'tree':
             return {
                 'type': 'tree',
                 'name': 'Tree',
                 'label': 'Shake',
-                'target': tree,
+                'target': target,
                 'can_interact': False,  # Not implemented
                 'blocked_reason': 'Shaking trees not implemented yet'
             }
@@ -0,0 +1,341 @@
+# profiler.py - Scoped timers and counters for the game loop and renderer
+"""
+Lightweight instrumentation for finding where tick and frame time goes.
+
+Usage:
+    profile = get_profiler().scope
+    with profile('tick.stamina'):
+        ...
+    get_profiler().count('sim.ticks', ticks)
+
+Names are dotted; the part before the first dot is the category
+('frame', 'render', 'canvas', 'tick', 'sim'), used to group the console
+report and as the Chrome trace category.
+
+Every finished scope and every counter sample goes into a ring buffer
+(PROFILER_RING_SIZE entries), so the most recent few seconds are always
+available without unbounded growth. From there they can be:
+- summarized (calls / total / mean / max per scope) for a console report
+- exported as a Chrome trace (chrome://tracing or https://ui.perfetto.dev)
+- exported as plain JSON for scripts
+
+When disabled, scope() returns a shared no-op context manager and count()
+returns immediately, so instrumentation can stay in hot paths.
+
+Safe to use from the GUI and simulation threads at once: deque appends are
+atomic, and each event records the thread it ran on.
+
+SamplingCapture is the after-the-fact tool: it walks every thread's stack
+(sys._current_frames) on a background thread, so it sees the simulation
+thread as well as the GUI (cProfile only hooks the thread that enables it)
+and costs nothing until started. It writes a .pstats file (pstats, snakeviz)
+and a .folded file (flamegraph.pl, speedscope).
+"""
+
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import nullcontext
+
+from constants import PROFILER_ENABLED, PROFILER_RING_SIZE, PROFILE_SAMPLE_INTERVAL
+
+
+_NULL_SCOPE = nullcontext()
+
+
+class _Scope:
+    """Times one with-block and records it on exit."""
+
+    __slots__ = ('_events', '_name', '_start')
+
+    def __init__(self, events, name):
+        self._events = events
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self._events.append((self._name, threading.get_ident(), self._start, end - self._start))
+        return False
+
+
+class Profiler:
+    """Collects scoped timings and counter samples into ring buffers."""
+
+    def __init__(self, enabled=PROFILER_ENABLED, capacity=PROFILER_RING_SIZE):
+        self.enabled = enabled
+        self._events = deque(maxlen=capacity)  # (name, thread_id, start_ns, duration_ns)
+        self._counters = deque(maxlen=capacity)  # (name, thread_id, time_ns, value)
+        self._epoch = time.perf_counter_ns()  # Trace timestamps are relative to this
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def scope(self, name):
+        """Context manager timing a block under `name` (no-op when disabled)."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self._events, name)
+
+    def count(self, name, value):
+        """Record a counter sample (e.g. ticks run this step, characters alive)."""
+        if not self.enabled:
+            return
+        self._counters.append((name, threading.get_ident(), time.perf_counter_ns(), value))
+
+    def now(self):
+        """Timestamp in the profiler's clock, for summary(since=...)."""
+        return time.perf_counter_ns()
+
+    def clear(self):
+        self._events.clear()
+        self._counters.clear()
+
+    # =========================================================================
+    # REPORTING
+    # =========================================================================
+
+    def summary(self, since=None):
+        """Aggregate scopes recorded since `since` (a now() value; None = everything).
+
+        Returns:
+            Dict of name -> {'calls', 'total_ms', 'mean_ms', 'max_ms'}
+        """
+        totals = {}
+        for name, _, start, duration in list(self._events):
+            if since is not None and start < since:
+                continue
+            entry = totals.get(name)
+            if entry is None:
+                totals[name] = [1, duration, duration]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+                if duration > entry[2]:
+                    entry[2] = duration
+        return {
+            name: {
+                'calls': calls,
+                'total_ms': total / 1e6,
+                'mean_ms': total / calls / 1e6,
+                'max_ms': longest / 1e6,
+            }
+            for name, (calls, total, longest) in totals.items()
+        }
+
+    def durations(self, since=None):
+        """Every recorded duration (seconds) per scope name, oldest first."""
+        result = {}
+        for name, _, start, duration in list(self._events):
+            if since is not None and start < since:
+                continue
+            result.setdefault(name, []).append(duration / 1e9)
+        return result
+
+    def format_report(self, since=None, frames=None):
+        """Multi-line text report grouped by category, biggest totals first.
+
+        If `frames` is given, totals are also shown per frame.
+        """
+        stats = self.summary(since)
+        if not stats:
+            return ""
+        by_category = {}
+        for name, entry in stats.items():
+            by_category.setdefault(name.split('.', 1)[0], []).append((name, entry))
+
+        lines = [f"=== PROFILE ({frames} frames) ===" if frames else "=== PROFILE ==="]
+        for category in sorted(by_category):
+            lines.append(f"  [{category}]")
+            for name, entry in sorted(by_category[category], key=lambda item: -item[1]['total_ms']):
+                per_frame = f" {entry['total_ms'] / frames:7.2f}ms/frame" if frames else ""
+                lines.append(
+                    f"    {name:<28}{per_frame} mean {entry['mean_ms']:6.3f}ms "
+                    f"max {entry['max_ms']:7.2f}ms  x{entry['calls']}"
+                )
+        return "\n".join(lines)
+
+    # =========================================================================
+    # EXPORT
+    # =========================================================================
+
+    def to_chrome_trace(self):
+        """Ring buffer contents in Chrome trace event format (a dict)."""
+        pid = os.getpid()
+        epoch = self._epoch
+        events = []
+        seen_threads = set()
+
+        for name, tid, start, duration in list(self._events):
+            seen_threads.add(tid)
+            events.append({
+                'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X',
+                'ts': (start - epoch) / 1000, 'dur': duration / 1000,
+                'pid': pid, 'tid': tid,
+            })
+        for name, tid, timestamp, value in list(self._counters):
+            seen_threads.add(tid)
+            events.append({
+                'name': name, 'cat': name.split('.', 1)[0], 'ph': 'C',
+                'ts': (timestamp - epoch) / 1000,
+                'pid': pid, 'tid': tid, 'args': {'value': value},
+            })
+
+        # Label threads (main / simulation) in the viewer
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for tid in seen_threads:
+            events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                'args': {'name': thread_names.get(tid, str(tid))},
+            })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path):
+        """Write the ring buffer as a Chrome trace JSON file. Returns the path."""
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+    def export_json(self, path):
+        """Write the summary plus raw scopes and counters as JSON. Returns the path."""
+        epoch = self._epoch
+        data = {
+            'summary': self.summary(),
+            'scopes': [
+                {'name': name, 'thread': tid, 'start_us': (start - epoch) / 1000, 'duration_us': duration / 1000}
+                for name, tid, start, duration in list(self._events)
+            ],
+            'counters': [
+                {'name': name, 'thread': tid, 'time_us': (timestamp - epoch) / 1000, 'value': value}
+                for name, tid, timestamp, value in list(self._counters)
+            ],
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1)
+        return path
+
+
+class SamplingCapture:
+    """Statistical profiler sampling all threads' stacks until stopped."""
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self._stacks = Counter()  # (thread_name, ((file, line, func), ...) outermost first) -> samples
+        self._thread = None
+        self._running = False
+        self._started = 0.0
+        self._elapsed = 0.0
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running = True
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self._elapsed = time.perf_counter() - self._started
+
+    def _run(self):
+        own = threading.get_ident()
+        thread_names = {}
+        while self._running:
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                name = thread_names.get(tid)
+                if name is None:
+                    thread_names = {t.ident: t.name for t in threading.enumerate()}
+                    name = thread_names.get(tid, str(tid))
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.reverse()
+                self._stacks[(name, tuple(stack))] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def _sample_seconds(self):
+        """Wall time one sample stands for (sleep overshoots the nominal interval)."""
+        if self.samples and self._elapsed:
+            return self._elapsed / self.samples
+        return self.interval
+
+    def write_folded(self, path):
+        """Folded stacks, one 'thread;outer;...;inner count' line per unique stack."""
+        with open(path, 'w') as f:
+            for (thread_name, stack), count in self._stacks.most_common():
+                frames = [thread_name] + [
+                    f"{func} ({os.path.basename(filename)}:{line})" for filename, line, func in stack
+                ]
+                f.write(f"{';'.join(frames)} {count}\n")
+        return path
+
+    def write_pstats(self, path):
+        """Samples converted to a pstats-loadable stats file.
+
+        Call counts are sample counts; times are samples x sample period, so
+        tottime is time spent in the function itself and cumtime includes
+        callees (counted once per sample even when recursive).
+        """
+        period = self._sample_seconds()
+        stats = {}  # func -> [cc, nc, tt, ct, callers]
+
+        def entry(func):
+            found = stats.get(func)
+            if found is None:
+                found = stats[func] = [0, 0, 0.0, 0.0, {}]
+            return found
+
+        for (_, stack), count in self._stacks.items():
+            if not stack:
+                continue
+            seconds = count * period
+            leaf = entry(stack[-1])
+            leaf[2] += seconds
+            for func in set(stack):
+                info = entry(func)
+                info[0] += count
+                info[1] += count
+                info[3] += seconds
+            for caller, callee in set(zip(stack, stack[1:])):
+                callers = entry(callee)[4]
+                nc, cc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                callers[caller] = (nc + count, cc + count, tt, ct + seconds)
+
+        with open(path, 'wb') as f:
+            marshal.dump({func: tuple(info) for func, info in stats.items()}, f)
+        return path
+
+
+# Global profiler instance (shared by the GUI, simulation and game logic)
+_profiler = None
+
+
+def get_profiler():
+    """Get the global profiler instance."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
@@ -0,0 +1,334 @@
+# render_snapshot.py - Immutable per-tick copies of everything the renderer draws
+"""
+The simulation thread publishes a RenderSnapshot once per step
+(see SimulationRunner). The GUI draws the world from the latest snapshot
+without holding the simulation lock, so nothing it reads can change under
+it mid-frame.
+
+A snapshot holds plain value objects, never live game objects:
+- CharacterView: position, facing, animation state, vitals, combat state and
+  bar progress of one character
+- ArrowView, GroundItemView, CorpseView, MarkerView: the other things that
+  move or come and go every tick
+- Results of the player-centric queries the renderer needs (who the player
+  perceives, who is in the attack cone)
+- Farm cell states and the loaded roads, so ground tiles can be (re)baked
+  off the lock
+
+Ground items, corpses and markers are keyed by id() of the live object: the
+renderer culls with the spatial index (whose buckets are copied on write)
+and draws the view it finds under each hit. World layout that only changes
+on chunk streaming or resets (houses, trees, furniture, interiors) is not
+copied; the renderer reads it through the spatial index too.
+
+interpolate_positions() blends the last two snapshots into a separate
+{key: position} mapping for drawing. Nothing here mutates game state.
+"""
+
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+from constants import ITEMS, FISTS, VISION_RANGE, SOUND_RADIUS
+
+_BOW_RANGE = ITEMS["bow"]["range"]
+# Farthest anyone can be perceived from: a vision cone reaching their sound radius
+_PERCEPTION_REACH = VISION_RANGE + SOUND_RADIUS
+_EMPTY = MappingProxyType({})
+
+
+class CharacterView(NamedTuple):
+    """What the renderer needs of one character at one tick."""
+    key: int  # id() of the character, stable across snapshots
+    name: str
+    job: Optional[str]
+    morality: int
+    is_player: bool
+    zone: Optional[str]
+    x: float  # World coords
+    y: float
+    prevailing_x: float  # Local coords (interior when inside, else same as x/y)
+    prevailing_y: float
+    facing: str
+    is_moving: bool  # Moved since the previous snapshot
+    health: float
+    stamina: float
+    fatigue: float
+    hunger: float
+    is_frozen: bool
+    is_starving: bool
+    is_sprinting: bool
+    is_backpedaling: bool
+    is_dying: bool
+    combat_mode: bool
+    is_blocking: bool
+    attack_angle: Optional[float]
+    attack_animation_start: Optional[float]  # time.time() of the last swing
+    heavy_attack_charging: bool
+    hit_flash_until: int  # Tick
+    weapon_type: Optional[str]  # Equipped weapon's 'melee'/'ranged', None when unarmed
+    weapon_range: float
+    camp_position: Optional[tuple]
+    ongoing_action: Optional[tuple]  # (start_time, duration) of the player's timed action
+    heavy_attack_progress: Optional[float]
+    bow_draw_progress: Optional[float]  # None unless drawing a bow
+    bow_spread_degrees: Optional[float]
+
+    def get(self, key, default=None):
+        """Dict-style read, like Character.get (used by the sprite manager)."""
+        return getattr(self, key, default)
+
+    def ongoing_action_progress(self, now=None):
+        """0.0-1.0 progress of the ongoing action at wall time `now`, or None."""
+        if self.ongoing_action is None:
+            return None
+        start_time, duration = self.ongoing_action
+        if now is None:
+            now = time.time()
+        return min(1.0, max(0.0, (now - start_time) / duration))
+
+
+class ArrowView(NamedTuple):
+    x: float
+    y: float
+    dx: float
+    dy: float
+    zone: Optional[str]
+    distance: float
+    max_range: float
+    stuck: bool
+
+
+class GroundItemView(NamedTuple):
+    item_type: str
+    amount: int
+    x: float
+    y: float
+    zone: Optional[str]
+    visual_offset_x: float
+    visual_offset_y: float
+
+
+class CorpseView(NamedTuple):
+    character_name: str
+    facing: str
+    job: Optional[str]
+    morality: int
+    x: float
+    y: float
+    zone: Optional[str]
+
+
+class MarkerView(NamedTuple):
+    x: float
+    y: float
+    zone: Optional[str]
+    count: int
+
+
+class RenderSnapshot(NamedTuple):
+    """Everything the renderer draws, as of the end of one tick."""
+    tick: int
+    time: float  # time.perf_counter() when published
+    characters: Mapping  # key -> CharacterView, in GameState.characters order
+    zones: Mapping  # zone -> tuple of CharacterView
+    player: Optional[CharacterView]
+    perceived: frozenset  # Keys of characters in the rendering zone the player perceives
+    attack_cone: frozenset  # Keys of characters in the player's attack cone
+    arrows: tuple  # ArrowView
+    ground_items: Mapping  # id(GroundItem) -> GroundItemView
+    corpses: Mapping  # id(Corpse) -> CorpseView
+    markers: Mapping  # id(CorpseMarker) -> MarkerView
+    farm_cells: Mapping  # (x, y) -> farm cell state
+    terrain: tuple  # (ChunkDirectory, generation, frozenset of roads) - replaced when ground tiles must be rebaked
+
+    def characters_in_zone(self, zone):
+        return self.zones.get(zone, ())
+
+
+# =============================================================================
+# CAPTURE
+# =============================================================================
+
+_VITALS = ('health', 'stamina', 'hunger', 'is_frozen', 'is_starving', 'is_sprinting')
+
+
+def _weapon(char):
+    """(weapon_type, melee range) of the equipped weapon; range as Character.get_weapon_stats."""
+    slot = char.equipped_weapon
+    if slot is not None and 0 <= slot < len(char.inventory):
+        item = char.inventory[slot]
+        if item is not None:
+            info = ITEMS.get(item.get('type', ''), {})
+            weapon_type = info.get('weapon_type')
+            if weapon_type == 'melee':
+                return weapon_type, info.get('range', FISTS['range'])
+            return weapon_type, FISTS['range']
+    return None, FISTS['range']
+
+
+def _vital_rows(table):
+    """Row -> (health, stamina, hunger, is_frozen, is_starving, is_sprinting).
+
+    One tolist() per column instead of a descriptor read per character and stat.
+    """
+    return list(zip(*(table.view(name).tolist() for name in _VITALS)))
+
+
+def _character_view(char, tick, before, rows, table):
+    x, y = char.x, char.y
+    is_player = char.is_player
+    action = char.ongoing_action
+    charging = char.heavy_attack_charging
+    drawing = is_player and char.bow_drawing
+    if char._vitals is table:
+        health, stamina, hunger, frozen, starving, sprinting = rows[char._vitals_row]
+    else:
+        health, stamina, hunger, frozen, starving, sprinting = (getattr(char, name) for name in _VITALS)
+    weapon_type, weapon_range = _weapon(char)
+    return CharacterView(
+        id(char), char.name, char.get('job'), char.morality, is_player,
+        char.zone, x, y, char.prevailing_x, char.prevailing_y,
+        char.facing,
+        before is not None and (abs(x - before.x) > 0.001 or abs(y - before.y) > 0.001),
+        health, stamina, char.fatigue, hunger,
+        frozen, starving, sprinting,
+        getattr(char, 'is_backpedaling', False),
+        getattr(char, 'is_dying', False),
+        getattr(char, 'combat_mode', False),
+        char.is_blocking,
+        getattr(char, 'attack_angle', None),
+        getattr(char, 'attack_animation_start', None),
+        charging,
+        getattr(char, 'hit_flash_until', 0),
+        weapon_type, weapon_range,
+        getattr(char, 'camp_position', None),
+        (action['start_time'], action['duration']) if action is not None else None,
+        char.get_heavy_attack_progress(tick) if charging else None,
+        char.get_bow_draw_progress(tick) if drawing else None,
+        char.get_bow_spread_degrees(tick) if drawing else None,
+    )
+
+
+def _perception_candidates(state, player):
+    """Characters the player might perceive in the zone the GUI draws.
+
+    The renderer only asks about characters in its rendering zone: the
+    player's own, or the far side of the window they're looking through.
+    Anyone farther than _PERCEPTION_REACH from where the player looks from
+    can't be perceived, so only the rest go through can_perceive_character.
+    """
+    window = getattr(player, 'viewing_through_window', None)
+    if window:
+        interior = getattr(player, 'viewing_into_interior', None)
+        if interior is not None:
+            zone, origin_x, origin_y = interior.name, window.interior_x + 0.5, window.interior_y + 0.5
+        else:
+            zone, origin_x, origin_y = None, window.world_x, window.world_y
+    else:
+        zone = player.zone
+        origin_x, origin_y = (player.prevailing_x, player.prevailing_y) if zone else (player.x, player.y)
+    reach_sq = _PERCEPTION_REACH * _PERCEPTION_REACH
+    for char in state.characters_in_zone(zone):
+        if char is player:
+            continue
+        x, y = (char.prevailing_x, char.prevailing_y) if zone else (char.x, char.y)
+        if (x - origin_x) ** 2 + (y - origin_y) ** 2 <= reach_sq:
+            yield char
+
+
+def _by_zone(views):
+    grouped = {}
+    for view in views:
+        grouped.setdefault(view.zone, []).append(view)
+    return MappingProxyType({zone: tuple(members) for zone, members in grouped.items()})
+
+
+def take_snapshot(state, logic, player_controller, previous=None):
+    """Capture a RenderSnapshot of the current state. Call with the simulation lock held.
+
+    `previous` (the last snapshot) is used to tell which characters are moving.
+    Without a player_controller (headless benchmarks) the attack cone is empty.
+    """
+    tick = state.ticks
+    before = previous.characters if previous is not None else _EMPTY
+
+    table = state.vitals
+    rows = _vital_rows(table)
+    characters = {}
+    for char in state.characters:
+        key = id(char)
+        characters[key] = _character_view(char, tick, before.get(key), rows, table)
+
+    player = state.player
+    player_view = characters.get(id(player)) if player is not None else None
+    perceived = frozenset()
+    attack_cone = frozenset()
+    if player_view is not None:
+        perceived = frozenset(
+            id(char) for char in _perception_candidates(state, player)
+            if logic.can_perceive_character(player, char)[0]
+        )
+        if player_controller is not None:
+            attack_cone = frozenset(player_controller.get_chars_in_attack_cone())
+
+    arrows = tuple(
+        ArrowView(a['x'], a['y'], a['dx'], a['dy'], a['zone'], a['distance'],
+                  a.get('max_range', _BOW_RANGE), bool(a.get('stuck')))
+        for a in state.arrows
+    )
+    ground_items = {
+        id(item): GroundItemView(item.item_type, item.amount, item.x, item.y, item.zone,
+                                 item.visual_offset_x, item.visual_offset_y)
+        for item in state.ground_items.items
+    }
+    corpses = {
+        id(c): CorpseView(c.character_name, c.facing, c.job, c.morality, c.x, c.y, c.zone)
+        for c in state.corpses
+    }
+    markers = {
+        id(m): MarkerView(m.x, m.y, m.zone, m.count) for m in state.corpses.markers.values()
+    }
+    farm_cells = MappingProxyType({pos: cell['state'] for pos, cell in state.farm_cells.items()})
+
+    # Roads only change when chunks stream in or out (or on reset, with new chunks)
+    chunks = state.chunks
+    terrain = previous.terrain if previous is not None else None
+    if terrain is None or terrain[0] is not chunks or terrain[1] != chunks.generation:
+        terrain = (chunks, chunks.generation, frozenset(state.roads))
+
+    return RenderSnapshot(
+        tick, time.perf_counter(),
+        MappingProxyType(characters), _by_zone(characters.values()), player_view,
+        perceived, attack_cone, arrows, MappingProxyType(ground_items),
+        MappingProxyType(corpses), MappingProxyType(markers), farm_cells, terrain,
+    )
+
+
+# =============================================================================
+# INTERPOLATION
+# =============================================================================
+
+def interpolate_positions(previous, latest, alpha):
+    """Draw positions blended between two snapshots.
+
+    Returns:
+        {key: (prevailing_x, prevailing_y, x, y)} for every character in
+        `latest`. Characters that weren't in `previous` (keys are id()s, so
+        a name mismatch means a reused id), or changed zone between the two,
+        sit at their latest position.
+    """
+    positions = {}
+    before = previous.characters
+    for key, view in latest.characters.items():
+        old = before.get(key) if alpha < 1.0 else None
+        if old is None or old.zone != view.zone or old.name != view.name:
+            positions[key] = (view.prevailing_x, view.prevailing_y, view.x, view.y)
+            continue
+        positions[key] = (
+            old.prevailing_x + (view.prevailing_x - old.prevailing_x) * alpha,
+            old.prevailing_y + (view.prevailing_y - old.prevailing_y) * alpha,
+            old.x + (view.x - old.x) * alpha,
+            old.y + (view.y - old.y) * alpha,
+        )
+    return positions
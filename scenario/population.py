@@ -0,0 +1,182 @@
+# population.py - Procedural character templates for stress-scale villages
+# Generates CHARACTER_TEMPLATES-format entries for a generated map (see scenario_characters.py)
+
+import random
+import json
+
+from constants import SKILLS, INVENTORY_SLOTS
+
+
+# =============================================================================
+# NAME POOLS
+# =============================================================================
+FIRST_NAMES = [
+    "Aldric", "Alys", "Ansel", "Ardith", "Baldwin", "Beatrix", "Bertram", "Brina",
+    "Cedric", "Cecily", "Conrad", "Clemence", "Dunstan", "Edith", "Edric", "Elswyth",
+    "Emmet", "Eluned", "Fulke", "Frideswide", "Godric", "Gisela", "Hamon", "Helewise",
+    "Hugh", "Isolde", "Ivo", "Joan", "Jocelyn", "Kenelm", "Leofric", "Lettice",
+    "Mabel", "Milo", "Matilda", "Osric", "Oswin", "Petronel", "Piers", "Rohesia",
+    "Ralf", "Sabine", "Simon", "Sybil", "Theobald", "Tiffany", "Walter", "Wymarc",
+    "Alaric", "Agnes", "Benedict", "Avice", "Drogo", "Ermengarde", "Giles", "Hawise",
+    "Jordan", "Maud", "Odo", "Rosamund", "Roger", "Thea", "Warin", "Ysolda",
+]
+
+SURNAMES = [
+    "Ashdown", "Barley", "Blackmere", "Bramble", "Brook", "Carter", "Chandler", "Cole",
+    "Cooper", "Crane", "Dale", "Dunning", "Elmwood", "Fairfax", "Fletcher", "Flint",
+    "Ford", "Fowler", "Gale", "Greaves", "Hale", "Harrow", "Hayward", "Heath",
+    "Holt", "Hollow", "Kemp", "Lark", "Marsh", "Mercer", "Miller", "Moss",
+    "Nash", "Oakes", "Page", "Pike", "Reeve", "Rook", "Rowe", "Sawyer",
+    "Shaw", "Slade", "Stone", "Swift", "Thatcher", "Thorne", "Tanner", "Vane",
+    "Wade", "Ward", "Weaver", "Webb", "Wells", "West", "Whitlock", "Wick",
+    "Wilde", "Wood", "Wren", "Wright", "Yarrow", "Yates", "Ashford", "Brewster",
+]
+
+
+# =============================================================================
+# DISTRIBUTIONS
+# =============================================================================
+# Traits are 1-10, drawn from a normal distribution around the mean
+TRAIT_MEAN = 5.5
+TRAIT_SPREAD = 2.0
+
+# Skills per character (beyond job skills) and their value range
+EXTRA_SKILLS = (0, 3)
+SKILL_RANGE = (5, 70)
+
+AGE_RANGE = (16, 65)
+
+# Job -> skill minimums that make the job make sense (see JOB_TIERS requires)
+JOB_SKILLS = {
+    "Farmer": {"farming": (40, 90)},
+    "Steward": {"mercantile": (50, 90)},
+    "Soldier": {"strength": (40, 80), "swords": (40, 80)},
+}
+
+# Share of homeless wanderers that still owe allegiance to the village
+HOMELESS_ALLEGIANCE_CHANCE = 0.5
+
+
+def _trait(rng, low=1, high=10):
+    value = int(round(rng.gauss(TRAIT_MEAN, TRAIT_SPREAD)))
+    return max(low, min(high, value))
+
+
+def _skills(rng, job):
+    skills = {}
+    for skill, (low, high) in JOB_SKILLS.get(job, {}).items():
+        skills[skill] = rng.randint(low, high)
+    for skill in rng.sample(sorted(SKILLS), rng.randint(*EXTRA_SKILLS)):
+        skills.setdefault(skill, rng.randint(*SKILL_RANGE))
+    return skills
+
+
+def _inventory(rng, job):
+    """Starting inventory in the in-game slot format (INVENTORY_SLOTS long)."""
+    slots = [{"type": "gold", "amount": rng.randint(0, 200)}]
+    if job == "Farmer":
+        slots.extend({"type": "wheat", "amount": 15} for _ in range(rng.randint(2, 4)))
+    elif job in ("Steward", "Soldier"):
+        slots.append({"type": "wheat", "amount": rng.randint(3, 10)})
+    else:
+        slots.extend({"type": "wheat", "amount": rng.randint(1, 8)} for _ in range(rng.randint(0, 2)))
+    if rng.random() < 0.05:
+        slots.append({"type": "bow", "amount": 1})
+    slots = slots[:INVENTORY_SLOTS]
+    return slots + [None] * (INVENTORY_SLOTS - len(slots))
+
+
+def _names(rng):
+    """Endless unique 'First Last' names; repeats get a roman-numeral suffix."""
+    seen = {}
+    numerals = ["", " II", " III", " IV", " V", " VI", " VII", " VIII", " IX", " X"]
+    while True:
+        base = f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}"
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        if count < len(numerals):
+            yield base + numerals[count]
+        else:
+            yield f"{base} {count + 1}"
+
+
+def _roles(world_data):
+    """(job, allegiance, home) slots the map can actually house.
+
+    One farmer per farmhouse, a steward and two soldiers per military
+    housing (its three beds), one resident per house bed.
+    """
+    village = world_data["name"]
+    roles = []
+    for area in world_data["areas"]:
+        role = area.get("role")
+        if role == "farmhouse":
+            roles.append(("Farmer", area.get("allegiance") or village, area["name"]))
+        elif role in ("military_housing", "barracks"):
+            allegiance = area.get("allegiance") or village
+            roles.append(("Steward", allegiance, area["name"]))
+            roles.append(("Soldier", allegiance, area["name"]))
+            roles.append(("Soldier", allegiance, area["name"]))
+        elif role == "house":
+            roles.append((None, area.get("allegiance") or village, area["name"]))
+    return roles
+
+
+def generate_population(world_data, count, seed=None, exclude_names=()):
+    """Generate `count` NPC templates for a map.
+
+    Args:
+        world_data: WORLD_DATA dict (name, areas, ...) the population lives on
+        count: Number of characters to generate
+        seed: Random seed (same seed + map = same population)
+        exclude_names: Names already taken (e.g. the hand-written characters)
+
+    Returns:
+        Dict of name -> template, in CHARACTER_TEMPLATES format. Characters
+        filling the map's jobs and beds come first; everyone past those is a
+        homeless wanderer.
+    """
+    rng = random.Random(seed)
+    village = world_data["name"]
+    roles = _roles(world_data)
+    names = _names(rng)
+    taken = set(exclude_names)
+
+    templates = {}
+    for i in range(count):
+        if i < len(roles):
+            job, allegiance, home = roles[i]
+        else:
+            job, home = None, None
+            allegiance = village if rng.random() < HOMELESS_ALLEGIANCE_CHANCE else None
+
+        name = next(names)
+        while name in taken:
+            name = next(names)
+        taken.add(name)
+
+        template = {
+            "attractiveness": _trait(rng),
+            "confidence": _trait(rng),
+            "cunning": _trait(rng),
+            "morality": _trait(rng),
+            "starting_allegiance": allegiance,
+            "starting_job": job,
+            "starting_home": home,
+            "starting_inventory": _inventory(rng, job),
+            "starting_age": rng.randint(*AGE_RANGE),
+            "starting_skills": _skills(rng, job),
+            "is_player": False,
+        }
+        if job == "Soldier":
+            # Soldiers must meet the enlistment requirements to keep the job
+            template["morality"] = max(template["morality"], 5)
+            template["confidence"] = max(template["confidence"], 7)
+            template["cunning"] = min(template["cunning"], 5)
+        templates[name] = template
+    return templates
+
+
+if __name__ == "__main__":
+    from scenario.scenario_world import WORLD_DATA
+    print(json.dumps(generate_population(WORLD_DATA, 10, seed=4), indent=2))
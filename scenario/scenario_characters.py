@@ -128,3 +128,13 @@ CHARACTER_TEMPLATES = {
         "is_player": True
     }
 }
+
+# =============================================================================
+# GENERATED POPULATION (optional)
+# =============================================================================
+# Stress-scale villages: fill the map's farmhouses, barracks and houses (and
+# then the roads, with wanderers) with seeded procedural characters - see
+# population.py. Pair with one of the larger WORLD_DATA presets.
+#from scenario.scenario_world import WORLD_DATA
+#from scenario.population import generate_population
+#CHARACTER_TEMPLATES.update(generate_population(WORLD_DATA, 2000, seed=4, exclude_names=CHARACTER_TEMPLATES))
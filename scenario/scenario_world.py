@@ -13,6 +13,15 @@ import json
 WORLD_DATA = generate_areas(30, 0, 2, seed=4, name="Dunmere", trees=0.01)
 #WORLD_DATA = generate_areas(350, 20, 4, seed=4, name="Dunmere", trees=0.08)
 
+# =============================================================================
+# WORLD PLAN (optional streamed surroundings)
+# =============================================================================
+# A plan exported from etc/generator_stubs/world_map_generator.py (press E).
+# With a plan, the town above becomes the top-left chunk of that world and the
+# rest is generated chunk by chunk around the player (see world_chunks.py).
+WORLD_PLAN = None
+#WORLD_PLAN = json.load(open("world_plan.json"))
+
 # =============================================================================
 # DERIVED CONSTANTS
 # =============================================================================
@@ -2,6 +2,7 @@ import random
 import math
 import numpy as np
 import json
+from collections import deque
 
 # Cell type constants (internal use)
 GRASS = 0
@@ -16,10 +17,13 @@ GARDEN = 9
 FARMHOUSE = 10
 TREE = 11
 
+# Cells that count as walkable network for connectivity checks
+PASSABLE_CELLS = [ROAD, MARKET, STALL]
+
 
 class TownGenerator:
     def __init__(self, size=50, seed=None, road_entries=None, num_houses=12, 
-                 num_farms=3, name=None, tree_density=0.08):
+                 num_farms=3, name=None, tree_density=0.08, civic_buildings=True):
         self.seed = seed if seed else random.randint(1, 99999)
         random.seed(self.seed)
         np.random.seed(self.seed)
@@ -33,6 +37,7 @@ class TownGenerator:
         self.num_farms = num_farms
         self.name = name if name else "Town"
         self.tree_density = tree_density
+        self.civic_buildings = civic_buildings  # Market and military housing
         
         # Store data for JSON output
         self.areas = []
@@ -46,8 +51,9 @@ class TownGenerator:
         self.generate_roads()
         
         # 2. Major buildings near center
-        self.place_market()
-        self.place_military_housing()
+        if self.civic_buildings:
+            self.place_market()
+            self.place_military_housing()
         
         # 3. Farms on outskirts with farmhouses
         self.place_farms_with_houses(self.num_farms)
@@ -64,16 +70,33 @@ class TownGenerator:
         # 7. Collect all data and return
         return self._build_output()
     
+    def generate_wilderness(self):
+        """Generate an unsettled tile: through-roads and trees, no buildings or areas."""
+        self.town_center = (self.size // 2, self.size // 2)
+        fx, fy = self.town_center
+        for ex, ey in self._entry_points():
+            self.draw_road(ex, ey, fx, fy)
+        
+        self.place_trees()
+        
+        trees = [(int(x), int(y)) for y, x in np.argwhere(self.grid == TREE)]
+        return {
+            "seed": self.seed,
+            "name": self.name,
+            "size": self.size,
+            "areas": [],
+            "roads": list(self.road_cells),
+            "trees": trees,
+        }
+    
     def _build_output(self):
         """Build the JSON-serializable output structure."""
         # Collect road positions
         self.road_positions = list(self.road_cells)
         
-        # Collect tree positions
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.grid[y, x] == TREE:
-                    self.tree_positions.append((x, y))
+        # Collect tree positions (row-major, same order as a y/x scan)
+        for y, x in np.argwhere(self.grid == TREE):
+            self.tree_positions.append((int(x), int(y)))
         
         # Calculate effective village bounds from structures (not trees/grass/roads)
         # Include: buildings, farms, market
@@ -97,13 +120,12 @@ class TownGenerator:
                 village_max_y = max(village_max_y, fy + 1)
         
         # Include market/stall cells
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.grid[y, x] in [MARKET, STALL]:
-                    village_min_x = min(village_min_x, x)
-                    village_min_y = min(village_min_y, y)
-                    village_max_x = max(village_max_x, x + 1)
-                    village_max_y = max(village_max_y, y + 1)
+        market_cells = [(int(x), int(y)) for y, x in np.argwhere(np.isin(self.grid, [MARKET, STALL]))]
+        for x, y in market_cells:
+            village_min_x = min(village_min_x, x)
+            village_min_y = min(village_min_y, y)
+            village_max_x = max(village_max_x, x + 1)
+            village_max_y = max(village_max_y, y + 1)
         
         # Add a 2-cell margin around the effective bounds for the village territory
         village_margin = 2
@@ -132,13 +154,7 @@ class TownGenerator:
             bounds = [by, bx, by + bh, bx + bw]
             
             if btype == 'Market':
-                # Get actual market bounds from grid
-                market_cells = []
-                for y in range(self.size):
-                    for x in range(self.size):
-                        if self.grid[y, x] in [MARKET, STALL]:
-                            market_cells.append((x, y))
-                
+                # Actual market bounds come from the grid cells collected above
                 if market_cells:
                     min_x = min(c[0] for c in market_cells)
                     max_x = max(c[0] for c in market_cells)
@@ -228,19 +244,24 @@ class TownGenerator:
     def is_clear(self, x, y, w, h, margin=1, allowed=None):
         if allowed is None:
             allowed = [GRASS]
-        for cy in range(y - margin, y + h + margin):
-            for cx in range(x - margin, x + w + margin):
-                if cx < 0 or cy < 0 or cx >= self.size or cy >= self.size:
-                    return False
-                if self.grid[cy, cx] not in allowed:
-                    return False
-        return True
+        x0, y0 = x - margin, y - margin
+        x1, y1 = x + w + margin, y + h + margin
+        if x0 < 0 or y0 < 0 or x1 > self.size or y1 > self.size:
+            return False
+        region = self.grid[y0:y1, x0:x1]
+        ok = region == allowed[0]
+        for cell_type in allowed[1:]:
+            ok |= region == cell_type
+        return bool(ok.all())
     
     def place(self, x, y, w, h, cell_type):
-        for cy in range(y, y + h):
-            for cx in range(x, x + w):
-                if 0 <= cx < self.size and 0 <= cy < self.size:
-                    self.grid[cy, cx] = cell_type
+        self.grid[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = cell_type
+    
+    def count_neighbours(self, mask):
+        """Count each cell's 4-neighbours that are set in mask (edges count as empty)."""
+        padded = np.pad(mask.astype(np.int8), 1)
+        return (padded[:-2, 1:-1] + padded[2:, 1:-1] +
+                padded[1:-1, :-2] + padded[1:-1, 2:])
     
     def generate_roads(self):
         """Create roads from specified edge entry points to a focal point."""
@@ -257,12 +278,20 @@ class TownGenerator:
                         self.grid[py, px] = ROAD
                         self.road_cells.add((px, py))
         
-        if not self.road_entries:
-            return
+        for ex, ey in self._entry_points():
+            self.draw_road(ex, ey, fx, fy)
+    
+    def _entry_points(self):
+        """Edge cells where roads enter the map, one per road_entries entry.
         
+        Entries are compass directions, or explicit (x, y) edge cells when the
+        caller needs roads to line up with a neighbouring map.
+        """
         entry_points = []
         for direction in self.road_entries:
-            if direction == 'north':
+            if isinstance(direction, tuple):
+                entry_points.append(direction)
+            elif direction == 'north':
                 entry_points.append((random.randint(10, self.size - 10), 0))
             elif direction == 'south':
                 entry_points.append((random.randint(10, self.size - 10), self.size - 1))
@@ -278,9 +307,7 @@ class TownGenerator:
                 entry_points.append((self.size - 1, self.size - 1))
             elif direction == 'southwest':
                 entry_points.append((0, self.size - 1))
-        
-        for ex, ey in entry_points:
-            self.draw_road(ex, ey, fx, fy)
+        return entry_points
     
     def draw_road(self, x1, y1, x2, y2):
         """Draw smooth road (2 cells thick) between two points using waypoints."""
@@ -545,31 +572,24 @@ class TownGenerator:
         
         random.shuffle(positions)
         
+        # Cells touching the farm (8-neighbourhood) and cells that are road;
+        # a footprint test then becomes a slice lookup
+        farm_mask = np.zeros(self.grid.shape, dtype=bool)
+        for fx, fy in farm_cells:
+            farm_mask[fy, fx] = True
+        padded = np.pad(farm_mask, 1)
+        near_farm = np.zeros_like(farm_mask)
+        for dy in range(3):
+            for dx in range(3):
+                if dx != 1 or dy != 1:
+                    near_farm |= padded[dy:dy + self.size, dx:dx + self.size]
+        is_road = self.grid == ROAD
+        
         for x, y in positions:
             if 2 <= x <= self.size - w - 2 and 2 <= y <= self.size - h - 2:
                 if self.is_clear(x, y, w, h, margin=0):
-                    is_adjacent = False
-                    for hx in range(x, x + w):
-                        for hy in range(y, y + h):
-                            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1), (-1,-1), (1,-1), (-1,1), (1,1)]:
-                                nx, ny = hx + dx, hy + dy
-                                if (nx, ny) in farm_cells:
-                                    is_adjacent = True
-                                    break
-                            if is_adjacent:
-                                break
-                        if is_adjacent:
-                            break
-                    
-                    crosses_road = False
-                    for hx in range(x - 1, x + w + 1):
-                        for hy in range(y - 1, y + h + 1):
-                            if 0 <= hx < self.size and 0 <= hy < self.size:
-                                if self.grid[hy, hx] == ROAD:
-                                    crosses_road = True
-                                    break
-                        if crosses_road:
-                            break
+                    is_adjacent = near_farm[y:y + h, x:x + w].any()
+                    crosses_road = is_road[y - 1:y + h + 1, x - 1:x + w + 1].any()
                     
                     if is_adjacent and not crosses_road:
                         self.place(x, y, w, h, FARMHOUSE)
@@ -703,71 +723,159 @@ class TownGenerator:
         self.ensure_full_connectivity()
     
     def ensure_full_connectivity(self):
-        """Ensure all houses can reach each other via roads/market."""
-        passable = set()
-        for y in range(self.size):
-            for x in range(self.size):
-                if self.grid[y, x] in [ROAD, MARKET, STALL]:
-                    passable.add((x, y))
-        
-        if not passable:
+        """Ensure all houses can reach each other via roads/market.
+        
+        Works on the grid as arrays: passable cells are labelled into
+        connected components once, and a BFS distance field from the main
+        component answers "closest connected cell" for each stranded
+        building. Drawing a connection merges the components it touches
+        without rescanning the grid.
+        """
+        passable = np.isin(self.grid, PASSABLE_CELLS)
+        if not passable.any():
             return
         
-        main_component = self.flood_fill_passable(self.town_center[0], self.town_center[1], passable)
+        labels, _ = self.label_components(passable)
+        
+        start = self.nearest_cell(passable, self.town_center[0], self.town_center[1])
+        main = labels == labels[start[1], start[0]]
+        
+        _, nearest = self.distance_field(main)
+        pending = []  # cells merged into main since the field was built
         
         for name, bx, by, bw, bh in self.buildings:
             if name not in ['House', 'Farmhouse']:
                 continue
             
-            connected = False
-            for x in range(bx - 1, bx + bw + 1):
-                for y in range(by - 1, by + bh + 1):
-                    if (x, y) in main_component:
-                        connected = True
-                        break
-                if connected:
-                    break
+            y0, x0 = max(0, by - 1), max(0, bx - 1)
+            if main[y0:by + bh + 1, x0:bx + bw + 1].any():
+                continue
             
-            if not connected:
-                exit_x, exit_y = bx + bw // 2, by + bh
-                
-                closest = None
-                closest_dist = float('inf')
-                for px, py in main_component:
-                    d = abs(px - exit_x) + abs(py - exit_y)
-                    if d < closest_dist:
-                        closest_dist = d
-                        closest = (px, py)
-                
-                if closest:
-                    self.draw_connection(exit_x, exit_y, closest[0], closest[1])
-                    
-                    for y in range(self.size):
-                        for x in range(self.size):
-                            if self.grid[y, x] in [ROAD, MARKET, STALL]:
-                                main_component.add((x, y))
+            exit_x, exit_y = bx + bw // 2, by + bh
+            ex = min(max(exit_x, 0), self.size - 1)
+            ey = min(max(exit_y, 0), self.size - 1)
+            closest = divmod(int(nearest[ey, ex]), self.size)[::-1]
+            closest_dist = abs(closest[0] - exit_x) + abs(closest[1] - exit_y)
+            if pending:
+                cells = np.array(pending)
+                d = np.abs(cells[:, 0] - exit_x) + np.abs(cells[:, 1] - exit_y)
+                i = int(np.argmin(d))
+                if d[i] < closest_dist:
+                    closest = (int(cells[i, 0]), int(cells[i, 1]))
+            
+            new_cells = self.draw_connection(exit_x, exit_y, closest[0], closest[1])
+            
+            # Grow the main component through the new road and any
+            # components it now touches; the distance field is rebuilt only
+            # once enough new cells have piled up to make scanning them slow
+            pending.extend(self.merge_into_component(main, labels, new_cells))
+            if len(pending) > self.size * 4:
+                _, nearest = self.distance_field(main)
+                pending = []
+    
+    def label_components(self, mask):
+        """Label 4-connected components of a boolean mask.
+        
+        Returns (labels, count) where labels is an int array the shape of
+        mask, 0 for cells outside the mask and 1..count for components.
+        """
+        labels = np.zeros(mask.shape, dtype=np.int32)
+        count = 0
+        h, w = mask.shape
+        for y, x in np.argwhere(mask):
+            if labels[y, x]:
+                continue
+            count += 1
+            labels[y, x] = count
+            queue = deque([(x, y)])
+            while queue:
+                cx, cy = queue.popleft()
+                for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+                    if 0 <= nx < w and 0 <= ny < h and mask[ny, nx] and not labels[ny, nx]:
+                        labels[ny, nx] = count
+                        queue.append((nx, ny))
+        return labels, count
+    
+    def nearest_cell(self, mask, x, y):
+        """Return the (x, y) cell of mask closest to (x, y) by Manhattan distance."""
+        cells = np.argwhere(mask)
+        if len(cells) == 0:
+            return None
+        d = np.abs(cells[:, 1] - x) + np.abs(cells[:, 0] - y)
+        cy, cx = cells[np.argmin(d)]
+        return int(cx), int(cy)
+    
+    def distance_field(self, sources):
+        """Distance field over the whole grid from the cells in sources.
+        
+        Returns (dist, nearest): dist holds the 4-neighbour step count to the
+        closest source (-1 if there are no sources) and nearest holds that
+        source's flat index (y * size + x). Movement is unobstructed, so the
+        BFS distance is the Manhattan distance and is computed with two
+        separable sweeps (along rows, then columns) instead of a per-cell
+        queue.
+        """
+        size = self.size
+        big = 4 * size
+        dist = np.where(sources, 0, big).astype(np.int32)
+        flat = np.arange(size * size, dtype=np.int64).reshape(size, size)
+        nearest = np.where(sources, flat, -1)
+        
+        # Sweep along x then along y; each pass carries (distance + 1) forward
+        for axis in (1, 0):
+            d = np.moveaxis(dist, axis, 0)
+            n = np.moveaxis(nearest, axis, 0)
+            for order in (range(1, size), range(size - 2, -1, -1)):
+                step = 1 if order.step == 1 else -1
+                for i in order:
+                    cand = d[i - step] + 1
+                    better = cand < d[i]
+                    d[i] = np.where(better, cand, d[i])
+                    n[i] = np.where(better, n[i - step], n[i])
+        
+        dist[dist >= big] = -1
+        return dist, nearest
+    
+    def merge_into_component(self, component, labels, new_cells):
+        """Merge freshly drawn passable cells into component (in place).
+        
+        Any labelled component that a new cell touches is absorbed whole.
+        Returns the list of (x, y) cells newly added to component.
+        """
+        added = []
+        absorbed = set()
+        for x, y in new_cells:
+            if component[y, x]:
+                continue
+            component[y, x] = True
+            added.append((x, y))
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1), (x, y)):
+                if 0 <= nx < self.size and 0 <= ny < self.size:
+                    label = labels[ny, nx]
+                    if label and not component[ny, nx]:
+                        absorbed.add(label)
+        
+        for label in absorbed:
+            region = (labels == label) & ~component
+            component |= region
+            added.extend((int(x), int(y)) for y, x in np.argwhere(region))
+        return added
     
     def flood_fill_passable(self, start_x, start_y, passable):
         """BFS flood fill to find all connected passable cells."""
-        nearest = None
-        min_dist = float('inf')
-        for px, py in passable:
-            d = abs(px - start_x) + abs(py - start_y)
-            if d < min_dist:
-                min_dist = d
-                nearest = (px, py)
-        
-        if nearest is None:
+        if not passable:
             return set()
         
-        visited = set()
-        queue = [nearest]
-        visited.add(nearest)
+        cells = np.array(list(passable))
+        d = np.abs(cells[:, 0] - start_x) + np.abs(cells[:, 1] - start_y)
+        nearest = tuple(int(v) for v in cells[np.argmin(d)])
+        
+        visited = {nearest}
+        queue = deque([nearest])
         
         while queue:
-            x, y = queue.pop(0)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
+            x, y = queue.popleft()
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
                 if (nx, ny) in passable and (nx, ny) not in visited:
                     visited.add((nx, ny))
                     queue.append((nx, ny))
@@ -775,7 +883,11 @@ class TownGenerator:
         return visited
     
     def draw_connection(self, x1, y1, x2, y2):
-        """Draw smooth road connection between two points."""
+        """Draw smooth road connection between two points.
+        
+        Returns the list of (x, y) passable cells the connection covers.
+        """
+        drawn = []
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
@@ -792,8 +904,10 @@ class TownGenerator:
                         if self.grid[py, px] in [GRASS, GARDEN]:
                             self.grid[py, px] = ROAD
                             self.road_cells.add((px, py))
+                            drawn.append((px, py))
                         elif self.grid[py, px] in [ROAD, MARKET, STALL]:
                             self.road_cells.add((px, py))
+                            drawn.append((px, py))
             
             if x == x2 and y == y2:
                 break
@@ -811,9 +925,17 @@ class TownGenerator:
             
             if not (0 <= x < self.size - 1 and 0 <= y < self.size - 1):
                 break
+        
+        return drawn
     
     def place_trees(self):
-        """Scatter trees realistically on grass."""
+        """Scatter trees realistically on grass.
+        
+        Acceptance probability rises toward the map edge and next to existing
+        trees (but drops inside dense clumps). The distance term is computed
+        once for the whole grid; candidates are drawn in batches and the
+        neighbour term is refreshed between batches so clusters still grow.
+        """
         if self.tree_density <= 0:
             return
         
@@ -821,42 +943,38 @@ class TownGenerator:
         
         grass_count = np.sum(self.grid == GRASS)
         target_trees = int(grass_count * self.tree_density)
+        if target_trees <= 0:
+            return
+        
+        ys, xs = np.mgrid[0:self.size, 0:self.size]
+        dist_to_center = np.sqrt((xs - cx) ** 2 + (ys - cy) ** 2)
+        max_dist = self.size * 0.7
+        edge_prob = 0.3 + 0.5 * np.minimum(1.0, dist_to_center / max_dist)
         
         trees_placed = 0
         attempts = 0
         max_attempts = target_trees * 10
+        batch_size = max(64, target_trees // 8)
         
         while trees_placed < target_trees and attempts < max_attempts:
-            attempts += 1
+            n = min(batch_size, max_attempts - attempts)
+            attempts += n
             
-            x = random.randint(1, self.size - 2)
-            y = random.randint(1, self.size - 2)
-            
-            if self.grid[y, x] != GRASS:
-                continue
-            
-            dist_to_center = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-            max_dist = self.size * 0.7
-            edge_factor = min(1.0, dist_to_center / max_dist)
-            
-            prob = 0.3 + 0.5 * edge_factor
-            
-            adjacent_trees = 0
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.size and 0 <= ny < self.size:
-                    if self.grid[ny, nx] == TREE:
-                        adjacent_trees += 1
+            adjacent_trees = self.count_neighbours(self.grid == TREE)
+            prob = edge_prob + 0.3 * adjacent_trees
+            prob[adjacent_trees >= 3] *= 0.2
             
-            if adjacent_trees > 0:
-                prob += 0.3 * adjacent_trees
+            x = np.random.randint(1, self.size - 1, n)
+            y = np.random.randint(1, self.size - 1, n)
+            accepted = (self.grid[y, x] == GRASS) & (np.random.random(n) < prob[y, x])
             
-            if adjacent_trees >= 3:
-                prob *= 0.2
+            # Drop duplicate picks within the batch, keeping draw order
+            cells = y[accepted] * self.size + x[accepted]
+            _, first = np.unique(cells, return_index=True)
+            cells = cells[np.sort(first)][:target_trees - trees_placed]
             
-            if random.random() < prob:
-                self.grid[y, x] = TREE
-                trees_placed += 1
+            self.grid.flat[cells] = TREE
+            trees_placed += len(cells)
 
 
 def generate_areas(size, houses, farms, seed, name, trees):
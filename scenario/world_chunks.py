@@ -0,0 +1,445 @@
+# world_chunks.py - Chunked world streaming on top of the world map plan
+"""
+Splits the world into square chunks of `chunk_size` cells and keeps only the
+ones near the player in memory.
+
+The world plan is the JSON exported by etc/generator_stubs/world_map_generator.py:
+one biome-grid cell of the world map becomes one chunk here. Settlements on the
+plan are generated as towns with TownGenerator, everything else as wilderness
+(through-roads and trees). The scenario town is the static home chunk at (0, 0)
+and replaces whatever the plan has in its top-left cell.
+
+Chunks are generated on first visit, written to a disk cache when evicted and
+read back on the next visit, so trees cut and crops grown survive a round trip.
+
+Coordinates follow the rest of the game: cells are (x, y), area bounds are
+[y_start, x_start, y_end, x_end] in world cells.
+"""
+
+import atexit
+import json
+import os
+import random
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from scenario.town_gen import TownGenerator
+
+
+# Tree density per biome for wilderness chunks (scaled down by water coverage)
+BIOME_TREE_DENSITY = {
+    "forest": 0.12,
+    "plains": 0.02,
+    "swamp": 0.06,
+}
+
+# Tree density inside generated settlements
+SETTLEMENT_TREE_DENSITY = 0.02
+
+# Settlement types that become towns, and whether they get market + military housing
+SETTLEMENT_CIVIC = {
+    "kingdom": True,
+    "village": False,
+    "encampment": False,
+}
+
+# Compass direction for a step between neighbouring chunks
+STEP_DIRECTIONS = {
+    (0, -1): 'north',
+    (0, 1): 'south',
+    (1, 0): 'east',
+    (-1, 0): 'west',
+}
+
+
+class WorldChunk:
+    """One square piece of the world: its areas, roads, trees and farm cells.
+
+    Everything is stored in world coordinates. `area_grid` is a per-cell lookup
+    of area names in local coordinates ([ly][lx], like the old whole-map area_map).
+    """
+
+    def __init__(self, key, size, areas=None, roads=None, trees=None, farm_cells=None, static=False):
+        self.key = key
+        self.size = size
+        self.origin = (key[0] * size, key[1] * size)
+        self.areas = areas or []
+        self.roads = roads or []
+        self.trees = trees or []
+        self.farm_cells = farm_cells or {}  # (x, y) -> {'state', 'timer', 'allegiance'}
+        self.static = static
+
+        self.area_grid = [[None for _ in range(size)] for _ in range(size)]
+        self.area_cells = {}  # name -> [(x, y), ...] in world coords
+        self._index_areas()
+
+    def _index_areas(self):
+        """Paint areas onto the local grid; later areas win, as in the scenario list."""
+        ox, oy = self.origin
+        for area in self.areas:
+            name = area["name"]
+            start_y, start_x, end_y, end_x = area["bounds"]
+            for y in range(max(start_y, oy), min(end_y, oy + self.size)):
+                row = self.area_grid[y - oy]
+                for x in range(max(start_x, ox), min(end_x, ox + self.size)):
+                    row[x - ox] = name
+
+        for ly, row in enumerate(self.area_grid):
+            for lx, name in enumerate(row):
+                if name is not None:
+                    self.area_cells.setdefault(name, []).append((ox + lx, oy + ly))
+
+    def get_area_at(self, x, y):
+        """Area name at a world cell inside this chunk."""
+        return self.area_grid[y - self.origin[1]][x - self.origin[0]]
+
+    def to_dict(self):
+        return {
+            "key": list(self.key),
+            "size": self.size,
+            "areas": self.areas,
+            "roads": [list(r) for r in self.roads],
+            "trees": [list(t) for t in self.trees],
+            "farm_cells": [[x, y, cell] for (x, y), cell in self.farm_cells.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            tuple(data["key"]),
+            data["size"],
+            areas=data["areas"],
+            roads=[tuple(r) for r in data["roads"]],
+            trees=[tuple(t) for t in data["trees"]],
+            farm_cells={(x, y): cell for x, y, cell in data["farm_cells"]},
+        )
+
+
+class ChunkDirectory:
+    """Resident chunks plus the plan needed to generate the rest on demand.
+
+    Area queries (get_area_at, get_area_def, get_area_cells) only look at
+    resident chunks and never trigger loading; loading happens in update_focus,
+    called once per tick with the player's position.
+
+    on_load(chunk) / on_evict(chunk) let the owner merge a chunk's trees and
+    farm cells into live state and write surviving state back before eviction.
+    """
+
+    def __init__(self, home, chunk_size, plan=None, load_radius=1, max_resident=25):
+        """
+        Args:
+            home: Scenario world data ({"name", "areas", "roads", "trees"})
+            chunk_size: Cells per chunk side (the scenario SIZE)
+            plan: World plan dict exported by the world map generator, or None
+                  for a single-chunk world (just the home town)
+        """
+        self.chunk_size = chunk_size
+        self.plan = plan
+        self.load_radius = load_radius
+        self.max_resident = max(max_resident, (2 * load_radius + 1) ** 2 + 1)
+
+        self.on_load = None
+        self.on_evict = None
+        self.generation = 0  # Bumped on every load/evict so caches can notice
+
+        if plan:
+            self.chunks_x = plan["chunks_x"]
+            self.chunks_y = plan["chunks_y"]
+        else:
+            self.chunks_x = 1
+            self.chunks_y = 1
+
+        self.static = WorldChunk(
+            (0, 0), chunk_size,
+            areas=home["areas"],
+            roads=[tuple(r) for r in home.get("roads", [])],
+            trees=[tuple(t) for t in home.get("trees", [])],
+            static=True,
+        )
+        self.resident = OrderedDict()  # key -> WorldChunk, least recently used first
+        self.resident[(0, 0)] = self.static
+
+        self.area_defs = {}  # area name -> area definition, for resident chunks
+        for area in self.static.areas:
+            self.area_defs[area["name"]] = area
+
+        self._settlements = {}  # chunk key -> settlement dict from the plan
+        self._road_links = set()  # frozenset({key_a, key_b}) for chunks joined by a road
+        if plan:
+            self._index_plan()
+
+        self._cache_dir = None
+        self._focus = None  # Chunk the resident set was last built around
+
+    # =========================================================================
+    # BOUNDS & LOOKUP (never loads)
+    # =========================================================================
+
+    @property
+    def bounds(self):
+        """World extent as (min_x, min_y, max_x, max_y); max is exclusive."""
+        return (0, 0, self.chunks_x * self.chunk_size, self.chunks_y * self.chunk_size)
+
+    def chunk_key(self, x, y):
+        return (int(x) // self.chunk_size, int(y) // self.chunk_size)
+
+    def contains(self, x, y):
+        """Check if a position is inside the world (works with float positions)."""
+        return (0 <= x < self.chunks_x * self.chunk_size and
+                0 <= y < self.chunks_y * self.chunk_size)
+
+    def get_chunk(self, x, y):
+        """Resident chunk containing a cell, or None."""
+        return self.resident.get(self.chunk_key(x, y))
+
+    def get_area_at(self, x, y):
+        """Area name at a cell, or None if outside the world or not loaded."""
+        cell_x, cell_y = int(x), int(y)
+        if not self.contains(cell_x, cell_y):
+            return None
+        chunk = self.resident.get((cell_x // self.chunk_size, cell_y // self.chunk_size))
+        if chunk is None:
+            return None
+        return chunk.get_area_at(cell_x, cell_y)
+
+    def get_area_def(self, area_name):
+        """Area definition for a resident area name, or None."""
+        return self.area_defs.get(area_name)
+
+    def get_area_cells(self, area_name):
+        """All cells of a resident area (may span chunk borders)."""
+        cells = []
+        for chunk in self.resident.values():
+            cells.extend(chunk.area_cells.get(area_name, ()))
+        return cells
+
+    # =========================================================================
+    # STREAMING
+    # =========================================================================
+
+    def update_focus(self, x, y):
+        """Load chunks around a position and evict the ones that fell out of range."""
+        if not self.plan:
+            return
+        focus = self.chunk_key(x, y)
+        if focus == self._focus:
+            return
+        self._focus = focus
+
+        wanted = self._wanted(focus)
+        for key in wanted:
+            if key in self.resident:
+                self.resident.move_to_end(key)
+            else:
+                self._load(key)
+
+        # Evict anything past the hysteresis ring, then oldest first over the cap
+        keep_radius = self.load_radius + 1
+        for key in list(self.resident):
+            chunk = self.resident[key]
+            if chunk.static:
+                continue
+            if max(abs(key[0] - focus[0]), abs(key[1] - focus[1])) > keep_radius:
+                self._evict(key)
+        for key in list(self.resident):
+            if len(self.resident) <= self.max_resident:
+                break
+            if key not in wanted and not self.resident[key].static:
+                self._evict(key)
+
+    def _wanted(self, focus):
+        r = self.load_radius
+        return [(focus[0] + dx, focus[1] + dy)
+                for dy in range(-r, r + 1) for dx in range(-r, r + 1)
+                if 0 <= focus[0] + dx < self.chunks_x and 0 <= focus[1] + dy < self.chunks_y]
+
+    def _load(self, key):
+        chunk = self._read_cached(key) or self._generate(key)
+        self.resident[key] = chunk
+        for area in chunk.areas:
+            self.area_defs[area["name"]] = area
+        self.generation += 1
+        if self.on_load:
+            self.on_load(chunk)
+
+    def _evict(self, key):
+        chunk = self.resident.pop(key)
+        if self.on_evict:
+            self.on_evict(chunk)
+        for area in chunk.areas:
+            self.area_defs.pop(area["name"], None)
+        self._write_cached(chunk)
+        self.generation += 1
+
+    # =========================================================================
+    # DISK CACHE
+    # =========================================================================
+
+    def _cache_path(self, key):
+        if self._cache_dir is None:
+            self._cache_dir = tempfile.mkdtemp(prefix="world_chunks_")
+            atexit.register(self.clear_cache)  # Don't leave it in the temp dir
+        return os.path.join(self._cache_dir, f"{key[0]}_{key[1]}.json")
+
+    def _read_cached(self, key):
+        if self._cache_dir is None:
+            return None
+        path = self._cache_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return WorldChunk.from_dict(json.load(f))
+
+    def _write_cached(self, chunk):
+        with open(self._cache_path(chunk.key), 'w') as f:
+            json.dump(chunk.to_dict(), f)
+
+    def clear_cache(self):
+        """Delete the disk cache (evicted chunks regenerate from the plan)."""
+        if self._cache_dir is not None:
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+            self._cache_dir = None
+            atexit.unregister(self.clear_cache)
+
+    # =========================================================================
+    # GENERATION
+    # =========================================================================
+
+    def _index_plan(self):
+        """Map settlements to chunks and find which neighbouring chunks roads join."""
+        for settlement in self.plan.get("settlements", []):
+            key = tuple(settlement["cell"])
+            if key == (0, 0):
+                continue  # The home town owns this chunk
+            current = self._settlements.get(key)
+            if current is None or settlement.get("houses", 0) > current.get("houses", 0):
+                self._settlements[key] = settlement
+
+        cell_pixels = self.plan["cell_pixels"]
+        step = max(1, cell_pixels // 4)
+        for points in self.plan.get("roads", []):
+            path = []
+            for (x1, y1), (x2, y2) in zip(points, points[1:]):
+                n = max(1, int(max(abs(x2 - x1), abs(y2 - y1)) // step))
+                for i in range(n + 1):
+                    px = x1 + (x2 - x1) * i / n
+                    py = y1 + (y2 - y1) * i / n
+                    key = (int(px) // cell_pixels, int(py) // cell_pixels)
+                    if not path or path[-1] != key:
+                        path.append(key)
+            for a, b in zip(path, path[1:]):
+                if a[0] != b[0] and a[1] != b[1]:
+                    # Diagonal step: go through the horizontal neighbour
+                    corner = (b[0], a[1])
+                    self._road_links.add(frozenset((a, corner)))
+                    self._road_links.add(frozenset((corner, b)))
+                else:
+                    self._road_links.add(frozenset((a, b)))
+
+    def _chunk_seed(self, key):
+        return zlib.crc32(f"{self.plan['seed']}:{key[0]}:{key[1]}".encode()) % 99999 + 1
+
+    def _edge_offset(self, a, b):
+        """Where the road between two neighbouring chunks crosses their shared edge."""
+        lo, hi = sorted((a, b))
+        h = zlib.crc32(f"{self.plan['seed']}:{lo}:{hi}".encode())
+        margin = min(10, self.chunk_size // 4)
+        return margin + h % max(1, self.chunk_size - 2 * margin)
+
+    def _road_entries(self, key):
+        """Edge cells (local coords) where roads from neighbouring chunks arrive."""
+        last = self.chunk_size - 1
+        entries = []
+        for (dx, dy), direction in STEP_DIRECTIONS.items():
+            neighbour = (key[0] + dx, key[1] + dy)
+            if frozenset((key, neighbour)) not in self._road_links:
+                continue
+            offset = self._edge_offset(key, neighbour)
+            if direction == 'north':
+                entries.append((offset, 0))
+            elif direction == 'south':
+                entries.append((offset, last))
+            elif direction == 'west':
+                entries.append((0, offset))
+            else:
+                entries.append((last, offset))
+        return entries
+
+    def _generate(self, key):
+        """Build a chunk from the plan with TownGenerator.
+
+        TownGenerator reseeds the global random and numpy generators, so their
+        state is saved and restored around it to keep the simulation's stream intact.
+        """
+        gx, gy = key
+        biome = self.plan["biomes"][gy][gx]
+        water = self.plan["water"][gy][gx]
+        settlement = self._settlements.get(key)
+        seed = self._chunk_seed(key)
+
+        py_state = random.getstate()
+        np_state = np.random.get_state()
+        try:
+            if settlement and settlement["type"] in SETTLEMENT_CIVIC:
+                max_houses = max(0, self.chunk_size * self.chunk_size // 150)
+                generator = TownGenerator(
+                    size=self.chunk_size,
+                    seed=seed,
+                    road_entries=self._road_entries(key),
+                    num_houses=min(settlement.get("houses", 0), max_houses),
+                    num_farms=min(settlement.get("farms", 0), 3),
+                    name=settlement["name"],
+                    tree_density=SETTLEMENT_TREE_DENSITY,
+                    civic_buildings=SETTLEMENT_CIVIC[settlement["type"]],
+                )
+                data = generator.generate()
+            else:
+                density = BIOME_TREE_DENSITY.get(biome, 0.02) * (1.0 - water)
+                generator = TownGenerator(
+                    size=self.chunk_size,
+                    seed=seed,
+                    road_entries=self._road_entries(key),
+                    name=f"Wilds {gx},{gy}",
+                    tree_density=density,
+                )
+                data = generator.generate_wilderness()
+        finally:
+            random.setstate(py_state)
+            np.random.set_state(np_state)
+
+        return self._chunk_from_town(key, data)
+
+    def _chunk_from_town(self, key, data):
+        """Shift generated town data from local to world coordinates."""
+        ox, oy = key[0] * self.chunk_size, key[1] * self.chunk_size
+        areas = []
+        farm_cells = {}
+        for area in data["areas"]:
+            area = dict(area)
+            y0, x0, y1, x1 = area["bounds"]
+            area["bounds"] = [y0 + oy, x0 + ox, y1 + oy, x1 + ox]
+            if "cells" in area:
+                area["cells"] = [(x + ox, y + oy) for x, y in area["cells"]]
+            if "farm_cells" in area:
+                area["farm_cells"] = [(x + ox, y + oy) for x, y in area["farm_cells"]]
+                if area.get("has_farm_cells"):
+                    for cell in area["farm_cells"]:
+                        farm_cells[cell] = {
+                            'state': 'ready',
+                            'timer': 0,
+                            'allegiance': area.get("allegiance"),
+                        }
+            areas.append(area)
+
+        return WorldChunk(
+            key, self.chunk_size,
+            areas=areas,
+            roads=[(x + ox, y + oy) for x, y in data["roads"]],
+            trees=[(x + ox, y + oy) for x, y in data["trees"]],
+            farm_cells=farm_cells,
+        )
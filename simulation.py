@@ -0,0 +1,255 @@
+# simulation.py - Drives the simulation clock, optionally on a worker thread
+"""
+SimulationRunner owns the simulation clock: it turns elapsed real time into
+GameLogic.process_tick() calls plus the sub-tick movement updates (player,
+NPCs, arrows), and publishes an immutable RenderSnapshot (render_snapshot.py)
+once per step, after the leftover movement.
+
+Threaded mode (SIMULATION_THREADED):
+- A worker thread advances the simulation on its own cadence
+  (SIMULATION_STEP_INTERVAL), so a slow frame no longer starves the
+  simulation and a heavy tick no longer stalls a whole frame.
+- All state access is serialized by `lock`. The worker holds it for one tick
+  (or one movement step) at a time; the GUI only takes it to hand over input
+  and commands. The renderer draws from the published snapshots without it.
+- Snapshots are swapped in as one (previous, latest) tuple, so a reader
+  always gets a consistent pair. interpolated() blends the two over one
+  SIMULATION_STEP_INTERVAL into a separate position mapping, so motion stays
+  smooth whatever the relative frame and tick rates, without touching the
+  characters.
+
+Without the thread, the GUI calls advance() once per frame exactly as before.
+
+Time budget: each step runs ticks for at most SIMULATION_STEP_BUDGET seconds
+of wall time. Ticks it couldn't fit are carried to the next step as debt
+(capped at SIMULATION_MAX_DEBT_TICKS), so a spike or a game speed the CPU
+can't sustain slows the game down instead of freezing it. While behind, the
+movement update can drop to one step per tick, and state.effective_speed
+reports the speed actually achieved.
+
+Turbo (state.turbo): game_speed is ignored and every step spends the whole
+TURBO_STEP_BUDGET on ticks; the GUI drops to TURBO_RENDER_FPS meanwhile.
+
+This class does NOT:
+- Contain game rules (that's in game_logic.py)
+- Draw anything (that's in ui/gui.py)
+"""
+
+import threading
+import time
+
+from profiler import get_profiler
+from render_snapshot import take_snapshot, interpolate_positions
+from constants import (
+    UPDATE_INTERVAL, SIMULATION_STEP_INTERVAL, SIMULATION_STEP_BUDGET,
+    SIMULATION_MAX_DEBT_TICKS, MOVEMENT_SUBSTEP, SIMULATION_PRESSURE_TICKS,
+    COARSE_SUBSTEPS_UNDER_PRESSURE, TURBO_STEP_BUDGET,
+)
+
+# How often effective_speed is re-measured (wall-clock seconds)
+SPEED_SAMPLE_INTERVAL = 0.5
+
+
+class SimulationRunner:
+    """Advances GameLogic in real time and publishes render snapshots."""
+
+    def __init__(self, game_state, game_logic, player_controller):
+        self.state = game_state
+        self.logic = game_logic
+        self.player_controller = player_controller
+
+        self.lock = threading.RLock()  # Guards all game state while threaded
+        self._accumulated_time = 0.0  # Game time owed, carried between steps
+        self.under_pressure = False  # True while ticks are owed past the budget
+        self._was_turbo = False
+        
+        # Effective speed measurement
+        self._speed_sample_start = time.perf_counter()
+        self._speed_sample_game_time = 0.0
+
+        self._thread = None
+        self._running = False
+        self._error = None  # Exception raised on the worker, re-raised by check()
+
+        snapshot = take_snapshot(game_state, game_logic, player_controller)
+        self._snapshots = (snapshot, snapshot)  # (previous, latest), swapped atomically
+
+    # =========================================================================
+    # STEPPING
+    # =========================================================================
+
+    def advance(self, dt):
+        """Advance the simulation by dt seconds of real time.
+
+        Runs whole ticks owed (at the current game speed) until they're paid
+        off or the wall-clock budget runs out, then moves characters by the
+        leftover fraction. Takes the lock per tick, so input can get in between
+        ticks of a long catch-up, and publishes one snapshot after the leftover
+        move.
+
+        Returns:
+            Number of ticks processed
+        """
+        # Cap delta time
+        dt = min(dt, 0.1)
+
+        if self.state.paused:
+            with self.lock:
+                self._publish()  # Show commands made while paused; nobody is moving
+            self._reset_speed_sample()
+            return 0
+
+        tick_duration = UPDATE_INTERVAL / 1000.0
+        max_debt = tick_duration * SIMULATION_MAX_DEBT_TICKS
+        budget = SIMULATION_STEP_BUDGET
+
+        if self.state.turbo:
+            # Flat out: always owe the maximum and spend the whole turbo budget
+            self._accumulated_time = max_debt
+            budget = TURBO_STEP_BUDGET
+        elif self._was_turbo:
+            self._accumulated_time = 0.0  # Don't pay back turbo's bottomless debt
+        else:
+            self._accumulated_time += dt * self.state.game_speed
+            # Cap debt - past this the game just runs slower
+            self._accumulated_time = min(self._accumulated_time, max_debt)
+        self._was_turbo = self.state.turbo
+
+        # Coarser movement while behind: one update per tick instead of per substep
+        substep = MOVEMENT_SUBSTEP
+        if self.under_pressure and COARSE_SUBSTEPS_UNDER_PRESSURE:
+            substep = tick_duration
+
+        # Process simulation in tick-sized chunks until the budget runs out
+        profiler = get_profiler()
+        deadline = time.perf_counter() + budget
+        ticks = 0
+        while self._accumulated_time >= tick_duration:
+            with self.lock:
+                if self.state.paused:
+                    break
+                with profiler.scope('sim.tick'):
+                    self.logic.process_tick()
+
+                with profiler.scope('sim.move'):
+                    remaining = tick_duration
+                    while remaining > 0:
+                        step = min(remaining, substep)
+                        self._move(step)
+                        remaining -= step
+
+            self._accumulated_time -= tick_duration
+            ticks += 1
+            if time.perf_counter() >= deadline:
+                break  # Out of budget - the rest stays owed
+
+        self.under_pressure = self._accumulated_time >= tick_duration * SIMULATION_PRESSURE_TICKS
+        profiler.count('sim.ticks_per_step', ticks)
+        profiler.count('sim.ticks_owed', self._accumulated_time / tick_duration)
+
+        # Handle remaining fractional time
+        with self.lock:
+            if tick_duration > self._accumulated_time > 0:
+                self._move(min(self._accumulated_time, MOVEMENT_SUBSTEP))
+            with profiler.scope('sim.publish'):
+                self._publish()
+
+        self._sample_speed(ticks * tick_duration)
+        return ticks
+
+    def _sample_speed(self, game_time):
+        """Accumulate simulated time and refresh state.effective_speed periodically."""
+        self._speed_sample_game_time += game_time
+        elapsed = time.perf_counter() - self._speed_sample_start
+        if elapsed >= SPEED_SAMPLE_INTERVAL:
+            self.state.effective_speed = self._speed_sample_game_time / elapsed
+            self._reset_speed_sample()
+
+    def _reset_speed_sample(self):
+        self._speed_sample_start = time.perf_counter()
+        self._speed_sample_game_time = 0.0
+
+    def _move(self, step):
+        """Sub-tick movement update for everything that moves."""
+        self.player_controller.update_position(step)
+        self.logic.update_npc_positions(step)
+        self.logic.update_arrows(step)
+
+    # =========================================================================
+    # WORKER THREAD
+    # =========================================================================
+
+    @property
+    def threaded(self):
+        """True while the worker thread is running."""
+        return self._thread is not None
+
+    def start(self):
+        """Start advancing the simulation on a worker thread."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread (waits for the current tick to finish)."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self):
+        """Re-raise an exception from the worker thread on the caller's thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        last = time.perf_counter()
+        try:
+            while self._running:
+                now = time.perf_counter()
+                dt = now - last
+                last = now
+                self.advance(dt)
+
+                # Sleep out the rest of the step; always yield a little so the
+                # renderer can take the lock
+                elapsed = time.perf_counter() - now
+                time.sleep(max(SIMULATION_STEP_INTERVAL - elapsed, 0.0005))
+        except Exception as e:
+            self._error = e
+            self._running = False
+
+    # =========================================================================
+    # SNAPSHOTS & INTERPOLATION
+    # =========================================================================
+
+    def _publish(self):
+        """Capture the current state and make it the latest snapshot. Call with `lock` held."""
+        previous = self._snapshots[1]
+        self._snapshots = (previous, take_snapshot(self.state, self.logic, self.player_controller, previous))
+
+    @property
+    def latest_snapshot(self):
+        return self._snapshots[1]
+
+    def interpolated(self, now=None):
+        """The latest snapshot plus where to draw each character. No lock needed.
+
+        Characters are drawn one step (SIMULATION_STEP_INTERVAL) behind the
+        simulation, blended by how far `now` is past the latest snapshot (see
+        render_snapshot.interpolate_positions). Without the worker thread the
+        GUI advances right before drawing, so the latest positions are used.
+
+        Returns:
+            (RenderSnapshot, {key: (prevailing_x, prevailing_y, x, y)})
+        """
+        previous, latest = self._snapshots
+        alpha = 1.0
+        if self._thread is not None:
+            if now is None:
+                now = time.perf_counter()
+            alpha = min(max((now - latest.time) / SIMULATION_STEP_INTERVAL, 0.0), 1.0)
+        return latest, interpolate_positions(previous, latest, alpha)
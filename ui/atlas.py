@@ -0,0 +1,242 @@
+# atlas.py - Texture atlas packing for sprites (Raylib)
+"""
+Packs many small sprites into a few large page textures so consecutive draws
+share a texture and Raylib can batch them instead of switching GPU state.
+
+Sprites are added as RGBA pixel arrays (or PNG files) and packed into pages on
+build(). Each sprite gets an AtlasRegion, which behaves like a Texture2D for
+the attributes callers read (width, height, id) and remembers where it sits on
+its page. Draw regions with draw_sprite_pro(), which takes a source rectangle
+in sprite-local coordinates (like a standalone texture) and offsets it.
+
+Sprites can be added after a build; the next build() packs only the new ones
+onto new pages sized to fit. Sprites needed one at a time mid-frame (cache
+misses while drawing) should use add_late() instead: it places the sprite on
+a reserved page and uploads just its rectangle, so a miss never costs a new
+page texture.
+"""
+
+import os
+
+import numpy as np
+import pyray as rl
+
+
+ATLAS_PAGE_SIZE = 2048  # Max page width/height in pixels
+ATLAS_PADDING = 2       # Transparent gap between sprites (keeps outlines/filtering clean)
+ATLAS_LATE_PAGE_SIZE = 1024  # Reserved page for sprites added one at a time (add_late)
+
+
+def image_to_pixels(image):
+    """Copy a Raylib Image into an (H, W, 4) uint8 RGBA array."""
+    rl.image_format(image, rl.PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
+    buffer = rl.ffi.buffer(image.data, image.width * image.height * 4)
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(image.height, image.width, 4).copy()
+
+
+def texture_from_pixels(pixels):
+    """Upload an (H, W, 4) uint8 RGBA array as a Raylib Texture2D."""
+    pixels = np.ascontiguousarray(pixels)
+    image = rl.Image(rl.ffi.cast('void *', rl.ffi.from_buffer(pixels)),
+                     pixels.shape[1], pixels.shape[0], 1, rl.PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
+    return rl.load_texture_from_image(image)  # Copies to the GPU; pixels can go after this
+
+
+class AtlasRegion:
+    """One packed sprite: its page texture and rectangle on that page."""
+
+    __slots__ = ('name', 'texture', 'x', 'y', 'width', 'height', '_pixels')
+
+    def __init__(self, name, pixels):
+        self.name = name
+        self.texture = None  # Page Texture2D, set by TextureAtlas.build()
+        self.x = 0
+        self.y = 0
+        self.height, self.width = pixels.shape[:2]
+        self._pixels = pixels  # Dropped once uploaded
+
+    @property
+    def id(self):
+        """GPU id of the page texture (0 until built, like an unloaded Texture2D)."""
+        return self.texture.id if self.texture is not None else 0
+
+    def source(self, x=0, y=0, width=None, height=None):
+        """Page-space source rectangle for a sub-rectangle of this sprite."""
+        return rl.Rectangle(
+            self.x + x, self.y + y,
+            self.width if width is None else width,
+            self.height if height is None else height,
+        )
+
+
+class TextureAtlas:
+    """Shelf-packs sprites into page textures and keeps the name -> region table."""
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.regions = {}  # name -> AtlasRegion
+        self.pages = []  # Texture2D list
+        self._pending = []  # Regions added since the last build
+        self._late_page = None  # Reserved Texture2D that add_late() fills in
+        self._late_shelf = (0, 0, 0)  # (x, y, height) of the open shelf on it
+
+    def add(self, name, pixels):
+        """Queue an (H, W, 4) uint8 RGBA array for packing. Returns its region."""
+        region = self.regions.get(name)
+        if region is not None:
+            return region
+        region = AtlasRegion(name, np.ascontiguousarray(pixels))
+        self.regions[name] = region
+        self._pending.append(region)
+        return region
+
+    def add_file(self, name, filepath):
+        """Queue an image file for packing. Returns its region, or None if missing."""
+        if name in self.regions:
+            return self.regions[name]
+        if not os.path.exists(filepath):
+            return None
+        image = rl.load_image(filepath)
+        pixels = image_to_pixels(image)
+        rl.unload_image(image)
+        return self.add(name, pixels)
+
+    def add_late(self, name, pixels):
+        """Place one sprite on the reserved late page right away. Returns its region.
+
+        Only the sprite's own rectangle is uploaded. A full late page is left
+        as is and a fresh one reserved; sprites bigger than a late page fall
+        back to a page of their own.
+        """
+        region = self.regions.get(name)
+        if region is not None:
+            return region
+        region = AtlasRegion(name, np.ascontiguousarray(pixels))
+        self.regions[name] = region
+
+        pad = self.padding
+        limit = ATLAS_LATE_PAGE_SIZE
+        w, h = region.width + pad, region.height + pad
+        if w > limit or h > limit:
+            self._upload_page([region], region.width, region.height)
+            return region
+
+        shelf_x, shelf_y, shelf_h = self._late_shelf
+        if shelf_x + w > limit:
+            shelf_y += shelf_h
+            shelf_x = shelf_h = 0
+        if self._late_page is None or shelf_y + h > limit:
+            self._late_page = texture_from_pixels(np.zeros((limit, limit, 4), dtype=np.uint8))
+            self.pages.append(self._late_page)
+            shelf_x = shelf_y = shelf_h = 0
+
+        region.x, region.y = shelf_x, shelf_y
+        rect = rl.Rectangle(shelf_x, shelf_y, region.width, region.height)
+        rl.update_texture_rec(self._late_page, rect, rl.ffi.cast('void *', rl.ffi.from_buffer(region._pixels)))
+        region.texture = self._late_page
+        region._pixels = None
+        self._late_shelf = (shelf_x + w, shelf_y, max(shelf_h, h))
+        return region
+
+    def get(self, name):
+        """Region for a sprite name, or None."""
+        return self.regions.get(name)
+
+    def build(self):
+        """Pack and upload everything added since the last build."""
+        if not self._pending:
+            return
+
+        pad = self.padding
+        limit = self.page_size
+        # Tallest first keeps shelves tight
+        pending = sorted(self._pending, key=lambda r: (r.height, r.width), reverse=True)
+        self._pending = []
+
+        page_regions = []
+        shelf_x = shelf_y = shelf_h = 0
+        used_w = used_h = 0
+        for region in pending:
+            w, h = region.width + pad, region.height + pad
+            if shelf_x + w > limit and shelf_x > 0:
+                # Next shelf
+                shelf_y += shelf_h
+                shelf_x = shelf_h = 0
+            if shelf_y + h > limit and page_regions:
+                # Page full - upload it and start another
+                self._upload_page(page_regions, used_w, used_h)
+                page_regions = []
+                shelf_x = shelf_y = shelf_h = 0
+                used_w = used_h = 0
+            region.x, region.y = shelf_x, shelf_y
+            page_regions.append(region)
+            shelf_x += w
+            shelf_h = max(shelf_h, h)
+            used_w = max(used_w, shelf_x)
+            used_h = max(used_h, shelf_y + shelf_h)
+
+        if page_regions:
+            self._upload_page(page_regions, used_w, used_h)
+
+    def _upload_page(self, regions, width, height):
+        """Blit regions into one page array (sized to content) and upload it."""
+        page = np.zeros((height, width, 4), dtype=np.uint8)
+        for region in regions:
+            page[region.y:region.y + region.height, region.x:region.x + region.width] = region._pixels
+        texture = texture_from_pixels(page)
+        self.pages.append(texture)
+        for region in regions:
+            region.texture = texture
+            region._pixels = None
+
+    def unload(self):
+        """Unload all page textures and forget every region."""
+        for texture in self.pages:
+            rl.unload_texture(texture)
+        self.pages = []
+        self.regions = {}
+        self._pending = []
+        self._late_page = None
+        self._late_shelf = (0, 0, 0)
+
+
+def draw_sprite_pro(sprite, source, dest, origin, rotation, tint):
+    """rl.draw_texture_pro for either a Texture2D or an AtlasRegion.
+
+    `source` is in sprite-local coordinates. A negative width/height flips the
+    sprite as it does for a standalone texture (where the x/y of a flipped
+    source wraps around the sprite's own size).
+    """
+    if not isinstance(sprite, AtlasRegion):
+        rl.draw_texture_pro(sprite, source, dest, origin, rotation, tint)
+        return
+
+    x, y, w, h = source.x, source.y, source.width, source.height
+    if w < 0:
+        x = x % sprite.width if sprite.width else 0
+    if h < 0:
+        y = y % sprite.height if sprite.height else 0
+    page_source = rl.Rectangle(sprite.x + x, sprite.y + y, w, h)
+    rl.draw_texture_pro(sprite.texture, page_source, dest, origin, rotation, tint)
+
+
+def sprite_texture_size(sprite):
+    """(width, height) of the texture a sprite is sampled from (page size for regions).
+
+    Shaders that step by texels need this rather than the sprite size.
+    """
+    texture = sprite.texture if isinstance(sprite, AtlasRegion) else sprite
+    return texture.width, texture.height
+
+
+# Global atlas instance (shared by the board, sprite manager and menus)
+_sprite_atlas = None
+
+
+def get_sprite_atlas():
+    """Get the global texture atlas instance."""
+    global _sprite_atlas
+    if _sprite_atlas is None:
+        _sprite_atlas = TextureAtlas()
+    return _sprite_atlas
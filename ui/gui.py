@@ -19,8 +19,9 @@ import pyray as rl
 import time
 import math
 import os
+from collections import OrderedDict
 from constants import (
-    CELL_SIZE, UPDATE_INTERVAL,
+    CELL_SIZE,
     FARM_CELL_COLORS, JOB_TIERS, ITEMS,
     BG_COLOR, GRID_COLOR, ROAD_COLOR,
     TICKS_PER_DAY, TICKS_PER_YEAR, SLEEP_START_FRACTION,
@@ -28,6 +29,8 @@ from constants import (
     DEFAULT_ZOOM, MIN_ZOOM, MAX_ZOOM, ZOOM_SPEED, SPRINT_SPEED,
     SOUND_RADIUS, VISION_RANGE, VISION_CONE_ANGLE, SHOW_PERCEPTION_DEBUG,
     ADJACENCY_DISTANCE, INTERACT_DISTANCE, SKILLS, START_MUTED,
+    GROUND_TILE_CELLS, GROUND_TILE_CACHE_SIZE, SIMULATION_THREADED, TURBO_RENDER_FPS,
+    PROFILER_REPORT_INTERVAL, PROFILER_TRACE_PATH,
     # Hitbox debug settings
     SHOW_CHARACTER_HITBOXES, SHOW_COLLISION_RADIUS, SHOW_SPRITE_BOUNDS,
     SHOW_INTERACTION_RADIUS, SHOW_ATTACK_RANGE, SHOW_CHARACTER_POSITION,
@@ -35,22 +38,30 @@ from constants import (
     AIM_CHEVRON_FEET_OFFSET, AIM_CHEVRON_THICKNESS, AIM_CHEVRON_COLOR,
     DEBUG_COLOR_COLLISION, DEBUG_COLOR_SPRITE, DEBUG_COLOR_INTERACT,
     DEBUG_COLOR_ATTACK, DEBUG_COLOR_POSITION, DEBUG_COLOR_ATTACK_CONE,
-    CHARACTER_COLLISION_RADIUS, FISTS,
+    CHARACTER_COLLISION_RADIUS,
     # Ongoing action constants
     ONGOING_ACTION_CHOP_DURATION, UI_COLOR_PROGRESS_BAR,
     # Block/shield
     SHIELD_COLOR
 )
-from scenario.scenario_world import AREAS, BARRELS, BEDS, VILLAGE_NAME, SIZE, ROADS
+from scenario.scenario_world import BARRELS, BEDS, VILLAGE_NAME, SIZE
 from game_state import GameState
 from game_logic import GameLogic
 from player_controller import PlayerController
+from simulation import SimulationRunner
+from profiler import get_profiler
 from ui.sprites import get_sprite_manager
+from ui.atlas import get_sprite_atlas, draw_sprite_pro, sprite_texture_size
 from ui.menus.dialogue_menu import DialogueMenu
 from ui.menus.environment_menu import EnvironmentMenu
 from ui.menus.inventory_menu import InventoryMenu
 
 
+# Spatial index kinds that block vision (the visibility cache keys on their versions)
+EXTERIOR_OCCLUDER_KINDS = ('tree', 'house')
+INTERIOR_OCCLUDER_KINDS = ('stove',)
+
+
 # =============================================================================
 # HUD CONFIGURATION
 # =============================================================================
@@ -224,6 +235,7 @@ class BoardGUI:
         self.state = GameState()
         self.logic = GameLogic(self.state)
         self.player_controller = PlayerController(self.state, self.logic)
+        self.simulation = SimulationRunner(self.state, self.logic, self.player_controller)
         
         # Dialogue system
         self.dialogue = DialogueMenu(self.state, self.logic)
@@ -253,18 +265,15 @@ class BoardGUI:
         self.zoom = DEFAULT_ZOOM
         self.camera_following_player = True
         
-        # Pre-compute road set for fast lookup
-        self._road_set = set(tuple(r) for r in ROADS)
-        
         # Timing
         self.last_frame_time = time.time()
-        self._accumulated_time = 0.0
         
         # Movement state
         self.player_moving = False
         
         # Running state
         self.running = True
+        self._turbo_active = False  # Whether the frame rate is currently lowered for turbo
         
         # UI state
         self.inventory_menu = InventoryMenu(self.state, self.logic)
@@ -287,14 +296,27 @@ class BoardGUI:
         
         # Frame-level rendering cache (cleared each frame for performance)
         self._frame_cache = {}
+        
+        # What this frame draws: the latest published snapshot and where each
+        # character sits between it and the previous one (see SimulationRunner.interpolated)
+        self._snapshot, self._draw_positions = self.simulation.interpolated()
+        self._interaction_context = None  # HUD hint, resolved under the lock each frame
+        
+        # Shadow-cast vision cones for the perception debug overlay
+        self._visibility_cache = {}  # observer key -> (signature, polygon, last drawn frame)
+        self._visibility_frame = 0
         self._visible_min_x = 0
         self._visible_max_x = SIZE
         self._visible_min_y = 0
         self._visible_max_y = SIZE
         
-        # Spatial hash for trees (built once, massive performance improvement)
-        self._tree_spatial_hash = None
-        self._tree_spatial_chunk_size = 16  # 16x16 cell chunks
+        # Baked ground tiles: (tile_x, tile_y) -> {'rt', 'farm_cells', 'signature', 'frame'}
+        # Static ground (grass, roads, area colors) is drawn into a render texture once;
+        # a tile is only re-baked when one of its farm cells changes state.
+        self._ground_tiles = OrderedDict()
+        self._ground_farm_index = None  # (tile_x, tile_y) -> [farm cell positions]
+        self._ground_source = None  # Snapshot terrain the tiles were baked from
+        self._ground_frame = 0
         
         # Track health/stamina for bar visibility
         self._char_prev_health = {}  # char_name -> previous health
@@ -353,10 +375,18 @@ class BoardGUI:
             rl.play_music_stream(self.music)
     
     def _load_resources(self):
-        """Load all game resources (sprites, textures, fonts)."""
+        """Load all game resources (sprites, textures, fonts).
+        
+        Character, world and item sprites are packed into the shared texture
+        atlas, so world_textures/item_textures hold AtlasRegions (draw them with
+        draw_sprite_pro).
+        """
+        self.atlas = get_sprite_atlas()
+        
         # Initialize sprite manager
         self.sprite_manager = get_sprite_manager(self.script_dir)
         self.sprite_manager.load_sprites()
+        self.sprite_manager.precompute_recolors(self._character_palette())
         
         # Load world sprites
         self.world_textures = {}
@@ -386,11 +416,20 @@ class BoardGUI:
         
         for name, filename in sprite_files.items():
             filepath = os.path.join(self.script_dir, filename)
-            if os.path.exists(filepath):
-                self.world_textures[name] = rl.load_texture(filepath)
-            else:
+            self.world_textures[name] = self.atlas.add_file(f"world:{name}", filepath)
+            if self.world_textures[name] is None:
                 print(f"Warning: World sprite not found: {filepath}")
-                self.world_textures[name] = None
+        
+        # Load item sprites for ground items (from ITEMS constant)
+        self.item_textures = {}
+        for item_type, item_info in ITEMS.items():
+            sprite_name = item_info.get('sprite')
+            if sprite_name:
+                filepath = os.path.join(self.script_dir, 'sprites', 'items', sprite_name)
+                self.item_textures[item_type] = self.atlas.add_file(f"item:{item_type}", filepath)
+        
+        # Pack everything queued above into atlas pages
+        self.atlas.build()
         
         # Extract campfire frames
         self.campfire_frames = []
@@ -418,95 +457,95 @@ class BoardGUI:
                         frames.append(rl.Rectangle(i * frame_w, 0, frame_w, frame_h))
                     self.occluder_frames[occluder_type] = frames
         
-        # Load item sprites for ground items (from ITEMS constant)
-        self.item_textures = {}
-        for item_type, item_info in ITEMS.items():
-            sprite_name = item_info.get('sprite')
-            if sprite_name:
-                filepath = os.path.join(self.script_dir, 'sprites', 'items', sprite_name)
-                if os.path.exists(filepath):
-                    self.item_textures[item_type] = rl.load_texture(filepath)
-                else:
-                    self.item_textures[item_type] = None
-        
         # Load fonts
         self.font_default = rl.get_font_default()
     
     def run(self):
         """Main game loop"""
-        # Profiling setup
-        self._profile_times = {'input': 0, 'logic': 0, 'render': 0, 'debug': 0}
-        self._profile_frame_count = 0
-        self._profile_last_report = time.time()
+        profiler = get_profiler()
+        profile = profiler.scope
+        report_since = profiler.now()
+        report_frames = 0
+        last_report = time.time()
+        
+        # Simulation runs on its own thread. Input and commands take its lock;
+        # drawing reads the published snapshots and doesn't
+        if SIMULATION_THREADED:
+            self.simulation.start()
         
         while self.running and not rl.window_should_close():
+            self.simulation.check()
+            
+            # Turbo: drop the frame rate so the simulation gets the CPU
+            if self.state.turbo != self._turbo_active:
+                self._turbo_active = self.state.turbo
+                rl.set_target_fps(TURBO_RENDER_FPS if self._turbo_active else 60)
+            
             # Update music stream
             if self.music:
                 rl.update_music_stream(self.music)
             
-            # Profile input handling
-            t0 = time.time()
-            self._handle_input()
-            t1 = time.time()
-            self._profile_times['input'] += t1 - t0
-            
-            # Profile game logic
-            self._game_loop()
-            t2 = time.time()
-            self._profile_times['logic'] += t2 - t1
-            
-            # Profile rendering
-            self._render_frame()
-            t3 = time.time()
-            self._profile_times['render'] += t3 - t2
-            
-            # Update debug window if present
-            if self.debug_window and self.debug_window.is_open():
-                player = self.state.player
-                if player:
-                    player_food = player.get_item('wheat')
-                    player_money = player.get_item('gold')
-                    status = f"Pos:({player.x:.1f},{player.y:.1f}) Wheat:{player_food} ${player_money} HP:{player.health} | Zoom:{self.zoom:.1f}x | {'Follow' if self.camera_following_player else 'Free'}"
-                else:
-                    status = f"No player | Zoom:{self.zoom:.1f}x"
-                self.debug_window.set_status(status)
-                self.debug_window.update()
-            t4 = time.time()
-            self._profile_times['debug'] += t4 - t3
-            
-            self._profile_frame_count += 1
-            
-            # Report profiling every 2 seconds
-            if time.time() - self._profile_last_report > 2.0:
-                total = sum(self._profile_times.values())
-                if total > 0 and self._profile_frame_count > 0:
-                    fps = self._profile_frame_count / 2.0
-                    print(f"\n=== PROFILE ({fps:.1f} FPS, {self._profile_frame_count} frames) ===")
-                    print(f"  Input:  {self._profile_times['input']*1000/self._profile_frame_count:.2f}ms/frame ({100*self._profile_times['input']/total:.1f}%)")
-                    print(f"  Logic:  {self._profile_times['logic']*1000/self._profile_frame_count:.2f}ms/frame ({100*self._profile_times['logic']/total:.1f}%)")
-                    print(f"  Render: {self._profile_times['render']*1000/self._profile_frame_count:.2f}ms/frame ({100*self._profile_times['render']/total:.1f}%)")
-                    print(f"  Debug:  {self._profile_times['debug']*1000/self._profile_frame_count:.2f}ms/frame ({100*self._profile_times['debug']/total:.1f}%)")
-                self._profile_times = {'input': 0, 'logic': 0, 'render': 0, 'debug': 0}
-                self._profile_frame_count = 0
-                self._profile_last_report = time.time()
+            with self.simulation.lock:
+                with profile('frame.input'):
+                    self._handle_input()
+                
+                with profile('frame.logic'):
+                    self._game_loop()
+                    self._update_ui_state()
+                
+                # Update debug window if present
+                if self.debug_window and self.debug_window.is_open():
+                    player = self.state.player
+                    if player:
+                        player_food = player.get_item('wheat')
+                        player_money = player.get_item('gold')
+                        status = f"Pos:({player.x:.1f},{player.y:.1f}) Wheat:{player_food} ${player_money} HP:{player.health} | Zoom:{self.zoom:.1f}x | {'Follow' if self.camera_following_player else 'Free'}"
+                    else:
+                        status = f"No player | Zoom:{self.zoom:.1f}x"
+                    with profile('frame.debug_window'):
+                        self.debug_window.set_status(status)
+                        self.debug_window.update()
+            
+            with profile('frame.render'):
+                self._render_frame()
+            
+            # Present (and wait for vsync); the simulation keeps running meanwhile
+            with profile('frame.present'):
+                rl.end_drawing()
+            
+            # Periodic console report of everything recorded since the last one
+            report_frames += 1
+            if profiler.enabled and PROFILER_REPORT_INTERVAL and time.time() - last_report > PROFILER_REPORT_INTERVAL:
+                print("\n" + profiler.format_report(since=report_since, frames=report_frames))
+                report_since = profiler.now()
+                report_frames = 0
+                last_report = time.time()
         
         # Cleanup
         self._cleanup()
     
     def _cleanup(self):
         """Clean up resources"""
+        self.simulation.stop()
+        
+        # Keep the last few seconds of timings for chrome://tracing / Perfetto
+        profiler = get_profiler()
+        if profiler.enabled and PROFILER_TRACE_PATH:
+            print(f"Profile trace written to {profiler.export_chrome_trace(PROFILER_TRACE_PATH)}")
+        
         if self.debug_window:
             self.debug_window.close()
         
-        # Unload textures
-        for tex in self.world_textures.values():
-            if tex:
-                rl.unload_texture(tex)
+        # Unload sprite atlas pages (world, item and character sprites)
+        self.sprite_manager.unload_sprites()
+        self.atlas.unload()
         
-        # Unload item textures
-        for tex in self.item_textures.values():
-            if tex:
-                rl.unload_texture(tex)
+        # Unload baked ground tiles
+        self._clear_ground_tiles()
+        
+        # Delete the evicted-chunk disk cache
+        if self.state.chunks is not None:
+            self.state.chunks.clear_cache()
         
         # Unload music
         if self.music:
@@ -1221,7 +1260,7 @@ class BoardGUI:
     # =========================================================================
     
     def _game_loop(self):
-        """Main game loop - process ticks and update positions"""
+        """Per-frame update - advances the simulation unless it runs on its own thread"""
         current_time = time.time()
         dt = current_time - self.last_frame_time
         self.last_frame_time = current_time
@@ -1229,50 +1268,12 @@ class BoardGUI:
         # Cap delta time
         dt = min(dt, 0.1)
         
+        if not self.simulation.threaded:
+            self.simulation.advance(dt)  # Publishes a snapshot, paused or not
+        
         if self.state.paused:
             return
         
-        game_dt = dt * self.state.game_speed
-        tick_duration = UPDATE_INTERVAL / 1000.0
-        
-        self._accumulated_time += game_dt
-        
-        # Cap accumulated time
-        max_ticks_per_frame = 200
-        self._accumulated_time = min(self._accumulated_time, tick_duration * max_ticks_per_frame)
-        
-        # Process simulation in tick-sized chunks
-        while self._accumulated_time >= tick_duration:
-            self.logic.process_tick()
-            
-            remaining = tick_duration
-            while remaining > 0:
-                step = min(remaining, 0.05)
-                self.player_controller.update_position(step)
-                self.logic.update_npc_positions(step)
-                self.logic.update_arrows(step)
-                remaining -= step
-            
-            self._accumulated_time -= tick_duration
-        
-        # Handle remaining fractional time
-        if self._accumulated_time > 0:
-            step = min(self._accumulated_time, 0.05)
-            self.player_controller.update_position(step)
-            self.logic.update_npc_positions(step)
-            self.logic.update_arrows(step)
-        
-        # Center camera on player if following
-        if self.camera_following_player and self.state.player:
-            player = self.state.player
-            # Use local coords when inside (so interior renders correctly)
-            if player.zone and not self.window_viewing:
-                self.camera_x = player.prevailing_x
-                self.camera_y = player.prevailing_y
-            else:
-                self.camera_x = player.x
-                self.camera_y = player.y
-        
         # Update dialogue system (runs even when game is unpaused)
         self.dialogue.update(dt)
         
@@ -1286,23 +1287,13 @@ class BoardGUI:
     # RENDERING
     # =========================================================================
     
-    def _render_frame(self):
-        """Render the current game state"""
-        # Detailed render profiling
-        if not hasattr(self, '_render_profile'):
-            self._render_profile = {'grid': 0, 'trees_chars': 0, 'hud': 0, 'other': 0}
-            self._render_profile_count = 0
-        
-        rl.begin_drawing()
-        rl.clear_background(hex_to_color(BG_COLOR))
-        
-        t0 = time.time()
-        self._draw_canvas()
-        t1 = time.time()
+    def _update_ui_state(self):
+        """Per-frame UI work that reads live state. Runs under the simulation lock.
         
-        # Draw HUD overlay or inventory screen
+        Everything else the frame draws comes from the published snapshot.
+        """
+        # Inventory menu handles its own clicks against the live inventories
         if self.inventory_menu.is_active:
-            # Update inventory menu state before rendering
             self.inventory_menu.set_canvas_size(self.canvas_width, self.canvas_height)
             self.inventory_menu.update_input(
                 self.input.mouse_x, self.input.mouse_y,
@@ -1312,37 +1303,77 @@ class BoardGUI:
             )
             # Handle scrolling (mouse wheel, scroll bar drag, gamepad stick)
             self.inventory_menu.update_scroll()
-            self.inventory_menu.render()
-        else:
-            self._draw_hud()
-        t2 = time.time()
         
-        # Draw dialogue UI (on top of everything)
-        self.dialogue.render(self.canvas_width, self.canvas_height)
+        # HUD interaction hint (same query as the E key)
+        player = self.state.player
+        self._interaction_context = None
+        if player and not self.window_viewing and not self.inventory_menu.is_active and not self.state.turbo:
+            self._interaction_context = self._get_player_context(player)
+    
+    def _char_position(self, char):
+        """(prevailing_x, prevailing_y, x, y) to draw a CharacterView at this frame."""
+        position = self._draw_positions.get(char.key)
+        if position is None:
+            return char.prevailing_x, char.prevailing_y, char.x, char.y
+        return position
+    
+    def _follow_player_camera(self):
+        """Center camera on player if following"""
+        player = self._snapshot.player
+        if self.camera_following_player and player:
+            local_x, local_y, world_x, world_y = self._char_position(player)
+            # Use local coords when inside (so interior renders correctly)
+            if player.zone and not self.window_viewing:
+                self.camera_x = local_x
+                self.camera_y = local_y
+            else:
+                self.camera_x = world_x
+                self.camera_y = world_y
+    
+    def _render_frame(self):
+        """Record the current frame from the latest snapshot. Doesn't need the lock.
         
-        # Draw environment menu (on top of everything)
-        self.environment_menu.render(self.canvas_width, self.canvas_height)
+        Characters are drawn at positions interpolated between the last two
+        snapshots. The frame is presented by run() (rl.end_drawing).
+        """
+        self._snapshot, self._draw_positions = self.simulation.interpolated()
+        # Camera follows the interpolated player so it doesn't jitter against the sprite
+        self._follow_player_camera()
+        self._draw_frame()
+    
+    def _draw_frame(self):
+        """Draw the current game state"""
+        profile = get_profiler().scope
         
-        rl.end_drawing()
+        rl.begin_drawing()
+        rl.clear_background(hex_to_color(BG_COLOR))
         
-        self._render_profile['grid'] += t1 - t0
-        self._render_profile['hud'] += t2 - t1
-        self._render_profile_count += 1
+        with profile('render.canvas'):
+            self._draw_canvas()
         
-        # Report every 60 frames
-        if self._render_profile_count >= 60:
-            print(f"  [Render breakdown] Canvas: {self._render_profile['grid']*1000/60:.2f}ms, HUD: {self._render_profile['hud']*1000/60:.2f}ms")
-            self._render_profile = {'grid': 0, 'trees_chars': 0, 'hud': 0, 'other': 0}
-            self._render_profile_count = 0
+        # Draw HUD overlay (the inventory screen replaces it; drawn with the menus below)
+        if not self.inventory_menu.is_active:
+            if self.state.turbo:
+                self._draw_turbo_overlay()
+            else:
+                with profile('render.hud'):
+                    self._draw_hud()
+        
+        # Menus show live inventories and dialogue, so they take the lock - only while open
+        if self.inventory_menu.is_active or self.dialogue.is_active or self.environment_menu.is_active:
+            with profile('render.menus'), self.simulation.lock:
+                if self.inventory_menu.is_active:
+                    self.inventory_menu.render()
+                
+                # Draw dialogue UI (on top of everything)
+                self.dialogue.render(self.canvas_width, self.canvas_height)
+                
+                # Draw environment menu (on top of everything)
+                self.environment_menu.render(self.canvas_width, self.canvas_height)
     
     def _draw_canvas(self):
         """Draw the game canvas with camera (zoom and pan)"""
-        # Detailed profiling
-        if not hasattr(self, '_canvas_profile'):
-            self._canvas_profile = {'setup': 0, 'grid': 0, 'trees_chars': 0, 'camps': 0, 'death': 0}
-            self._canvas_profile_count = 0
-        
-        _cp_t0 = time.time()
+        profile = get_profiler().scope
         
         canvas_width = self.canvas_width
         canvas_height = self.canvas_height
@@ -1361,7 +1392,7 @@ class BoardGUI:
         
         # Check if player is in an interior (and not looking through window)
         # OR if we're looking into an interior from outside
-        player = self.state.player
+        player = self._snapshot.player
         
         # Track last known player zone for death rendering
         if player:
@@ -1380,7 +1411,8 @@ class BoardGUI:
         
         if in_interior or looking_into_interior or player_dead_in_interior:
             # Render interior instead of exterior
-            self._draw_interior_canvas()
+            with profile('canvas.interior'):
+                self._draw_interior_canvas()
             return
         
         # Calculate visible world bounds
@@ -1393,10 +1425,11 @@ class BoardGUI:
         max_visible_y = int(self.camera_y + half_view_height) + 2
         
         # Clamp to world bounds
+        _, _, world_max_x, world_max_y = self._snapshot.terrain[0].bounds
         min_visible_x = max(0, min_visible_x)
-        max_visible_x = min(SIZE, max_visible_x)
+        max_visible_x = min(world_max_x, max_visible_x)
         min_visible_y = max(0, min_visible_y)
-        max_visible_y = min(SIZE, max_visible_y)
+        max_visible_y = min(world_max_y, max_visible_y)
         
         # Store visible bounds for use by other methods (Fix #1: view frustum culling)
         self._visible_min_x = min_visible_x
@@ -1404,48 +1437,38 @@ class BoardGUI:
         self._visible_min_y = min_visible_y
         self._visible_max_y = max_visible_y
         
-        _cp_t1 = time.time()
-        self._canvas_profile['setup'] += _cp_t1 - _cp_t0
-        
         # Draw grid cells
-        self._draw_grid(min_visible_x, max_visible_x, min_visible_y, max_visible_y)
-        _cp_t2 = time.time()
-        self._canvas_profile['grid'] += _cp_t2 - _cp_t1
+        with profile('canvas.grid'):
+            self._draw_grid(min_visible_x, max_visible_x, min_visible_y, max_visible_y)
         
         # Draw camps (these stay on ground level, not occluding)
-        self._draw_camps()
-        _cp_t3 = time.time()
-        self._canvas_profile['camps'] += _cp_t3 - _cp_t2
+        with profile('canvas.camps'):
+            self._draw_camps()
         
         # Draw perception debug if enabled
         if SHOW_PERCEPTION_DEBUG:
-            self._draw_perception_debug()
+            with profile('canvas.perception'):
+                self._draw_perception_debug()
         
-        # Draw aiming arc under player (before characters so it appears underneath)
-        self._draw_player_aiming_arc()
-        
-        # Draw bow accuracy cone when drawing bow
-        self._draw_bow_accuracy_cone()
+        with profile('canvas.aiming'):
+            # Draw aiming arc under player (before characters so it appears underneath)
+            self._draw_player_aiming_arc()
+            
+            # Draw bow accuracy cone when drawing bow
+            self._draw_bow_accuracy_cone()
         
         # Draw all occluders (trees, houses, barrels, beds, stoves) and characters together, Y-sorted for proper depth
-        self._draw_trees_and_characters()
-        _cp_t4 = time.time()
-        self._canvas_profile['trees_chars'] += _cp_t4 - _cp_t3
+        with profile('canvas.trees_chars'):
+            self._draw_trees_and_characters()
         
         # Draw character hitbox debug visualization
         if SHOW_CHARACTER_HITBOXES:
-            self._draw_character_hitboxes()
+            with profile('canvas.hitboxes'):
+                self._draw_character_hitboxes()
         
         # Draw death animations
-        self._draw_death_animations()
-        _cp_t5 = time.time()
-        self._canvas_profile['death'] += _cp_t5 - _cp_t4
-        
-        self._canvas_profile_count += 1
-        if self._canvas_profile_count >= 60:
-            print(f"    [Canvas] setup:{self._canvas_profile['setup']*1000/60:.1f}ms grid:{self._canvas_profile['grid']*1000/60:.1f}ms trees+chars:{self._canvas_profile['trees_chars']*1000/60:.1f}ms camps:{self._canvas_profile['camps']*1000/60:.1f}ms")
-            self._canvas_profile = {'setup': 0, 'grid': 0, 'trees_chars': 0, 'camps': 0, 'death': 0}
-            self._canvas_profile_count = 0
+        with profile('canvas.death'):
+            self._draw_death_animations()
     
     def _draw_interior_canvas(self):
         """Draw the interior when player is inside a building or looking in from outside.
@@ -1462,7 +1485,7 @@ class BoardGUI:
         - Front wall (south) takes priority at y=height corners
         - Side walls (east/west) take priority at y=-1 corners (back wall)
         """
-        player = self.state.player
+        player = self._snapshot.player
         
         # Determine which interior to render
         if self.window_viewing_interior is not None:
@@ -1513,7 +1536,7 @@ class BoardGUI:
             if tex:
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(int(screen_x), int(screen_y), tile_size, tile_size)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 rl.draw_rectangle(int(screen_x), int(screen_y), tile_size, tile_size, fallback_color)
         
@@ -1586,57 +1609,128 @@ class BoardGUI:
         return screen_x, screen_y
     
     def _draw_grid(self, min_x, max_x, min_y, max_y):
-        """Draw grid cells"""
+        """Draw the ground as baked tiles (one textured quad per visible tile)"""
         cell_size = self._cam_cell_size
+        tile_cells = GROUND_TILE_CELLS
+        
+        # Roads, areas and farm cells change wholesale on reset and chunk streaming
+        source = self._snapshot.terrain
+        if self._ground_source is not source:
+            self._clear_ground_tiles()
+            self._ground_source = source
+        if self._ground_farm_index is None:
+            self._build_ground_farm_index()
+        
+        self._ground_frame += 1
+        farm_cells = self._snapshot.farm_cells
+        dest_size = tile_cells * cell_size + 1  # +1 pixel overlap hides seams between tiles
+        
+        for tile_y in range(min_y // tile_cells, (max_y - 1) // tile_cells + 1):
+            for tile_x in range(min_x // tile_cells, (max_x - 1) // tile_cells + 1):
+                key = (tile_x, tile_y)
+                tile = self._ground_tiles.get(key)
+                positions = self._ground_farm_index.get(key, ())
+                signature = tuple(farm_cells[pos] for pos in positions if pos in farm_cells)
+                
+                if tile is None:
+                    tile = {'rt': rl.load_render_texture(tile_cells * CELL_SIZE, tile_cells * CELL_SIZE)}
+                    self._ground_tiles[key] = tile
+                    self._bake_ground_tile(key, tile['rt'])
+                    tile['signature'] = signature
+                elif tile['signature'] != signature:
+                    self._bake_ground_tile(key, tile['rt'])
+                    tile['signature'] = signature
+                self._ground_tiles.move_to_end(key)
+                tile['frame'] = self._ground_frame
+                
+                texture = tile['rt'].texture
+                screen_x, screen_y = self._world_to_screen(tile_x * tile_cells, tile_y * tile_cells)
+                # Render textures are stored upside down - flip with a negative source height
+                rl.draw_texture_pro(
+                    texture,
+                    rl.Rectangle(0, 0, texture.width, -texture.height),
+                    rl.Rectangle(screen_x, screen_y, dest_size, dest_size),
+                    rl.Vector2(0, 0), 0, rl.WHITE
+                )
+        
+        # Unload least recently drawn tiles over budget (never ones drawn this frame)
+        while len(self._ground_tiles) > GROUND_TILE_CACHE_SIZE:
+            key, tile = next(iter(self._ground_tiles.items()))
+            if tile['frame'] == self._ground_frame:
+                break
+            rl.unload_render_texture(tile['rt'])
+            del self._ground_tiles[key]
+    
+    def _bake_ground_tile(self, key, render_texture):
+        """Draw one tile's grass, roads and area/farm colors into its render texture."""
+        tile_cells = GROUND_TILE_CELLS
+        x0, y0 = key[0] * tile_cells, key[1] * tile_cells
+        chunks, _, roads = self._snapshot.terrain
+        _, _, world_max_x, world_max_y = chunks.bounds
         
         road_tex = self.world_textures.get('road')
         grass_tex = self.world_textures.get('grass')
+        bg_color = hex_to_color(BG_COLOR)
         
-        tile_size = int(cell_size) + 1
-        
-        for y in range(min_y, max_y):
-            for x in range(min_x, max_x):
-                screen_x, screen_y = self._world_to_screen(x, y)
-                
-                is_road = (x, y) in self._road_set
+        rl.begin_texture_mode(render_texture)
+        rl.clear_background(rl.Color(0, 0, 0, 0))
+        for y in range(max(0, y0), min(world_max_y, y0 + tile_cells)):
+            for x in range(max(0, x0), min(world_max_x, x0 + tile_cells)):
+                px = (x - x0) * CELL_SIZE
+                py = (y - y0) * CELL_SIZE
+                dest = rl.Rectangle(px, py, CELL_SIZE, CELL_SIZE)
                 
                 # Draw grass as base layer
                 if grass_tex:
                     source = rl.Rectangle(0, 0, grass_tex.width, grass_tex.height)
-                    dest = rl.Rectangle(screen_x, screen_y, tile_size, tile_size)
-                    rl.draw_texture_pro(grass_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(grass_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
-                    rl.draw_rectangle(int(screen_x), int(screen_y), tile_size, tile_size, hex_to_color(BG_COLOR))
+                    rl.draw_rectangle(px, py, CELL_SIZE, CELL_SIZE, bg_color)
                 
                 # Draw road or area colors on top
-                if is_road and road_tex:
+                if road_tex and (x, y) in roads:
                     source = rl.Rectangle(0, 0, road_tex.width, road_tex.height)
-                    dest = rl.Rectangle(screen_x, screen_y, tile_size, tile_size)
-                    rl.draw_texture_pro(road_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(road_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     color = self._get_cell_color(x, y)
                     if color != BG_COLOR:
-                        rl.draw_rectangle(int(screen_x), int(screen_y), tile_size, tile_size, hex_to_color(color))
+                        rl.draw_rectangle(px, py, CELL_SIZE, CELL_SIZE, hex_to_color(color))
+        rl.end_texture_mode()
+    
+    def _build_ground_farm_index(self):
+        """Group farm cell positions by ground tile so tiles can detect state changes."""
+        tile_cells = GROUND_TILE_CELLS
+        self._ground_farm_index = {}
+        for x, y in self._snapshot.farm_cells:
+            self._ground_farm_index.setdefault((x // tile_cells, y // tile_cells), []).append((x, y))
+    
+    def _clear_ground_tiles(self):
+        """Unload all baked ground tiles (they are re-baked on demand)."""
+        for tile in self._ground_tiles.values():
+            rl.unload_render_texture(tile['rt'])
+        self._ground_tiles.clear()
+        self._ground_farm_index = None
     
     def _get_cell_color(self, x, y):
         """Get the background color for a cell"""
-        if (x, y) in self._road_set:
+        chunks, _, roads = self._snapshot.terrain
+        if (x, y) in roads:
             return ROAD_COLOR
         
         # Only show farm cell colors for actual farmable cells
-        farm_cell = self.state.get_farm_cell_state(x, y)
-        if farm_cell:
-            return FARM_CELL_COLORS.get(farm_cell['state'], BG_COLOR)
+        farm_state = self._snapshot.farm_cells.get((x, y))
+        if farm_state:
+            return FARM_CELL_COLORS.get(farm_state, BG_COLOR)
         
-        area = self.state.get_area_at(x, y)
+        area = chunks.get_area_at(x, y)
         if area:
-            for area_def in AREAS:
-                if area_def["name"] == area:
-                    role = area_def.get("role")
-                    # Make these area types transparent (just show background)
-                    if role in ("village", "house", "farmhouse", "farm"):
-                        return BG_COLOR
-                    return area_def.get("color", BG_COLOR)
+            area_def = chunks.get_area_def(area)
+            if area_def:
+                role = area_def.get("role")
+                # Make these area types transparent (just show background)
+                if role in ("village", "house", "farmhouse", "farm"):
+                    return BG_COLOR
+                return area_def.get("color", BG_COLOR)
         
         return BG_COLOR
     
@@ -1668,7 +1762,7 @@ class BoardGUI:
             if tex:
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(screen_x, screen_y, width, height)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 rl.draw_rectangle(int(screen_x), int(screen_y), int(width), int(height), hex_to_color("#C4813D"))
     
@@ -1681,9 +1775,10 @@ class BoardGUI:
         """
         # Collect all drawable entities with their sort key (Y position)
         drawables = []
+        snapshot = self._snapshot
         
         # Determine what zone we're rendering
-        player = self.state.player
+        player = snapshot.player
         if self.window_viewing and self.window_viewing_interior is not None:
             rendering_zone = self.window_viewing_interior.name
         elif self.window_viewing:
@@ -1705,23 +1800,25 @@ class BoardGUI:
             drawables.append(('occluder', sort_y, occluder_type, pos, data))
         
         # Add characters - only those in the same zone we're rendering
-        for char in self.state.characters:
-            if char.zone != rendering_zone:
-                continue
-            
+        zone_characters = snapshot.characters_in_zone(rendering_zone)
+        for char in zone_characters:
+            local_x, local_y, world_x, world_y = self._char_position(char)
             if rendering_zone:
-                sort_y = char.prevailing_y
+                sort_y = local_y
             else:
-                sort_y = char.y
+                sort_y = world_y
             drawables.append(('character', sort_y, char, None, None))
         
-        # Add ground items - only those in the same zone we're rendering
-        if hasattr(self.state, 'ground_items'):
-            for ground_item in self.state.ground_items.get_items_in_zone(rendering_zone):
+        # Add visible ground items (same spatial query as the occluders), as of the snapshot
+        for kind, ground_item in self._get_visible_objects(rendering_zone):
+            if kind == 'ground_item':
+                view = snapshot.ground_items.get(id(ground_item))
+                if view is None:
+                    continue  # Dropped since the snapshot
                 # Sort ground items slightly behind things at the same Y
                 # by subtracting a small amount from sort_y
-                sort_y = ground_item.y - 0.1
-                drawables.append(('ground_item', sort_y, ground_item, None, None))
+                sort_y = view.y - 0.1
+                drawables.append(('ground_item', sort_y, view, None, None))
         
         # Sort by Y position (smaller Y drawn first = behind)
         drawables.sort(key=lambda d: d[1])
@@ -1729,19 +1826,18 @@ class BoardGUI:
         # Pre-calculate which characters are perceived and occluded
         # OPTIMIZATION: Only check visible occluders for occlusion
         perceived_occluded_chars = set()
-        for char in self.state.characters:
-            if char.zone != rendering_zone:
-                continue
-            is_player = char is self.state.player
+        for char in zone_characters:
+            is_player = char.is_player
             is_perceived = is_player or self._is_character_perceived(char)
             if is_perceived:
+                local_x, local_y, world_x, world_y = self._char_position(char)
                 if rendering_zone:
-                    check_x, check_y = char.prevailing_x, char.prevailing_y
+                    check_x, check_y = local_x, local_y
                 else:
-                    check_x, check_y = char.x, char.y
+                    check_x, check_y = world_x, world_y
                 # Use fast visible-only occlusion check
                 if self._is_occluded_by_visible(check_x, check_y, visible_occluders, rendering_zone):
-                    perceived_occluded_chars.add(id(char))
+                    perceived_occluded_chars.add(char.key)
         
         # Reset caches
         self._character_ui_cache = []
@@ -1757,7 +1853,7 @@ class BoardGUI:
                 self._draw_single_character_sprite(entity)
                 ui_info = self._character_ui_cache[-1]
                 
-                if id(entity) in perceived_occluded_chars:
+                if entity.key in perceived_occluded_chars:
                     self._deferred_ui_cache.append(ui_info)
                 else:
                     self._draw_character_ui(ui_info)
@@ -1769,7 +1865,7 @@ class BoardGUI:
         self._draw_arrows(rendering_zone)
         
         # Draw red outlines for characters in player's attack cone (when in combat mode)
-        chars_in_attack_cone = self.player_controller.get_chars_in_attack_cone()
+        chars_in_attack_cone = snapshot.attack_cone
         if chars_in_attack_cone:
             self._draw_combat_target_outlines(chars_in_attack_cone)
         
@@ -1783,99 +1879,51 @@ class BoardGUI:
     # Handles depth sorting and occlusion detection for trees, barrels, etc.
     # Methods are scattered throughout rendering code for performance reasons.
 
+    def _get_visible_objects(self, zone):
+        """Get (kind, obj) pairs for everything in the visible area. Cached per frame.
+        
+        One rectangle query against the interactables' spatial index covers
+        occluders, campfires, ground items and corpses.
+        """
+        cache_key = ('visible_objects', zone)
+        if cache_key in self._frame_cache:
+            return self._frame_cache[cache_key]
+        
+        # Visible bounds with margin for tall objects
+        cull_margin = 3
+        result = self.state.interactables.get_objects_in_rect(
+            zone,
+            self._visible_min_x - cull_margin, self._visible_min_y - cull_margin,
+            self._visible_max_x + cull_margin, self._visible_max_y + cull_margin,
+        )
+        self._frame_cache[cache_key] = result
+        return result
+
     def _get_visible_occluders(self, zone):
         """Get only occluders within the visible area. Cached per frame.
 
         Returns list of (occluder_type, pos, data, sort_y) tuples.
-        
-        Uses spatial hashing for trees to avoid iterating all trees in the world.
         """
         cache_key = ('visible_occluders', zone)
         if cache_key in self._frame_cache:
             return self._frame_cache[cache_key]
         
         result = []
-        
-        # Visible bounds with margin for tall objects
-        cull_margin = 3
-        min_x = self._visible_min_x - cull_margin
-        max_x = self._visible_max_x + cull_margin
-        min_y = self._visible_min_y - cull_margin
-        max_y = self._visible_max_y + cull_margin
-        
-        for occluder_type, config in OCCLUDER_CONFIG.items():
+        for occluder_type, obj in self._get_visible_objects(zone):
+            config = OCCLUDER_CONFIG.get(occluder_type)
+            if config is None:
+                continue
             sort_y_offset = config['sort_y_offset']
-            
-            # OPTIMIZED: Use spatial hash for trees
-            if occluder_type == 'tree' and zone is None:
-                # Build spatial hash if not exists or if trees changed (game reset)
-                current_trees = self.state.interactables.trees
-                if (self._tree_spatial_hash is None or 
-                    getattr(self, '_tree_spatial_hash_source', None) is not current_trees):
-                    self._build_tree_spatial_hash()
-                
-                # Only query chunks that overlap visible area
-                chunk_size = self._tree_spatial_chunk_size
-                chunk_min_x = int(min_x) // chunk_size
-                chunk_max_x = int(max_x) // chunk_size + 1
-                chunk_min_y = int(min_y) // chunk_size
-                chunk_max_y = int(max_y) // chunk_size + 1
-                
-                for cx in range(chunk_min_x, chunk_max_x + 1):
-                    for cy in range(chunk_min_y, chunk_max_y + 1):
-                        chunk_trees = self._tree_spatial_hash.get((cx, cy), [])
-                        for pos, data in chunk_trees:
-                            x, y = pos
-                            if min_x <= x <= max_x and min_y <= y <= max_y:
-                                result.append((occluder_type, pos, data, y + sort_y_offset))
-                                
-            elif occluder_type == 'house' and zone is None:
-                for house in self.state.interactables.houses.values():
-                    y_start, x_start, y_end, x_end = house.bounds
-                    if x_end >= min_x and x_start <= max_x and y_end >= min_y and y_start <= max_y:
-                        pos = (x_start, y_end - 1)
-                        result.append((occluder_type, pos, house, y_end - 1 + sort_y_offset))
-            elif occluder_type == 'barrel':
-                for key, obj in self.state.interactables.barrels.items():
-                    if obj.zone == zone:
-                        x, y = obj.x, obj.y
-                        if min_x <= x <= max_x and min_y <= y <= max_y:
-                            result.append((occluder_type, (x, y), obj, y + sort_y_offset))
-            elif occluder_type == 'bed':
-                for key, obj in self.state.interactables.beds.items():
-                    if obj.zone == zone:
-                        x, y = obj.x, obj.y
-                        if min_x <= x <= max_x and min_y <= y <= max_y:
-                            result.append((occluder_type, (x, y), obj, y + sort_y_offset))
-            elif occluder_type == 'stove':
-                for key, obj in self.state.interactables.stoves.items():
-                    if obj.zone == zone:
-                        x, y = obj.x, obj.y
-                        if min_x <= x <= max_x and min_y <= y <= max_y:
-                            result.append((occluder_type, (x, y), obj, y + sort_y_offset))
+            if occluder_type == 'house':
+                y_start, x_start, y_end, x_end = obj.bounds
+                result.append((occluder_type, (x_start, y_end - 1), obj, y_end - 1 + sort_y_offset))
+            else:
+                x, y = obj.x, obj.y
+                result.append((occluder_type, (x, y), obj, y + sort_y_offset))
         
         self._frame_cache[cache_key] = result
         return result
     
-    def _build_tree_spatial_hash(self):
-        """Build spatial hash for trees. Called once, speeds up visible tree queries.
-        
-        Also stores reference to detect if trees dict changes (game reset).
-        """
-        self._tree_spatial_hash = {}
-        self._tree_spatial_hash_source = self.state.interactables.trees  # Track source for invalidation
-        chunk_size = self._tree_spatial_chunk_size
-        
-        for pos, data in self.state.interactables.trees.items():
-            x, y = pos
-            chunk_x = int(x) // chunk_size
-            chunk_y = int(y) // chunk_size
-            chunk_key = (chunk_x, chunk_y)
-            
-            if chunk_key not in self._tree_spatial_hash:
-                self._tree_spatial_hash[chunk_key] = []
-            self._tree_spatial_hash[chunk_key].append((pos, data))
-    
     def _is_occluded_by_visible(self, char_x, char_y, visible_occluders, zone):
         """Fast occlusion check using only visible occluders.
         
@@ -1922,20 +1970,16 @@ class BoardGUI:
     def _is_character_perceived(self, char):
         """Check if a character is within the player's perception (vision cone or sound radius).
 
-        Delegates to game_logic.can_perceive_character() for centralized perception logic.
+        Uses game_logic.can_perceive_character() as evaluated when the snapshot
+        was taken (RenderSnapshot.perceived).
 
         Args:
-            char: Character to check
+            char: CharacterView to check
 
         Returns:
             True if player can perceive the character
         """
-        player = self.state.player
-        if not player or char is player:
-            return False
-        
-        can_perceive, method = self.logic.can_perceive_character(player, char)
-        return can_perceive
+        return char.key in self._snapshot.perceived
     
     def _draw_perceived_outlines(self):
         """Draw outlines for player and all perceived characters that are occluded.
@@ -1960,8 +2004,7 @@ class BoardGUI:
         characters_to_outline = []
         for ui_info in self._deferred_ui_cache:
             char = ui_info['char']
-            char_x = char['x']
-            char_y = char['y']
+            _, _, char_x, char_y = self._char_position(char)
             
             # Find occluders hiding this character (from visible set only)
             occluding_objects = []
@@ -1977,7 +2020,7 @@ class BoardGUI:
                     house_width = x_end - x_start
                     if char_y < y_end and char_y > y_start:
                         if abs(char_x - house_center_x) < house_width / 2:
-                            occluding_objects.append((occluder_type, pos, config))
+                            occluding_objects.append((occluder_type, pos, data))
                 else:
                     obj_x, obj_y = pos
                     if abs(obj_x - char_x) > 2 or abs(obj_y - char_y) > 3:
@@ -1990,7 +2033,7 @@ class BoardGUI:
                     
                     if char_y < obj_sort_y and char_y > obj_y - occlusion_height:
                         if abs(char_x - obj_center_x) < occlusion_width:
-                            occluding_objects.append((occluder_type, pos, config))
+                            occluding_objects.append((occluder_type, pos, data))
             
             if occluding_objects:
                 characters_to_outline.append((ui_info, occluding_objects))
@@ -2020,12 +2063,12 @@ class BoardGUI:
         rl.clear_background(rl.Color(0, 0, 0, 0))
         
         # Collect all unique occluding objects
-        all_occluders = set()
+        all_occluders = {}
         for ui_info, occluding_objects in characters_to_outline:
-            for occluder_type, pos, config in occluding_objects:
-                all_occluders.add((occluder_type, pos))
+            for occluder_type, pos, data in occluding_objects:
+                all_occluders[(occluder_type, pos)] = data
         
-        for occluder_type, pos in all_occluders:
+        for (occluder_type, pos), data in all_occluders.items():
             config = OCCLUDER_CONFIG.get(occluder_type)
             if not config:
                 continue
@@ -2034,17 +2077,7 @@ class BoardGUI:
             
             # Special handling for houses
             if occluder_type == 'house':
-                # Find the house at this position
-                house = None
-                for h in self.state.interactables.houses.values():
-                    y_start, x_start, y_end, x_end = h.bounds
-                    # Houses use y_end - 1 as position key (front edge)
-                    if x_start == ox and y_end - 1 == oy:
-                        house = h
-                        break
-                if not house:
-                    continue
-                
+                house = data
                 bounds = house.bounds
                 y_start, x_start, y_end, x_end = bounds
                 house_width_cells = x_end - x_start
@@ -2063,7 +2096,7 @@ class BoardGUI:
                 if tex:
                     source = rl.Rectangle(0, 0, tex.width, tex.height)
                     dest = rl.Rectangle(screen_x, screen_y, width, height)
-                    rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     rl.draw_rectangle(int(screen_x), int(screen_y), int(width), int(height), rl.WHITE)
                 continue
@@ -2081,7 +2114,7 @@ class BoardGUI:
                     blit_y = screen_y + (cell_size * 0.1)
                     source = rl.Rectangle(0, 0, tex.width, tex.height)
                     dest = rl.Rectangle(blit_x, blit_y, bed_width, bed_height)
-                    rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     padding = int(4 * self.zoom)
                     bed_width = int(cell_size - 2*padding)
@@ -2101,7 +2134,7 @@ class BoardGUI:
                     blit_y = screen_y + (cell_size - stove_size) / 2
                     source = rl.Rectangle(0, 0, tex.width, tex.height)
                     dest = rl.Rectangle(blit_x, blit_y, stove_size, stove_size)
-                    rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     padding = int(4 * self.zoom)
                     stove_size = int(cell_size - 2*padding)
@@ -2119,7 +2152,7 @@ class BoardGUI:
                     blit_y = screen_y + (cell_size - barrel_size) / 2
                     source = rl.Rectangle(0, 0, tex.width, tex.height)
                     dest = rl.Rectangle(blit_x, blit_y, barrel_size, barrel_size)
-                    rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     padding = int(5 * self.zoom)
                     rl.draw_rectangle(int(screen_x + padding), int(screen_y + padding),
@@ -2150,7 +2183,7 @@ class BoardGUI:
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
             
             dest = rl.Rectangle(obj_blit_x, obj_blit_y, draw_width, draw_height)
-            rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
         
         rl.end_texture_mode()
         
@@ -2188,13 +2221,13 @@ class BoardGUI:
             
             dest = rl.Rectangle(blit_x, blit_y, sprite_width, sprite_height)
             
-            texture_size = rl.ffi.new("float[2]", [recolored_texture.width, recolored_texture.height])
+            texture_size = rl.ffi.new("float[2]", list(sprite_texture_size(recolored_texture)))
             outline_width = rl.ffi.new("float *", 1.0)
             rl.set_shader_value(shader, self._outline_texture_size_loc, texture_size, rl.SHADER_UNIFORM_VEC2)
             rl.set_shader_value(shader, self._outline_width_loc, outline_width, rl.SHADER_UNIFORM_FLOAT)
             
             rl.begin_shader_mode(shader)
-            rl.draw_texture_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             rl.end_shader_mode()
         
         rl.end_texture_mode()
@@ -2292,7 +2325,7 @@ class BoardGUI:
             if tex:
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(screen_x, screen_y, width, height)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 rl.draw_rectangle(int(screen_x), int(screen_y), int(width), int(height), hex_to_color("#C4813D"))
             return
@@ -2313,7 +2346,7 @@ class BoardGUI:
                 
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(blit_x, blit_y, bed_width, bed_height)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 # Fallback: draw programmatically
                 padding = int(4 * self.zoom)
@@ -2347,7 +2380,7 @@ class BoardGUI:
                 
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(blit_x, blit_y, stove_size, stove_size)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 # Fallback: draw programmatically
                 padding = int(4 * self.zoom)
@@ -2379,7 +2412,7 @@ class BoardGUI:
                 
                 source = rl.Rectangle(0, 0, tex.width, tex.height)
                 dest = rl.Rectangle(blit_x, blit_y, barrel_size, barrel_size)
-                rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             else:
                 padding = int(5 * self.zoom)
                 rl.draw_rectangle(int(screen_x + padding), int(screen_y + padding),
@@ -2416,7 +2449,7 @@ class BoardGUI:
             source = rl.Rectangle(0, 0, tex.width, tex.height)
         
         dest = rl.Rectangle(blit_x, blit_y, draw_width, draw_height)
-        rl.draw_texture_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+        draw_sprite_pro(tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
     
     def _get_occluding_objects(self, char_x, char_y, zone=None):
         """Get all occluders that hide a character at the given position.
@@ -2695,24 +2728,25 @@ class BoardGUI:
         # Get the red outline shader
         shader = self._init_red_outline_shader()
         
-        for char in self.state.characters:
-            if id(char) not in chars_in_attack_cone:
+        for char in self._snapshot.characters.values():
+            if char.key not in chars_in_attack_cone:
                 continue
             
             # Get visual coordinates
+            local_x, local_y, world_x, world_y = self._char_position(char)
             if char.zone:
                 if not self.window_viewing:
-                    vis_x = char.prevailing_x
-                    vis_y = char.prevailing_y
+                    vis_x = local_x
+                    vis_y = local_y
                 elif self.window_viewing_interior and char.zone == self.window_viewing_interior.name:
-                    vis_x = char.prevailing_x
-                    vis_y = char.prevailing_y
+                    vis_x = local_x
+                    vis_y = local_y
                 else:
-                    vis_x = char.x
-                    vis_y = char.y
+                    vis_x = world_x
+                    vis_y = world_y
             else:
-                vis_x = char.x
-                vis_y = char.y
+                vis_x = world_x
+                vis_y = world_y
             
             pixel_cx, pixel_cy = self._world_to_screen(vis_x, vis_y)
             
@@ -2744,14 +2778,14 @@ class BoardGUI:
             dest = rl.Rectangle(blit_x, blit_y, sprite_width, sprite_height)
             
             # Set shader uniforms
-            texture_size = rl.ffi.new("float[2]", [recolored_texture.width, recolored_texture.height])
+            texture_size = rl.ffi.new("float[2]", list(sprite_texture_size(recolored_texture)))
             outline_width = rl.ffi.new("float *", .5)  # Slightly thicker than perceived outlines
             rl.set_shader_value(shader, self._red_outline_texture_size_loc, texture_size, rl.SHADER_UNIFORM_VEC2)
             rl.set_shader_value(shader, self._red_outline_width_loc, outline_width, rl.SHADER_UNIFORM_FLOAT)
             
             # Draw the red outline
             rl.begin_shader_mode(shader)
-            rl.draw_texture_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
             rl.end_shader_mode()
     
     def _draw_camps(self):
@@ -2769,8 +2803,8 @@ class BoardGUI:
         
         campfire_tex = self.world_textures.get('campfire')
         
-        for char in self.state.characters:
-            camp_pos = char.get('camp_position')
+        for char in self._snapshot.characters.values():
+            camp_pos = char.camp_position
             if camp_pos:
                 x, y = camp_pos
                 screen_x, screen_y = self._world_to_screen(x, y)
@@ -2781,7 +2815,7 @@ class BoardGUI:
                     blit_y = screen_y + cell_size - campfire_size
                     
                     dest = rl.Rectangle(blit_x, blit_y, campfire_size, campfire_size)
-                    rl.draw_texture_pro(campfire_tex, campfire_source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(campfire_tex, campfire_source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
                 else:
                     # Fallback to circles
                     fire_cx = int(screen_x + cell_size / 2)
@@ -2813,13 +2847,23 @@ class BoardGUI:
         if job in JOB_TIERS and "color" in JOB_TIERS[job]:
             return JOB_TIERS[job]["color"]
         
-        morality = char.get('morality', 5)
+        return self._morality_color(char.get('morality', 5))
+    
+    def _morality_color(self, morality):
+        """Dark blue (morality 1) to light blue (morality 10)."""
         t = (morality - 1) / 9.0
         r = int(0 + t * 173)
         g = int(0 + t * 216)
         b = int(139 + t * (230 - 139))
         return f"#{r:02x}{g:02x}{b:02x}"
     
+    def _character_palette(self):
+        """Every color _get_character_color can return (sprites are recolored up front)."""
+        palette = ["#FF0000", "#FF8C00"]  # Frozen, starving
+        palette += [info["color"] for info in JOB_TIERS.values() if "color" in info]
+        palette += [self._morality_color(m) for m in range(1, 11)]
+        return palette
+    
     def _draw_ground_item(self, ground_item):
         """Draw a ground item in the world with its sprite and amount."""
         cell_size = self._cam_cell_size
@@ -2847,7 +2891,7 @@ class BoardGUI:
             # Draw the sprite scaled to fit
             source_rect = rl.Rectangle(0, 0, texture.width, texture.height)
             dest_rect = rl.Rectangle(draw_x, draw_y, sprite_size, sprite_size)
-            rl.draw_texture_pro(texture, source_rect, dest_rect, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(texture, source_rect, dest_rect, rl.Vector2(0, 0), 0, rl.WHITE)
         else:
             # Fallback: draw a colored square with icon
             item_info = ITEMS.get(ground_item.item_type, {})
@@ -2880,21 +2924,22 @@ class BoardGUI:
         # Use local coords when character is in interior and:
         # 1. We're inside that interior (not window viewing), OR
         # 2. We're viewing INTO that interior through a window
+        local_x, local_y, world_x, world_y = self._char_position(char)
         if char.zone:
             if not self.window_viewing:
                 # We're inside the interior
-                vis_x = char.prevailing_x
-                vis_y = char.prevailing_y
+                vis_x = local_x
+                vis_y = local_y
             elif self.window_viewing_interior and char.zone == self.window_viewing_interior.name:
                 # We're viewing into this character's interior through window
-                vis_x = char.prevailing_x
-                vis_y = char.prevailing_y
+                vis_x = local_x
+                vis_y = local_y
             else:
-                vis_x = char.x
-                vis_y = char.y
+                vis_x = world_x
+                vis_y = world_y
         else:
-            vis_x = char.x
-            vis_y = char.y
+            vis_x = world_x
+            vis_y = world_y
         
         pixel_cx, pixel_cy = self._world_to_screen(vis_x, vis_y)
         
@@ -2902,8 +2947,7 @@ class BoardGUI:
         sprite_width = int(CHARACTER_WIDTH * cell_size)
         
         # Check if character should flash red from being hit
-        hit_flash_until = char.get('hit_flash_until', 0)
-        is_hit_flashing = hit_flash_until > self.state.ticks
+        is_hit_flashing = char.hit_flash_until > self._snapshot.tick
         
         # Get sprite frame info
         frame_info, should_flip = self.sprite_manager.get_frame(char, current_time)
@@ -2928,7 +2972,7 @@ class BoardGUI:
                 
                 # Apply red tint if hit flashing, otherwise white (normal)
                 tint = rl.Color(255, 100, 100, 255) if is_hit_flashing else rl.WHITE
-                rl.draw_texture_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, tint)
+                draw_sprite_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, tint)
             else:
                 # Fallback if recoloring failed - draw original frame
                 texture = frame_info['texture']
@@ -2943,7 +2987,7 @@ class BoardGUI:
                 
                 dest = rl.Rectangle(blit_x, blit_y, sprite_width, sprite_height)
                 tint = rl.Color(255, 100, 100, 255) if is_hit_flashing else rl.WHITE
-                rl.draw_texture_pro(texture, source, dest, rl.Vector2(0, 0), 0, tint)
+                draw_sprite_pro(texture, source, dest, rl.Vector2(0, 0), 0, tint)
         else:
             # Fallback to colored rectangle
             char_color = self._get_character_color(char)
@@ -2982,7 +3026,7 @@ class BoardGUI:
             
             source = rl.Rectangle(0, 0, shield_tex.width, shield_tex.height)
             dest = rl.Rectangle(draw_x, draw_y, shield_size, shield_size)
-            rl.draw_texture_pro(shield_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(shield_tex, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
         else:
             # Fallback to blue circle if texture not found
             shield_color = rl.Color(*SHIELD_COLOR)
@@ -2993,33 +3037,32 @@ class BoardGUI:
         import math
         from constants import ARROW_SPRITE_SCALE, ARROW_DROP_START, ARROW_DROP_MAX_ANGLE
         
-        _bow = ITEMS["bow"]
         arrow_tex = self.world_textures.get('arrow')
         cell_size = self._cam_cell_size
         
-        for arrow in self.state.arrows:
+        for arrow in self._snapshot.arrows:
             # Only draw arrows in current zone
-            if arrow['zone'] != rendering_zone:
+            if arrow.zone != rendering_zone:
                 continue
             
             # Get arrow position in screen coords
-            screen_x, screen_y = self._world_to_screen(arrow['x'], arrow['y'])
+            screen_x, screen_y = self._world_to_screen(arrow.x, arrow.y)
             
             if arrow_tex:
                 # Calculate base rotation angle from direction vector
                 # Sprite faces top-left (-135°), so add 135° offset
-                angle_rad = math.atan2(arrow['dy'], arrow['dx'])
+                angle_rad = math.atan2(arrow.dy, arrow.dx)
                 angle_deg = math.degrees(angle_rad) + 135
                 
                 # Calculate drop rotation based on flight progress
-                arrow_max_range = arrow.get('max_range', _bow["range"])
+                arrow_max_range = arrow.max_range
                 
-                if arrow.get('stuck'):
+                if arrow.stuck:
                     # Stuck arrow: use maximum drop
                     drop_progress = 1.0
                 else:
                     # Flying arrow: calculate progress through flight
-                    progress = arrow['distance'] / arrow_max_range if arrow_max_range > 0 else 0
+                    progress = arrow.distance / arrow_max_range if arrow_max_range > 0 else 0
                     
                     if progress < ARROW_DROP_START:
                         drop_progress = 0.0
@@ -3033,7 +3076,7 @@ class BoardGUI:
                 # - Flying right (dx > 0): rotates clockwise (positive) to tip down-right
                 # - Flying left (dx < 0): rotates counter-clockwise (negative) to tip down-left
                 # - Flying up/down (dx = 0): no visible drop
-                drop_rotation = ARROW_DROP_MAX_ANGLE * drop_progress * arrow['dx']
+                drop_rotation = ARROW_DROP_MAX_ANGLE * drop_progress * arrow.dx
                 angle_deg += drop_rotation
                 
                 # Scale arrow based on zoom and ARROW_SPRITE_SCALE constant
@@ -3049,7 +3092,7 @@ class BoardGUI:
                 )
                 origin = rl.Vector2(arrow_tex.width * scale / 2, arrow_tex.height * scale / 2)
                 
-                rl.draw_texture_pro(
+                draw_sprite_pro(
                     arrow_tex,
                     source_rect,
                     dest_rect,
@@ -3060,8 +3103,8 @@ class BoardGUI:
             else:
                 # Fallback to line if texture not loaded
                 from constants import ARROW_LENGTH, ARROW_THICKNESS
-                end_x = arrow['x'] - arrow['dx'] * ARROW_LENGTH
-                end_y = arrow['y'] - arrow['dy'] * ARROW_LENGTH
+                end_x = arrow.x - arrow.dx * ARROW_LENGTH
+                end_y = arrow.y - arrow.dy * ARROW_LENGTH
                 screen_end_x, screen_end_y = self._world_to_screen(end_x, end_y)
                 
                 rl.draw_line_ex(
@@ -3083,7 +3126,7 @@ class BoardGUI:
         cell_size = self._cam_cell_size
         
         # Determine current rendering zone
-        player = self.state.player
+        player = self._snapshot.player
         if self.window_viewing and self.window_viewing_interior is not None:
             rendering_zone = self.window_viewing_interior.name
         elif self.window_viewing:
@@ -3095,29 +3138,27 @@ class BoardGUI:
         else:
             rendering_zone = None
         
-        for char in self.state.characters:
-            # Only draw hitboxes for characters in current zone
-            if char.zone != rendering_zone:
-                continue
-            
+        # Only draw hitboxes for characters in current zone
+        for char in self._snapshot.characters_in_zone(rendering_zone):
             # Skip dead characters
-            if char.get('health', 100) <= 0:
+            if char.health <= 0:
                 continue
             
             # Get visual coordinates (same logic as _draw_single_character_sprite)
+            local_x, local_y, world_x, world_y = self._char_position(char)
             if char.zone:
                 if not self.window_viewing:
-                    vis_x = char.prevailing_x
-                    vis_y = char.prevailing_y
+                    vis_x = local_x
+                    vis_y = local_y
                 elif self.window_viewing_interior and char.zone == self.window_viewing_interior.name:
-                    vis_x = char.prevailing_x
-                    vis_y = char.prevailing_y
+                    vis_x = local_x
+                    vis_y = local_y
                 else:
-                    vis_x = char.x
-                    vis_y = char.y
+                    vis_x = world_x
+                    vis_y = world_y
             else:
-                vis_x = char.x
-                vis_y = char.y
+                vis_x = world_x
+                vis_y = world_y
             
             # Convert to screen coordinates
             pixel_cx, pixel_cy = self._world_to_screen(vis_x, vis_y)
@@ -3140,9 +3181,8 @@ class BoardGUI:
             
             # Draw attack range (orange)
             if SHOW_ATTACK_RANGE:
-                # Get actual weapon stats from character's equipped weapon or fists
-                weapon_stats = char.get_weapon_stats()
-                attack_radius_px = weapon_stats.get('range', FISTS['range']) * cell_size
+                # Reach of the character's equipped melee weapon or fists
+                attack_radius_px = char.weapon_range * cell_size
                 rl.draw_circle_lines(
                     int(pixel_cx), int(pixel_cy),
                     attack_radius_px,
@@ -3192,7 +3232,7 @@ class BoardGUI:
                 )
             
             # Draw player's directional attack cone (yellow) - only for player in combat mode
-            if SHOW_ATTACK_CONE and char.is_player and char.get('combat_mode', False):
+            if SHOW_ATTACK_CONE and char.is_player and char.combat_mode:
                 self._draw_player_attack_cone(char, pixel_cx, pixel_cy, cell_size)
 
     def _draw_player_attack_cone(self, player, pixel_cx, pixel_cy, cell_size):
@@ -3205,17 +3245,17 @@ class BoardGUI:
         - Straight edges (linear angle interpolation)
         
         Args:
-            player: Player character
+            player: Player CharacterView
             pixel_cx, pixel_cy: Screen center position
             cell_size: Current cell size in pixels
         """
         # Get the precise attack angle (360° aiming)
-        attack_angle = player.get('attack_angle')
+        attack_angle = player.attack_angle
         if attack_angle is None:
             return
         
         # Get weapon reach based on equipped weapon
-        weapon_reach = self.player_controller.get_weapon_reach()
+        weapon_reach = player.weapon_range
         
         # Convert dimensions to pixels
         reach_px = weapon_reach * cell_size
@@ -3348,28 +3388,29 @@ class BoardGUI:
         Called before character sprites so it appears underneath.
         Has a chevron tip pointing in the aim direction.
         """
-        player = self.state.player
+        player = self._snapshot.player
         if not player:
             return
         
         # Only show in combat mode
-        if not player.get('combat_mode', False):
+        if not player.combat_mode:
             return
         
         # Get the precise attack angle
-        attack_angle = player.get('attack_angle')
+        attack_angle = player.attack_angle
         if attack_angle is None:
             return
         
         cell_size = self._cam_cell_size
         
         # Get player screen position
+        local_x, local_y, world_x, world_y = self._char_position(player)
         if player.zone:
-            vis_x = player.prevailing_x
-            vis_y = player.prevailing_y
+            vis_x = local_x
+            vis_y = local_y
         else:
-            vis_x = player.x
-            vis_y = player.y
+            vis_x = world_x
+            vis_y = world_y
         
         pixel_cx, pixel_cy = self._world_to_screen(vis_x, vis_y)
         
@@ -3461,36 +3502,32 @@ class BoardGUI:
         
         _bow = ITEMS["bow"]
         
-        player = self.state.player
+        player = self._snapshot.player
         if not player:
             return
         
-        # Only show while drawing bow
-        if not player.is_drawing_bow():
-            return
-        
-        # Get spread and draw progress
-        current_tick = self.state.ticks
-        spread_degrees = player.get_bow_spread_degrees(current_tick)
-        draw_progress = player.get_bow_draw_progress(current_tick)
+        # Spread and draw progress (only set while drawing the bow)
+        spread_degrees = player.bow_spread_degrees
+        draw_progress = player.bow_draw_progress
         
         if spread_degrees is None or draw_progress is None:
             return
         
         # Get the precise attack angle
-        attack_angle = player.get('attack_angle')
+        attack_angle = player.attack_angle
         if attack_angle is None:
             return
         
         cell_size = self._cam_cell_size
         
         # Get player screen position
+        local_x, local_y, world_x, world_y = self._char_position(player)
         if player.zone:
-            vis_x = player.prevailing_x
-            vis_y = player.prevailing_y
+            vis_x = local_x
+            vis_y = local_y
         else:
-            vis_x = player.x
-            vis_y = player.y
+            vis_x = world_x
+            vis_y = world_y
         
         pixel_cx, pixel_cy = self._world_to_screen(vis_x, vis_y)
         
@@ -3544,17 +3581,17 @@ class BoardGUI:
         sprite_height = ui_info['sprite_height']
         
         # Draw first name below sprite
-        first_name = char['name'].split()[0]
+        first_name = char.name.split()[0]
         text_width = rl.measure_text(first_name, 10)
         text_x = int(pixel_cx - text_width / 2)
         text_y = int(pixel_cy + sprite_height / 3.2)
         rl.draw_text(first_name, text_x, text_y, 10, rl.WHITE)
         
         # Check if we should show HP/Stamina bars
-        char_name = char['name']
-        health = char.get('health', 100)
-        stamina = char.get('stamina', 100)
-        is_sprinting = char.get('is_sprinting', False)
+        char_name = char.name
+        health = char.health
+        stamina = char.stamina
+        is_sprinting = char.is_sprinting
         current_time = time.time()
         
         # Get previous values
@@ -3575,8 +3612,9 @@ class BoardGUI:
         
         # Determine if we should show bars
         show_bars_timer = self._char_show_bars_until.get(char_name, 0)
-        is_player = (char is self.state.player)
-        in_combat_mode = self.state.player.get('combat_mode', False) if self.state.player else False
+        is_player = char.is_player
+        player = self._snapshot.player
+        in_combat_mode = player.combat_mode if player else False
         
         # For player: only show bars in combat mode (HUD shows full stats)
         # For NPCs: show bars when damaged, sprinting, or recently changed
@@ -3623,8 +3661,8 @@ class BoardGUI:
                                  rl.Color(COLOR_STAMINA.r, COLOR_STAMINA.g, COLOR_STAMINA.b, 220))
         
         # Draw ongoing action progress bar (player only)
-        if is_player and char.has_ongoing_action():
-            progress = char.get_ongoing_action_progress()
+        if is_player and char.ongoing_action is not None:
+            progress = char.ongoing_action_progress(current_time)
             if progress is not None:
                 # Make bars narrower than sprite (70% of sprite width)
                 bar_width = int(sprite_width * 0.7)
@@ -3651,8 +3689,8 @@ class BoardGUI:
                                      rl.Color(70, 130, 220, 220))
         
         # Draw heavy attack charge bar (player only, when charging)
-        if is_player and char.is_charging_heavy_attack():
-            progress = char.get_heavy_attack_progress(self.state.ticks)
+        if is_player and char.heavy_attack_charging:
+            progress = char.heavy_attack_progress
             if progress is not None and progress >= 0:
                 # Make bars narrower than sprite (70% of sprite width)
                 bar_width = int(sprite_width * 0.7)
@@ -3678,8 +3716,8 @@ class BoardGUI:
                                      rl.Color(70, 130, 220, 220))
         
         # Draw bow draw charge bar (player only, when drawing)
-        if is_player and char.is_drawing_bow():
-            progress = char.get_bow_draw_progress(self.state.ticks)
+        if is_player and char.bow_draw_progress is not None:
+            progress = char.bow_draw_progress
             if progress is not None and progress >= 0:
                 # Make bars narrower than sprite (70% of sprite width)
                 bar_width = int(sprite_width * 0.7)
@@ -3710,7 +3748,8 @@ class BoardGUI:
         cell_size = self._cam_cell_size
 
         # Determine current rendering zone
-        player = self.state.player
+        snapshot = self._snapshot
+        player = snapshot.player
         if self.window_viewing and self.window_viewing_interior is not None:
             rendering_zone = self.window_viewing_interior.name
         elif self.window_viewing:
@@ -3722,10 +3761,18 @@ class BoardGUI:
         else:
             rendering_zone = None
 
-        for corpse in self.state.corpses:
-            # Only draw corpses in the current rendering zone
-            if corpse.zone != rendering_zone:
+        for kind, obj in self._get_visible_objects(rendering_zone):
+            # Only draw visible corpses in the current rendering zone, as of the snapshot
+            if kind == 'corpse_marker':
+                marker = snapshot.markers.get(id(obj))
+                if marker is not None:
+                    self._draw_corpse_marker(marker)
                 continue
+            if kind != 'corpse':
+                continue
+            corpse = snapshot.corpses.get(id(obj))
+            if corpse is None:
+                continue  # Appeared since the snapshot
 
             # Coords are already in correct space (local for interior, world for exterior)
             pixel_cx, pixel_cy = self._world_to_screen(corpse.x, corpse.y)
@@ -3749,12 +3796,7 @@ class BoardGUI:
                 if job in JOB_TIERS and "color" in JOB_TIERS[job]:
                     color = JOB_TIERS[job]["color"]
                 else:
-                    morality = corpse.morality
-                    t = (morality - 1) / 9.0
-                    r = int(0 + t * 173)
-                    g = int(0 + t * 216)
-                    b = int(139 + t * (230 - 139))
-                    color = f"#{r:02x}{g:02x}{b:02x}"
+                    color = self._morality_color(corpse.morality)
 
                 recolored_texture = self.sprite_manager.recolor_red_to_color(frame_info, color)
 
@@ -3768,46 +3810,137 @@ class BoardGUI:
                         source = rl.Rectangle(0, 0, recolored_texture.width, recolored_texture.height)
 
                     dest = rl.Rectangle(blit_x, blit_y, sprite_width, sprite_height)
-                    rl.draw_texture_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
+                    draw_sprite_pro(recolored_texture, source, dest, rl.Vector2(0, 0), 0, rl.WHITE)
     
-    def _get_vision_obstacles_for_rendering(self, zone):
-        """Get obstacles that block vision for visualization.
+    def _draw_corpse_marker(self, marker):
+        """Draw the bones left where corpses decayed (one pair per body, up to three)."""
+        cell_size = self._cam_cell_size
+        screen_x, screen_y = self._world_to_screen(marker.x, marker.y)
+        half = max(3, cell_size * 0.18)
+        thickness = max(1.5, cell_size * 0.05)
+        color = rl.Color(225, 215, 190, 200)
+        for i in range(min(marker.count, 3)):
+            offset = (i - (min(marker.count, 3) - 1) / 2) * half * 0.8
+            cx, cy = screen_x + offset, screen_y + offset * 0.5
+            rl.draw_line_ex(rl.Vector2(cx - half, cy - half), rl.Vector2(cx + half, cy + half), thickness, color)
+            rl.draw_line_ex(rl.Vector2(cx - half, cy + half), rl.Vector2(cx + half, cy - half), thickness, color)
+    
+    def _get_vision_obstacles_for_rendering(self, zone, x, y, radius):
+        """Get obstacles that block vision near a point, for visualization.
         
         Args:
             zone: Interior name or None for exterior
+            x, y: Search center (local coords for interiors, world coords outside)
+            radius: Search radius in cells
             
         Returns:
             List of (x, y, radius) tuples for obstacles
         """
         obstacles = []
         
-        if zone is None:
-            # Exterior - trees block vision
-            for pos in self.state.interactables.trees:
-                x, y = pos
-                obstacles.append((x + 0.5, y + 0.5, 0.4))
-            
-            # House walls
-            for house in self.state.interactables.houses.values():
-                y_start, x_start, y_end, x_end = house.bounds
+        # Exterior - trees and house walls block vision; interior - stoves do
+        kinds = EXTERIOR_OCCLUDER_KINDS if zone is None else INTERIOR_OCCLUDER_KINDS
+        for kind, obj in self.state.interactables.get_objects_near(zone, x, y, radius + 1, kinds):
+            if kind == 'house':
+                y_start, x_start, y_end, x_end = obj.bounds
                 for hx in range(x_start, x_end):
                     obstacles.append((hx + 0.5, y_start + 0.5, 0.5))
                     obstacles.append((hx + 0.5, y_end - 0.5, 0.5))
                 for hy in range(y_start, y_end):
                     obstacles.append((x_start + 0.5, hy + 0.5, 0.5))
                     obstacles.append((x_end - 0.5, hy + 0.5, 0.5))
-        else:
-            # Interior - stoves block vision
-            interior = self.state.interiors.get_interior(zone)
-            if interior:
-                for stove in self.state.interactables.stoves.values():
-                    if stove.zone != zone:
-                        continue
-                    # Stove is in interior coords
-                    obstacles.append((stove.x + 0.5, stove.y + 0.5, 0.4))
+            else:
+                obstacles.append((obj.x + 0.5, obj.y + 0.5, 0.4))
         
         return obstacles
     
+    def _get_visibility_polygon(self, cache_key, origin_x, origin_y, facing_angle, zone):
+        """Shadow-cast vision cone for one observer. Cached until it moves or turns.
+        
+        Angular sweep: each nearby obstacle covers an angular interval of the
+        cone. Rays are cast along the regular cone segments plus just inside and
+        outside both edges of every interval (so shadow edges stay sharp), and
+        each ray is only tested against the intervals open at its angle.
+        
+        Args:
+            cache_key: Stable key for the observer (e.g. ('char', name))
+            origin_x, origin_y: Cone origin (local coords for interiors)
+            facing_angle: Cone direction in radians (y up, as from atan2(-face_y, face_x))
+            zone: Zone whose obstacles cast shadows
+            
+        Returns:
+            List of (dx, dy) cell offsets from the origin, ordered by angle
+        """
+        kinds = EXTERIOR_OCCLUDER_KINDS if zone is None else INTERIOR_OCCLUDER_KINDS
+        occluders = self.state.interactables.spatial.kind_version(kinds)
+        signature = (zone, origin_x, origin_y, facing_angle, occluders)
+        cached = self._visibility_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            self._visibility_cache[cache_key] = (signature, cached[1], self._visibility_frame)
+            return cached[1]
+        
+        num_segments = 20
+        edge_epsilon = 1e-4
+        half_angle = math.radians(VISION_CONE_ANGLE / 2)
+        span = 2 * half_angle
+        start = facing_angle - half_angle
+        two_pi = 2 * math.pi
+        
+        # Angular intervals relative to the cone start
+        samples = [span * i / num_segments for i in range(num_segments + 1)]
+        intervals = []
+        for obstacle in self._get_vision_obstacles_for_rendering(zone, origin_x, origin_y, VISION_RANGE):
+            ox, oy, radius = obstacle
+            if abs(ox - origin_x) < 0.3 and abs(oy - origin_y) < 0.3:
+                continue  # Obstacle at origin
+            dx = ox - origin_x
+            dy = origin_y - oy  # Angles are y-up
+            dist = math.hypot(dx, dy)
+            if dist <= radius or dist - radius >= VISION_RANGE:
+                continue  # Observer inside it (rays start past it) or out of range
+            center = (math.atan2(dy, dx) - start) % two_pi
+            width = math.asin(radius / dist)
+            for wrap in (0, -two_pi):  # Intervals can straddle the cone start
+                lo, hi = center + wrap - width, center + wrap + width
+                if hi < 0 or lo > span:
+                    continue
+                intervals.append((lo, hi, obstacle))
+                for edge in (lo - edge_epsilon, lo + edge_epsilon, hi - edge_epsilon, hi + edge_epsilon):
+                    if 0 < edge < span:
+                        samples.append(edge)
+        samples.sort()
+        intervals.sort(key=lambda interval: interval[0])
+        
+        # Sweep: open intervals as their start passes, drop them once past their end
+        polygon = []
+        active = []
+        next_interval = 0
+        for rel_angle in samples:
+            while next_interval < len(intervals) and intervals[next_interval][0] <= rel_angle:
+                active.append(intervals[next_interval])
+                next_interval += 1
+            active = [interval for interval in active if interval[1] >= rel_angle]
+            
+            angle = start + rel_angle
+            dist = VISION_RANGE
+            if active:
+                dist = self._get_shadow_distance(origin_x, origin_y, angle, VISION_RANGE,
+                                                 [interval[2] for interval in active])
+            polygon.append((math.cos(angle) * dist, -math.sin(angle) * dist))
+        
+        self._visibility_cache[cache_key] = (signature, polygon, self._visibility_frame)
+        return polygon
+    
+    def _draw_visibility_polygon(self, screen_x, screen_y, polygon, cell_size, color):
+        """Draw a visibility polygon as a fan of triangles around its origin."""
+        center = rl.Vector2(screen_x, screen_y)
+        prev = None
+        for dx, dy in polygon:
+            point = rl.Vector2(screen_x + dx * cell_size, screen_y + dy * cell_size)
+            if prev is not None:
+                rl.draw_triangle(center, prev, point, color)
+            prev = point
+    
     def _get_shadow_distance(self, from_x, from_y, angle, max_range, obstacles):
         """Get distance to first obstacle along a ray.
         
@@ -3905,7 +4038,7 @@ class BoardGUI:
     def _draw_perception_debug(self):
         """Draw perception debug visualization"""
         cell_size = self._cam_cell_size
-        player = self.state.player
+        player = self._snapshot.player
         
         # Determine what zone we're rendering
         # If window_viewing into interior: render that interior (local coords)
@@ -3929,21 +4062,24 @@ class BoardGUI:
             rendering_zone = None  # Exterior
             use_local_coords = False
         
-        for char in self.state.characters:
-            if char.get('health', 100) <= 0:
-                continue
-            
-            # Only draw characters in the rendering zone
-            if char.zone != rendering_zone:
+        # Drop cached visibility polygons for observers that weren't drawn last frame
+        self._visibility_frame += 1
+        self._visibility_cache = {key: entry for key, entry in self._visibility_cache.items()
+                                  if entry[2] >= self._visibility_frame - 1}
+        
+        # Only draw characters in the rendering zone
+        for char in self._snapshot.characters_in_zone(rendering_zone):
+            if char.health <= 0:
                 continue
             
             # Use local coords when rendering interior, world coords otherwise
+            local_x, local_y, world_x, world_y = self._char_position(char)
             if use_local_coords:
-                vis_x = char.prevailing_x
-                vis_y = char.prevailing_y
+                vis_x = local_x
+                vis_y = local_y
             else:
-                vis_x = char.x
-                vis_y = char.y
+                vis_x = world_x
+                vis_y = world_y
             
             screen_x, screen_y = self._world_to_screen(vis_x, vis_y)
             
@@ -3954,7 +4090,7 @@ class BoardGUI:
             
             # Vision cone
             vision_radius_pixels = int(VISION_RANGE * cell_size)
-            facing = char.get('facing', 'down')
+            facing = char.facing
             
             facing_vectors = {
                 'up': (0, -1),
@@ -3969,40 +4105,12 @@ class BoardGUI:
             face_x, face_y = facing_vectors.get(facing, (0, 1))
             
             facing_angle = math.atan2(-face_y, face_x)
-            half_angle = math.radians(VISION_CONE_ANGLE / 2)
-            
-            angle1 = facing_angle - half_angle
-            angle2 = facing_angle + half_angle
             
-            # Get obstacles for shadow casting
-            obstacles = self._get_vision_obstacles_for_rendering(rendering_zone)
-            
-            # Draw vision cone as a series of triangles with shadow casting
-            num_segments = 20
-            for i in range(num_segments):
-                t1 = i / num_segments
-                t2 = (i + 1) / num_segments
-                a1 = angle1 + t1 * (angle2 - angle1)
-                a2 = angle1 + t2 * (angle2 - angle1)
-                
-                # Get shadow distances for each edge
-                dist1 = self._get_shadow_distance(vis_x, vis_y, a1, VISION_RANGE, obstacles)
-                dist2 = self._get_shadow_distance(vis_x, vis_y, a2, VISION_RANGE, obstacles)
-                
-                r1_pixels = int(dist1 * cell_size)
-                r2_pixels = int(dist2 * cell_size)
-                
-                p1_x = screen_x + math.cos(a1) * r1_pixels
-                p1_y = screen_y - math.sin(a1) * r1_pixels
-                p2_x = screen_x + math.cos(a2) * r2_pixels
-                p2_y = screen_y - math.sin(a2) * r2_pixels
-                
-                rl.draw_triangle(
-                    rl.Vector2(screen_x, screen_y),
-                    rl.Vector2(p1_x, p1_y),
-                    rl.Vector2(p2_x, p2_y),
-                    rl.Color(255, 100, 100, 30)
-                )
+            # Shadow-cast vision cone (cached until this character moves or turns)
+            polygon = self._get_visibility_polygon(
+                ('char', char.name), vis_x, vis_y, facing_angle, rendering_zone)
+            self._draw_visibility_polygon(screen_x, screen_y, polygon, cell_size,
+                                          rl.Color(255, 100, 100, 30))
         
         # Draw player's vision cone through window when window viewing
         if self.window_viewing and self.window_viewing_window and player:
@@ -4040,41 +4148,13 @@ class BoardGUI:
                 face_y = -face_y
             
             facing_angle = math.atan2(-face_y, face_x)
-            half_angle = math.radians(VISION_CONE_ANGLE / 2)
             
-            angle1 = facing_angle - half_angle
-            angle2 = facing_angle + half_angle
-            
-            # Get obstacles for shadow casting (in the zone we're viewing into)
+            # Shadows come from the zone we're viewing into
             target_zone = self.window_viewing_interior.name if self.window_viewing_interior else None
-            window_obstacles = self._get_vision_obstacles_for_rendering(target_zone)
-            
-            # Draw vision cone as a series of triangles (different color for window view)
-            num_segments = 20
-            for i in range(num_segments):
-                t1 = i / num_segments
-                t2 = (i + 1) / num_segments
-                a1 = angle1 + t1 * (angle2 - angle1)
-                a2 = angle1 + t2 * (angle2 - angle1)
-                
-                # Get shadow distances
-                dist1 = self._get_shadow_distance(cone_x, cone_y, a1, VISION_RANGE, window_obstacles)
-                dist2 = self._get_shadow_distance(cone_x, cone_y, a2, VISION_RANGE, window_obstacles)
-                
-                r1_pixels = int(dist1 * cell_size)
-                r2_pixels = int(dist2 * cell_size)
-                
-                p1_x = screen_x + math.cos(a1) * r1_pixels
-                p1_y = screen_y - math.sin(a1) * r1_pixels
-                p2_x = screen_x + math.cos(a2) * r2_pixels
-                p2_y = screen_y - math.sin(a2) * r2_pixels
-                
-                rl.draw_triangle(
-                    rl.Vector2(screen_x, screen_y),
-                    rl.Vector2(p1_x, p1_y),
-                    rl.Vector2(p2_x, p2_y),
-                    rl.Color(100, 100, 255, 30)  # Blue tint for window vision
-                )
+            polygon = self._get_visibility_polygon(
+                ('window', id(window), target_zone), cone_x, cone_y, facing_angle, target_zone)
+            self._draw_visibility_polygon(screen_x, screen_y, polygon, cell_size,
+                                          rl.Color(100, 100, 255, 30))  # Blue tint for window vision
         
         # Draw NPC cross-zone window vision cones
         self._draw_cross_zone_window_cones(rendering_zone, use_local_coords, cell_size)
@@ -4106,10 +4186,8 @@ class BoardGUI:
             # Rendering an interior - draw cones for exterior NPCs looking in
             interior = self.state.interiors.get_interior(rendering_zone)
             if interior:
-                for char in self.state.characters:
-                    if char.get('health', 100) <= 0:
-                        continue
-                    if char.zone is not None:  # Only exterior characters
+                for char in self._snapshot.characters_in_zone(None):  # Only exterior characters
+                    if char.health <= 0:
                         continue
                     
                     # Check each window
@@ -4127,25 +4205,24 @@ class BoardGUI:
                                 face_x, face_y = window_facing_vectors.get(window.facing, (0, 1))
                                 face_x, face_y = -face_x, -face_y
                                 
-                                # Get interior obstacles for shadow casting
-                                interior_obstacles = self._get_vision_obstacles_for_rendering(rendering_zone)
-                                
+                                # Interior obstacles cast the shadows
                                 self._draw_vision_cone_triangles(
                                     screen_x, screen_y, face_x, face_y,
                                     vision_radius_pixels, rl.Color(100, 255, 100, 30),
-                                    world_x=cone_x, world_y=cone_y, obstacles=interior_obstacles, cell_size=cell_size
+                                    world_x=cone_x, world_y=cone_y, zone=rendering_zone, cell_size=cell_size,
+                                    cache_key=('window', id(window), rendering_zone)
                                 )
         else:
-            # Rendering exterior - draw cones for interior NPCs looking out
-            for house in self.state.interactables.get_all_houses():
+            # Rendering exterior - draw cones for interior NPCs looking out of visible houses
+            for kind, house in self._get_visible_objects(None):
+                if kind != 'house':
+                    continue
                 interior = house.interior
                 if not interior:
                     continue
                 
-                for char in self.state.characters:
-                    if char.get('health', 100) <= 0:
-                        continue
-                    if char.zone != interior.name:  # Only characters in this interior
+                for char in self._snapshot.characters_in_zone(interior.name):  # Only characters in this interior
+                    if char.health <= 0:
                         continue
                     
                     # Check each window
@@ -4160,16 +4237,15 @@ class BoardGUI:
                                 
                                 face_x, face_y = window_facing_vectors.get(window.facing, (0, 1))
                                 
-                                # Get exterior obstacles for shadow casting
-                                exterior_obstacles = self._get_vision_obstacles_for_rendering(None)
-                                
+                                # Exterior obstacles cast the shadows
                                 self._draw_vision_cone_triangles(
                                     screen_x, screen_y, face_x, face_y,
                                     vision_radius_pixels, rl.Color(100, 255, 100, 30),
-                                    world_x=cone_x, world_y=cone_y, obstacles=exterior_obstacles, cell_size=cell_size
+                                    world_x=cone_x, world_y=cone_y, zone=None, cell_size=cell_size,
+                                    cache_key=('window', id(window), None)
                                 )
     
-    def _draw_vision_cone_triangles(self, screen_x, screen_y, face_x, face_y, radius_pixels, color, world_x=None, world_y=None, obstacles=None, cell_size=None):
+    def _draw_vision_cone_triangles(self, screen_x, screen_y, face_x, face_y, radius_pixels, color, world_x=None, world_y=None, zone=None, cell_size=None, cache_key=None):
         """Helper to draw a vision cone as triangles with optional shadow casting.
         
         Args:
@@ -4178,36 +4254,30 @@ class BoardGUI:
             radius_pixels: Max cone radius in pixels
             color: Fill color
             world_x, world_y: World position for shadow casting (optional)
-            obstacles: List of obstacles for shadow casting (optional)
+            zone: Zone whose obstacles cast shadows (used with cache_key)
             cell_size: Cell size for converting shadow distances to pixels (optional)
+            cache_key: Observer key for the cached visibility polygon; enables shadow casting
         """
         facing_angle = math.atan2(-face_y, face_x)
-        half_angle = math.radians(VISION_CONE_ANGLE / 2)
         
+        if cache_key is not None and world_x is not None and cell_size is not None:
+            polygon = self._get_visibility_polygon(cache_key, world_x, world_y, facing_angle, zone)
+            self._draw_visibility_polygon(screen_x, screen_y, polygon, cell_size, color)
+            return
+        
+        half_angle = math.radians(VISION_CONE_ANGLE / 2)
         angle1 = facing_angle - half_angle
         angle2 = facing_angle + half_angle
         
         num_segments = 20
         for i in range(num_segments):
-            t1 = i / num_segments
-            t2 = (i + 1) / num_segments
-            a1 = angle1 + t1 * (angle2 - angle1)
-            a2 = angle1 + t2 * (angle2 - angle1)
-            
-            # Use shadow distances if provided
-            if obstacles is not None and world_x is not None and cell_size is not None:
-                dist1 = self._get_shadow_distance(world_x, world_y, a1, VISION_RANGE, obstacles)
-                dist2 = self._get_shadow_distance(world_x, world_y, a2, VISION_RANGE, obstacles)
-                r1_pixels = int(dist1 * cell_size)
-                r2_pixels = int(dist2 * cell_size)
-            else:
-                r1_pixels = radius_pixels
-                r2_pixels = radius_pixels
+            a1 = angle1 + i / num_segments * (angle2 - angle1)
+            a2 = angle1 + (i + 1) / num_segments * (angle2 - angle1)
             
-            p1_x = screen_x + math.cos(a1) * r1_pixels
-            p1_y = screen_y - math.sin(a1) * r1_pixels
-            p2_x = screen_x + math.cos(a2) * r2_pixels
-            p2_y = screen_y - math.sin(a2) * r2_pixels
+            p1_x = screen_x + math.cos(a1) * radius_pixels
+            p1_y = screen_y - math.sin(a1) * radius_pixels
+            p2_x = screen_x + math.cos(a2) * radius_pixels
+            p2_y = screen_y - math.sin(a2) * radius_pixels
             
             rl.draw_triangle(
                 rl.Vector2(screen_x, screen_y),
@@ -4222,7 +4292,7 @@ class BoardGUI:
     
     def _draw_hud(self):
         """Draw all HUD elements overlay"""
-        player = self.state.player
+        player = self._snapshot.player
         if not player:
             return
         
@@ -4352,7 +4422,7 @@ class BoardGUI:
     def _draw_location_time(self):
         """Draw compact time info in top-right (debug window style)"""
         # Calculate time values
-        ticks = self.state.ticks
+        ticks = self._snapshot.tick
         year = (ticks // TICKS_PER_YEAR) + 1
         day = ((ticks % TICKS_PER_YEAR) // TICKS_PER_DAY) + 1
         day_progress = (ticks % TICKS_PER_DAY) / TICKS_PER_DAY * 100
@@ -4377,8 +4447,8 @@ class BoardGUI:
             self._draw_action_prompt(x, y, 'E', 'Stop Viewing')
             return
         
-        # Get what player can interact with
-        context = self._get_player_context(player)
+        # What the player can interact with (resolved under the lock, see _update_ui_state)
+        context = self._interaction_context
         
         if not context:
             return
@@ -4518,6 +4588,24 @@ class BoardGUI:
         }
         return facing in required_facings.get(window.facing, ())
     
+    def _draw_turbo_overlay(self):
+        """Minimal HUD while in turbo mode: speed achieved and the date"""
+        ticks = self._snapshot.tick
+        year = (ticks // TICKS_PER_YEAR) + 1
+        day = ((ticks % TICKS_PER_YEAR) // TICKS_PER_DAY) + 1
+        lines = [
+            f"TURBO  {self.state.effective_speed:.0f}x",
+            f"Year {year}, Day {day}  |  Tick {ticks}  |  {len(self._snapshot.characters)} alive",
+        ]
+        if self.state.paused:
+            lines.append("PAUSED")
+        
+        y = HUD_MARGIN
+        for i, line in enumerate(lines):
+            size = HUD_FONT_SIZE_MEDIUM if i == 0 else HUD_FONT_SIZE_SMALL
+            rl.draw_text(line, HUD_MARGIN, y, size, COLOR_TEXT_BRIGHT if i == 0 else COLOR_TEXT_DIM)
+            y += size + 4
+    
     def _draw_debug_info(self):
         """Draw minimal debug info below stat bars"""
         x = HUD_MARGIN
@@ -4527,9 +4615,14 @@ class BoardGUI:
         fps = rl.get_fps()
         rl.draw_text(f"FPS: {fps}", x, y, HUD_FONT_SIZE_SMALL, COLOR_TEXT_FAINT)
         
-        # Game speed indicator
-        if self.state.game_speed != 1:
-            speed_str = f"Speed: {self.state.game_speed}x"
+        # Game speed indicator (with the speed actually achieved when falling behind)
+        requested = self.state.game_speed
+        effective = self.state.effective_speed
+        lagging = not self.state.paused and effective < requested * 0.95
+        if requested != 1 or lagging:
+            speed_str = f"Speed: {requested}x"
+            if lagging:
+                speed_str += f" (actual {effective:.1f}x)"
             rl.draw_text(speed_str, x, y + 14, HUD_FONT_SIZE_SMALL, COLOR_TEXT_DIM)
         
         # Paused indicator
@@ -10,6 +10,7 @@ from constants import (
     UI_COLOR_OPTION_SELECTED
 )
 from world_objects import GroundItem, find_valid_drop_position
+from ui.atlas import get_sprite_atlas, draw_sprite_pro
 
 
 # =============================================================================
@@ -151,7 +152,7 @@ class InventoryMenu:
         self._compact_mode = False
         
         # Item sprites - loaded lazily on first use
-        self._item_textures = {}  # {item_type: Texture2D}
+        self._item_textures = {}  # {item_type: AtlasRegion}
         self._sprites_loaded = False
         
         # Scroll state for panels
@@ -195,6 +196,7 @@ class InventoryMenu:
             container: Optional Container object to view. If provided, container inventory
                       is shown instead of Ground section.
         """
+        self._release_container()
         self._active = True
         # Support both old (barrel/corpse) and new (container) parameters for backwards compatibility
         if container is not None:
@@ -205,6 +207,9 @@ class InventoryMenu:
             self._viewing_container = barrel
         else:
             self._viewing_container = None
+        # Corpses don't decay while they're open here
+        if self._is_viewing_corpse():
+            self.state.corpses.pin(self._viewing_container)
         # Reset selection to inventory section
         self.selected_section = 'inventory'
         self.selected_slot = 0
@@ -230,9 +235,23 @@ class InventoryMenu:
             self._return_held_item_to_inventory()
         self.held_item = None
         self._held_was_equipped = False
-        self._viewing_container = None
+        self._release_container()
         self._active = False
     
+    def _is_viewing_corpse(self):
+        return self._viewing_container is not None and self._viewing_container.container_type == 'corpse'
+    
+    def _release_container(self):
+        """Stop viewing the current container (unpins a corpse)."""
+        if self._is_viewing_corpse():
+            self.state.corpses.unpin(self._viewing_container)
+        self._viewing_container = None
+    
+    def _check_container(self):
+        """Close the menu if the corpse being viewed is gone (removed or world reset)."""
+        if self._active and self._is_viewing_corpse() and self._viewing_container not in self.state.corpses:
+            self.close()
+    
     def _return_held_item_to_inventory(self):
         """Return held item to first available inventory slot, or drop to ground if full."""
         if not self.held_item or not self.state.player:
@@ -280,6 +299,8 @@ class InventoryMenu:
         self.mouse_right_click = mouse_right_click
         self.gamepad_connected = gamepad_connected
         
+        self._check_container()
+        
         # Handle shift+click for quick-move (all sections)
         if self._active and not self.context_menu_open and not self._confirm_popup_open and mouse_left_click and shift_held:
             clicked_slot = self._get_slot_at_mouse()
@@ -2034,11 +2055,15 @@ class InventoryMenu:
         if self._sprites_loaded:
             return
         
+        # Shares the board's atlas regions when it already packed these items
+        atlas = get_sprite_atlas()
         for item_type, item_info in ITEMS.items():
             sprite_path = get_item_sprite_path(item_type)
-            if sprite_path and os.path.exists(sprite_path):
-                texture = rl.load_texture(sprite_path)
-                self._item_textures[item_type] = texture
+            if sprite_path:
+                region = atlas.add_file(f"item:{item_type}", sprite_path)
+                if region is not None:
+                    self._item_textures[item_type] = region
+        atlas.build()
         
         self._sprites_loaded = True
     
@@ -2046,7 +2071,7 @@ class InventoryMenu:
         """Get the texture for an item type, loading if necessary.
         
         Returns:
-            Texture2D or None if no sprite available
+            AtlasRegion or None if no sprite available
         """
         if not self._sprites_loaded:
             self._load_item_sprites()
@@ -2078,7 +2103,7 @@ class InventoryMenu:
             # Draw the scaled texture
             source_rect = rl.Rectangle(0, 0, texture.width, texture.height)
             dest_rect = rl.Rectangle(draw_x, draw_y, draw_width, draw_height)
-            rl.draw_texture_pro(texture, source_rect, dest_rect, rl.Vector2(0, 0), 0, rl.WHITE)
+            draw_sprite_pro(texture, source_rect, dest_rect, rl.Vector2(0, 0), 0, rl.WHITE)
         else:
             # Fallback to text icon if no sprite
             icon = get_item_icon(item_type)
@@ -2088,10 +2113,7 @@ class InventoryMenu:
             rl.draw_text(icon, icon_x, icon_y, icon_size, COLOR_TEXT_BRIGHT)
     
     def unload_sprites(self):
-        """Unload all item sprites. Call when closing the game."""
-        for texture in self._item_textures.values():
-            if texture and texture.id > 0:
-                rl.unload_texture(texture)
+        """Forget all item sprites (the shared atlas owns the page textures)."""
         self._item_textures = {}
         self._sprites_loaded = False
     
@@ -6,6 +6,9 @@ frame for a character's current state and direction.
 
 Designed for compatibility with eventual Rust migration (raylib-rs).
 
+Sheets and recolored frames live in the shared texture atlas (ui/atlas.py), so
+textures handed out here are AtlasRegions - draw them with draw_sprite_pro().
+
 Sprite Sheet Layout:
 - Civilian1_Move.png: 4 frames × 8 directions (208x416, walking animation - unarmed/bow/fists)
 - Civilian1_Move_longsword.png: 4 frames × 8 directions (208x416, walking with sword in combat mode)
@@ -33,9 +36,13 @@ Animation States:
 """
 
 import pyray as rl
+import numpy as np
+import hashlib
 import os
 import time
 
+from ui.atlas import get_sprite_atlas, image_to_pixels
+
 
 # Animation timing
 WALK_FRAME_DURATION = 0.12  # 120ms per frame = 480ms per cycle (4 frames)
@@ -49,6 +56,10 @@ DIRECTIONS_PER_SHEET = 8  # 8 directions
 FRAME_WIDTH = 52  # Width of each frame
 FRAME_HEIGHT = 52  # Height of each frame
 
+# Recolor cache (bump the version whenever recolor_red_pixels changes its output)
+RECOLOR_CACHE_DIR = 'sprites/.recolor_cache'
+RECOLOR_CACHE_VERSION = 1
+
 # Direction name to row index mapping
 DIRECTION_TO_ROW = {
     'down': 0,
@@ -68,6 +79,45 @@ def hex_to_rgb(hex_color):
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+def recolor_red_pixels(pixels, target_color, red_threshold=0.3):
+    """Replace red-ish pixels with a target color, keeping their luminosity.
+    
+    Args:
+        pixels: (H, W, 4) uint8 RGBA array
+        target_color: Target color as (R, G, B) tuple
+        red_threshold: How dominant red must be (0.0-1.0, higher = more selective)
+        
+    Returns:
+        New (H, W, 4) uint8 array
+    """
+    rgb = pixels[..., :3].astype(np.float64)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    alpha = pixels[..., 3]
+    
+    brightness = (r + g + b) / 3
+    spread = np.maximum(np.maximum(np.abs(r - g), np.abs(r - b)), np.abs(g - b))
+    # Transparent, very dark and very light/white pixels are left alone
+    candidate = (alpha != 0) & (brightness >= 30) & ~((brightness > 240) & (spread < 20))
+    
+    red_dominance = r / 255.0 - np.maximum(g, b) / 255.0
+    reddish = candidate & (r > g * 1.2) & (r > b * 1.2) & (red_dominance > red_threshold)
+    
+    luminosity = 0.299 * r + 0.587 * g + 0.114 * b
+    target_lum = 0.299 * target_color[0] + 0.587 * target_color[1] + 0.114 * target_color[2]
+    
+    result = pixels.copy()
+    if target_lum > 0:
+        scale = np.minimum(luminosity / target_lum, 2.0)
+        for channel in range(3):
+            new = np.minimum(255, np.floor(target_color[channel] * scale))
+            result[..., channel] = np.where(reddish, new, pixels[..., channel])
+    else:
+        grey = np.floor(luminosity)
+        for channel in range(3):
+            result[..., channel] = np.where(reddish, grey, pixels[..., channel])
+    return result
+
+
 class SpriteManager:
     """Manages sprite loading and frame selection for all characters using Raylib."""
     
@@ -78,9 +128,11 @@ class SpriteManager:
             sprite_dir: Directory containing sprite PNG files
         """
         self.sprite_dir = sprite_dir
-        self.textures = {}  # {action: Texture2D}
+        self.textures = {}  # {action: AtlasRegion}
         self.loaded = False
-        self._recolor_cache = {}  # Cache for recolored textures
+        self._sheet_pixels = {}  # {action: (H, W, 4) uint8 array} - CPU copy for recoloring
+        self._sheet_hashes = {}  # {action: content hash} - disk cache key
+        self._recolor_cache = {}  # {(action, x, y, color_hex): AtlasRegion} per-frame recolors
         
     def load_sprites(self):
         """Load all sprite sheets."""
@@ -98,30 +150,29 @@ class SpriteManager:
             'AttackSword': 'sprites/characters/Civilian1_Attack_longsword.png',
         }
         
+        atlas = get_sprite_atlas()
         for action, filename in sprite_files.items():
             filepath = os.path.join(self.sprite_dir, filename)
             
             if os.path.exists(filepath):
-                texture = rl.load_texture(filepath)
-                self.textures[action] = texture
+                image = rl.load_image(filepath)
+                self._sheet_pixels[action] = image_to_pixels(image)
+                rl.unload_image(image)
+                self.textures[action] = atlas.add(f"character:{action}", self._sheet_pixels[action])
+                with open(filepath, 'rb') as f:
+                    self._sheet_hashes[action] = hashlib.sha1(f.read()).hexdigest()
             else:
                 print(f"Warning: Sprite sheet not found: {filepath}")
                 self.textures[action] = None
         
+        atlas.build()
         self.loaded = True
     
     def unload_sprites(self):
-        """Unload all loaded textures."""
-        for texture in self.textures.values():
-            if texture:
-                rl.unload_texture(texture)
-        
-        # Unload cached recolored textures
-        for texture in self._recolor_cache.values():
-            if texture:
-                rl.unload_texture(texture)
-        
+        """Forget all loaded sprites (the atlas owns and unloads the page textures)."""
         self.textures = {}
+        self._sheet_pixels = {}
+        self._sheet_hashes = {}
         self._recolor_cache = {}
         self.loaded = False
     
@@ -162,7 +213,7 @@ class SpriteManager:
         """Get the appropriate sprite frame for a character.
         
         Args:
-            char: Character dictionary with state info
+            char: CharacterView (render_snapshot.py) or Character; only read
             current_time: Current time (defaults to time.time())
             
         Returns:
@@ -179,7 +230,9 @@ class SpriteManager:
         direction_row = self.get_direction_row(facing)
         
         # Determine equipped weapon type for sprite selection
-        equipped_weapon_type = self._get_equipped_weapon_type(char)
+        equipped_weapon_type = char.get('weapon_type')
+        if equipped_weapon_type is None:
+            equipped_weapon_type = self._get_equipped_weapon_type(char)
         
         # Determine animation state
         action, frame_idx = self._get_animation_state(char, current_time, equipped_weapon_type)
@@ -187,8 +240,8 @@ class SpriteManager:
         texture = self.textures.get(action)
         if texture is None:
             # Fallback to base sprites if weapon-specific not found
-            fallback_action = action.replace('Sword', '')
-            texture = self.textures.get(fallback_action)
+            action = action.replace('Sword', '')
+            texture = self.textures.get(action)
             if texture is None:
                 return None, False
         
@@ -196,7 +249,7 @@ class SpriteManager:
         source_rect = self.get_frame_rect(action, direction_row, frame_idx)
         
         # No flipping needed - we have all 8 directions
-        return {'texture': texture, 'source': source_rect}, False
+        return {'texture': texture, 'source': source_rect, 'action': action}, False
     
     def _get_equipped_weapon_type(self, char):
         """Get the weapon type equipped by a character.
@@ -260,18 +313,8 @@ class SpriteManager:
                 action = 'AttackSword' if use_sword_sprites else 'Attack'
                 return action, frame_idx
         
-        # Detect movement
-        current_x = char.get('x', 0)
-        current_y = char.get('y', 0)
-        last_x = char.get('_last_anim_x', current_x)
-        last_y = char.get('_last_anim_y', current_y)
-        
-        dx = current_x - last_x
-        dy = current_y - last_y
-        is_moving = abs(dx) > 0.001 or abs(dy) > 0.001
-        
-        char['_last_anim_x'] = current_x
-        char['_last_anim_y'] = current_y
+        # Movement is detected by the snapshot (moved since the previous one)
+        is_moving = char.get('is_moving', False)
         
         # Check if in combat mode
         in_combat_mode = char.get('combat_mode', False)
@@ -300,105 +343,128 @@ class SpriteManager:
             # Idle - first frame of walk
             return walk_action, 0
     
+    def precompute_recolors(self, colors, red_threshold=0.3):
+        """Build every (frame, color) variant up front so nothing is recolored mid-game.
+        
+        Whole sheets are recolored at once with NumPy; results are cached on disk
+        per sheet content hash, so later launches only slice and upload.
+        
+        Args:
+            colors: Iterable of target colors (hex strings or (R, G, B) tuples)
+            red_threshold: Passed through to recolor_red_pixels
+        """
+        if not self.loaded:
+            self.load_sprites()
+        
+        palette = {}
+        for color in colors:
+            color_hex, rgb = self._normalize_color(color)
+            palette[color_hex] = rgb
+        
+        for action, pixels in self._sheet_pixels.items():
+            sheets = self._load_recolor_cache(action, red_threshold)
+            missing = [c for c in palette if c not in sheets]
+            for color_hex in missing:
+                sheets[color_hex] = recolor_red_pixels(pixels, palette[color_hex], red_threshold)
+            if missing:
+                self._save_recolor_cache(action, red_threshold, sheets)
+            
+            for color_hex in palette:
+                self._upload_frames(action, color_hex, sheets[color_hex])
+        
+        # Pack all new frames onto atlas pages in one go
+        get_sprite_atlas().build()
+    
     def recolor_red_to_color(self, frame_info, target_color, red_threshold=0.3):
         """Replace red-ish pixels in a frame with a target color.
         
-        This creates a new texture with the recolored pixels.
-        Results are cached for performance.
+        Returns the precomputed texture when precompute_recolors covered this
+        color; otherwise recolors just this frame (vectorized) and caches it.
         
         Args:
-            frame_info: Dict with 'texture' and 'source' Rectangle
+            frame_info: Dict with 'texture', 'source' Rectangle and 'action'
             target_color: Target color as (R, G, B) tuple or hex string "#RRGGBB"
             red_threshold: How dominant red must be (0.0-1.0, higher = more selective)
             
         Returns:
-            Raylib Texture2D with recolored pixels
+            AtlasRegion with recolored pixels, or None if the frame isn't from our sheets
         """
         if frame_info is None:
             return None
         
-        texture = frame_info['texture']
         source_rect = frame_info['source']
+        color_hex, rgb = self._normalize_color(target_color)
+        action = frame_info.get('action')
+        
+        cache_key = (action, int(source_rect.x), int(source_rect.y), color_hex)
+        cached = self._recolor_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        x, y = int(source_rect.x), int(source_rect.y)
+        w, h = int(source_rect.width), int(source_rect.height)
+        pixels = self._sheet_pixels.get(action)
+        if pixels is None:
+            return None
         
-        # Convert hex color to RGB if needed
-        if isinstance(target_color, str):
-            color_hex = target_color.lstrip('#').upper()
-            target_color = tuple(int(color_hex[i:i+2], 16) for i in (0, 2, 4))
+        frame = recolor_red_pixels(pixels[y:y + h, x:x + w], rgb, red_threshold)
+        # Drawn this frame, so it can't wait for a build; add_late doesn't cost a page
+        region = get_sprite_atlas().add_late(f"character:{action}:{color_hex}:{x},{y}", frame)
+        self._recolor_cache[cache_key] = region
+        return region
+    
+    def _normalize_color(self, color):
+        """Return (RRGGBB hex key, (R, G, B)) for a hex string or RGB tuple."""
+        if isinstance(color, str):
+            color_hex = color.lstrip('#').upper()
+            return color_hex, tuple(int(color_hex[i:i+2], 16) for i in (0, 2, 4))
+        return f"{color[0]:02X}{color[1]:02X}{color[2]:02X}", tuple(color[:3])
+    
+    def _upload_frames(self, action, color_hex, sheet):
+        """Slice a recolored sheet into per-frame atlas regions in the recolor cache.
+        
+        Regions are only queued here; precompute_recolors builds the atlas once
+        every sheet and color has been sliced.
+        """
+        if action == 'Death':
+            frames = [(0, 0)]
         else:
-            color_hex = f"{target_color[0]:02X}{target_color[1]:02X}{target_color[2]:02X}"
-        
-        # Create cache key using texture id, source rect, and color
-        cache_key = (id(texture), int(source_rect.x), int(source_rect.y), color_hex)
-        
-        if cache_key in self._recolor_cache:
-            return self._recolor_cache[cache_key]
-        
-        # Load image from texture for pixel manipulation
-        image = rl.load_image_from_texture(texture)
-        
-        # Crop to the frame we want
-        cropped = rl.image_from_image(image, source_rect)
-        rl.unload_image(image)
-        
-        # Get pixel data
-        width = int(source_rect.width)
-        height = int(source_rect.height)
-        
-        # Process pixels
-        for y in range(height):
-            for x in range(width):
-                pixel = rl.get_image_color(cropped, x, y)
-                r, g, b, a = pixel.r, pixel.g, pixel.b, pixel.a
-                
-                # Skip transparent pixels
-                if a == 0:
-                    continue
-                
-                # Skip very dark pixels
-                brightness = (r + g + b) / 3
-                if brightness < 30:
-                    continue
-                
-                # Skip very light/white pixels
-                if brightness > 240 and max(abs(r-g), abs(r-b), abs(g-b)) < 20:
-                    continue
-                
-                # Check if red is dominant
-                max_channel = max(r, g, b)
-                if max_channel == 0:
-                    continue
-                
-                r_norm = r / 255.0
-                g_norm = g / 255.0
-                b_norm = b / 255.0
-                
-                red_dominance = r_norm - max(g_norm, b_norm)
-                is_reddish = (r > g * 1.2 and r > b * 1.2 and red_dominance > red_threshold)
-                
-                if is_reddish:
-                    # Calculate luminosity
-                    luminosity = 0.299 * r + 0.587 * g + 0.114 * b
-                    target_lum = 0.299 * target_color[0] + 0.587 * target_color[1] + 0.114 * target_color[2]
-                    
-                    if target_lum > 0:
-                        scale = luminosity / target_lum
-                        scale = min(scale, 2.0)
-                        new_r = min(255, int(target_color[0] * scale))
-                        new_g = min(255, int(target_color[1] * scale))
-                        new_b = min(255, int(target_color[2] * scale))
-                    else:
-                        new_r = new_g = new_b = int(luminosity)
-                    
-                    rl.image_draw_pixel(cropped, x, y, rl.Color(new_r, new_g, new_b, a))
-        
-        # Create texture from modified image
-        result_texture = rl.load_texture_from_image(cropped)
-        rl.unload_image(cropped)
-        
-        # Cache and return
-        self._recolor_cache[cache_key] = result_texture
-        
-        return result_texture
+            frames = [(col * FRAME_WIDTH, row * FRAME_HEIGHT)
+                      for row in range(DIRECTIONS_PER_SHEET) for col in range(FRAMES_PER_ROW)]
+        
+        atlas = get_sprite_atlas()
+        for x, y in frames:
+            cache_key = (action, x, y, color_hex)
+            if cache_key in self._recolor_cache:
+                continue
+            frame = sheet[y:y + FRAME_HEIGHT, x:x + FRAME_WIDTH]
+            if frame.shape[:2] != (FRAME_HEIGHT, FRAME_WIDTH):
+                continue  # Sheet smaller than the expected grid
+            self._recolor_cache[cache_key] = atlas.add(f"character:{action}:{color_hex}:{x},{y}", frame)
+    
+    def _recolor_cache_path(self, action, red_threshold):
+        key = f"{self._sheet_hashes[action]}:{red_threshold}:{RECOLOR_CACHE_VERSION}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:20]
+        return os.path.join(self.sprite_dir, RECOLOR_CACHE_DIR, f"{action}_{digest}.npz")
+    
+    def _load_recolor_cache(self, action, red_threshold):
+        """Recolored sheets for an action from disk: {color_hex: array}."""
+        path = self._recolor_cache_path(action, red_threshold)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with np.load(path) as data:
+                return {color_hex: data[color_hex] for color_hex in data.files}
+        except (OSError, ValueError):
+            return {}  # Corrupt or partial file - rebuild it
+    
+    def _save_recolor_cache(self, action, red_threshold, sheets):
+        path = self._recolor_cache_path(action, red_threshold)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.savez_compressed(path, **sheets)
+        except OSError as e:
+            print(f"Warning: Could not write recolor cache {path}: {e}")
 
 
 # Global sprite manager instance
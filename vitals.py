@@ -0,0 +1,129 @@
+# vitals.py - Per-character vital stats stored column-wise in NumPy arrays
+"""
+Hunger, stamina, health and the starvation/sprint bookkeeping for every
+character live in one VitalsTable (GameState.vitals), one array per stat,
+one row per character. GameLogic updates them for everyone at once with
+masked array operations each tick; only characters that cross a threshold
+(start starving, freeze, lose morality, run out of stamina) get per-character
+handling.
+
+Character exposes the same attributes as before (char.hunger,
+char['health'], ...) through VitalField descriptors that read and write its
+row. A character that isn't in a table (not yet added to a GameState, or
+removed from it) keeps its values in plain instance attributes instead, so
+dead characters can still be inspected.
+"""
+
+import numpy as np
+
+
+def _number(value):
+    """Array scalar -> int when whole, else float (keeps '100' from printing as '100.0')."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+# name -> (dtype, reader)
+VITAL_COLUMNS = {
+    'health': (np.float64, _number),
+    'hunger': (np.float64, _number),
+    'stamina': (np.float64, _number),
+    'starvation_health_lost': (np.float64, _number),
+    'ticks_starving': (np.int64, int),
+    'is_starving': (np.bool_, bool),
+    'is_frozen': (np.bool_, bool),
+    'is_sprinting': (np.bool_, bool),
+    '_last_sprint_tick': (np.int64, int),
+    '_stamina_depleted': (np.bool_, bool),
+}
+
+INITIAL_CAPACITY = 64
+
+
+class VitalField:
+    """Descriptor for one vital stat: reads/writes the character's table row."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attr = '_vital_' + name
+        self.reader = VITAL_COLUMNS[name][1]
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        table = obj._vitals
+        if table is None:
+            try:
+                return obj.__dict__[self.attr]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        return self.reader(table.columns[self.name][obj._vitals_row])
+
+    def __set__(self, obj, value):
+        table = obj.__dict__.get('_vitals')
+        if table is None:
+            obj.__dict__[self.attr] = value
+        else:
+            table.columns[self.name][obj._vitals_row] = value
+
+
+class VitalsTable:
+    """
+    Column arrays of vital stats, one row per registered character.
+
+    Rows are packed: removing a character moves the last row into its slot,
+    so [:count] is always exactly the live characters (in `chars` order).
+    """
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.count = 0
+        self.chars = []  # Row index -> Character
+        self.columns = {name: np.zeros(capacity, dtype=dtype)
+                        for name, (dtype, _) in VITAL_COLUMNS.items()}
+
+    def __len__(self):
+        return self.count
+
+    def view(self, name):
+        """Live slice of one column covering the registered characters."""
+        return self.columns[name][:self.count]
+
+    def _grow(self):
+        for name, column in self.columns.items():
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def attach(self, char):
+        """Move a character's vitals into a new row (it reads/writes the table from now on)."""
+        if char._vitals is self:
+            return
+        if self.count == len(self.columns['health']):
+            self._grow()
+        row = self.count
+        for name in VITAL_COLUMNS:
+            self.columns[name][row] = getattr(char, name)
+        self.chars.append(char)
+        self.count += 1
+        char._vitals_row = row
+        char._vitals = self
+
+    def detach(self, char):
+        """Copy a character's vitals back onto it and free its row."""
+        if char._vitals is not self:
+            return
+        row = char._vitals_row
+        for name, (_, reader) in VITAL_COLUMNS.items():
+            char.__dict__['_vital_' + name] = reader(self.columns[name][row])
+        char._vitals = None
+        char._vitals_row = None
+
+        last = self.count - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = self.chars[last]
+            self.chars[row] = moved
+            moved._vitals_row = row
+        self.chars.pop()
+        self.count -= 1
@@ -4,6 +4,8 @@ This module contains classes representing physical things in the game world:
 - static_interactables: Buildings, containers, furniture, resources
 - interiors: Interior spaces for buildings
 - ground_items: Items dropped on the ground
+- corpses: Corpse decay and the markers they leave behind
+- spatial_index: Per-zone bucketed lookup of all of the above by position
 
 These are purely representational - they describe what exists in the world,
 not the logic of how things work (that's in game_logic.py).
@@ -23,6 +25,8 @@ from .static_interactables import (
     InteractableManager,
 )
 
+from .spatial_index import SpatialIndex
+
 from .interiors import (
     Interior,
     Window,
@@ -35,6 +39,11 @@ from .ground_items import (
     find_valid_drop_position,
 )
 
+from .corpses import (
+    CorpseMarker,
+    CorpseManager,
+)
+
 __all__ = [
     # static_interactables
     'Interactable',
@@ -56,4 +65,9 @@ __all__ = [
     'GroundItem',
     'GroundItemManager',
     'find_valid_drop_position',
+    # corpses
+    'CorpseMarker',
+    'CorpseManager',
+    # spatial_index
+    'SpatialIndex',
 ]
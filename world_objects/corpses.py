@@ -0,0 +1,207 @@
+# corpses.py - Corpse lifecycle: decay, compaction into markers, lookup by position
+"""
+Handles the bodies left behind by dead characters.
+
+Corpses:
+- Are created by GameLogic._process_deaths and keep the dead character's inventory
+- Are indexed as 'corpse' in the shared SpatialIndex, so proximity checks and
+  rendering only look at nearby buckets
+- Collapse into a CorpseMarker once looted bare (checked every CORPSE_EMPTY_TICKS)
+- Rot after CORPSE_DECAY_TICKS: anything still on them drops to the ground
+  (despawning after GROUND_ITEM_DESPAWN_TICKS) and they collapse into a
+  marker too
+- Are left alone while pinned (open in the inventory menu), so items moved
+  into a corpse being looted aren't lost; their deadline is pushed back
+
+Markers are a few slots of data (position, zone, how many bodies) with no
+inventory. Bodies decaying on the same cell share one marker, and markers
+fade after CORPSE_MARKER_TICKS, so a long war leaves a bounded trace.
+
+Nothing is scanned per tick: every corpse and marker has one pending entry in
+a deadline heap, and update() only pops the entries that are due.
+"""
+
+import heapq
+from typing import Optional
+
+from constants import (
+    CORPSE_EMPTY_TICKS, CORPSE_DECAY_TICKS, CORPSE_MARKER_TICKS, GROUND_ITEM_DESPAWN_TICKS,
+)
+
+
+class CorpseMarker:
+    """Bones left where one or more corpses decayed. Not lootable."""
+
+    __slots__ = ('x', 'y', 'zone', 'count', 'expires_tick')
+
+    def __init__(self, x, y, zone, expires_tick):
+        self.x = x  # Exact position of the first body (same space as Corpse.x/y)
+        self.y = y
+        self.zone = zone
+        self.count = 1  # Bodies that decayed on this cell
+        self.expires_tick = expires_tick
+
+    @property
+    def center(self):
+        return (self.x, self.y)
+
+
+class CorpseManager:
+    """
+    Owns every corpse and marker in the world.
+
+    Iterating the manager yields the corpses (oldest first), so code that
+    treated GameState.corpses as a list keeps working.
+    """
+
+    def __init__(self, spatial=None, ground_items=None):
+        self._corpses = {}  # Corpse -> tick it was added (insertion-ordered)
+        self.markers = {}   # (zone, cell_x, cell_y) -> CorpseMarker
+        self.spatial = spatial            # Optional SpatialIndex kept in sync
+        self.ground_items = ground_items  # Where decaying corpses drop their items
+        self._deadlines = []  # Heap of (tick, seq, corpse or marker)
+        self._seq = 0
+        self._pinned = set()  # Corpses that mustn't decay right now (being viewed)
+
+    def __iter__(self):
+        return iter(tuple(self._corpses))
+
+    def __len__(self):
+        return len(self._corpses)
+
+    def __contains__(self, corpse):
+        return corpse in self._corpses
+
+    def _schedule(self, tick, obj):
+        self._seq += 1
+        heapq.heappush(self._deadlines, (tick, self._seq, obj))
+
+    # =========================================================================
+    # ADD / REMOVE
+    # =========================================================================
+
+    def add(self, corpse, tick):
+        """Add a corpse that appeared at `tick`."""
+        self._corpses[corpse] = tick
+        if self.spatial is not None:
+            self.spatial.insert('corpse', corpse, corpse.zone, corpse.x, corpse.y)
+        self._schedule(tick + CORPSE_EMPTY_TICKS, corpse)
+
+    def remove(self, corpse):
+        """Remove a corpse outright (no marker). Returns True if it was here."""
+        if self._corpses.pop(corpse, None) is None:
+            return False
+        self._pinned.discard(corpse)
+        if self.spatial is not None:
+            self.spatial.remove(corpse)
+        return True
+
+    def clear(self):
+        """Remove all corpses and markers."""
+        for corpse in tuple(self._corpses):
+            self.remove(corpse)
+        for marker in self.markers.values():
+            if self.spatial is not None:
+                self.spatial.remove(marker)
+        self.markers.clear()
+        self._deadlines.clear()
+        self._pinned.clear()
+
+    def pin(self, corpse):
+        """Keep a corpse from being compacted or rotting until unpin()."""
+        if corpse in self._corpses:
+            self._pinned.add(corpse)
+
+    def unpin(self, corpse):
+        """Let a pinned corpse decay again (its next deadline applies as usual)."""
+        self._pinned.discard(corpse)
+
+    # =========================================================================
+    # DECAY
+    # =========================================================================
+
+    def update(self, tick):
+        """Decay/compact every corpse and fade every marker whose deadline has passed."""
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= tick:
+            _, _, obj = heapq.heappop(deadlines)
+            if isinstance(obj, CorpseMarker):
+                self._fade_marker(obj, tick)
+                continue
+
+            added_tick = self._corpses.get(obj)
+            if added_tick is None:
+                continue  # Removed since it was scheduled
+            if obj in self._pinned:
+                self._schedule(tick + CORPSE_EMPTY_TICKS, obj)  # Check again once released
+                continue
+            decay_tick = added_tick + CORPSE_DECAY_TICKS
+            if tick >= decay_tick:
+                self._drop_inventory(obj, tick)
+                self._compact(obj, tick)
+            elif all(slot is None for slot in obj.inventory):
+                self._compact(obj, tick)
+            else:
+                self._schedule(min(tick + CORPSE_EMPTY_TICKS, decay_tick), obj)
+
+    def _drop_inventory(self, corpse, tick):
+        if self.ground_items is None:
+            return
+        for i, slot in enumerate(corpse.inventory):
+            if slot is not None:
+                self.ground_items.add_item(slot['type'], slot['amount'], corpse.x, corpse.y, corpse.zone,
+                                           despawn_tick=tick + GROUND_ITEM_DESPAWN_TICKS)
+                corpse.inventory[i] = None
+
+    def _compact(self, corpse, tick):
+        """Replace a corpse with (or fold it into) the marker on its cell."""
+        self.remove(corpse)
+        key = (corpse.zone, int(corpse.x), int(corpse.y))
+        marker = self.markers.get(key)
+        if marker is None:
+            marker = CorpseMarker(corpse.x, corpse.y, corpse.zone, tick + CORPSE_MARKER_TICKS)
+            self.markers[key] = marker
+            if self.spatial is not None:
+                self.spatial.insert('corpse_marker', marker, marker.zone, marker.x, marker.y)
+        else:
+            marker.count += 1
+            marker.expires_tick = tick + CORPSE_MARKER_TICKS
+        self._schedule(marker.expires_tick, marker)
+
+    def _fade_marker(self, marker, tick):
+        if marker.expires_tick > tick:
+            return  # Refreshed by another body; a later entry covers it
+        key = (marker.zone, int(marker.x), int(marker.y))
+        if self.markers.get(key) is marker:
+            del self.markers[key]
+            if self.spatial is not None:
+                self.spatial.remove(marker)
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def get_corpses_near(self, x: float, y: float, radius: float, zone: Optional[str]):
+        """
+        Get corpses within radius of a position in the same zone, nearest first.
+
+        Args:
+            x, y: Center position (interior coords inside, world coords outside)
+            radius: Search radius
+            zone: Zone to search in (None for exterior)
+        """
+        if self.spatial is not None:
+            candidates = [corpse for kind, corpse in
+                          self.spatial.query_radius(zone, x, y, radius, ('corpse',))]
+        else:
+            candidates = [corpse for corpse in self._corpses if corpse.zone == zone]
+
+        nearby = []
+        for corpse in candidates:
+            dx = corpse.x - x
+            dy = corpse.y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= radius * radius:
+                nearby.append((dist_sq, corpse))
+        nearby.sort(key=lambda entry: entry[0])
+        return [corpse for _, corpse in nearby]
@@ -8,12 +8,18 @@ Ground items:
 - Are zone-specific (None for exterior, interior name for inside)
 - Have a small visual offset for natural appearance when multiple items nearby
 - Can be picked up via inventory Ground UI (not environment menu)
+- Merge into a nearby stack of the same type when dropped next to one
+- Can be given a despawn tick (e.g. loot spilled by a rotting corpse)
 """
 
+import heapq
 import random
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
 
+from constants import ITEMS, GROUND_ITEM_MERGE_RADIUS
+from .spatial_index import SpatialIndex
+
 
 @dataclass
 class GroundItem:
@@ -23,6 +29,7 @@ class GroundItem:
     x: float  # World coords for exterior, interior coords for interior
     y: float
     zone: Optional[str] = None  # None for exterior, interior name for inside
+    despawn_tick: Optional[int] = None  # Tick it disappears at (None = never)
     
     # Small random offset for visual variety (set on creation)
     visual_offset_x: float = field(default_factory=lambda: random.uniform(-0.15, 0.15))
@@ -36,6 +43,7 @@ class GroundItem:
             'x': self.x,
             'y': self.y,
             'zone': self.zone,
+            'despawn_tick': self.despawn_tick,
             'visual_offset_x': self.visual_offset_x,
             'visual_offset_y': self.visual_offset_y,
         }
@@ -49,6 +57,7 @@ class GroundItem:
             x=data['x'],
             y=data['y'],
             zone=data.get('zone'),
+            despawn_tick=data.get('despawn_tick'),
         )
         item.visual_offset_x = data.get('visual_offset_x', random.uniform(-0.15, 0.15))
         item.visual_offset_y = data.get('visual_offset_y', random.uniform(-0.15, 0.15))
@@ -59,34 +68,94 @@ class GroundItemManager:
     """
     Manages all ground items in the game world.
     
-    Items are stored in a flat list and filtered by zone/distance when needed.
+    Items are kept per zone and indexed as 'ground_item' in a SpatialIndex
+    (the game shares InteractableManager.spatial; a private one is made
+    otherwise), so zone and distance queries only look at nearby buckets.
+    
+    Dropping an item next to a stack of the same type tops that stack up
+    (up to the item's stack_size) instead of adding another entry. Items
+    given a despawn_tick disappear once update() reaches it.
     """
     
-    def __init__(self):
-        self.items: List[GroundItem] = []
+    def __init__(self, spatial=None):
+        self._zones: Dict[Optional[str], Dict[int, GroundItem]] = {}  # zone -> {id(item): item}
+        self._count = 0
+        self.spatial = spatial if spatial is not None else SpatialIndex()
+        self._despawns = []  # Heap of (despawn_tick, seq, item)
+        self._seq = 0
+    
+    @property
+    def items(self) -> List[GroundItem]:
+        """All ground items (a new list)."""
+        return [item for members in self._zones.values() for item in members.values()]
+    
+    def _store(self, item: GroundItem):
+        self._zones.setdefault(item.zone, {})[id(item)] = item
+        self._count += 1
+        self.spatial.insert('ground_item', item, item.zone, item.x, item.y)
+        self._schedule_despawn(item)
+    
+    def _schedule_despawn(self, item: GroundItem):
+        if item.despawn_tick is not None:
+            self._seq += 1
+            heapq.heappush(self._despawns, (item.despawn_tick, self._seq, item))
+    
+    def _merge_target(self, item_type: str, x: float, y: float, zone: Optional[str]) -> Optional[GroundItem]:
+        """Nearest same-type stack within GROUND_ITEM_MERGE_RADIUS that still has room."""
+        stack_limit = ITEMS.get(item_type, {}).get('stack_size')
+        best, best_dist = None, None
+        for kind, item in self.spatial.query_radius(zone, x, y, GROUND_ITEM_MERGE_RADIUS, ('ground_item',)):
+            if item.item_type != item_type:
+                continue
+            if stack_limit is not None and item.amount >= stack_limit:
+                continue
+            dist = (item.x - x) ** 2 + (item.y - y) ** 2
+            if best is None or dist < best_dist:
+                best, best_dist = item, dist
+        return best
     
     def add_item(self, item_type: str, amount: int, x: float, y: float, 
-                 zone: Optional[str] = None) -> GroundItem:
+                 zone: Optional[str] = None, merge: bool = True,
+                 despawn_tick: Optional[int] = None) -> GroundItem:
         """
-        Add a new item to the ground.
+        Add an item to the ground.
         
         Args:
             item_type: Type of item ('wheat', 'gold', etc.)
             amount: Stack amount
             x, y: Position (world coords for exterior, interior coords for interior)
             zone: None for exterior, interior name for inside
+            merge: Top up nearby stacks of the same type before placing a new one
+            despawn_tick: Tick the item disappears at (None = stays until picked up)
             
         Returns:
-            The created GroundItem
+            The GroundItem the drop ended up in (the last one, if it was split)
         """
+        stack_limit = ITEMS.get(item_type, {}).get('stack_size')
+        target = None
+        while merge and amount > 0:
+            target = self._merge_target(item_type, x, y, zone)
+            if target is None:
+                break
+            moved = amount if stack_limit is None else min(amount, stack_limit - target.amount)
+            target.amount += moved
+            amount -= moved
+            # A merged stack lives as long as the longer-lived of the two
+            if target.despawn_tick is not None and (despawn_tick is None or despawn_tick > target.despawn_tick):
+                target.despawn_tick = despawn_tick
+                self._schedule_despawn(target)
+        if amount <= 0:
+            return target
+        
         item = GroundItem(
             item_type=item_type,
             amount=amount,
             x=x,
             y=y,
             zone=zone,
+            despawn_tick=despawn_tick,
         )
-        self.items.append(item)
+        self._store(item)
         return item
     
     def remove_item(self, item: GroundItem) -> bool:
@@ -96,14 +165,26 @@ class GroundItemManager:
         Returns:
             True if item was found and removed, False otherwise
         """
-        if item in self.items:
-            self.items.remove(item)
-            return True
-        return False
+        members = self._zones.get(item.zone)
+        if members is None or members.get(id(item)) is not item:
+            return False
+        del members[id(item)]
+        self._count -= 1
+        self.spatial.remove(item)
+        return True
+    
+    def update(self, tick: int):
+        """Remove every item whose despawn_tick has been reached."""
+        despawns = self._despawns
+        while despawns and despawns[0][0] <= tick:
+            _, _, item = heapq.heappop(despawns)
+            # Skip entries for items already picked up or given a later deadline
+            if item.despawn_tick is not None and item.despawn_tick <= tick:
+                self.remove_item(item)
     
     def get_items_in_zone(self, zone: Optional[str]) -> List[GroundItem]:
         """Get all ground items in a specific zone."""
-        return [item for item in self.items if item.zone == zone]
+        return list(self._zones.get(zone, {}).values())
     
     def get_items_near(self, x: float, y: float, radius: float, 
                        zone: Optional[str]) -> List[GroundItem]:
@@ -118,24 +199,20 @@ class GroundItemManager:
         Returns:
             List of nearby GroundItems
         """
-        nearby = []
-        for item in self.items:
-            if item.zone != zone:
-                continue
-            dx = item.x - x
-            dy = item.y - y
-            distance = (dx * dx + dy * dy) ** 0.5
-            if distance <= radius:
-                nearby.append(item)
-        return nearby
+        return [item for kind, item in
+                self.spatial.query_radius(zone, x, y, radius, ('ground_item',))]
     
     def get_all_items(self) -> List[GroundItem]:
         """Get all ground items."""
-        return self.items.copy()
+        return self.items
     
     def clear(self):
         """Remove all ground items."""
-        self.items.clear()
+        for item in self.items:
+            self.spatial.remove(item)
+        self._zones.clear()
+        self._count = 0
+        self._despawns.clear()
     
     def to_list(self) -> List[dict]:
         """Convert all items to list of dicts for saving."""
@@ -143,12 +220,12 @@ class GroundItemManager:
     
     def load_from_list(self, data: List[dict]):
         """Load items from list of dicts (from save file)."""
-        self.items.clear()
+        self.clear()
         for item_data in data:
-            self.items.append(GroundItem.from_dict(item_data))
+            self._store(GroundItem.from_dict(item_data))
     
     def __len__(self) -> int:
-        return len(self.items)
+        return self._count
 
 
 def find_valid_drop_position(player_x: float, player_y: float, zone: Optional[str],
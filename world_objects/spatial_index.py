@@ -0,0 +1,161 @@
+# spatial_index.py - Bucketed spatial index for world objects
+"""
+A uniform-grid spatial index, kept separately per zone (None for the exterior,
+interior name for inside), so renderers and interaction code can ask "what is
+inside this rectangle?" without scanning every object in the world.
+
+Entries are (kind, obj) pairs - kind is a short string such as 'tree',
+'barrel', 'house', 'ground_item', 'corpse' or 'corpse_marker'. Point objects sit in a single
+bucket; multi-cell objects (houses) are registered in every bucket their
+bounds touch. Owners keep the index current through insert()/remove() as
+objects come and go; nothing is rebuilt wholesale.
+
+`version` changes on any insert/remove. Caches that only depend on some kinds
+(e.g. vision occluders) should key on kind_version(kinds) instead, so ground
+items and corpses coming and going don't invalidate them.
+
+Buckets are copied on write: insert()/remove() replace a bucket with an
+updated copy instead of changing it in place. The renderer queries the index
+without holding the simulation lock, and a query that is iterating a bucket
+while the simulation thread updates it just finishes on the old copy.
+"""
+
+from constants import SPATIAL_BUCKET_SIZE
+
+
+class SpatialIndex:
+    """
+    Per-zone grid of buckets holding (kind, obj) entries.
+    
+    Objects are tracked by identity, so the same object can't be indexed twice
+    and remove() doesn't need to know where it was put.
+    """
+    
+    def __init__(self, bucket_size=SPATIAL_BUCKET_SIZE):
+        self.bucket_size = bucket_size
+        self._zones = {}    # zone -> {(bx, by): {id(obj): entry}}
+        self._entries = {}  # id(obj) -> (kind, obj, zone, (min_x, min_y, max_x, max_y))
+        self.version = 0  # Bumped on every change, so callers can cache query results
+        self._kind_versions = {}  # kind -> changes to that kind
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+    
+    def kind_version(self, kinds):
+        """Counter that changes whenever an object of one of these kinds is inserted or removed."""
+        versions = self._kind_versions
+        return sum(versions.get(kind, 0) for kind in kinds)
+    
+    def _touch(self, kind):
+        self.version += 1
+        self._kind_versions[kind] = self._kind_versions.get(kind, 0) + 1
+    
+    def _bucket_keys(self, min_x, min_y, max_x, max_y):
+        size = self.bucket_size
+        bx0, bx1 = int(min_x // size), int(max_x // size)
+        by0, by1 = int(min_y // size), int(max_y // size)
+        return [(bx, by) for bx in range(bx0, bx1 + 1) for by in range(by0, by1 + 1)]
+    
+    def insert(self, kind, obj, zone, x, y, max_x=None, max_y=None):
+        """
+        Add an object at (x, y), or covering (x, y)-(max_x, max_y) if given.
+        
+        Re-inserting an object that's already indexed moves it.
+        """
+        if id(obj) in self._entries:
+            self.remove(obj)
+        rect = (x, y, x if max_x is None else max_x, y if max_y is None else max_y)
+        entry = (kind, obj, zone, rect)
+        self._entries[id(obj)] = entry
+        self._touch(kind)
+        buckets = self._zones.setdefault(zone, {})
+        for key in self._bucket_keys(*rect):
+            bucket = dict(buckets.get(key, ()))
+            bucket[id(obj)] = entry
+            buckets[key] = bucket
+    
+    def remove(self, obj):
+        """Drop an object from the index. Returns True if it was indexed."""
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return False
+        kind, _, zone, rect = entry
+        self._touch(kind)
+        buckets = self._zones.get(zone, {})
+        for key in self._bucket_keys(*rect):
+            bucket = buckets.get(key)
+            if bucket is not None and id(obj) in bucket:
+                if len(bucket) == 1:
+                    del buckets[key]
+                else:
+                    bucket = dict(bucket)
+                    del bucket[id(obj)]
+                    buckets[key] = bucket
+        return True
+    
+    def remove_kind(self, kind):
+        """Drop every object of one kind (used when a collection is rebuilt)."""
+        for entry in [e for e in self._entries.values() if e[0] == kind]:
+            self.remove(entry[1])
+    
+    def clear(self):
+        """Drop everything."""
+        self._zones = {}
+        self._entries = {}
+        self.version += 1
+        for kind in self._kind_versions:
+            self._kind_versions[kind] += 1
+    
+    def query_rect(self, zone, min_x, min_y, max_x, max_y, kinds=None):
+        """
+        Get (kind, obj) pairs in a zone whose bounds overlap a rectangle.
+        
+        Args:
+            zone: Zone to search (None for exterior)
+            min_x, min_y, max_x, max_y: Inclusive query bounds
+            kinds: Optional collection of kinds to keep (None = all)
+            
+        Returns:
+            List of (kind, obj) tuples, each object at most once
+        """
+        return [(kind, obj) for kind, obj, _ in self._query(zone, min_x, min_y, max_x, max_y, kinds)]
+    
+    def _query(self, zone, min_x, min_y, max_x, max_y, kinds):
+        """query_rect() as (kind, obj, rect) triples."""
+        buckets = self._zones.get(zone)
+        if not buckets:
+            return []
+        
+        result = []
+        seen = set()
+        for key in self._bucket_keys(min_x, min_y, max_x, max_y):
+            bucket = buckets.get(key)
+            if not bucket:
+                continue
+            for obj_id, (kind, obj, _, rect) in bucket.items():
+                if kinds is not None and kind not in kinds:
+                    continue
+                if rect[0] > max_x or rect[2] < min_x or rect[1] > max_y or rect[3] < min_y:
+                    continue
+                # Only multi-cell objects can appear in more than one bucket
+                if rect[0] != rect[2] or rect[1] != rect[3]:
+                    if obj_id in seen:
+                        continue
+                    seen.add(obj_id)
+                result.append((kind, obj, rect))
+        return result
+    
+    def query_radius(self, zone, x, y, radius, kinds=None):
+        """Get (kind, obj) pairs whose bounds come within radius of (x, y)."""
+        radius_sq = radius * radius
+        result = []
+        for kind, obj, rect in self._query(zone, x - radius, y - radius, x + radius, y + radius, kinds):
+            min_x, min_y, max_x, max_y = rect
+            dx = max(min_x - x, 0, x - max_x)
+            dy = max(min_y - y, 0, y - max_y)
+            if dx * dx + dy * dy <= radius_sq:
+                result.append((kind, obj))
+        return result
@@ -38,9 +38,10 @@ To add a new specialized container (e.g., Chest, Sack, Quiver, Weapon Rack):
    In InteractableManager.__init__:
        self.chests = {}  # (x, y, zone) -> Chest
 
-   Add initialization method:
+   Add initialization method (index chests so renderers can cull them):
        def init_chests(self, chest_defs):
            self.chests = {}
+           self.spatial.remove_kind('chest')
            for chest_def in chest_defs:
                x, y = chest_def["position"]
                zone = chest_def.get("zone")
@@ -52,6 +53,7 @@ To add a new specialized container (e.g., Chest, Sack, Quiver, Weapon Rack):
                    slots=chest_def.get("slots", 24)
                )
                self.chests[(x, y, zone)] = chest
+               self.spatial.insert('chest', chest, zone, x, y)
 
    Add lookup methods:
        def get_chest_at(self, x, y, zone=None):
@@ -100,6 +102,7 @@ To add a new specialized container (e.g., Chest, Sack, Quiver, Weapon Rack):
 
 import math
 from constants import ITEMS, ADJACENCY_DISTANCE, INVENTORY_SLOTS, BARREL_SLOTS
+from .spatial_index import SpatialIndex
 
 
 class Ownable:
@@ -373,7 +376,7 @@ class Barrel(Container, Ownable):
 class Corpse(Container):
     """
     Corpse of a dead character with lootable inventory.
-    Remains indefinitely until looted/removed.
+    Decays into a CorpseMarker over time (see corpses.CorpseManager).
     """
 
     def __init__(self, name, character_name, x, y, zone=None, facing='down', job=None, morality=5, inventory_size=None):
@@ -558,6 +561,10 @@ class InteractableManager:
     """
     Manages all interactable objects in the game world.
     Provides lookup methods by position, home, owner, etc.
+    
+    Every object is also kept in `spatial`, a per-zone SpatialIndex that the
+    init/add/remove methods update as they go. Objects owned elsewhere (ground
+    items, corpses) join the same index through track()/untrack().
     """
     
     def __init__(self):
@@ -567,6 +574,7 @@ class InteractableManager:
         self.campfires = {}  # (x, y) -> Campfire
         self.trees = {}    # (x, y) -> Tree
         self.houses = {}   # name -> House
+        self.spatial = SpatialIndex()  # zone -> bucketed (kind, obj) entries
     
     # =========================================================================
     # INITIALIZATION
@@ -575,6 +583,7 @@ class InteractableManager:
     def init_barrels(self, barrel_defs):
         """Initialize barrels from configuration list."""
         self.barrels = {}
+        self.spatial.remove_kind('barrel')
         for barrel_def in barrel_defs:
             x, y = barrel_def["position"]
             zone = barrel_def.get("zone")  # None for exterior, interior name for inside
@@ -586,10 +595,12 @@ class InteractableManager:
             )
             # Key includes zone to allow same coords in different zones
             self.barrels[(x, y, zone)] = barrel
+            self.spatial.insert('barrel', barrel, zone, x, y)
     
     def init_beds(self, bed_defs):
         """Initialize beds from configuration list."""
         self.beds = {}
+        self.spatial.remove_kind('bed')
         for bed_def in bed_defs:
             x, y = bed_def["position"]
             zone = bed_def.get("zone")  # None for exterior, interior name for inside
@@ -602,10 +613,12 @@ class InteractableManager:
             )
             # Key includes zone to allow same coords in different zones
             self.beds[(x, y, zone)] = bed
+            self.spatial.insert('bed', bed, zone, x, y)
     
     def init_stoves(self, stove_defs):
         """Initialize stoves from configuration list."""
         self.stoves = {}
+        self.spatial.remove_kind('stove')
         for stove_def in stove_defs:
             x, y = stove_def["position"]
             zone = stove_def.get("zone")  # None for exterior, interior name for inside
@@ -617,14 +630,17 @@ class InteractableManager:
             )
             # Key includes zone to allow same coords in different zones
             self.stoves[(x, y, zone)] = stove
+            self.spatial.insert('stove', stove, zone, x, y)
     
     def init_trees(self, tree_positions):
         """Initialize trees from list of (x, y) positions."""
         self.trees = {}
+        self.spatial.remove_kind('tree')
         for pos in tree_positions:
             x, y = pos
             tree = Tree(x, y)
             self.trees[(x, y)] = tree
+            self.spatial.insert('tree', tree, None, x, y)
     
     def init_houses(self, house_defs):
         """Initialize houses from configuration list.
@@ -633,6 +649,7 @@ class InteractableManager:
             house_defs: List of dicts with 'name', 'bounds', and optionally 'allegiance'
         """
         self.houses = {}
+        self.spatial.remove_kind('house')
         for house_def in house_defs:
             house = House(
                 name=house_def["name"],
@@ -640,6 +657,8 @@ class InteractableManager:
                 allegiance=house_def.get("allegiance")
             )
             self.houses[house.name] = house
+            y_start, x_start, y_end, x_end = house.bounds
+            self.spatial.insert('house', house, None, x_start, y_start, x_end, y_end)
     
     def reset(self, barrel_defs, bed_defs, stove_defs, tree_positions=None, house_defs=None):
         """Reset all interactables from configuration."""
@@ -649,6 +668,7 @@ class InteractableManager:
         self.init_trees(tree_positions or [])
         self.init_houses(house_defs or [])
         self.campfires = {}
+        self.spatial.remove_kind('campfire')
     
     # =========================================================================
     # BARREL LOOKUPS
@@ -730,7 +750,11 @@ class InteractableManager:
     def add_campfire(self, x, y, owner_name=None, zone=None):
         """Create a new campfire at position in the given zone."""
         campfire = Campfire(x, y, owner_name, zone=zone)
+        old = self.campfires.get((x, y, zone))
+        if old is not None:
+            self.spatial.remove(old)
         self.campfires[(x, y, zone)] = campfire
+        self.spatial.insert('campfire', campfire, zone, x, y)
         return campfire
     
     def get_campfire_at(self, x, y, zone=None):
@@ -740,7 +764,7 @@ class InteractableManager:
     def remove_campfire(self, x, y, zone=None):
         """Remove campfire at position in the given zone."""
         if (x, y, zone) in self.campfires:
-            del self.campfires[(x, y, zone)]
+            self.spatial.remove(self.campfires.pop((x, y, zone)))
     
     def is_adjacent_to_camp(self, char, camp_position):
         """Check if character is adjacent to a camp position.
@@ -773,10 +797,37 @@ class InteractableManager:
         """Check if there is a tree at the given position."""
         return (x, y) in self.trees
 
+    def add_tree(self, x, y):
+        """Add a tree at position (no-op if one is already there)."""
+        if (x, y) not in self.trees:
+            tree = Tree(x, y)
+            self.trees[(x, y)] = tree
+            self.spatial.insert('tree', tree, None, x, y)
+
     def remove_tree(self, x, y):
         """Remove tree at position."""
         if (x, y) in self.trees:
-            del self.trees[(x, y)]
+            self.spatial.remove(self.trees.pop((x, y)))
+    
+    # =========================================================================
+    # SPATIAL QUERIES
+    # =========================================================================
+    
+    def track(self, kind, obj):
+        """Index an object this manager doesn't own (ground item, corpse) at its position."""
+        self.spatial.insert(kind, obj, obj.zone, obj.x, obj.y)
+    
+    def untrack(self, obj):
+        """Drop an object added with track()."""
+        self.spatial.remove(obj)
+    
+    def get_objects_in_rect(self, zone, min_x, min_y, max_x, max_y, kinds=None):
+        """Get (kind, obj) pairs in a zone overlapping a rectangle (inclusive bounds)."""
+        return self.spatial.query_rect(zone, min_x, min_y, max_x, max_y, kinds)
+    
+    def get_objects_near(self, zone, x, y, radius, kinds=None):
+        """Get (kind, obj) pairs in a zone within radius of a point."""
+        return self.spatial.query_radius(zone, x, y, radius, kinds)
     
     # =========================================================================
     # HOUSE LOOKUPS